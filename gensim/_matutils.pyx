@@ -8,6 +8,7 @@ import numpy as np
 cimport numpy as np
 ctypedef cython.floating DTYPE_t
 from libc.math cimport log, exp, fabs
+from libc.stdlib cimport malloc, free
 from cython.parallel import prange
 
 
@@ -357,3 +358,86 @@ cdef inline DTYPE_t _digamma(DTYPE_t x,) nogil:
         - r * ( 1.0 / 132.0 ) ) ) ) )
 
     return value;
+
+
+def quantized_dot(quantized, vector, out):
+    """Compute the dot products of the rows of a quantized matrix with a vector, without up-casting the matrix.
+
+    Scanning the compact matrix directly reads only its bytes from memory, unlike converting it to float32 first.
+
+    Parameters
+    ----------
+    quantized : numpy.ndarray
+        C-contiguous 2d matrix of int8 or float16.
+    vector : numpy.ndarray
+        1d vector, of int8 for an int8 `quantized` (the products are then summed exactly, as int32),
+        of float32 for a float16 `quantized`.
+    out : numpy.ndarray
+        1d output, of int32 for an int8 `quantized`, of float32 for a float16 `quantized`.
+
+    """
+    if quantized.dtype == np.int8:
+        _dot_int8(quantized, vector, out)
+    elif quantized.dtype == np.float16:
+        _dot_float16(quantized.view(np.uint16), vector, out)
+    else:
+        raise ValueError("unsupported quantized matrix type %s" % quantized.dtype)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _dot_int8(const np.int8_t[:, ::1] quantized, const np.int8_t[::1] vector, np.int32_t[::1] out) nogil:
+    cdef Py_ssize_t i, j
+    cdef np.int32_t result
+    cdef const np.int8_t *row
+
+    for i in range(quantized.shape[0]):
+        row = &quantized[i, 0]
+        result = 0
+        for j in range(quantized.shape[1]):
+            result += row[j] * vector[j]
+        out[i] = result
+
+
+cdef union _Float32Bits:
+    np.uint32_t bits
+    float value
+
+
+cdef enum:
+    HALF_BLOCK = 16
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _dot_float16(const np.uint16_t[:, ::1] quantized, const float[::1] vector, float[::1] out) nogil:
+    cdef Py_ssize_t i, j, k, start, width
+    cdef Py_ssize_t num_columns = quantized.shape[1]
+    cdef const np.uint16_t *row
+    cdef _Float32Bits converted[HALF_BLOCK]
+    cdef float partial[HALF_BLOCK]  # independent sums, so that the compiler can vectorize the loops
+    # Shifting the float16 bits into a float32 leaves the exponent biased by 15 instead of 127: a factor
+    # of 2**-112, which is folded into the vector instead. This converts subnormals correctly, too.
+    cdef float *scaled = <float *>malloc(num_columns * sizeof(float))
+
+    for j in range(num_columns):
+        scaled[j] = vector[j] * 5192296858534827628530496329220096.0  # 2**112
+    for i in range(quantized.shape[0]):
+        row = &quantized[i, 0]
+        for k in range(HALF_BLOCK):
+            partial[k] = 0.0
+        start = 0
+        while start < num_columns:
+            width = min(<Py_ssize_t>HALF_BLOCK, num_columns - start)
+            for k in range(width):
+                converted[k].bits = (
+                    ((<np.uint32_t>(row[start + k] & 0x8000)) << 16)
+                    | ((<np.uint32_t>(row[start + k] & 0x7fff)) << 13)
+                )
+            for k in range(width):
+                partial[k] += converted[k].value * scaled[start + k]
+            start += HALF_BLOCK
+        out[i] = 0.0
+        for k in range(HALF_BLOCK):
+            out[i] += partial[k]
+    free(scaled)
@@ -1019,9 +1019,122 @@ def jaccard_distance(set1, set2):
     return 1. - float(len(set1 & set2)) / float(union_cardinality)
 
 
+#: :func:`~gensim.matutils.product_quantize` trains each codebook on at most this many sampled vectors per centroid.
+PQ_POINTS_PER_CENTROID = 256
+
+
+def nearest_centroids(vectors, centroids, chunksize=4096):
+    """Get the index of the nearest (by Euclidean distance) of `centroids` to each of `vectors`.
+
+    Parameters
+    ----------
+    vectors : numpy.ndarray
+        2d array of vectors.
+    centroids : numpy.ndarray
+        2d array of centroids, of the same dimensionality.
+    chunksize : int, optional
+        Number of vectors processed at once, small enough for their distances to stay in the CPU cache.
+
+    Returns
+    -------
+    numpy.ndarray
+        Index of the nearest centroid, for each vector.
+
+    """
+    nearest = np.empty(len(vectors), dtype=np.int64)
+    centroid_norms = (centroids ** 2).sum(axis=1)
+    for start in range(0, len(vectors), chunksize):
+        # squared distances, minus the constant squared norm of each vector
+        distances = np.dot(vectors[start:start + chunksize], centroids.T)
+        distances *= -2
+        distances += centroid_norms
+        nearest[start:start + chunksize] = distances.argmin(axis=1)
+    return nearest
+
+
+def kmeans(vectors, num_clusters, iterations, rng):
+    """Cluster `vectors` by Lloyd's k-means, starting from randomly selected vectors.
+
+    Clusters that become empty are re-seeded from a random vector, so exactly `min(num_clusters, len(vectors))`
+    centroids are always returned.
+
+    Parameters
+    ----------
+    vectors : numpy.ndarray
+        2d array of vectors to cluster.
+    num_clusters : int
+        Number of clusters.
+    iterations : int
+        Number of iterations.
+    rng : numpy.random.Generator
+        Source of randomness.
+
+    Returns
+    -------
+    numpy.ndarray
+        The centroids, as a 2d float32 array.
+
+    """
+    num_clusters = min(num_clusters, len(vectors))
+    centroids = vectors[rng.choice(len(vectors), num_clusters, replace=False)].astype(np.float32)
+    for _ in range(iterations):
+        assignments = nearest_centroids(vectors, centroids)
+        counts = np.bincount(assignments, minlength=num_clusters)
+        membership = scipy.sparse.csr_matrix(
+            (np.ones(len(vectors), dtype=np.float32), (assignments, np.arange(len(vectors)))),
+            shape=(num_clusters, len(vectors)),
+        )
+        sums = membership @ vectors
+        nonempty = counts > 0
+        centroids[nonempty] = sums[nonempty] / counts[nonempty, np.newaxis]
+        num_empty = num_clusters - nonempty.sum()
+        if num_empty:
+            centroids[~nonempty] = vectors[rng.choice(len(vectors), num_empty, replace=False)]
+    return centroids
+
+
+def product_quantize(vectors, num_subvectors, num_centroids, iterations, rng):
+    """Product-quantize `vectors`: cut each into `num_subvectors` pieces, and replace each piece by the index
+    of its nearest centroid, from a codebook learned by k-means for that piece.
+
+    Parameters
+    ----------
+    vectors : numpy.ndarray
+        2d array of vectors, with a dimensionality divisible by `num_subvectors`.
+    num_subvectors : int
+        Number of pieces per vector.
+    num_centroids : int
+        Number of centroids in each codebook, at most 256.
+    iterations : int
+        Number of k-means iterations.
+    rng : numpy.random.Generator
+        Source of randomness.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        The uint8 codes, one row of `num_subvectors` centroid indexes per vector, and the float32 codebooks,
+        of shape `(num_subvectors, num_centroids, vector_size // num_subvectors)`.
+
+    """
+    num_vectors, vector_size = vectors.shape
+    subvector_size = vector_size // num_subvectors
+    codes = np.zeros((num_vectors, num_subvectors), dtype=np.uint8)
+    codebooks = np.zeros((num_subvectors, num_centroids, subvector_size), dtype=np.float32)
+    if not num_vectors:
+        return codes, codebooks
+    sample = rng.choice(num_vectors, min(num_vectors, num_centroids * PQ_POINTS_PER_CENTROID), replace=False)
+    for i in range(num_subvectors):
+        piece = np.ascontiguousarray(vectors[:, i * subvector_size:(i + 1) * subvector_size])
+        centroids = kmeans(piece[sample], num_centroids, iterations, rng)
+        codebooks[i, :len(centroids)] = centroids
+        codes[:, i] = nearest_centroids(piece, centroids)
+    return codes, codebooks
+
+
 try:
     # try to load fast, cythonized code if possible
-    from gensim._matutils import logsumexp, mean_absolute_difference, dirichlet_expectation
+    from gensim._matutils import logsumexp, mean_absolute_difference, dirichlet_expectation, quantized_dot
 
 except ImportError:
     def logsumexp(x):
@@ -1086,6 +1199,26 @@ except ImportError:
             result = psi(alpha) - psi(np.sum(alpha, 1))[:, np.newaxis]
         return result.astype(alpha.dtype, copy=False)  # keep the same precision as input
 
+    def quantized_dot(quantized, vector, out, chunksize=1024):
+        """Compute the dot products of the rows of a quantized matrix with a vector.
+
+        Parameters
+        ----------
+        quantized : numpy.ndarray
+            2d matrix of int8 or float16.
+        vector : numpy.ndarray
+            1d vector, of int8 for an int8 `quantized`, of float32 for a float16 `quantized`.
+        out : numpy.ndarray
+            1d output, of int32 for an int8 `quantized`, of float32 for a float16 `quantized`.
+        chunksize : int, optional
+            Number of rows up-cast at a time, small enough for them to stay in the CPU cache.
+
+        """
+        work_type = np.float64 if quantized.dtype == np.int8 else np.float32  # int8 sums are exact in float64
+        vector = vector.astype(work_type)
+        for start in range(0, len(quantized), chunksize):
+            out[start:start + chunksize] = np.dot(quantized[start:start + chunksize].astype(work_type), vector)
+
 
 def qr_destroy(la):
     """Get QR decomposition of `la[0]`.
@@ -14,6 +14,7 @@ from .logentropy_model import LogEntropyModel  # noqa:F401
 from .word2vec import Word2Vec, FAST_VERSION  # noqa:F401
 from .doc2vec import Doc2Vec  # noqa:F401
 from .keyedvectors import KeyedVectors  # noqa:F401
+from .sharded_keyedvectors import ShardedKeyedVectors  # noqa:F401
 from .ldamulticore import LdaMulticore  # noqa:F401
 from .phrases import Phrases  # noqa:F401
 from .normmodel import NormModel  # noqa:F401
@@ -90,9 +90,12 @@ Create and bind a callback to a topic model. This callback will log the perplexi
 import gensim
 import logging
 import copy
+import os
 import sys
 import numpy as np
 
+from gensim import utils
+
 if sys.version_info[0] >= 3:
     from queue import Queue
 else:
@@ -627,3 +630,264 @@ class CallbackAny2Vec:
 
         """
         pass
+
+    def on_progress(self, model, metrics):
+        """Method called at each progress report during training, and once more at the end of each epoch.
+
+        Progress is reported at most once every `report_delay` seconds, see
+        :meth:`~gensim.models.word2vec.Word2Vec.train`.
+
+        Parameters
+        ----------
+        model : :class:`~gensim.models.word2vec.Word2Vec` or subclass
+            Current model.
+        metrics : :class:`~gensim.models.callbacks.TrainingMetrics`
+            Progress and throughput of the current epoch.
+
+        """
+        pass
+
+
+class TrainingMetrics:
+    """Progress and throughput of one training epoch of :class:`~gensim.models.word2vec.Word2Vec` & subclasses,
+    as passed to :meth:`~gensim.models.callbacks.CallbackAny2Vec.on_progress`.
+
+    All times are in seconds since the start of the epoch. The time of each worker thread is split into
+
+    * `starved` time, spent waiting for the producer to queue up the next job,
+    * `kernel` time, spent in the compiled training routines (`_do_train_job` of the model), and
+    * the rest, spent in Python: in the worker loop, or waiting for the GIL, see :attr:`worker_python_time`.
+
+    With `corpus_file` training, the whole epoch of a worker runs in the compiled routines and is reported
+    only when the worker finishes.
+
+    Attributes
+    ----------
+    epoch : int
+        The current training epoch, starting from 0.
+    epoch_end : bool
+        Whether this is the final report of the epoch.
+    progress : float
+        The done fraction of the epoch, from 0.0 to 1.0.
+    elapsed : float
+        Time since the start of the epoch.
+    alpha : float
+        The effective learning rate, as last set by the job producer.
+    example_count : int
+        Number of examples, such as sentences, processed so far.
+    raw_word_count : int
+        Number of words processed so far.
+    trained_word_count : int
+        Number of effective words trained so far (after ignoring unknown words, downsampling and trimming
+        the sentence length).
+    job_queue_size : int
+        Number of jobs queued up by the producer and waiting for a worker, or -1 with `corpus_file` training.
+    progress_queue_size : int
+        Number of worker reports waiting to be counted.
+    worker_words : dict of (int, int)
+        Effective words trained so far by each worker thread.
+    worker_starved_time : dict of (int, float)
+        Time each worker thread spent waiting for jobs.
+    worker_kernel_time : dict of (int, float)
+        Time each worker thread spent in the compiled training routines.
+
+    """
+    def __init__(
+            self, epoch, elapsed, alpha, example_count=0, total_examples=None, raw_word_count=0, total_words=None,
+            trained_word_count=0, job_queue_size=-1, progress_queue_size=0, worker_words=None,
+            worker_starved_time=None, worker_kernel_time=None, epoch_end=False,
+        ):
+        self.epoch = epoch
+        self.epoch_end = epoch_end
+        if total_examples:
+            self.progress = min(1.0, example_count / total_examples)
+        elif total_words:
+            self.progress = min(1.0, raw_word_count / total_words)
+        else:
+            self.progress = 0.0
+        self.elapsed = elapsed
+        self.alpha = alpha
+        self.example_count = example_count
+        self.raw_word_count = raw_word_count
+        self.trained_word_count = trained_word_count
+        self.job_queue_size = job_queue_size
+        self.progress_queue_size = progress_queue_size
+        self.worker_words = dict(worker_words or {})
+        self.worker_starved_time = dict(worker_starved_time or {})
+        self.worker_kernel_time = dict(worker_kernel_time or {})
+
+    def __str__(self):
+        return "%s<epoch=%i, progress=%.2f%%, %.0f words/s, alpha=%f, starved=%.2fs, kernel=%.2fs>" % (
+            self.__class__.__name__, self.epoch + 1, 100.0 * self.progress, self.words_per_sec, self.alpha,
+            self.starved_time, self.kernel_time,
+        )
+
+    @property
+    def words_per_sec(self):
+        """float: Effective words trained per second, over all workers."""
+        return self.trained_word_count / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def worker_words_per_sec(self):
+        """dict of (int, float): Effective words trained per second, by each worker thread."""
+        return {
+            worker: words / self.elapsed if self.elapsed > 0 else 0.0
+            for worker, words in self.worker_words.items()
+        }
+
+    @property
+    def worker_python_time(self):
+        """dict of (int, float): Time each worker thread spent neither starved nor in the compiled routines."""
+        return {
+            worker: max(0.0, self.elapsed - self.worker_starved_time.get(worker, 0.0) - kernel_time)
+            for worker, kernel_time in self.worker_kernel_time.items()
+        }
+
+    @property
+    def starved_time(self):
+        """float: Time all worker threads spent waiting for jobs, summed up."""
+        return sum(self.worker_starved_time.values())
+
+    @property
+    def kernel_time(self):
+        """float: Time all worker threads spent in the compiled training routines, summed up."""
+        return sum(self.worker_kernel_time.values())
+
+    @property
+    def python_time(self):
+        """float: Time all worker threads spent neither starved nor in the compiled routines, summed up."""
+        return sum(self.worker_python_time.values())
+
+
+class PrometheusExporter(CallbackAny2Vec):
+    """Export the :class:`~gensim.models.callbacks.TrainingMetrics` of :class:`~gensim.models.word2vec.Word2Vec`
+    & subclasses in the `Prometheus text format
+    <https://prometheus.io/docs/instrumenting/exposition_formats/#text-based-format>`_.
+
+    The metrics are rewritten into `path` at each progress report, so they can be scraped by the textfile collector
+    of the Prometheus node exporter, or served by any HTTP server. No Prometheus client library is needed.
+
+    Examples
+    --------
+    .. sourcecode:: pycon
+
+        >>> from gensim.models import Word2Vec
+        >>> from gensim.models.callbacks import PrometheusExporter
+        >>> from gensim.test.utils import common_texts, get_tmpfile
+        >>>
+        >>> exporter = PrometheusExporter(get_tmpfile("word2vec.prom"), labels={"model": "w2v"})
+        >>> model = Word2Vec(common_texts, vector_size=10, min_count=1, callbacks=[exporter])
+        >>> text = exporter.to_text()  # the same text as written into the file
+
+    """
+    def __init__(self, path=None, prefix="gensim_any2vec", labels=None):
+        """
+
+        Parameters
+        ----------
+        path : str, optional
+            Path of the file to (re)write with the metrics at each report. If None, the metrics are only
+            available through :meth:`~gensim.models.callbacks.PrometheusExporter.to_text`.
+        prefix : str, optional
+            Prefix of all metric names.
+        labels : dict of (str, str), optional
+            Labels added to all metrics, for example to tell apart models trained at the same time.
+
+        """
+        self.path = path
+        self.prefix = prefix
+        self.labels = dict(labels or {})
+        self.metrics = None
+        self.done_words = 0  # effective words trained in the finished epochs
+
+    def on_train_begin(self, model):
+        self.metrics = None
+        self.done_words = 0
+
+    def on_progress(self, model, metrics):
+        self.metrics = metrics
+        if metrics.epoch_end:
+            self.done_words += metrics.trained_word_count
+        if self.path is not None:
+            self.write(self.path)
+
+    def _labels(self, **extra):
+        labels = dict(self.labels, **extra)
+        if not labels:
+            return ''
+        escaped = (
+            (key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for key, value in sorted(labels.items())
+        )
+        return '{' + ','.join('%s="%s"' % item for item in escaped) + '}'
+
+    def to_text(self):
+        """Get the metrics of the last report.
+
+        Returns
+        -------
+        str
+            The metrics in the Prometheus text format, empty before the first report.
+
+        """
+        metrics = self.metrics
+        if metrics is None:
+            return ''
+        trained_words = self.done_words if metrics.epoch_end else self.done_words + metrics.trained_word_count
+        gauges = [
+            ('epoch', 'Current training epoch, starting from 0.', metrics.epoch),
+            ('epoch_progress', 'Done fraction of the current epoch.', metrics.progress),
+            ('alpha', 'Effective learning rate.', metrics.alpha),
+            ('words_per_second', 'Effective words trained per second in the current epoch.', metrics.words_per_sec),
+            ('job_queue_size', 'Jobs waiting for a worker, -1 with corpus_file training.', metrics.job_queue_size),
+            ('progress_queue_size', 'Worker reports waiting to be counted.', metrics.progress_queue_size),
+        ]
+        worker_gauges = [
+            (
+                'worker_words_per_second', 'Effective words trained per second by each worker.',
+                metrics.worker_words_per_sec,
+            ),
+            (
+                'worker_starved_seconds', 'Time each worker waited for jobs in the current epoch.',
+                metrics.worker_starved_time,
+            ),
+            (
+                'worker_kernel_seconds', 'Time each worker spent in compiled training routines in the current epoch.',
+                metrics.worker_kernel_time,
+            ),
+            (
+                'worker_python_seconds', 'Time each worker spent in Python in the current epoch.',
+                metrics.worker_python_time,
+            ),
+        ]
+
+        lines = []
+        for name, doc, value in gauges:
+            name = '%s_%s' % (self.prefix, name)
+            lines.extend(['# HELP %s %s' % (name, doc), '# TYPE %s gauge' % name])
+            lines.append('%s%s %r' % (name, self._labels(), float(value)))
+        name = '%s_trained_words_total' % self.prefix
+        lines.extend(['# HELP %s Effective words trained so far.' % name, '# TYPE %s counter' % name])
+        lines.append('%s%s %r' % (name, self._labels(), float(trained_words)))
+        for name, doc, values in worker_gauges:
+            name = '%s_%s' % (self.prefix, name)
+            lines.extend(['# HELP %s %s' % (name, doc), '# TYPE %s gauge' % name])
+            for worker, value in sorted(values.items()):
+                lines.append('%s%s %r' % (name, self._labels(worker=worker), float(value)))
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """Write the metrics of the last report into a file.
+
+        The file is replaced atomically, so readers never see a partially written file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the output file.
+
+        """
+        tmp_path = '%s.tmp' % path
+        with utils.open(tmp_path, 'w', encoding='utf8') as fout:
+            fout.write(self.to_text())
+        os.replace(tmp_path, path)
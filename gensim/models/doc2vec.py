@@ -63,6 +63,7 @@ import logging
 import os
 from collections import namedtuple, defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from timeit import default_timer
 
 from dataclasses import dataclass
@@ -72,12 +73,15 @@ import numpy as np
 from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
 from gensim.utils import deprecated
 from gensim.models import Word2Vec, FAST_VERSION  # noqa: F401
+from gensim.models.word2vec import _LineSentenceRange, CorpusFileIndex
 from gensim.models.keyedvectors import KeyedVectors, pseudorandom_weak_vector
 
 logger = logging.getLogger(__name__)
 
 try:
-    from gensim.models.doc2vec_inner import train_document_dbow, train_document_dm, train_document_dm_concat
+    from gensim.models.doc2vec_inner import (
+        train_document_dbow, train_document_dm, train_document_dm_concat, infer_documents,
+    )
 except ImportError:
     raise utils.NO_CYTHON
 
@@ -198,6 +202,9 @@ class Doc2Vec(Word2Vec):
             Limits the RAM during vocabulary building; if there are more unique
             words than this, then prune the infrequent ones. Every 10 million word types need about 1GB of RAM.
             Set to `None` for no limit.
+        vocab_sketch : bool, optional
+            If True, count at most `max_vocab_size` distinct words with a Space-Saving sketch instead of pruning,
+            see :class:`~gensim.models.word2vec.Word2Vec`.
         sample : float, optional
             The threshold for configuring which higher-frequency words are randomly downsampled,
             useful range is (0, 1e-5).
@@ -232,6 +239,11 @@ class Doc2Vec(Word2Vec):
         dbow_words : {1,0}, optional
             If set to 1 trains word-vectors (in skip-gram fashion) simultaneous with DBOW
             doc-vector training; If 0, only trains doc-vectors (faster).
+        dv_mapfile : str, optional
+            Path to a file backing the document vectors `dv.vectors` through a `numpy.memmap`, for corpora with more
+            documents than their vectors fit in RAM. The operating system's page cache then holds the vectors being
+            trained. Pages are reused best when documents sharing a tag are close in the corpus, as with the line-number
+            tags of `corpus_file` mode, where each worker trains a contiguous range of lines.
         trim_rule : function, optional
             Vocabulary trimming rule, specifies whether certain words should remain in the vocabulary,
             be trimmed away, or handled using the default (discard if word count < min_count).
@@ -327,6 +339,13 @@ class Doc2Vec(Word2Vec):
         """Resets the current word vectors. """
         self.wv.norms = None
         self.dv.norms = None
+        self.wv._drop_quantized()
+        self.dv._drop_quantized()
+
+    def _checkpoint_arrays(self):
+        arrays = super(Doc2Vec, self)._checkpoint_arrays()
+        arrays['dv.vectors'] = self.dv.vectors
+        return arrays
 
     def init_weights(self):
         super(Doc2Vec, self).init_weights()
@@ -352,6 +371,7 @@ class Doc2Vec(Word2Vec):
         self.wv.index_to_key = other_model.wv.index_to_key
         self.wv.expandos = other_model.wv.expandos
         self.cum_table = other_model.cum_table
+        self.alias_table = other_model.alias_table
         self.corpus_count = other_model.corpus_count
         self.dv.key_to_index = other_model.dv.key_to_index
         self.dv.index_to_key = other_model.dv.index_to_key
@@ -514,9 +534,11 @@ class Doc2Vec(Word2Vec):
     def _get_offsets_and_start_doctags_for_corpusfile(cls, corpus_file, workers):
         """Get offset and initial document tag in a corpus_file for each worker.
 
-        Firstly, approximate offsets are calculated based on number of workers and corpus_file size.
-        Secondly, for each approximate offset we find the maximum offset which points to the beginning of line and
-        less than approximate offset.
+        Each worker gets about the same number of words, and starts at the beginning of the line holding
+        the first of them.
+
+        The line offsets come from the :class:`~gensim.models.word2vec.CorpusFileIndex` of `corpus_file`,
+        so the file is only scanned the first time.
 
         Parameters
         ----------
@@ -530,29 +552,7 @@ class Doc2Vec(Word2Vec):
         list of int, list of int
             Lists with offsets and document tags with length = number of workers.
         """
-        corpus_file_size = os.path.getsize(corpus_file)
-        approx_offsets = [int(corpus_file_size // workers * i) for i in range(workers)]
-        offsets = []
-        start_doctags = []
-
-        with utils.open(corpus_file, mode='rb') as fin:
-            curr_offset_idx = 0
-            prev_filepos = 0
-
-            for line_no, line in enumerate(fin):
-                if curr_offset_idx == len(approx_offsets):
-                    break
-
-                curr_filepos = prev_filepos + len(line)
-                while curr_offset_idx != len(approx_offsets) and approx_offsets[curr_offset_idx] < curr_filepos:
-                    offsets.append(prev_filepos)
-                    start_doctags.append(line_no)
-
-                    curr_offset_idx += 1
-
-                prev_filepos = curr_filepos
-
-        return offsets, start_doctags
+        return CorpusFileIndex.load_or_build(corpus_file).split(workers)
 
     def _raw_word_count(self, job):
         """Get the number of words in a given job.
@@ -647,6 +647,74 @@ class Doc2Vec(Word2Vec):
 
         return doctag_vectors[0]
 
+    def infer_vectors(self, documents, alpha=None, min_alpha=None, epochs=None, workers=None, seeds=None, out=None,
+                      chunksize=100):
+        """Infer vectors for many post-bulk training documents at once.
+
+        Works like :meth:`~gensim.models.doc2vec.Doc2Vec.infer_vector`, but the documents are split into chunks,
+        inferred concurrently by `workers` threads that release the GIL while training each document.
+
+        Each document gets its own random stream, derived from its seed and the model's `seed`, so its vector does not
+        depend on the number of workers or on the other documents.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            The documents for which the vector representations will be inferred.
+        alpha : float, optional
+            The initial learning rate. If unspecified, value from model initialization will be reused.
+        min_alpha : float, optional
+            Learning rate will linearly drop to `min_alpha` over all inference epochs. If unspecified,
+            value from model initialization will be reused.
+        epochs : int, optional
+            Number of times to train each document. If unspecified, the `epochs` value from model initialization
+            will be reused.
+        workers : int, optional
+            Number of worker threads. If unspecified, the `workers` value from model initialization will be reused.
+        seeds : iterable of int, optional
+            Non-negative seed for each document, such as a stable document id. By default, each document is seeded
+            with its position in `documents`.
+        out : numpy.ndarray, optional
+            C-contiguous float32 matrix of shape `(len(documents), vector_size)`, to store the inferred vectors into.
+            If unspecified, a new matrix is allocated.
+        chunksize : int, optional
+            Number of documents handed to a worker thread at a time.
+
+        Returns
+        -------
+        numpy.ndarray
+            The inferred vectors, one row for each document in `documents`.
+
+        """
+        documents = list(documents)
+        if any(isinstance(doc_words, str) for doc_words in documents):  # a common mistake; fail with a nicer error
+            raise TypeError("Parameter documents of infer_vectors() must contain lists of strings (not strings).")
+
+        alpha = alpha or self.alpha
+        min_alpha = min_alpha or self.min_alpha
+        epochs = epochs or self.epochs
+        workers = workers or self.workers
+        seeds = range(len(documents)) if seeds is None else list(seeds)
+        if len(seeds) != len(documents):
+            raise ValueError("Got %i seeds for %i documents." % (len(seeds), len(documents)))
+
+        shape = (len(documents), self.dv.vector_size)
+        if out is None:
+            out = np.empty(shape, dtype=REAL)
+        elif out.shape != shape or out.dtype != REAL or not out.flags.c_contiguous:
+            raise ValueError("Parameter out must be a C-contiguous %s matrix of shape %s." % (np.dtype(REAL), shape))
+
+        def infer_chunk(start):
+            stop = start + chunksize
+            return infer_documents(
+                self, documents[start:stop], out[start:stop], seeds[start:stop], alpha, min_alpha, epochs,
+            )
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            effective_words = sum(executor.map(infer_chunk, range(0, len(documents), chunksize)))
+        logger.debug("inferred %i documents with %i effective words", len(documents), effective_words)
+        return out
+
     def __getitem__(self, tag):
         """Get the vector representation of (possible multi-term) tag.
 
@@ -826,11 +894,12 @@ class Doc2Vec(Word2Vec):
         """
         report = report or {}
         report['doctag_lookup'] = self.estimated_lookup_memory()
-        report['doctag_syn0'] = len(self.dv) * self.vector_size * dtype(REAL).itemsize
+        if not self.dv.mapfile_path:  # memory-mapped vectors live in the page cache instead
+            report['doctag_syn0'] = len(self.dv) * self.vector_size * dtype(REAL).itemsize
         return super(Doc2Vec, self).estimate_memory(vocab_size, report=report)
 
     def build_vocab(self, corpus_iterable=None, corpus_file=None, update=False, progress_per=10000,
-                    keep_raw_vocab=False, trim_rule=None, **kwargs):
+                    keep_raw_vocab=False, trim_rule=None, producers=0, **kwargs):
         """Build vocabulary from a sequence of documents (can be a once-only generator stream).
 
         Parameters
@@ -864,13 +933,16 @@ class Doc2Vec(Word2Vec):
                 * `count` (int) - the word's frequency count in the corpus
                 * `min_count` (int) - the minimum count threshold.
 
+        producers : int, optional
+            Number of worker processes that count the words and tags, see
+            :meth:`~gensim.models.doc2vec.Doc2Vec.scan_vocab`. By default (0), the corpus is scanned in this process.
         **kwargs
             Additional key word arguments passed to the internal vocabulary construction.
 
         """
         total_words, corpus_count = self.scan_vocab(
             corpus_iterable=corpus_iterable, corpus_file=corpus_file,
-            progress_per=progress_per, trim_rule=trim_rule
+            progress_per=progress_per, trim_rule=trim_rule, producers=producers,
         )
         self.corpus_count = corpus_count
         self.corpus_total_words = total_words
@@ -936,7 +1008,8 @@ class Doc2Vec(Word2Vec):
         interval_start = default_timer() - 0.00001  # guard against next sample being identical
         interval_count = 0
         checked_string_types = 0
-        vocab = defaultdict(int)
+        sketch = utils.SpaceSaving(self.max_vocab_size) if self.vocab_sketch and self.max_vocab_size else None
+        vocab = defaultdict(int) if sketch is None else sketch
         max_rawint = -1  # highest raw int tag seen (-1 for none)
         doctags_lookup = {}
         doctags_list = []
@@ -971,15 +1044,37 @@ class Doc2Vec(Word2Vec):
                         doctags_lookup[tag] = Doctag(index=len(doctags_list), word_count=document_length, doc_count=1)
                         doctags_list.append(tag)
 
-            for word in document.words:
-                vocab[word] += 1
+            if sketch is not None:
+                sketch.update(document.words)
+            else:
+                for word in document.words:
+                    vocab[word] += 1
             total_words += len(document.words)
 
-            if self.max_vocab_size and len(vocab) > self.max_vocab_size:
+            if sketch is None and self.max_vocab_size and len(vocab) > self.max_vocab_size:
                 utils.prune_vocab(vocab, min_reduce, trim_rule=trim_rule)
                 min_reduce += 1
 
         corpus_count = document_no + 1
+        self._set_doctags(doctags_lookup, doctags_list, max_rawint, corpus_count)
+        self.raw_vocab = vocab if sketch is None else self._sketch_counts(sketch)
+        return total_words, corpus_count
+
+    def _set_doctags(self, doctags_lookup, doctags_list, max_rawint, corpus_count):
+        """Size `self.dv` for the document tags collected by a vocabulary scan.
+
+        Parameters
+        ----------
+        doctags_lookup : dict of (str, :class:`~gensim.models.doc2vec.Doctag`)
+            The string tags.
+        doctags_list : list of str
+            The string tags, in order of first appearance.
+        max_rawint : int
+            The highest int tag, -1 for none.
+        corpus_count : int
+            Number of documents in the corpus.
+
+        """
         if len(doctags_list) > corpus_count:
             logger.warning("More unique tags (%i) than documents (%i).", len(doctags_list), corpus_count)
         if max_rawint > corpus_count:
@@ -998,10 +1093,8 @@ class Doc2Vec(Word2Vec):
             self.dv.key_to_index[t] = dt.index
             self.dv.set_vecattr(t, 'word_count', dt.word_count)
             self.dv.set_vecattr(t, 'doc_count', dt.doc_count)
-        self.raw_vocab = vocab
-        return total_words, corpus_count
 
-    def scan_vocab(self, corpus_iterable=None, corpus_file=None, progress_per=10000, trim_rule=None):
+    def scan_vocab(self, corpus_iterable=None, corpus_file=None, progress_per=10000, trim_rule=None, producers=0):
         """Create the models Vocabulary: A mapping from unique words in the corpus to their frequency count.
 
         Parameters
@@ -1027,6 +1120,10 @@ class Doc2Vec(Word2Vec):
                 * `word` (str) - the word we are examining
                 * `count` (int) - the word's frequency count in the corpus
                 * `min_count` (int) - the minimum count threshold.
+        producers : int, optional
+            Number of worker processes that count the words and tags, each over its own partitions of the corpus,
+            see :meth:`~gensim.models.word2vec.Word2Vec.scan_vocab`. With `producers`, `corpus_iterable` must be
+            a sequence of partitions, each an iterable of :class:`~gensim.models.doc2vec.TaggedDocument`.
 
         Returns
         -------
@@ -1035,10 +1132,38 @@ class Doc2Vec(Word2Vec):
 
         """
         logger.info("collecting all words and their counts")
-        if corpus_file is not None:
-            corpus_iterable = TaggedLineDocument(corpus_file)
-
-        total_words, corpus_count = self._scan_vocab(corpus_iterable, progress_per, trim_rule)
+        if producers and (corpus_file is not None or corpus_iterable is not None):
+            if corpus_file is not None:
+                partitions = _TaggedLineRange.split(corpus_file, producers)
+            else:
+                partitions = self._check_corpus_partitions(corpus_iterable)
+                if any(isinstance(partition, TaggedDocument) for partition in partitions):
+                    raise TypeError(
+                        "With producers, corpus_iterable must be a sequence of partitions, each an iterable of "
+                        "TaggedDocument, got a TaggedDocument instead of a partition"
+                    )
+            total_words, corpus_count, extras = self._scan_vocab_partitions(
+                partitions, producers, _scan_tagged_documents, trim_rule)
+
+            # merge the string tags in order of first appearance, as if scanning the partitions one after another
+            doctags_lookup, doctags_list, max_rawint = {}, [], -1
+            for partition_doctags, partition_max_rawint in extras:
+                max_rawint = max(max_rawint, partition_max_rawint)
+                for tag, doctag in partition_doctags.items():
+                    if tag in doctags_lookup:
+                        doctags_lookup[tag].word_count += doctag.word_count
+                        doctags_lookup[tag].doc_count += doctag.doc_count
+                    else:
+                        doctag.index = len(doctags_list)
+                        doctags_lookup[tag] = doctag
+                        doctags_list.append(tag)
+            if corpus_file is not None:
+                max_rawint = corpus_count - 1  # tags are the line numbers across the whole file
+            self._set_doctags(doctags_lookup, doctags_list, max_rawint, corpus_count)
+        else:
+            if corpus_file is not None:
+                corpus_iterable = TaggedLineDocument(corpus_file)
+            total_words, corpus_count = self._scan_vocab(corpus_iterable, progress_per, trim_rule)
 
         logger.info(
             "collected %i word types and %i unique tags from a corpus of %i examples and %i words",
@@ -1076,6 +1201,57 @@ class Doc2Vec(Word2Vec):
         return np.dot(matutils.unitvec(d1), matutils.unitvec(d2))
 
 
+def _scan_tagged_documents(documents, max_vocab_size, trim_rule, vocab_sketch):
+    """Count the words and tags of `documents`, like :meth:`Doc2Vec._scan_vocab`, in a worker process of
+    :meth:`~gensim.models.doc2vec.Doc2Vec.scan_vocab`.
+
+    Returns
+    -------
+    (dict of (str, int) or :class:`~gensim.utils.SpaceSaving`, int, int, int,
+    (dict of (str, :class:`~gensim.models.doc2vec.Doctag`), int))
+        The word counts, number of words, number of documents, the next `min_reduce` threshold for pruning,
+        and the extra statistics: the string tags in order of first appearance, and the highest int tag
+        (-1 for none).
+
+    """
+    total_words, document_count, min_reduce, max_rawint = 0, 0, 1, -1
+    sketch = utils.SpaceSaving(max_vocab_size) if vocab_sketch and max_vocab_size else None
+    vocab = defaultdict(int) if sketch is None else sketch
+    doctags = {}
+    for document in documents:
+        document_length = len(document.words)
+        for tag in document.tags:
+            if isinstance(tag, (int, integer,)):
+                max_rawint = max(max_rawint, tag)
+            elif tag in doctags:
+                doctags[tag].doc_count += 1
+                doctags[tag].word_count += document_length
+            else:
+                doctags[tag] = Doctag(index=len(doctags), word_count=document_length, doc_count=1)
+        if sketch is not None:
+            sketch.update(document.words)
+        else:
+            for word in document.words:
+                vocab[word] += 1
+        total_words += document_length
+        document_count += 1
+        if sketch is None and max_vocab_size and len(vocab) > max_vocab_size:
+            utils.prune_vocab(vocab, min_reduce, trim_rule=trim_rule)
+            min_reduce += 1
+    counts = dict(vocab) if sketch is None else sketch
+    return counts, total_words, document_count, min_reduce, (doctags, max_rawint)
+
+
+class _TaggedLineRange(_LineSentenceRange):
+    """The documents of a :class:`~gensim.models.doc2vec.TaggedLineDocument` file, restricted to the lines that
+    start within a range of byte offsets. Their int tags count the lines from the start of the range.
+
+    """
+    def __iter__(self):
+        for item_no, line in enumerate(self.lines()):
+            yield TaggedDocument(utils.to_unicode(line).split(), [item_no])
+
+
 class Doc2VecVocab(utils.SaveLoad):
     """Obsolete class retained for now as load-compatibility state capture"""
 
@@ -206,7 +206,7 @@ def d2v_train_epoch_dbow(
                         if c.negative:
                             # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
                             c.next_random = fast_document_dbow_neg(
-                                c.negative, c.cum_table, c.cum_table_len, c.word_vectors, c.syn1neg,
+                                c.negative, c.alias_table, c.alias_table_len, c.word_vectors, c.syn1neg,
                                 c.layer1_size, c.indexes[i], c.indexes[j], c.alpha, c.work,
                                 c.next_random, c.learn_words, c.learn_hidden, c.words_lockf, c.words_lockf_len)
 
@@ -220,7 +220,7 @@ def d2v_train_epoch_dbow(
 
                     if c.negative:
                         c.next_random = fast_document_dbow_neg(
-                            c.negative, c.cum_table, c.cum_table_len, c.doctag_vectors, c.syn1neg,
+                            c.negative, c.alias_table, c.alias_table_len, c.doctag_vectors, c.syn1neg,
                             c.layer1_size, c.indexes[i], _doc_tag, c.alpha, c.work, c.next_random,
                             c.learn_doctags, c.learn_hidden, c.doctags_lockf, c.doctags_lockf_len)
 
@@ -358,7 +358,7 @@ def d2v_train_epoch_dm(
 
                 if c.negative:
                     c.next_random = fast_document_dm_neg(
-                        c.negative, c.cum_table, c.cum_table_len, c.next_random, c.neu1,
+                        c.negative, c.alias_table, c.alias_table_len, c.next_random, c.neu1,
                         c.syn1neg, c.indexes[i], c.alpha, c.work, c.layer1_size, c.learn_hidden)
 
                 if not c.cbow_mean:
@@ -523,7 +523,7 @@ def d2v_train_epoch_dm_concat(
 
                 if c.negative:
                     c.next_random = fast_document_dmc_neg(
-                        c.negative, c.cum_table, c.cum_table_len, c.next_random, c.neu1, c.syn1neg,
+                        c.negative, c.alias_table, c.alias_table_len, c.next_random, c.neu1, c.syn1neg,
                         c.indexes[i], c.alpha, c.work, c.layer1_size, c.vector_size, c.learn_hidden)
 
                 if c.learn_doctags and _doc_tag < c.docvecs_count:
@@ -48,8 +48,8 @@ cdef struct Doc2VecConfig:
 
     # For negative sampling
     REAL_t *syn1neg
-    np.uint32_t *cum_table
-    unsigned long long cum_table_len, next_random
+    const np.uint32_t *alias_table
+    unsigned long long alias_table_len, next_random
 
 
 cdef void fast_document_dbow_hs(
@@ -60,7 +60,7 @@ cdef void fast_document_dbow_hs(
 
 
 cdef unsigned long long fast_document_dbow_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len,
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len,
     REAL_t *context_vectors, REAL_t *syn1neg, const int size, const np.uint32_t word_index,
     const np.uint32_t context_index, const REAL_t alpha, REAL_t *work,
     unsigned long long next_random, int learn_context, int learn_hidden, REAL_t *contexts_lockf,
@@ -74,7 +74,7 @@ cdef void fast_document_dm_hs(
 
 
 cdef unsigned long long fast_document_dm_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len, unsigned long long next_random,
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len, unsigned long long next_random,
     REAL_t *neu1, REAL_t *syn1neg, const int predict_word_index, const REAL_t alpha, REAL_t *work,
     const int size, int learn_hidden) nogil
 
@@ -86,7 +86,7 @@ cdef void fast_document_dmc_hs(
 
 
 cdef unsigned long long fast_document_dmc_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len, unsigned long long next_random,
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len, unsigned long long next_random,
     REAL_t *neu1, REAL_t *syn1neg, const int predict_word_index, const REAL_t alpha, REAL_t *work,
     const int layer1_size, const int vector_size, int learn_hidden) nogil
 
@@ -16,6 +16,7 @@ from numpy import zeros, float32 as REAL
 cimport numpy as np
 
 from libc.string cimport memset, memcpy
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
 
 # scipy <= 0.15
 try:
@@ -24,7 +25,7 @@ except ImportError:
     # in scipy > 0.15, fblas function has been removed
     import scipy.linalg.blas as fblas
 
-from word2vec_inner cimport bisect_left, random_int32, sscal, REAL_t, EXP_TABLE, our_dot, our_saxpy
+from word2vec_inner cimport alias_draw, random_int32, sscal, REAL_t, EXP_TABLE, our_dot, our_saxpy
 
 DEF MAX_DOCUMENT_LEN = 10000
 
@@ -34,6 +35,14 @@ cdef REAL_t ONEF = <REAL_t>1.0
 DEF EXP_TABLE_SIZE = 1000
 DEF MAX_EXP = 6
 
+# words of a document being inferred, before the subsampling of each epoch
+cdef struct DocumentWords:
+    int length
+    np.uint32_t indexes[MAX_DOCUMENT_LEN]
+    int codelens[MAX_DOCUMENT_LEN]
+    np.uint32_t *points[MAX_DOCUMENT_LEN]
+    np.uint8_t *codes[MAX_DOCUMENT_LEN]
+
 cdef void fast_document_dbow_hs(
     const np.uint32_t *word_point, const np.uint8_t *word_code, const int codelen,
     REAL_t *context_vectors, REAL_t *syn1, const int size,
@@ -61,7 +70,7 @@ cdef void fast_document_dbow_hs(
 
 
 cdef unsigned long long fast_document_dbow_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len,
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len,
     REAL_t *context_vectors, REAL_t *syn1neg, const int size, const np.uint32_t word_index,
     const np.uint32_t context_index, const REAL_t alpha, REAL_t *work,
     unsigned long long next_random, int learn_context, int learn_hidden, REAL_t *contexts_lockf,
@@ -81,8 +90,7 @@ cdef unsigned long long fast_document_dbow_neg(
             target_index = word_index
             label = ONEF
         else:
-            target_index = bisect_left(cum_table, (next_random >> 16) % cum_table[cum_table_len-1], 0, cum_table_len)
-            next_random = (next_random * <unsigned long long>25214903917ULL + 11) & modulo
+            target_index = alias_draw(alias_table, alias_table_len, &next_random)
             if target_index == word_index:
                 continue
             label = <REAL_t>0.0
@@ -126,7 +134,7 @@ cdef void fast_document_dm_hs(
 
 
 cdef unsigned long long fast_document_dm_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len, unsigned long long next_random,
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len, unsigned long long next_random,
     REAL_t *neu1, REAL_t *syn1neg, const int predict_word_index, const REAL_t alpha, REAL_t *work,
     const int size, int learn_hidden) nogil:
 
@@ -143,8 +151,7 @@ cdef unsigned long long fast_document_dm_neg(
             target_index = predict_word_index
             label = ONEF
         else:
-            target_index = bisect_left(cum_table, (next_random >> 16) % cum_table[cum_table_len-1], 0, cum_table_len)
-            next_random = (next_random * <unsigned long long>25214903917ULL + 11) & modulo
+            target_index = alias_draw(alias_table, alias_table_len, &next_random)
             if target_index == predict_word_index:
                 continue
             label = <REAL_t>0.0
@@ -186,7 +193,7 @@ cdef void fast_document_dmc_hs(
 
 
 cdef unsigned long long fast_document_dmc_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len, unsigned long long next_random,
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len, unsigned long long next_random,
     REAL_t *neu1, REAL_t *syn1neg, const int predict_word_index, const REAL_t alpha, REAL_t *work,
     const int layer1_size, const int vector_size, int learn_hidden) nogil:
 
@@ -204,8 +211,7 @@ cdef unsigned long long fast_document_dmc_neg(
             target_index = predict_word_index
             label = ONEF
         else:
-            target_index = bisect_left(cum_table, (next_random >> 16) % cum_table[cum_table_len-1], 0, cum_table_len)
-            next_random = (next_random * <unsigned long long>25214903917ULL + 11) & modulo
+            target_index = alias_draw(alias_table, alias_table_len, &next_random)
             if target_index == predict_word_index:
                 continue
             label = <REAL_t>0.0
@@ -267,8 +273,8 @@ cdef init_d2v_config(Doc2VecConfig *c, model, alpha, learn_doctags, learn_words,
 
     if c[0].negative:
         c[0].syn1neg = <REAL_t *>(np.PyArray_DATA(model.syn1neg))
-        c[0].cum_table = <np.uint32_t *>(np.PyArray_DATA(model.cum_table))
-        c[0].cum_table_len = len(model.cum_table)
+        c[0].alias_table = <np.uint32_t *>(np.PyArray_DATA(model.alias_table))
+        c[0].alias_table_len = len(model.alias_table)
     if c[0].negative or c[0].sample:
         c[0].next_random = (2**24) * model.random.randint(0, 2**24) + model.random.randint(0, 2**24)
 
@@ -281,6 +287,147 @@ cdef init_d2v_config(Doc2VecConfig *c, model, alpha, learn_doctags, learn_words,
     c[0].neu1 = <REAL_t *>np.PyArray_DATA(neu1)
 
 
+cdef void dbow_document(Doc2VecConfig *c) nogil:
+    """Train the PV-DBOW model on the document already loaded into `c`."""
+    cdef int i, j, k
+
+    for i in range(c.document_len):
+        if c.train_words:  # simultaneous skip-gram wordvec-training
+            j = i - c.window + c.reduced_windows[i]
+            if j < 0:
+                j = 0
+            k = i + c.window + 1 - c.reduced_windows[i]
+            if k > c.document_len:
+                k = c.document_len
+            for j in range(j, k):
+                if j == i:
+                    continue
+                if c.hs:
+                    # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
+                    fast_document_dbow_hs(c.points[i], c.codes[i], c.codelens[i], c.word_vectors, c.syn1, c.layer1_size,
+                                          c.indexes[j], c.alpha, c.work, c.learn_words, c.learn_hidden, c.words_lockf,
+                                          c.words_lockf_len)
+                if c.negative:
+                    # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
+                    c.next_random = fast_document_dbow_neg(c.negative, c.alias_table, c.alias_table_len, c.word_vectors,
+                                                           c.syn1neg, c.layer1_size, c.indexes[i], c.indexes[j],
+                                                           c.alpha, c.work, c.next_random, c.learn_words,
+                                                           c.learn_hidden, c.words_lockf, c.words_lockf_len)
+
+        # docvec-training
+        for j in range(c.doctag_len):
+            if c.hs:
+                fast_document_dbow_hs(c.points[i], c.codes[i], c.codelens[i], c.doctag_vectors, c.syn1, c.layer1_size,
+                                      c.doctag_indexes[j], c.alpha, c.work, c.learn_doctags, c.learn_hidden, c.doctags_lockf,
+                                      c.doctags_lockf_len)
+            if c.negative:
+                c.next_random = fast_document_dbow_neg(c.negative, c.alias_table, c.alias_table_len, c.doctag_vectors,
+                                                       c.syn1neg, c.layer1_size, c.indexes[i], c.doctag_indexes[j],
+                                                       c.alpha, c.work, c.next_random, c.learn_doctags,
+                                                       c.learn_hidden, c.doctags_lockf, c.doctags_lockf_len)
+
+
+cdef void dm_document(Doc2VecConfig *c) nogil:
+    """Train the PV-DM model, with a sum or mean of the context vectors, on the document already loaded into `c`."""
+    cdef REAL_t count, inv_count = 1.0
+    cdef int i, j, k, m
+
+    for i in range(c.document_len):
+        j = i - c.window + c.reduced_windows[i]
+        if j < 0:
+            j = 0
+        k = i + c.window + 1 - c.reduced_windows[i]
+        if k > c.document_len:
+            k = c.document_len
+
+        # compose l1 (in _neu1) & clear _work
+        memset(c.neu1, 0, c.layer1_size * cython.sizeof(REAL_t))
+        count = <REAL_t>0.0
+        for m in range(j, k):
+            if m == i:
+                continue
+            else:
+                count += ONEF
+                our_saxpy(&c.layer1_size, &ONEF, &c.word_vectors[c.indexes[m] * c.layer1_size], &ONE, c.neu1, &ONE)
+        for m in range(c.doctag_len):
+            count += ONEF
+            our_saxpy(&c.layer1_size, &ONEF, &c.doctag_vectors[c.doctag_indexes[m] * c.layer1_size], &ONE, c.neu1, &ONE)
+        if count > (<REAL_t>0.5):
+            inv_count = ONEF/count
+        if c.cbow_mean:
+            sscal(&c.layer1_size, &inv_count, c.neu1, &ONE)  # (does this need BLAS-variants like saxpy?)
+        memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
+        if c.hs:
+            fast_document_dm_hs(c.points[i], c.codes[i], c.codelens[i], c.neu1, c.syn1, c.alpha, c.work,
+                                c.layer1_size, c.learn_hidden)
+        if c.negative:
+            c.next_random = fast_document_dm_neg(c.negative, c.alias_table, c.alias_table_len, c.next_random,
+                                                 c.neu1, c.syn1neg, c.indexes[i], c.alpha, c.work, c.layer1_size,
+                                                 c.learn_hidden)
+
+        if not c.cbow_mean:
+            sscal(&c.layer1_size, &inv_count, c.work, &ONE)  # (does this need BLAS-variants like saxpy?)
+        # apply accumulated error in work
+        if c.learn_doctags:
+            for m in range(c.doctag_len):
+                our_saxpy(&c.layer1_size, &c.doctags_lockf[c.doctag_indexes[m] % c.doctags_lockf_len], c.work,
+                          &ONE, &c.doctag_vectors[c.doctag_indexes[m] * c.layer1_size], &ONE)
+        if c.learn_words:
+            for m in range(j, k):
+                if m == i:
+                    continue
+                else:
+                     our_saxpy(&c.layer1_size, &c.words_lockf[c.indexes[m] % c.doctags_lockf_len], c.work, &ONE,
+                               &c.word_vectors[c.indexes[m] * c.layer1_size], &ONE)
+
+
+cdef void dm_concat_document(Doc2VecConfig *c) nogil:
+    """Train the PV-DM model, with a concatenation of the context vectors, on the document already loaded into `c`."""
+    cdef int i, j, k, m, n
+
+    for i in range(c.document_len):
+        j = i - c.window      # negative OK: will pad with null word
+        k = i + c.window + 1  # past document end OK: will pad with null word
+
+        # compose l1 & clear work
+        for m in range(c.doctag_len):
+            # doc vector(s)
+            memcpy(&c.neu1[m * c.vector_size], &c.doctag_vectors[c.doctag_indexes[m] * c.vector_size],
+                   c.vector_size * cython.sizeof(REAL_t))
+        n = 0
+        for m in range(j, k):
+            # word vectors in window
+            if m == i:
+                continue
+            if m < 0 or m >= c.document_len:
+                c.window_indexes[n] = c.null_word_index
+            else:
+                c.window_indexes[n] = c.indexes[m]
+            n += 1
+        for m in range(2 * c.window):
+            memcpy(&c.neu1[(c.doctag_len + m) * c.vector_size], &c.word_vectors[c.window_indexes[m] * c.vector_size],
+                   c.vector_size * cython.sizeof(REAL_t))
+        memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
+
+        if c.hs:
+            fast_document_dmc_hs(c.points[i], c.codes[i], c.codelens[i],
+                                 c.neu1, c.syn1, c.alpha, c.work,
+                                 c.layer1_size, c.vector_size, c.learn_hidden)
+        if c.negative:
+            c.next_random = fast_document_dmc_neg(c.negative, c.alias_table, c.alias_table_len, c.next_random,
+                                                  c.neu1, c.syn1neg, c.indexes[i], c.alpha, c.work,
+                                                  c.layer1_size, c.vector_size, c.learn_hidden)
+
+        if c.learn_doctags:
+            for m in range(c.doctag_len):
+                our_saxpy(&c.vector_size, &c.doctags_lockf[c.doctag_indexes[m] % c.doctags_lockf_len], &c.work[m * c.vector_size],
+                          &ONE, &c.doctag_vectors[c.doctag_indexes[m] * c.vector_size], &ONE)
+        if c.learn_words:
+            for m in range(2 * c.window):
+                our_saxpy(&c.vector_size, &c.words_lockf[c.window_indexes[m] % c.words_lockf_len], &c.work[(c.doctag_len + m) * c.vector_size],
+                          &ONE, &c.word_vectors[c.window_indexes[m] * c.vector_size], &ONE)
+
+
 
 def train_document_dbow(model, doc_words, doctag_indexes, alpha, work=None,
                         train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
@@ -331,7 +478,7 @@ def train_document_dbow(model, doc_words, doctag_indexes, alpha, work=None,
     """
     cdef Doc2VecConfig c
 
-    cdef int i, j
+    cdef int i
     cdef long result = 0
     cdef np.uint32_t *vocab_sample_ints
 
@@ -374,40 +521,7 @@ def train_document_dbow(model, doc_words, doctag_indexes, alpha, work=None,
 
     # release GIL & train on the document
     with nogil:
-        for i in range(c.document_len):
-            if c.train_words:  # simultaneous skip-gram wordvec-training
-                j = i - c.window + c.reduced_windows[i]
-                if j < 0:
-                    j = 0
-                k = i + c.window + 1 - c.reduced_windows[i]
-                if k > c.document_len:
-                    k = c.document_len
-                for j in range(j, k):
-                    if j == i:
-                        continue
-                    if c.hs:
-                        # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
-                        fast_document_dbow_hs(c.points[i], c.codes[i], c.codelens[i], c.word_vectors, c.syn1, c.layer1_size,
-                                              c.indexes[j], c.alpha, c.work, c.learn_words, c.learn_hidden, c.words_lockf,
-                                              c.words_lockf_len)
-                    if c.negative:
-                        # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
-                        c.next_random = fast_document_dbow_neg(c.negative, c.cum_table, c.cum_table_len, c.word_vectors,
-                                                               c.syn1neg, c.layer1_size, c.indexes[i], c.indexes[j],
-                                                               c.alpha, c.work, c.next_random, c.learn_words,
-                                                               c.learn_hidden, c.words_lockf, c.words_lockf_len)
-
-            # docvec-training
-            for j in range(c.doctag_len):
-                if c.hs:
-                    fast_document_dbow_hs(c.points[i], c.codes[i], c.codelens[i], c.doctag_vectors, c.syn1, c.layer1_size,
-                                          c.doctag_indexes[j], c.alpha, c.work, c.learn_doctags, c.learn_hidden, c.doctags_lockf,
-                                          c.doctags_lockf_len)
-                if c.negative:
-                    c.next_random = fast_document_dbow_neg(c.negative, c.cum_table, c.cum_table_len, c.doctag_vectors,
-                                                           c.syn1neg, c.layer1_size, c.indexes[i], c.doctag_indexes[j],
-                                                           c.alpha, c.work, c.next_random, c.learn_doctags,
-                                                           c.learn_hidden, c.doctags_lockf, c.doctags_lockf_len)
+        dbow_document(&c)
 
     return result
 
@@ -462,8 +576,7 @@ def train_document_dm(model, doc_words, doctag_indexes, alpha, work=None, neu1=N
     """
     cdef Doc2VecConfig c
 
-    cdef REAL_t count, inv_count = 1.0
-    cdef int i, j, k, m
+    cdef int i
     cdef long result = 0
     cdef np.uint32_t *vocab_sample_ints
 
@@ -506,53 +619,7 @@ def train_document_dm(model, doc_words, doctag_indexes, alpha, work=None, neu1=N
 
     # release GIL & train on the document
     with nogil:
-        for i in range(c.document_len):
-            j = i - c.window + c.reduced_windows[i]
-            if j < 0:
-                j = 0
-            k = i + c.window + 1 - c.reduced_windows[i]
-            if k > c.document_len:
-                k = c.document_len
-
-            # compose l1 (in _neu1) & clear _work
-            memset(c.neu1, 0, c.layer1_size * cython.sizeof(REAL_t))
-            count = <REAL_t>0.0
-            for m in range(j, k):
-                if m == i:
-                    continue
-                else:
-                    count += ONEF
-                    our_saxpy(&c.layer1_size, &ONEF, &c.word_vectors[c.indexes[m] * c.layer1_size], &ONE, c.neu1, &ONE)
-            for m in range(c.doctag_len):
-                count += ONEF
-                our_saxpy(&c.layer1_size, &ONEF, &c.doctag_vectors[c.doctag_indexes[m] * c.layer1_size], &ONE, c.neu1, &ONE)
-            if count > (<REAL_t>0.5):
-                inv_count = ONEF/count
-            if c.cbow_mean:
-                sscal(&c.layer1_size, &inv_count, c.neu1, &ONE)  # (does this need BLAS-variants like saxpy?)
-            memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
-            if c.hs:
-                fast_document_dm_hs(c.points[i], c.codes[i], c.codelens[i], c.neu1, c.syn1, c.alpha, c.work,
-                                    c.layer1_size, c.learn_hidden)
-            if c.negative:
-                c.next_random = fast_document_dm_neg(c.negative, c.cum_table, c.cum_table_len, c.next_random,
-                                                     c.neu1, c.syn1neg, c.indexes[i], c.alpha, c.work, c.layer1_size,
-                                                     c.learn_hidden)
-
-            if not c.cbow_mean:
-                sscal(&c.layer1_size, &inv_count, c.work, &ONE)  # (does this need BLAS-variants like saxpy?)
-            # apply accumulated error in work
-            if c.learn_doctags:
-                for m in range(c.doctag_len):
-                    our_saxpy(&c.layer1_size, &c.doctags_lockf[c.doctag_indexes[m] % c.doctags_lockf_len], c.work,
-                              &ONE, &c.doctag_vectors[c.doctag_indexes[m] * c.layer1_size], &ONE)
-            if c.learn_words:
-                for m in range(j, k):
-                    if m == i:
-                        continue
-                    else:
-                         our_saxpy(&c.layer1_size, &c.words_lockf[c.indexes[m] % c.doctags_lockf_len], c.work, &ONE,
-                                   &c.word_vectors[c.indexes[m] * c.layer1_size], &ONE)
+        dm_document(&c)
 
     return result
 
@@ -607,7 +674,7 @@ def train_document_dm_concat(model, doc_words, doctag_indexes, alpha, work=None,
     """
     cdef Doc2VecConfig c
 
-    cdef int i, j, k, m, n
+    cdef int i
     cdef long result = 0
     cdef np.uint32_t *vocab_sample_ints
 
@@ -647,46 +714,135 @@ def train_document_dm_concat(model, doc_words, doctag_indexes, alpha, work=None,
 
     # release GIL & train on the document
     with nogil:
-        for i in range(c.document_len):
-            j = i - c.window      # negative OK: will pad with null word
-            k = i + c.window + 1  # past document end OK: will pad with null word
+        dm_concat_document(&c)
+
+    return result
+
+
+cdef unsigned long long mix_seed(unsigned long long seed) nogil:
+    """Scramble `seed` (splitmix64 finalizer), so that nearby seeds start unrelated random streams."""
+    seed = (seed ^ (seed >> 30)) * <unsigned long long>0xbf58476d1ce4e5b9ULL
+    seed = (seed ^ (seed >> 27)) * <unsigned long long>0x94d049bb133111ebULL
+    return (seed ^ (seed >> 31)) & 281474976710655ULL
 
-            # compose l1 & clear work
-            for m in range(c.doctag_len):
-                # doc vector(s)
-                memcpy(&c.neu1[m * c.vector_size], &c.doctag_vectors[c.doctag_indexes[m] * c.vector_size],
-                       c.vector_size * cython.sizeof(REAL_t))
-            n = 0
-            for m in range(j, k):
-                # word vectors in window
-                if m == i:
-                    continue
-                if m < 0 or m >= c.document_len:
-                    c.window_indexes[n] = c.null_word_index
-                else:
-                    c.window_indexes[n] = c.indexes[m]
-                n += 1
-            for m in range(2 * c.window):
-                memcpy(&c.neu1[(c.doctag_len + m) * c.vector_size], &c.word_vectors[c.window_indexes[m] * c.vector_size],
-                       c.vector_size * cython.sizeof(REAL_t))
-            memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
 
+cdef void infer_document(Doc2VecConfig *c, const DocumentWords *words, const np.uint32_t *vocab_sample_ints,
+                         const int sg, const int dm_concat, const REAL_t alpha, const REAL_t alpha_delta,
+                         const int epochs) nogil:
+    """Initialize the vector of the document in `words` from `c.next_random`, then train it for `epochs` passes."""
+    cdef int epoch, i, n
+    cdef REAL_t *vector = &c.doctag_vectors[c.doctag_indexes[0] * c.vector_size]
+
+    # small random values centered on zero, like pseudorandom_weak_vector()
+    for i in range(c.vector_size):
+        vector[i] = (<REAL_t>random_int32(&c.next_random) / <REAL_t>4294967296.0 - <REAL_t>0.5) / c.vector_size
+    if dm_concat and c.doctag_len != c.expected_doctag_len:
+        return  # same as train_document_dm_concat(): skip doc without expected number of tags
+
+    for epoch in range(epochs):
+        c.alpha = alpha - epoch * alpha_delta
+        n = 0
+        for i in range(words.length):
+            if c.sample and vocab_sample_ints[words.indexes[i]] < random_int32(&c.next_random):
+                continue
+            c.indexes[n] = words.indexes[i]
             if c.hs:
-                fast_document_dmc_hs(c.points[i], c.codes[i], c.codelens[i],
-                                     c.neu1, c.syn1, c.alpha, c.work,
-                                     c.layer1_size, c.vector_size, c.learn_hidden)
-            if c.negative:
-                c.next_random = fast_document_dmc_neg(c.negative, c.cum_table, c.cum_table_len, c.next_random,
-                                                      c.neu1, c.syn1neg, c.indexes[i], c.alpha, c.work,
-                                                      c.layer1_size, c.vector_size, c.learn_hidden)
-
-            if c.learn_doctags:
-                for m in range(c.doctag_len):
-                    our_saxpy(&c.vector_size, &c.doctags_lockf[c.doctag_indexes[m] % c.doctags_lockf_len], &c.work[m * c.vector_size],
-                              &ONE, &c.doctag_vectors[c.doctag_indexes[m] * c.vector_size], &ONE)
-            if c.learn_words:
-                for m in range(2 * c.window):
-                    our_saxpy(&c.vector_size, &c.words_lockf[c.window_indexes[m] % c.words_lockf_len], &c.work[(c.doctag_len + m) * c.vector_size],
-                              &ONE, &c.word_vectors[c.window_indexes[m] * c.vector_size], &ONE)
+                c.codelens[n] = words.codelens[i]
+                c.codes[n] = words.codes[i]
+                c.points[n] = words.points[i]
+            n += 1
+        c.document_len = n
+
+        if sg:
+            dbow_document(c)
+        elif dm_concat:
+            dm_concat_document(c)
+        else:
+            for i in range(n):
+                c.reduced_windows[i] = random_int32(&c.next_random) % c.window
+            dm_document(c)
+
+
+def infer_documents(model, documents, doctag_vectors, seeds, alpha, min_alpha, epochs):
+    """Infer vectors for new documents, releasing the GIL while training each of them.
+
+    Called internally from :meth:`~gensim.models.doc2vec.Doc2Vec.infer_vectors`, possibly from several threads
+    at once: only `doctag_vectors` is written to, the model itself is left unchanged.
+
+    Parameters
+    ----------
+    model : :class:`~gensim.models.doc2vec.Doc2Vec`
+        The trained model.
+    documents : list of list of str
+        The new documents. Each word will be looked up in the model's vocabulary.
+    doctag_vectors : numpy.ndarray
+        C-contiguous output matrix, with a row for each document in `documents`.
+    seeds : iterable of int
+        Non-negative seed for each document, from which its initial vector and all random draws during its
+        training are derived, together with the model's `seed`.
+    alpha : float
+        The initial learning rate.
+    min_alpha : float
+        The learning rate of the last epoch.
+    epochs : int
+        Number of times to train each document.
+
+    Returns
+    -------
+    int
+        Number of words in `documents` that were found in the model's vocabulary.
+
+    """
+    cdef Doc2VecConfig c
+    cdef DocumentWords *words
+    cdef np.uint32_t *vocab_sample_ints = NULL
+    cdef REAL_t start_alpha = alpha
+    cdef REAL_t alpha_delta = (alpha - min_alpha) / max(epochs - 1, 1)
+    cdef int num_epochs = epochs, sg = model.sg, dm_concat = model.dm_concat
+    cdef unsigned long long model_seed = model.seed & 0xffffffff, seed
+    cdef int i
+    cdef long result = 0
+
+    # keep references to the working memory, for as long as the config points into it
+    work = zeros(model.layer1_size, dtype=REAL)
+    neu1 = zeros(model.layer1_size, dtype=REAL)
+    doctags_lockf = np.ones(1, dtype=REAL)
+    init_d2v_config(&c, model, alpha, learn_doctags=True, learn_words=False, learn_hidden=False, train_words=False,
+                    work=work, neu1=neu1, word_vectors=None, words_lockf=None,
+                    doctag_vectors=doctag_vectors, doctags_lockf=doctags_lockf)
+    c.doctag_len = 1
+    if c.sample:
+        vocab_sample_ints = <np.uint32_t *>np.PyArray_DATA(model.wv.expandos['sample_int'])
+    if c.hs:
+        vocab_codes = model.wv.expandos['code']
+        vocab_points = model.wv.expandos['point']
+
+    words = <DocumentWords *>PyMem_Malloc(cython.sizeof(DocumentWords))
+    if words == NULL:
+        raise MemoryError()
+    try:
+        for row, (doc_words, seed) in enumerate(zip(documents, seeds)):
+            i = 0
+            for token in doc_words:
+                word_index = model.wv.key_to_index.get(token, None)
+                if word_index is None:  # shrink document to leave out word
+                    continue  # leaving i unchanged
+                words.indexes[i] = word_index
+                if c.hs:
+                    words.codelens[i] = <int>len(vocab_codes[word_index])
+                    words.codes[i] = <np.uint8_t *>np.PyArray_DATA(vocab_codes[word_index])
+                    words.points[i] = <np.uint32_t *>np.PyArray_DATA(vocab_points[word_index])
+                i += 1
+                if i == MAX_DOCUMENT_LEN:
+                    break  # TODO: log warning, tally overflow?
+            words.length = i
+            result += i
+
+            c.doctag_indexes[0] = row
+            c.next_random = mix_seed(model_seed * <unsigned long long>0x9e3779b97f4a7c15ULL + seed)
+            with nogil:
+                infer_document(&c, words, vocab_sample_ints, sg, dm_concat, start_alpha, alpha_delta, num_epochs)
+    finally:
+        PyMem_Free(words)
 
     return result
@@ -244,22 +244,26 @@ And on word analogies:
 """
 
 import logging
+import threading
+from collections import OrderedDict, namedtuple
 
 import numpy as np
 from numpy import ones, vstack, float32 as REAL
 
 import gensim.models._fasttext_bin
-from gensim.models.word2vec import Word2Vec
+from gensim.models.word2vec import Word2Vec, _IndexedBatch
 from gensim.models.keyedvectors import KeyedVectors, prep_vectors
-from gensim import utils
+from gensim import utils, matutils
 from gensim.utils import deprecated
 try:
     from gensim.models.fasttext_inner import (  # noqa: F401
         train_batch_any,
+        train_batch_indexed,
         MAX_WORDS_IN_BATCH,
         compute_ngrams,
         compute_ngrams_bytes,
         ft_hash_bytes,
+        ft_ngram_hashes_batch,
     )
     from gensim.models.fasttext_corpusfile import train_epoch_sg, train_epoch_cbow
 except ImportError:
@@ -268,6 +272,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+#: How many out-of-vocabulary words :meth:`FastTextKeyedVectors.get_vectors` composes at once, bounding the
+#: temporary array of their gathered ngram vectors.
+OOV_BATCH_WORDS = 1024
+
+_OovCacheInfo = namedtuple('OovCacheInfo', 'hits misses maxsize currsize')
+
 
 class FastText(Word2Vec):
 
@@ -276,7 +286,7 @@ class FastText(Word2Vec):
                  max_vocab_size=None, word_ngrams=1, sample=1e-3, seed=1, workers=3, min_alpha=0.0001,
                  negative=5, ns_exponent=0.75, cbow_mean=1, hashfxn=hash, epochs=5, null_word=0, min_n=3, max_n=6,
                  sorted_vocab=1, bucket=2000000, trim_rule=None, batch_words=MAX_WORDS_IN_BATCH, callbacks=(),
-                 max_final_vocab=None):
+                 max_final_vocab=None, vocab_sketch=False):
         """Train, use and evaluate word representations learned using the method
         described in `Enriching Word Vectors with Subword Information <https://arxiv.org/abs/1607.04606>`_,
         aka FastText.
@@ -326,6 +336,9 @@ class FastText(Word2Vec):
             Limits the RAM during vocabulary building; if there are more unique
             words than this, then prune the infrequent ones. Every 10 million word types need about 1GB of RAM.
             Set to `None` for no limit.
+        vocab_sketch : bool, optional
+            If True, count at most `max_vocab_size` distinct words with a Space-Saving sketch instead of pruning,
+            see :class:`~gensim.models.word2vec.Word2Vec`.
         sample : float, optional
             The threshold for configuring which higher-frequency words are randomly downsampled,
             useful range is (0, 1e-5).
@@ -429,7 +442,7 @@ class FastText(Word2Vec):
         super(FastText, self).__init__(
             sentences=sentences, corpus_file=corpus_file, workers=workers, vector_size=vector_size, epochs=epochs,
             callbacks=callbacks, batch_words=batch_words, trim_rule=trim_rule, sg=sg, alpha=alpha, window=window,
-            max_vocab_size=max_vocab_size, max_final_vocab=max_final_vocab,
+            max_vocab_size=max_vocab_size, max_final_vocab=max_final_vocab, vocab_sketch=vocab_sketch,
             min_count=min_count, sample=sample, sorted_vocab=sorted_vocab,
             null_word=null_word, ns_exponent=ns_exponent, hashfxn=hashfxn,
             seed=seed, hs=hs, negative=negative, cbow_mean=cbow_mean, min_alpha=min_alpha)
@@ -454,11 +467,22 @@ class FastText(Word2Vec):
 
         self.layer1_size = vector_size
 
+    def _check_training_sanity(self, *args, **kwargs):
+        if self.wv.ngram_buckets is not None:
+            raise RuntimeError("cannot train a model whose ngram vectors were compressed")
+        super(FastText, self)._check_training_sanity(*args, **kwargs)
+
     def _clear_post_train(self):
         """Clear any cached values that training may have invalidated."""
         super(FastText, self)._clear_post_train()
         self.wv.adjust_vectors()  # ensure composite-word vecs reflect latest training
 
+    def _checkpoint_arrays(self):
+        arrays = super(FastText, self)._checkpoint_arrays()
+        arrays['wv.vectors_vocab'] = self.wv.vectors_vocab
+        arrays['wv.vectors_ngrams'] = self.wv.vectors_ngrams
+        return arrays
+
     def estimate_memory(self, vocab_size=None, report=None):
         """Estimate memory that will be needed to train a model, and print the estimates to log."""
         vocab_size = vocab_size or len(self.wv)
@@ -513,6 +537,7 @@ class FastText(Word2Vec):
             consider an iterable that streams the sentences directly from disk/network.
             See :class:`~gensim.models.word2vec.BrownCorpus`, :class:`~gensim.models.word2vec.Text8Corpus`
             or :class:`~gensim.models.word2vec.LineSentence` in :mod:`~gensim.models.word2vec` module for such examples.
+            May also be a batch of sentences already converted to vocabulary indexes.
         alpha : float
             The current learning rate.
         inits : tuple of (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
@@ -525,6 +550,9 @@ class FastText(Word2Vec):
 
         """
         work, neu1 = inits
+        if isinstance(sentences, _IndexedBatch):
+            tally = train_batch_indexed(self, sentences.indexes, sentences.offsets, alpha, work, neu1)
+            return tally, sentences.raw_words
         tally = train_batch_any(self, sentences, alpha, work, neu1)
 
         return tally, self._raw_word_count(sentences)
@@ -907,6 +935,8 @@ def save_facebook_model(model, path, encoding="utf-8", lr_update_rate=100, word_
     -------
     None
     """
+    if model.wv.ngram_buckets is not None:
+        raise ValueError("cannot save compressed ngram vectors in the Facebook format")
     fb_fasttext_parameters = {"lr_update_rate": lr_update_rate, "word_ngrams": word_ngrams}
     gensim.models._fasttext_bin.save(model, path, fb_fasttext_parameters, encoding)
 
@@ -956,6 +986,18 @@ class FastTextKeyedVectors(KeyedVectors):
             Columns correspond to vector dimensions.
         buckets_word : list of np.array
             For each key (by its index), report bucket slots their subwords map to.
+        ngram_buckets : np.array
+            Set by :meth:`~gensim.models.fasttext.FastTextKeyedVectors.compress_ngrams`: the sorted buckets
+            still backed by a vector, `ngram_buckets[i]` being stored in row `i` of `vectors_ngrams`
+            (or `vectors_ngrams_codes`). None while all `bucket` buckets are stored.
+        vectors_ngrams_codes : np.array
+            Set by :meth:`~gensim.models.fasttext.FastTextKeyedVectors.compress_ngrams` with `subvectors`:
+            the product-quantized directions of the ngram vectors, replacing `vectors_ngrams`. Each row holds one
+            centroid index per subvector, into the matching codebook of `vectors_ngrams_codebooks`; the lengths
+            of the vectors are kept in `vectors_ngrams_norms`.
+        oov_cache_size : int
+            Maximum number of composed out-of-vocabulary vectors kept in memory, see
+            :meth:`~gensim.models.fasttext.FastTextKeyedVectors.set_oov_cache_size`. 0 (default) disables caching.
 
         When used in training, FastTextKeyedVectors may be decorated with
         extra attributes that closely associate with its core attributes,
@@ -971,6 +1013,42 @@ class FastTextKeyedVectors(KeyedVectors):
         self.vectors_vocab = np.zeros((count, vector_size), dtype=dtype)  # fka (formerly known as) syn0_vocab
         self.vectors_ngrams = None  # must be initialized later
         self.compatible_hash = True
+        self.ngram_buckets = None  # all buckets stored, until compress_ngrams()
+        self.vectors_ngrams_codes = None
+        self.vectors_ngrams_codebooks = None
+        self.vectors_ngrams_norms = None
+        self._oov_cache = _OovVectorCache(0)
+
+    @property
+    def oov_cache_size(self):
+        return self._oov_cache.maxsize
+
+    def set_oov_cache_size(self, maxsize):
+        """Keep up to `maxsize` composed out-of-vocabulary vectors in memory, evicting the least recently used.
+
+        Useful when the same unknown words are looked up repeatedly, e.g. while vectorizing a stream of
+        documents. The cache is emptied whenever the vectors change (after training or loading).
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of cached vectors. 0 disables the cache.
+
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative, got %r" % maxsize)
+        self._oov_cache = _OovVectorCache(maxsize)
+
+    def oov_cache_info(self):
+        """Report statistics of the out-of-vocabulary vector cache.
+
+        Returns
+        -------
+        namedtuple
+            `(hits, misses, maxsize, currsize)`, like :func:`functools.lru_cache`'s `cache_info()`.
+
+        """
+        return self._oov_cache.info()
 
     @classmethod
     def load(cls, fname_or_handle, **kwargs):
@@ -1013,6 +1091,15 @@ class FastTextKeyedVectors(KeyedVectors):
             self.vectors_vocab_lockf = ones(1, dtype=REAL)
         if len(self.vectors_ngrams_lockf.shape) > 1:
             self.vectors_ngrams_lockf = ones(1, dtype=REAL)
+        if not hasattr(self, '_oov_cache'):
+            self._oov_cache = _OovVectorCache(0)
+        if not hasattr(self, 'ngram_buckets'):
+            self.ngram_buckets = None
+            self.vectors_ngrams_codes = None
+            self.vectors_ngrams_codebooks = None
+            self.vectors_ngrams_norms = None
+        if self.ngram_buckets is not None:
+            return  # compressed: `vectors` were saved, and there's no more training
         if not hasattr(self, 'buckets_word') or not self.buckets_word:
             self.recalc_char_ngram_buckets()
         if not hasattr(self, 'vectors') or self.vectors is None:
@@ -1070,9 +1157,20 @@ class FastTextKeyedVectors(KeyedVectors):
         """Arrange any special handling for the gensim.utils.SaveLoad protocol"""
         # don't save properties that are merely calculated from others
         ignore = set(ignore).union(['buckets_word', 'vectors', ])
+        if self.ngram_buckets is not None:
+            ignore.discard('vectors')  # can't be recalculated from the compressed ngram vectors
         return super(FastTextKeyedVectors, self)._save_specials(
             fname, separately, sep_limit, ignore, pickle_protocol, compress, subname)
 
+    def __getitem__(self, word_or_words):
+        """Get vector representation of `word_or_words`, see
+        :meth:`~gensim.models.fasttext.FastTextKeyedVectors.get_vectors` for lists of words.
+
+        """
+        if isinstance(word_or_words, keyedvectors.KEY_TYPES):
+            return self.get_vector(word_or_words)
+        return self.get_vectors(word_or_words)
+
     def get_vector(self, word, norm=False):
         """Get `word` representations in vector space, as a 1D numpy array.
 
@@ -1096,32 +1194,221 @@ class FastTextKeyedVectors(KeyedVectors):
         """
         if word in self.key_to_index:
             return super(FastTextKeyedVectors, self).get_vector(word, norm=norm)
-        elif self.bucket == 0:
-            raise KeyError('cannot calculate vector for OOV word without ngrams')
-        else:
-            word_vec = np.zeros(self.vectors_ngrams.shape[1], dtype=np.float32)
-            ngram_weights = self.vectors_ngrams
-            ngram_hashes = ft_ngram_hashes(word, self.min_n, self.max_n, self.bucket)
-            if len(ngram_hashes) == 0:
-                #
-                # If it is impossible to extract _any_ ngrams from the input
-                # word, then the best we can do is return a vector that points
-                # to the origin.  The reference FB implementation does this,
-                # too.
-                #
-                # https://github.com/RaRe-Technologies/gensim/issues/2402
-                #
-                logger.warning('could not extract any ngrams from %r, returning origin vector', word)
-                return word_vec
-            for nh in ngram_hashes:
-                word_vec += ngram_weights[nh]
-            if norm:
-                return word_vec / np.linalg.norm(word_vec)
+        return self.get_vectors([word], norm=norm)[0]
+
+    def get_vectors(self, words, norm=False):
+        """Get the representations of many words at once, as a 2D numpy array.
+
+        Equivalent to stacking :meth:`~gensim.models.fasttext.FastTextKeyedVectors.get_vector` for each word,
+        but the ngrams of all out-of-vocabulary words are hashed in a single pass and their vectors summed
+        with one vectorized gather-reduce, rather than word by word in Python.
+
+        Parameters
+        ----------
+        words : iterable of str
+            Input words, in- or out-of-vocabulary.
+        norm : bool, optional
+            If True, resulting vectors will be L2-normalized (unit Euclidean length).
+
+        Returns
+        -------
+        numpy.ndarray
+            Vector representations of `words`, one row per word.
+
+        Raises
+        ------
+        KeyError
+            If some word is out of vocabulary and the model has no ngrams.
+
+        """
+        words = list(words)
+        result = np.empty((len(words), self.vector_size), dtype=self.vectors.dtype)
+        oov_positions = []
+        vocab_positions, vocab_indexes = [], []
+        for position, word in enumerate(words):
+            index = self.key_to_index.get(word, -1)
+            if index >= 0:
+                vocab_positions.append(position)
+                vocab_indexes.append(index)
             else:
-                return word_vec / len(ngram_hashes)
+                oov_positions.append(position)
+
+        if vocab_positions:
+            result[vocab_positions] = self.vectors[vocab_indexes]
+            if norm:
+                self.fill_norms()
+                result[vocab_positions] /= self.norms[vocab_indexes, np.newaxis]
+
+        if oov_positions:
+            if self.bucket == 0:
+                raise KeyError('cannot calculate vector for OOV word without ngrams')
+            cache = self._oov_cache
+            missing = {}  # word => positions where it occurs
+            for position in oov_positions:
+                word = words[position]
+                vector = cache.get(word)
+                if vector is None:
+                    missing.setdefault(word, []).append(position)
+                else:
+                    result[position] = vector
+            missing_words = list(missing)
+            for start in range(0, len(missing_words), OOV_BATCH_WORDS):
+                batch = missing_words[start:start + OOV_BATCH_WORDS]
+                for word, vector in zip(batch, self._compose_oov_vectors(batch)):
+                    result[missing[word]] = vector
+                    cache.put(word, vector)
+            if norm:
+                oov_norms = np.linalg.norm(result[oov_positions], axis=1)
+                oov_norms[oov_norms == 0.0] = 1.0  # leave origin vectors as they are
+                result[oov_positions] /= oov_norms[:, np.newaxis]
+
+        return result
+
+    def _compose_oov_vectors(self, words):
+        """Average the ngram vectors of each of `words`, as a 2D numpy array."""
+        hashes, offsets = ft_ngram_hashes_batch(words, self.min_n, self.max_n, self.bucket)
+        counts = np.diff(offsets)
+        vectors = np.zeros((len(words), self.vector_size), dtype=np.float32)
+        has_ngrams = counts > 0
+        if not has_ngrams.all():
+            #
+            # If it is impossible to extract _any_ ngrams from the input
+            # word, then the best we can do is return a vector that points
+            # to the origin.  The reference FB implementation does this,
+            # too.
+            #
+            # https://github.com/RaRe-Technologies/gensim/issues/2402
+            #
+            for word in (word for word, ok in zip(words, has_ngrams) if not ok):
+                logger.warning('could not extract any ngrams from %r, returning origin vector', word)
+        if self.ngram_buckets is not None:
+            # skip the ngrams of pruned buckets, like the reference implementation does for pruned models
+            rows = np.searchsorted(self.ngram_buckets, hashes)
+            found = rows < len(self.ngram_buckets)
+            found[found] = self.ngram_buckets[rows[found]] == hashes[found]
+            hashes = rows[found]
+            offsets = np.concatenate(([0], np.cumsum(found)))[offsets]
+            counts = np.diff(offsets)
+            has_ngrams = counts > 0
+        if len(hashes):
+            # empty segments in between the starts of non-empty ones contribute nothing to the sums
+            sums = np.add.reduceat(self._ngram_vectors(hashes), offsets[:-1][has_ngrams], axis=0)
+            vectors[has_ngrams] = sums / counts[has_ngrams, np.newaxis]
+        return vectors
+
+    def _ngram_vectors(self, rows):
+        """Get the ngram vectors stored in `rows`, decoding product-quantized ones."""
+        if self.vectors_ngrams_codes is None:
+            return self.vectors_ngrams[rows]
+        codebooks = self.vectors_ngrams_codebooks
+        decoded = codebooks[np.arange(len(codebooks)), self.vectors_ngrams_codes[rows]]
+        return decoded.reshape(len(rows), self.vector_size) * self.vectors_ngrams_norms[rows, np.newaxis]
+
+    def compress_ngrams(
+            self, sentences=None, min_count=1, max_buckets=None, subvectors=None, centroids=256, epochs=25, seed=0,
+        ):
+        """Shrink the ngram vectors for compact deployment, similar to the `quantize` command of Facebook's fastText.
+
+        Buckets that no word of the vocabulary nor of the `sentences` sample maps to, or fewer than `min_count`
+        times, are dropped; the remaining ones are looked up through the compact `ngram_buckets` table. Their
+        vectors can then also be product-quantized: the direction of each vector is split into `subvectors`
+        parts, each part replaced by the index of its nearest centroid, learned by k-means, while its length is
+        kept as is. With the default 256 centroids, each part takes a single byte.
+
+        The vectors of vocabulary words are kept as they are. Out-of-vocabulary words average the vectors of
+        their ngrams still stored, so they are only affected by ngrams seen neither in the vocabulary nor in
+        `sentences`, and by the quantization error.
+
+        After compression the vectors can be saved, loaded and queried as usual, but the model can no longer be
+        trained, nor saved in Facebook's format.
+
+        Parameters
+        ----------
+        sentences : iterable of list of str, optional
+            A sample of the text the vectors will be queried with, whose words' ngrams should be kept.
+        min_count : int, optional
+            Keep buckets hit at least this many times, counting each vocabulary word once and each word
+            occurrence in `sentences`. 0 keeps all buckets.
+        max_buckets : int, optional
+            Keep at most this many buckets: the most frequently hit ones, preferring larger vectors among
+            equally frequent ones.
+        subvectors : int, optional
+            Product-quantize the kept vectors, into this many parts. Must divide `vector_size`.
+            If None, the vectors are kept as they are.
+        centroids : int, optional
+            Number of centroids for each part, between 1 and 256.
+        epochs : int, optional
+            Number of k-means iterations used to learn the centroids.
+        seed : int, optional
+            Seed for sampling the k-means points and initial centroids.
+
+        """
+        if self.ngram_buckets is not None:
+            raise RuntimeError("ngram vectors are already compressed")
+        if subvectors is not None and (subvectors <= 0 or self.vector_size % subvectors):
+            raise ValueError(f"subvectors must divide vector_size {self.vector_size}, got {subvectors}")
+        if not 1 <= centroids <= 256:
+            raise ValueError(f"centroids must be between 1 and 256, got {centroids}")
+
+        hits = self._count_ngram_hits(sentences)
+        kept = np.flatnonzero(hits >= min_count)
+        if max_buckets is not None and len(kept) > max_buckets:
+            norms = np.linalg.norm(self.vectors_ngrams[kept], axis=1)
+            kept = np.sort(kept[np.lexsort((-norms, -hits[kept]))[:max_buckets]])
+        vectors_ngrams = self.vectors_ngrams[kept]
+
+        if subvectors:
+            # quantize the directions and keep the lengths, like fastText's `-qnorm`: the lengths of ngram vectors
+            # vary too much for a shared set of centroids
+            norms = np.linalg.norm(vectors_ngrams, axis=1)
+            directions = vectors_ngrams / np.where(norms > 0.0, norms, 1.0)[:, np.newaxis]
+            rng = np.random.default_rng(seed=seed)
+            self.vectors_ngrams_codes, self.vectors_ngrams_codebooks = matutils.product_quantize(
+                directions, subvectors, centroids, epochs, rng,
+            )
+            self.vectors_ngrams_norms = norms.astype(REAL)
+            self.vectors_ngrams = None
+        else:
+            self.vectors_ngrams = vectors_ngrams
+        self.ngram_buckets = kept.astype(np.uint32)
+        # only needed for training
+        self.vectors_vocab = None
+        self.buckets_word = None
+        self._oov_cache.clear()
+
+        self.add_lifecycle_event(
+            "compress_ngrams",
+            msg=(
+                f"kept {len(kept)} of {self.bucket} ngram buckets"
+                + (f", quantized to {subvectors}x{centroids} centroids" if subvectors else "")
+            ),
+        )
+
+    def _count_ngram_hits(self, sentences=None):
+        """Count how many times each bucket is hit by the vocabulary (once per word) and by `sentences`."""
+        hits = np.zeros(self.bucket, dtype=np.int64)
+
+        def count(words):
+            hashes, _ = ft_ngram_hashes_batch(words, self.min_n, self.max_n, self.bucket)
+            hits[:] += np.bincount(hashes, minlength=self.bucket)
+
+        batch_words = 65536
+        for start in range(0, len(self.index_to_key), batch_words):
+            count(self.index_to_key[start:start + batch_words])
+        if sentences is not None:
+            words = []
+            for sentence in sentences:
+                words.extend(sentence)
+                if len(words) >= batch_words:
+                    count(words)
+                    words = []
+            count(words)
+        return hits
 
     def resize_vectors(self, seed=0):
         """Make underlying vectors match 'index_to_key' size; random-initialize any new rows."""
+        if self.ngram_buckets is not None:
+            raise RuntimeError("cannot resize compressed ngram vectors, see compress_ngrams()")
 
         vocab_shape = (len(self.index_to_key), self.vector_size)
         # Unlike in superclass, 'vectors_vocab' array is primary with 'vectors' derived from it & ngrams
@@ -1131,6 +1418,7 @@ class FastTextKeyedVectors(KeyedVectors):
 
         self.allocate_vecattrs()
         self.norms = None
+        self._drop_quantized()
         self.recalc_char_ngram_buckets()  # ensure new words have precalc buckets
         self.adjust_vectors()  # ensure `vectors` filled as well (though may be nonsense pre-training)
 
@@ -1170,6 +1458,9 @@ class FastTextKeyedVectors(KeyedVectors):
         implementation behavior.
 
         """
+        self._oov_cache.clear()  # composed from the previous ngram vectors
+        if self.ngram_buckets is not None:
+            return  # `vectors` were composed before compression, and can't change anymore
         if self.bucket == 0:
             self.vectors = self.vectors_vocab  # no ngrams influence
             return
@@ -1200,6 +1491,58 @@ class FastTextKeyedVectors(KeyedVectors):
            )
 
 
+class _OovVectorCache:
+    """Bounded, thread-safe LRU cache of composed out-of-vocabulary vectors, with hit/miss counters.
+
+    Pickles as an empty cache of the same size.
+
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._vectors = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(state['maxsize'])
+
+    def get(self, word):
+        """Return the cached vector of `word`, or None."""
+        if not self.maxsize:
+            return None
+        with self._lock:
+            vector = self._vectors.get(word)
+            if vector is None:
+                self.misses += 1
+            else:
+                self._vectors.move_to_end(word)
+                self.hits += 1
+            return vector
+
+    def put(self, word, vector):
+        if not self.maxsize:
+            return
+        vector = np.array(vector)
+        vector.setflags(write=False)
+        with self._lock:
+            self._vectors[word] = vector
+            self._vectors.move_to_end(word)
+            while len(self._vectors) > self.maxsize:
+                self._vectors.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._vectors.clear()
+
+    def info(self):
+        with self._lock:
+            return _OovCacheInfo(self.hits, self.misses, self.maxsize, len(self._vectors))
+
+
 def _pad_random(m, new_rows, rand):
     """Pad a matrix with additional rows filled with random values."""
     _, columns = m.shape
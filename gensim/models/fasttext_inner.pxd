@@ -109,8 +109,8 @@ cdef struct FastTextConfig:
 
     # For negative sampling
     REAL_t *syn1neg
-    np.uint32_t *cum_table
-    unsigned long long cum_table_len
+    const np.uint32_t *alias_table
+    unsigned long long alias_table_len
     # for sampling (negative and frequent-word downsampling)
     unsigned long long next_random
 
@@ -55,7 +55,7 @@ from libc.string cimport memset
 #
 # The versions are as chosen in word2vec_inner.pyx, and aliased to `our_` functions
 
-from word2vec_inner cimport bisect_left, random_int32, scopy, sscal, \
+from word2vec_inner cimport alias_draw, random_int32, scopy, sscal, \
      REAL_t, our_dot, our_saxpy
 
 DEF MAX_SENTENCE_LEN = 10000
@@ -123,9 +123,7 @@ cdef void fasttext_fast_sentence_sg_neg(FastTextConfig *c, int i, int j) nogil:
             target_index = word_index
             label = ONEF
         else:
-            target_index = bisect_left(
-                c.cum_table, (c.next_random >> 16) % c.cum_table[c.cum_table_len-1], 0, c.cum_table_len)
-            c.next_random = (c.next_random * <unsigned long long>25214903917ULL + 11) & modulo
+            target_index = alias_draw(c.alias_table, c.alias_table_len, &c.next_random)
             if target_index == word_index:
                 continue
             label = <REAL_t>0.0
@@ -271,8 +269,7 @@ cdef void fasttext_fast_sentence_cbow_neg(FastTextConfig *c, int i, int j, int k
             target_index = word_index
             label = ONEF
         else:
-            target_index = bisect_left(c.cum_table, (c.next_random >> 16) % c.cum_table[c.cum_table_len-1], 0, c.cum_table_len)
-            c.next_random = (c.next_random * <unsigned long long>25214903917ULL + 11) & modulo
+            target_index = alias_draw(c.alias_table, c.alias_table_len, &c.next_random)
             if target_index == word_index:
                 continue
             label = <REAL_t>0.0
@@ -416,8 +413,8 @@ cdef void init_ft_config(FastTextConfig *c, model, alpha, _work, _neu1):
 
     if c.negative:
         c.syn1neg = <REAL_t *>(np.PyArray_DATA(model.syn1neg))
-        c.cum_table = <np.uint32_t *>(np.PyArray_DATA(model.cum_table))
-        c.cum_table_len = len(model.cum_table)
+        c.alias_table = <np.uint32_t *>(np.PyArray_DATA(model.alias_table))
+        c.alias_table_len = len(model.alias_table)
     if c.negative or c.sample:
         c.next_random = (2**24) * model.random.randint(0, 2**24) + model.random.randint(0, 2**24)
 
@@ -611,6 +608,99 @@ def train_batch_any(model, sentences, alpha, _work, _neu1):
     return num_words
 
 
+def train_batch_indexed(model, indexes, offsets, alpha, _work, _neu1):
+    """Update the model by training on a batch of sentences already converted to vocabulary indexes.
+
+    Unlike :func:`train_batch_any`, no vocabulary lookups are needed: only the subword buckets (and the
+    hierarchical softmax codes) of the words are fetched while holding the GIL.
+    Called internally from :meth:`~gensim.models.fasttext.FastText.train`.
+
+    Parameters
+    ----------
+    model : :class:`~gensim.models.fasttext.FastText`
+        Model to be trained.
+    indexes : np.ndarray of np.uint32
+        Vocabulary indexes of the in-vocabulary words of the sentences, concatenated.
+    offsets : np.ndarray of np.int64
+        Sentence boundaries: sentence number X spans `indexes[offsets[X]:offsets[X + 1]]`.
+    alpha : float
+        Learning rate.
+    _work : np.ndarray
+        Private working memory for each worker.
+    _neu1 : np.ndarray
+        Private working memory for each worker.
+
+    Returns
+    -------
+    int
+        Effective number of words trained.
+
+    """
+    cdef:
+        FastTextConfig c
+        np.uint32_t *vocab_sample_ints = NULL
+        np.uint32_t *word_indexes
+        np.int64_t *sentence_offsets
+        long long num_sentences, sent_idx, pos
+        np.uint32_t word_index
+        int num_words = 0
+        int effective_sentences = 0
+        int i
+
+    indexes = np.ascontiguousarray(indexes, dtype=np.uint32)
+    offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+    word_indexes = <np.uint32_t *>np.PyArray_DATA(indexes)
+    sentence_offsets = <np.int64_t *>np.PyArray_DATA(offsets)
+    num_sentences = len(offsets) - 1
+
+    init_ft_config(&c, model, alpha, _work, _neu1)
+    if c.sample:
+        vocab_sample_ints = <np.uint32_t *>np.PyArray_DATA(model.wv.expandos['sample_int'])
+
+    # downsample frequent words and cap the batch at MAX_SENTENCE_LEN words, as in populate_ft_config()
+    with nogil:
+        c.sentence_idx[0] = 0
+        for sent_idx in range(num_sentences):
+            for pos in range(sentence_offsets[sent_idx], sentence_offsets[sent_idx + 1]):
+                word_index = word_indexes[pos]
+                if c.sample and vocab_sample_ints[word_index] < random_int32(&c.next_random):
+                    continue
+                c.indexes[num_words] = word_index
+                num_words += 1
+                if num_words == MAX_SENTENCE_LEN:
+                    break
+            effective_sentences += 1
+            c.sentence_idx[effective_sentences] = num_words
+            if num_words == MAX_SENTENCE_LEN:
+                break
+
+    buckets_word = model.wv.buckets_word
+    if c.hs:
+        vocab_codes = model.wv.expandos['code']
+        vocab_points = model.wv.expandos['point']
+    for i in range(num_words):
+        word_index = c.indexes[i]
+        if model.wv.bucket:
+            c.subwords_idx_len[i] = <int>(len(buckets_word[word_index]))
+            c.subwords_idx[i] = <np.uint32_t *>np.PyArray_DATA(buckets_word[word_index])
+        else:
+            c.subwords_idx_len[i] = 0
+        if c.hs:
+            c.codelens[i] = <int>len(vocab_codes[word_index])
+            c.codes[i] = <np.uint8_t *>np.PyArray_DATA(vocab_codes[word_index])
+            c.points[i] = <np.uint32_t *>np.PyArray_DATA(vocab_points[word_index])
+
+    # precompute "reduced window" offsets in a single randint() call
+    for i, randint in enumerate(model.random.randint(0, c.window, num_words)):
+        c.reduced_windows[i] = randint
+
+    # release GIL & train on all sentences in the batch
+    with nogil:
+        fasttext_train_any(&c, effective_sentences)
+
+    return num_words
+
+
 cpdef ft_hash_bytes(bytes bytez):
     """Calculate hash based on `bytez`.
     Reproduce `hash method from Facebook fastText implementation
@@ -715,6 +805,66 @@ cpdef compute_ngrams_bytes(word, unsigned int min_n, unsigned int max_n):
     return ngrams
 
 
+def ft_ngram_hashes_batch(words, unsigned int min_n, unsigned int max_n, unsigned int num_buckets):
+    """Calculate the ngram buckets of many words in one pass, without building the ngrams themselves.
+
+    Gives the same buckets as :func:`~gensim.models.fasttext.ft_ngram_hashes` for each word, hashing each ngram
+    while walking over its UTF-8 bytes like :func:`~gensim.models.fasttext_inner.compute_ngrams_bytes`.
+
+    Parameters
+    ----------
+    words : iterable of str
+        The words.
+    min_n : unsigned int
+        The minimum ngram length.
+    max_n : unsigned int
+        The maximum ngram length.
+    num_buckets : unsigned int
+        The number of buckets, must be positive.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        The buckets of the ngrams of all words, as uint32, and the boundaries of each word's buckets in that
+        array, as int64: the buckets of word `k` are `buckets[offsets[k]:offsets[k + 1]]`.
+
+    """
+    encoded = [('<%s>' % word).encode("utf-8") for word in words]
+    # each character starts at most (max_n - min_n + 1) ngrams
+    capacity = sum(len(utf8_word) for utf8_word in encoded) * max(<int>max_n - <int>min_n + 1, 0)
+    buckets = np.empty(capacity, dtype=np.uint32)
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    cdef np.uint32_t *out = <np.uint32_t *>np.PyArray_DATA(buckets)
+    cdef np.int64_t *out_offsets = <np.int64_t *>np.PyArray_DATA(offsets)
+    cdef const unsigned char *bytez
+    cdef size_t num_bytes, i, j, n
+    cdef long long count = 0
+    cdef np.uint32_t h
+
+    for w, utf8_word in enumerate(encoded):
+        bytez = utf8_word
+        num_bytes = len(utf8_word)
+        with nogil:
+            for i in range(num_bytes):
+                if bytez[i] & _MB_MASK == _MB_START:
+                    continue
+
+                h = 2166136261  # hash of the ngram bytez[i:j], extended by each byte like ft_hash_bytes()
+                j, n = i, 1
+                while j < num_bytes and n <= max_n:
+                    h = (h ^ <np.uint32_t>(<np.int8_t>bytez[j])) * 16777619
+                    j += 1
+                    while j < num_bytes and (bytez[j] & _MB_MASK) == _MB_START:
+                        h = (h ^ <np.uint32_t>(<np.int8_t>bytez[j])) * 16777619
+                        j += 1
+                    if n >= min_n and not (n == 1 and (i == 0 or j == num_bytes)):
+                        out[count] = h % num_buckets
+                        count += 1
+                    n += 1
+        out_offsets[w + 1] = count
+    return buckets[:count], offsets
+
+
 def init():
     """Precompute function `sigmoid(x) = 1 / (1 + exp(-x))`, for x values discretized into table EXP_TABLE.
     Also calculate log(sigmoid(x)) into LOG_TABLE.
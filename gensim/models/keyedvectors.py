@@ -166,21 +166,26 @@ and so on.
 
 """
 
+import collections.abc
 import logging
+import mmap
+import multiprocessing
+import os
 import sys
 import itertools
 import warnings
+import zlib
 from numbers import Integral
 
 from numpy import (
     dot, float32 as REAL, double, array, zeros, vstack,
-    ndarray, sum as np_sum, prod, argmax, dtype, ascontiguousarray, frombuffer,
+    ndarray, sum as np_sum, prod, argmax, dtype, ascontiguousarray, frombuffer, empty,
 )
 import numpy as np
 from scipy import stats
+from scipy.spatial.distance import cdist
 
 from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
-from gensim.corpora.dictionary import Dictionary
 from gensim.utils import deprecated
 
 
@@ -216,7 +221,8 @@ class KeyedVectors(utils.SaveLoad):
             Vector dimensions will default to `np.float32` (AKA `REAL` in some Gensim code) unless
             another type is provided here.
         mapfile_path : string, optional
-            Currently unused.
+            Path to a file backing `vectors` through a `numpy.memmap`, rather than RAM, whenever they get
+            (re-)allocated by :meth:`~gensim.models.keyedvectors.KeyedVectors.resize_vectors`.
         """
         self.vector_size = vector_size
         # pre-allocating `index_to_key` to full size helps avoid redundant re-allocations, esp for `expandos`
@@ -227,6 +233,14 @@ class KeyedVectors(utils.SaveLoad):
         self.vectors = zeros((count, vector_size), dtype=dtype)  # formerly known as syn0
         self.norms = None
 
+        # optional scalar-quantized copy of the unit-normed vectors, see quantize_vectors()
+        self.vectors_quantized = None
+        self.quantized_scales = None
+        self.quantized_rerank = None
+
+        # optional compact store backing `key_to_index` and `index_to_key`, see compact_keys()
+        self.compact_key_index = None
+
         # "expandos" are extra attributes stored for each key: {attribute_name} => numpy array of values of
         # this attribute, with one array value for each vector key.
         # The same information used to be stored in a structure called Vocab in Gensim <4.0.0, but
@@ -252,6 +266,15 @@ class KeyedVectors(utils.SaveLoad):
         # ensure at least a 'None' in 'norms' to force recalc
         if not hasattr(self, 'norms'):
             self.norms = None
+        # ensure the (absent) quantized vectors of older models
+        if not hasattr(self, 'vectors_quantized'):
+            self.vectors_quantized = None
+            self.quantized_scales = None
+            self.quantized_rerank = None
+        if not hasattr(self, 'compact_key_index'):
+            self.compact_key_index = None
+        if not hasattr(self, 'mapfile_path'):
+            self.mapfile_path = None
         # ensure at least an empty 'expandos'
         if not hasattr(self, 'expandos'):
             self.expandos = {}
@@ -354,9 +377,10 @@ class KeyedVectors(utils.SaveLoad):
     def resize_vectors(self, seed=0):
         """Make underlying vectors match index_to_key size; random-initialize any new rows."""
         target_shape = (len(self.index_to_key), self.vector_size)
-        self.vectors = prep_vectors(target_shape, prior_vectors=self.vectors, seed=seed)
+        self.vectors = prep_vectors(target_shape, prior_vectors=self.vectors, seed=seed, mapfile_path=self.mapfile_path)
         self.allocate_vecattrs()
         self.norms = None
+        self._drop_quantized()
 
     def __len__(self):
         return len(self.index_to_key)
@@ -471,6 +495,7 @@ class KeyedVectors(utils.SaveLoad):
             self.index_to_key[target_index] = key
             self.key_to_index[key] = target_index
             self.vectors[target_index] = vector
+            self._drop_quantized()
             self.next_index += 1
         return target_index
 
@@ -514,6 +539,7 @@ class KeyedVectors(utils.SaveLoad):
 
         # add vectors, extras for new entities
         self.vectors = vstack((self.vectors, weights[~in_vocab_mask].astype(self.vectors.dtype)))
+        self._drop_quantized()
         for attr, extra in extras:
             self.expandos[attr] = np.vstack((self.expandos[attr], extra[~in_vocab_mask]))
 
@@ -615,9 +641,81 @@ class KeyedVectors(utils.SaveLoad):
         either recalculated or 'None', to trigger a full recalculation later on-request.
 
         """
+        if force:
+            self._drop_quantized()  # vectors changed
         if self.norms is None or force:
             self.norms = np.linalg.norm(self.vectors, axis=1)
 
+    def quantize_vectors(self, dtype=np.int8, rerank=4, chunksize=65536):
+        """Build a compact, scalar-quantized copy of the unit-normed vectors, to speed up similarity searches.
+
+        Once built, :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar` scans this smaller copy
+        to select candidates, and then reranks the candidates exactly against the full-precision `vectors`.
+        Scanning `int8` vectors reads 4x fewer bytes from memory than scanning `float32` vectors (`float16`: 2x).
+
+        The quantized copy is stored in the `vectors_quantized` attribute (plus a per-vector `quantized_scales`
+        for `int8`), so it's persisted by :meth:`~gensim.models.keyedvectors.KeyedVectors.save` and can be
+        memory-mapped by :meth:`~gensim.models.keyedvectors.KeyedVectors.load` like `vectors`.
+        Any modification of the vectors discards the quantized copy; call this method again to rebuild it.
+
+        Parameters
+        ----------
+        dtype : {numpy.int8, numpy.float16}, optional
+            Type of the quantized copy. `int8` stores each vector as 8-bit integers with a per-vector scale.
+            `None` drops any existing quantized copy.
+        rerank : int, optional
+            Rerank `rerank` times more candidates than requested from the quantized scan against the full
+            vectors. Higher values make the results more likely to exactly match a full-precision search.
+        chunksize : int, optional
+            Number of vectors to process at once, limiting the temporary memory used during quantization.
+
+        """
+        if dtype is None:
+            self._drop_quantized()
+            return
+        dtype = np.dtype(dtype)
+        if dtype not in (np.int8, np.float16):
+            raise ValueError(f"unsupported quantization type {dtype}, use numpy.int8 or numpy.float16")
+
+        self.fill_norms()
+        quantized = np.empty(self.vectors.shape, dtype=dtype)
+        scales = np.empty(len(self.vectors), dtype=REAL) if dtype == np.int8 else None
+        for start in range(0, len(self.vectors), chunksize):
+            chunk = self.vectors[start:start + chunksize] / self.norms[start:start + chunksize, np.newaxis]
+            if dtype == np.int8:
+                chunk_scales = np.abs(chunk).max(axis=1) / 127.0
+                chunk_scales[chunk_scales == 0.0] = 1.0  # leave zero vectors alone
+                chunk = np.rint(chunk / chunk_scales[:, np.newaxis])
+                scales[start:start + chunksize] = chunk_scales
+            quantized[start:start + chunksize] = chunk
+
+        self.vectors_quantized, self.quantized_scales, self.quantized_rerank = quantized, scales, rerank
+        self.add_lifecycle_event(
+            "quantize_vectors",
+            msg=f"quantized {quantized.shape} vectors to {dtype}",
+        )
+
+    def _quantized_similarities(self, vector, clip_start, clip_end):
+        """Approximate cosine similarities of `vector` to keys in `clip_start:clip_end`, from the quantized copy."""
+        quantized = np.ascontiguousarray(self.vectors_quantized[clip_start:clip_end])
+        if self.quantized_scales is None:
+            dists = np.empty(len(quantized), dtype=REAL)
+            matutils.quantized_dot(quantized, vector.astype(REAL), dists)
+            return dists
+        # quantize the query as well, so that the scan is an exact int8 dot product
+        vector_scale = np.abs(vector).max() / 127.0 or 1.0
+        products = np.empty(len(quantized), dtype=np.int32)
+        matutils.quantized_dot(quantized, np.rint(vector / vector_scale).astype(np.int8), products)
+        return products * (self.quantized_scales[clip_start:clip_end] * REAL(vector_scale))
+
+    def _drop_quantized(self):
+        """Discard the quantized copy of `vectors`, after they changed."""
+        self.vectors_quantized, self.quantized_scales, self.quantized_rerank = None, None, None
+
+    def _has_quantized(self):
+        """Is a quantized copy of `vectors`, built by `quantize_vectors()`, available and up to date?"""
+        return self.vectors_quantized is not None and len(self.vectors_quantized) == len(self.vectors)
+
     @property
     def index2entity(self):
         raise AttributeError(
@@ -653,6 +751,31 @@ class KeyedVectors(utils.SaveLoad):
     def vocab(self, value):
         self.vocab()  # trigger above NotImplementedError
 
+    def compact_keys(self):
+        """Replace the `key_to_index` dict and `index_to_key` list by read-only views of a compact key store.
+
+        For vocabularies of many millions of keys, the Python dict and list take several GB of RAM and make
+        :meth:`~gensim.models.keyedvectors.KeyedVectors.load` slow, as each key is a separate Python object to
+        unpickle. The :class:`~gensim.models.keyedvectors.CompactKeyIndex` store keeps all keys in a few numpy
+        arrays instead, which are saved separately and can be memory-mapped by
+        :meth:`~gensim.models.keyedvectors.KeyedVectors.load`. Key lookups are a few times slower.
+
+        Only string keys are supported. While keys are compact, no keys can be added: call
+        :meth:`~gensim.models.keyedvectors.KeyedVectors.expand_keys` first.
+
+        """
+        self.compact_key_index = CompactKeyIndex(self.index_to_key)
+        self.key_to_index = CompactKeyToIndex(self.compact_key_index)
+        self.index_to_key = CompactIndexToKey(self.compact_key_index)
+
+    def expand_keys(self):
+        """Undo :meth:`~gensim.models.keyedvectors.KeyedVectors.compact_keys`: restore a regular `key_to_index`
+        dict and `index_to_key` list."""
+        if self.compact_key_index is not None:
+            self.index_to_key = list(self.index_to_key)
+            self.key_to_index = {key: index for index, key in enumerate(self.index_to_key)}
+            self.compact_key_index = None
+
     def sort_by_descending_frequency(self):
         """Sort the vocabulary so the most frequent words have the lowest indexes."""
         if not len(self):
@@ -666,7 +789,10 @@ class KeyedVectors(utils.SaveLoad):
         if len(self.vectors):
             logger.warning("sorting after vectors have been allocated is expensive & error-prone")
             self.vectors = self.vectors[count_sorted_indexes]
+            self.norms = None
+            self._drop_quantized()
         self.key_to_index = {word: i for i, word in enumerate(self.index_to_key)}
+        self.compact_key_index = None
 
     def save(self, *args, **kwargs):
         """Save KeyedVectors to a file.
@@ -743,6 +869,49 @@ class KeyedVectors(utils.SaveLoad):
             # allow calls like most_similar('dog'), as a shorthand for most_similar(['dog'])
             positive = [positive]
 
+        mean, all_keys = self._query_mean(positive, negative)
+
+        if indexer is not None and isinstance(topn, int):
+            return indexer.most_similar(mean, topn)
+
+        if topn and self._has_quantized():
+            # select candidates from the compact quantized copy, then rerank them with the full vectors
+            approx_dists = self._quantized_similarities(mean, clip_start, clip_end)
+            candidates = matutils.argsort(
+                approx_dists, topn=(topn + len(all_keys)) * self.quantized_rerank, reverse=True,
+            )
+            candidates = np.asarray(candidates, dtype=np.int64) + clip_start
+            exact_dists = dot(self.vectors[candidates], mean) / self.norms[candidates]
+            best = matutils.argsort(exact_dists, topn=topn + len(all_keys), reverse=True)
+            result = [
+                (self.index_to_key[candidates[sim]], float(exact_dists[sim]))
+                for sim in best if candidates[sim] not in all_keys
+            ]
+            return result[:topn]
+
+        dists = dot(self.vectors[clip_start:clip_end], mean) / self.norms[clip_start:clip_end]
+        if not topn:
+            return dists
+        best = matutils.argsort(dists, topn=topn + len(all_keys), reverse=True)
+        # ignore (don't return) keys from the input
+        result = [
+            (self.index_to_key[sim + clip_start], float(dists[sim]))
+            for sim in best if (sim + clip_start) not in all_keys
+        ]
+        return result[:topn]
+
+    def _query_mean(self, positive, negative):
+        """Compute the unit-normed weighted mean of `positive` and `negative` keys or vectors.
+
+        Helper for :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar` and
+        :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar_batch`.
+
+        Returns
+        -------
+        (numpy.ndarray, set of int)
+            The query vector, and the set of indexes of the input keys, which shouldn't be returned as results.
+
+        """
         # add weights for each key, if not already present; default to 1.0 for positive and -1.0 for negative keys
         positive = [
             (item, 1.0) if isinstance(item, KEY_TYPES + (ndarray,))
@@ -765,20 +934,106 @@ class KeyedVectors(utils.SaveLoad):
         if not mean:
             raise ValueError("cannot compute similarity with no input")
         mean = matutils.unitvec(array(mean).mean(axis=0)).astype(REAL)
+        return mean, all_keys
 
-        if indexer is not None and isinstance(topn, int):
-            return indexer.most_similar(mean, topn)
+    def most_similar_batch(
+            self, queries, topn=10, clip_start=0, clip_end=None, restrict_vocab=None, batch_size=1024,
+        ):
+        """Find the top-N most similar keys for many queries at once.
+
+        Equivalent to calling :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar` once per query,
+        but the similarities for a whole block of queries are computed with a single matrix-matrix product,
+        and the top-N selection is done for all queries in the block together. This is much faster than
+        many single-query calls, which are dominated by Python overhead and memory-bound matrix-vector products.
+
+        Parameters
+        ----------
+        queries : iterable of {str, int, numpy.ndarray, list, (list, list)}
+            The queries. Each query is either a single key or vector; or a list of keys/vectors (optionally as
+            `(key, weight)` tuples) that contribute positively; or a `(positive, negative)` tuple of such lists,
+            as in the `positive` and `negative` parameters of
+            :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar`.
+        topn : int or None, optional
+            Number of top-N similar keys to return for each query, when `topn` is int. When `topn` is None,
+            similarities of all queries to all keys are returned.
+        clip_start : int
+            Start clipping index.
+        clip_end : int
+            End clipping index.
+        restrict_vocab : int, optional
+            Optional integer which limits the range of vectors which are searched for most-similar values.
+            If specified, overrides any values of ``clip_start`` or ``clip_end``.
+        batch_size : int, optional
+            Number of queries to process in a single matrix-matrix product. Larger blocks are faster,
+            but need `batch_size * len(self)` floats of temporary memory.
+
+        Returns
+        -------
+        list of list of (str, float) or numpy.ndarray
+            When `topn` is int, one sequence of (key, similarity) per query, in the order of `queries`.
+            When `topn` is None, a 2D numpy array of shape `(number_of_queries, number_of_keys)` with the
+            similarities of each query to each key.
+
+        """
+        if isinstance(topn, Integral) and topn < 1:
+            return [[] for _ in queries]
+
+        self.fill_norms()
+        clip_end = clip_end or len(self.vectors)
+
+        if restrict_vocab:
+            clip_start = 0
+            clip_end = restrict_vocab
+
+        means, ignored = [], []
+        for query in queries:
+            if isinstance(query, KEY_TYPES + (ndarray,)):
+                positive, negative = [query], []
+            elif isinstance(query, tuple) and len(query) == 2 and isinstance(query[0], list):
+                positive, negative = query
+            else:
+                positive, negative = query, []
+            mean, all_keys = self._query_mean(positive, negative)
+            means.append(mean)
+            ignored.append(all_keys)
+
+        if not means:
+            return [] if topn else zeros((0, clip_end - clip_start), dtype=REAL)
+
+        vectors = self.vectors[clip_start:clip_end]
+        norms = self.norms[clip_start:clip_end]
+        num_keys = len(vectors)
+
+        results, all_dists = [], []
+        for start in range(0, len(means), batch_size):
+            block = vstack(means[start:start + batch_size])
+            dists = dot(block, vectors.T) / norms
+            if not topn:
+                all_dists.append(dists)
+                continue
+
+            block_ignored = ignored[start:start + batch_size]
+            # ask for enough extra candidates to still have `topn` left after dropping each query's own inputs
+            k = min(topn + max(len(keys) for keys in block_ignored), num_keys)
+            if k < num_keys:
+                best = np.argpartition(-dists, k - 1, axis=1)[:, :k]
+            else:
+                best = np.tile(np.arange(num_keys), (len(block), 1))
+            best_dists = np.take_along_axis(dists, best, axis=1)
+            order = np.argsort(-best_dists, axis=1)
+            best = np.take_along_axis(best, order, axis=1)
+            best_dists = np.take_along_axis(best_dists, order, axis=1)
+
+            for row, keys in enumerate(block_ignored):
+                result = [
+                    (self.index_to_key[sim + clip_start], float(dist))
+                    for sim, dist in zip(best[row], best_dists[row]) if (sim + clip_start) not in keys
+                ]
+                results.append(result[:topn])
 
-        dists = dot(self.vectors[clip_start:clip_end], mean) / self.norms[clip_start:clip_end]
         if not topn:
-            return dists
-        best = matutils.argsort(dists, topn=topn + len(all_keys), reverse=True)
-        # ignore (don't return) keys from the input
-        result = [
-            (self.index_to_key[sim + clip_start], float(dists[sim]))
-            for sim in best if (sim + clip_start) not in all_keys
-        ]
-        return result[:topn]
+            return vstack(all_dists)
+        return results
 
     def similar_by_word(self, word, topn=10, restrict_vocab=None):
         """Compatibility alias for similar_by_key()."""
@@ -894,47 +1149,35 @@ class KeyedVectors(utils.SaveLoad):
             logger.warning("At least one of the documents had no words that were in the vocabulary.")
             return float('inf')
 
-        dictionary = Dictionary(documents=[document1, document2])
-        vocab_len = len(dictionary)
+        # Map the union of both documents' tokens to positions 0..vocab_len-1.
+        token_ids = {}
+        doc1_ids = [token_ids.setdefault(token, len(token_ids)) for token in document1]
+        doc2_ids = [token_ids.setdefault(token, len(token_ids)) for token in document2]
+        vocab_len = len(token_ids)
 
         if vocab_len == 1:
             # Both documents are composed of a single unique token => zero distance.
             return 0.0
 
-        # Sets for faster look-up.
-        docset1 = set(document1)
-        docset2 = set(document2)
+        # Compute the distance matrix in one go, from (potentially unit-normed) word vectors.
+        vectors = vstack([self.get_vector(token, norm=norm) for token in token_ids]).astype(double)
+        distance_matrix = cdist(vectors, vectors)
 
-        # Compute distance matrix.
-        distance_matrix = zeros((vocab_len, vocab_len), dtype=double)
-        for i, t1 in dictionary.items():
-            if t1 not in docset1:
-                continue
-
-            for j, t2 in dictionary.items():
-                if t2 not in docset2 or distance_matrix[i, j] != 0.0:
-                    continue
-
-                # Compute Euclidean distance between (potentially unit-normed) word vectors.
-                distance_matrix[i, j] = distance_matrix[j, i] = np.sqrt(
-                    np_sum((self.get_vector(t1, norm=norm) - self.get_vector(t2, norm=norm))**2))
+        # Only distances between a token of one document and a token of the other one matter.
+        in_doc1 = np.zeros(vocab_len, dtype=bool)
+        in_doc1[doc1_ids] = True
+        in_doc2 = np.zeros(vocab_len, dtype=bool)
+        in_doc2[doc2_ids] = True
+        distance_matrix[~(np.outer(in_doc1, in_doc2) | np.outer(in_doc2, in_doc1))] = 0.0
 
         if abs(np_sum(distance_matrix)) < 1e-8:
             # `emd` gets stuck if the distance matrix contains only zeros.
             logger.info('The distance matrix is all zeros. Aborting (returning inf).')
             return float('inf')
 
-        def nbow(document):
-            d = zeros(vocab_len, dtype=double)
-            nbow = dictionary.doc2bow(document)  # Word frequencies.
-            doc_len = len(document)
-            for idx, freq in nbow:
-                d[idx] = freq / float(doc_len)  # Normalized word frequencies.
-            return d
-
-        # Compute nBOW representation of documents. This is what pyemd expects on input.
-        d1 = nbow(document1)
-        d2 = nbow(document2)
+        # Compute nBOW representation of documents (normalized word frequencies). This is what pyemd expects on input.
+        d1 = np.bincount(doc1_ids, minlength=vocab_len) / float(len(document1))
+        d2 = np.bincount(doc2_ids, minlength=vocab_len) / float(len(document2))
 
         # Compute WMD.
         return emd(d1, d2, distance_matrix)
@@ -1203,7 +1446,10 @@ class KeyedVectors(utils.SaveLoad):
         logger.info("%s: %.1f%% (%i/%i)", section['section'], 100.0 * score, correct, correct + incorrect)
         return score
 
-    def evaluate_word_analogies(self, analogies, restrict_vocab=300000, case_insensitive=True, dummy4unknown=False):
+    def evaluate_word_analogies(
+            self, analogies, restrict_vocab=300000, case_insensitive=True, dummy4unknown=False,
+            similarity_function='3CosAdd', batch_size=64,
+        ):
         """Compute performance of the model on an analogy test set.
 
         The accuracy is reported (printed to log and returned as a score) for each section separately,
@@ -1229,6 +1475,12 @@ class KeyedVectors(utils.SaveLoad):
         dummy4unknown : bool, optional
             If True - produce zero accuracies for 4-tuples with out-of-vocabulary words.
             Otherwise, these tuples are skipped entirely and not used in the evaluation.
+        similarity_function : {'3CosAdd', '3CosMul'}, optional
+            Method used to find the answer of each analogy: the vector offset method of
+            :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar`, or the multiplicative combination of
+            :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar_cosmul`.
+        batch_size : int, optional
+            Number of analogies answered together, by a single matrix multiplication against the vocabulary.
 
         Returns
         -------
@@ -1240,6 +1492,8 @@ class KeyedVectors(utils.SaveLoad):
             keys 'correct' and 'incorrect'.
 
         """
+        if similarity_function not in ('3CosAdd', '3CosMul'):
+            raise ValueError(f"unknown similarity_function {similarity_function!r}, expected '3CosAdd' or '3CosMul'")
         ok_keys = self.index_to_key[:restrict_vocab]
         if case_insensitive:
             ok_vocab = {k.upper(): self.get_index(k) for k in reversed(ok_keys)}
@@ -1249,15 +1503,14 @@ class KeyedVectors(utils.SaveLoad):
         logger.info("Evaluating word analogies for top %i words in the model on %s", restrict_vocab, analogies)
         sections, section = [], None
         quadruplets_no = 0
+        # all 4-tuples in file order, with the position of their question in `questions` (None for OOV 4-tuples)
+        entries, questions = [], []
         with utils.open(analogies, 'rb') as fin:
             for line_no, line in enumerate(fin):
                 line = utils.to_unicode(line)
                 if line.startswith(': '):
-                    # a new section starts => store the old section
-                    if section:
-                        sections.append(section)
-                        self._log_evaluate_word_analogies(section)
                     section = {'section': line.lstrip(': ').strip(), 'correct': [], 'incorrect': []}
+                    sections.append(section)
                 else:
                     if not section:
                         raise ValueError("Missing section header before line #%i in %s" % (line_no, analogies))
@@ -1274,31 +1527,23 @@ class KeyedVectors(utils.SaveLoad):
                         oov += 1
                         if dummy4unknown:
                             logger.debug('Zero accuracy for line #%d with OOV words: %s', line_no, line.strip())
-                            section['incorrect'].append((a, b, c, expected))
+                            entries.append((section, (a, b, c, expected), None))
                         else:
                             logger.debug("Skipping line #%i with OOV words: %s", line_no, line.strip())
                         continue
-                    original_key_to_index = self.key_to_index
-                    self.key_to_index = ok_vocab
-                    ignore = {a, b, c}  # input words to be ignored
-                    predicted = None
-                    # find the most likely prediction using 3CosAdd (vector offset) method
-                    # TODO: implement 3CosMul and set-based methods for solving analogies
-                    sims = self.most_similar(positive=[b, c], negative=[a], topn=5, restrict_vocab=restrict_vocab)
-                    self.key_to_index = original_key_to_index
-                    for element in sims:
-                        predicted = element[0].upper() if case_insensitive else element[0]
-                        if predicted in ok_vocab and predicted not in ignore:
-                            if predicted != expected:
-                                logger.debug("%s: expected %s, predicted %s", line.strip(), expected, predicted)
-                            break
-                    if predicted == expected:
-                        section['correct'].append((a, b, c, expected))
-                    else:
-                        section['incorrect'].append((a, b, c, expected))
-        if section:
-            # store the last section, too
-            sections.append(section)
+                    entries.append((section, (a, b, c, expected), len(questions)))
+                    questions.append((ok_vocab[a], ok_vocab[b], ok_vocab[c]))
+
+        predictions = self._predict_analogies(
+            questions, [quadruplet for _, quadruplet, row in entries if row is not None],
+            ok_vocab, restrict_vocab, case_insensitive, similarity_function, batch_size,
+        )
+        for section, quadruplet, row in entries:
+            if row is not None and predictions[row] == quadruplet[3]:
+                section['correct'].append(quadruplet)
+            else:
+                section['incorrect'].append(quadruplet)
+        for section in sections:
             self._log_evaluate_word_analogies(section)
 
         total = {
@@ -1319,6 +1564,74 @@ class KeyedVectors(utils.SaveLoad):
         # Return the overall score and the full lists of correct and incorrect analogies
         return analogies_score, sections
 
+    def _predict_analogies(
+            self, questions, quadruplets, ok_vocab, restrict_vocab, case_insensitive, similarity_function, batch_size,
+        ):
+        """Answer analogy questions "`a` is to `b` as `c` is to ?", many questions at a time.
+
+        Helper for :meth:`~gensim.models.keyedvectors.KeyedVectors.evaluate_word_analogies`.
+
+        Parameters
+        ----------
+        questions : list of (int, int, int)
+            Indexes of the words `a`, `b` and `c` of each question.
+        quadruplets : list of (str, str, str, str)
+            The words `a`, `b`, `c` and the expected answer of each question, as they appear in `ok_vocab`.
+
+        Returns
+        -------
+        list of str
+            The predicted answer to each question.
+
+        """
+        self.fill_norms()
+        vectors, norms = self.vectors[:restrict_vocab], self.norms[:restrict_vocab]
+        topn = min(5, len(vectors))
+        questions = array(questions, dtype=np.int64).reshape(-1, 3)
+        predictions = []
+        for start in range(0, len(questions), batch_size):
+            batch = questions[start:start + batch_size]
+            inputs = vectors[batch] / norms[batch][:, :, np.newaxis]  # unit-normed vectors of a, b, c
+            if similarity_function == '3CosAdd':
+                # the vector offset method of most_similar(positive=[b, c], negative=[a])
+                query = inputs[:, 1] + inputs[:, 2] - inputs[:, 0]
+                query_norms = np.linalg.norm(query, axis=1, keepdims=True)
+                query /= np.where(query_norms > 0, query_norms, 1.0)
+                dists = dot(query, vectors.T) / norms
+            else:
+                # equation (4) of Levy & Goldberg, as in most_similar_cosmul(positive=[b, c], negative=[a])
+                sims = (1 + dot(inputs.reshape(-1, self.vector_size), vectors.T) / norms) / 2
+                sims = sims.reshape(len(batch), 3, -1)
+                dists = sims[:, 1] * sims[:, 2] / (sims[:, 0] + 0.000001)
+
+            # ignore (don't predict) the input words
+            rows = np.arange(len(batch))
+            dists[rows[:, np.newaxis], batch] = -np.inf
+            # a few argmax passes are much faster than argpartition, for the handful of top candidates needed
+            best = np.empty((len(batch), topn), dtype=np.int64)
+            best_dists = np.empty((len(batch), topn), dtype=dists.dtype)
+            for i in range(topn):
+                best[:, i] = dists.argmax(axis=1)
+                best_dists[:, i] = dists[rows, best[:, i]]
+                dists[rows, best[:, i]] = -np.inf
+
+            for row, candidates in enumerate(best):
+                a, b, c, expected = quadruplets[start + row]
+                ignore = {a, b, c}  # input words to be ignored, including their other case variants
+                predicted = None
+                for candidate, dist in zip(candidates, best_dists[row]):
+                    if dist == -np.inf:
+                        break
+                    predicted = self.index_to_key[candidate]
+                    if case_insensitive:
+                        predicted = predicted.upper()
+                    if predicted in ok_vocab and predicted not in ignore:
+                        if predicted != expected:
+                            logger.debug("%s %s %s: expected %s, predicted %s", a, b, c, expected, predicted)
+                        break
+                predictions.append(predicted)
+        return predictions
+
     @staticmethod
     def log_accuracy(section):
         correct, incorrect = len(section['correct']), len(section['incorrect'])
@@ -1583,7 +1896,7 @@ class KeyedVectors(utils.SaveLoad):
     @classmethod
     def load_word2vec_format(
             cls, fname, fvocab=None, binary=False, encoding='utf8', unicode_errors='strict',
-            limit=None, datatype=REAL, no_header=False,
+            limit=None, datatype=REAL, no_header=False, workers=1,
         ):
         """Load KeyedVectors from a file produced by the original C word2vec-tool format.
 
@@ -1620,6 +1933,9 @@ class KeyedVectors(utils.SaveLoad):
             following vectors & number of dimensions. If True, the file is assumed to lack a declaratory
             (vocab_size, vector_size) header and instead start with the 1st vector, and an extra
             reading-pass will be used to discover the number of vectors. Works only with `binary=False`.
+        workers : int, optional
+            Parse the file in this many parallel processes, each reading a separate byte range of it.
+            Only local, uncompressed files can be split up like this; other files are always read serially.
 
         Returns
         -------
@@ -1629,8 +1945,149 @@ class KeyedVectors(utils.SaveLoad):
         """
         return _load_word2vec_format(
             cls, fname, fvocab=fvocab, binary=binary, encoding=encoding, unicode_errors=unicode_errors,
-            limit=limit, datatype=datatype, no_header=no_header,
+            limit=limit, datatype=datatype, no_header=no_header, workers=workers,
+        )
+
+    def save_mmap_format(self, fname, datatype=None):
+        """Store the vectors in a single binary file that can be memory-mapped back by
+        :meth:`~gensim.models.keyedvectors.KeyedVectors.load_mmap_format`, without any parsing.
+
+        The file consists of a fixed-size header, a table of byte offsets of the keys, the utf8-encoded keys,
+        optionally the `count` of each key, and the 2D vectors array, aligned to a page boundary.
+        Unlike :meth:`~gensim.models.keyedvectors.KeyedVectors.save`, the file doesn't rely on pickle,
+        so it doesn't depend on the Python or Gensim version that wrote it.
+
+        Parameters
+        ----------
+        fname : str
+            File path to save the vectors to.
+        datatype : type, optional
+            Store the vectors as this float type (such as `np.float16`, to halve the file size).
+            Defaults to the current type of the vectors.
+
+        """
+        num_vectors = len(self.index_to_key)
+        datatype = np.dtype(self.vectors.dtype if datatype is None else datatype).newbyteorder('<')
+        if datatype.kind != 'f':
+            raise ValueError(f"vectors can only be stored as a float type, not {datatype}")
+
+        flags = 0
+        if all(isinstance(key, (int, np.integer)) for key in self.index_to_key):
+            flags |= _MMAP_FORMAT_INT_KEYS
+            keys = np.array(self.index_to_key, dtype='<i8').tobytes()
+        elif all(isinstance(key, str) for key in self.index_to_key):
+            # each key is followed by a null byte, so that all keys can be decoded with a single split on load
+            encoded = [key.encode('utf8') + b'\0' for key in self.index_to_key]
+            offsets = np.zeros(num_vectors + 1, dtype='<u8')
+            np.cumsum([len(key) for key in encoded], out=offsets[1:])
+            keys = offsets.tobytes() + b''.join(encoded)
+        else:
+            raise ValueError("only vectors whose keys are either all strings or all integers can be stored")
+
+        counts = b''
+        if 'count' in self.expandos:
+            counts = np.zeros(num_vectors, dtype='<i8')
+            stored_counts = self.expandos['count'][:num_vectors]
+            counts[:len(stored_counts)] = stored_counts
+            counts = counts.tobytes()
+
+        header = np.zeros(1, dtype=_MMAP_FORMAT_HEADER)
+        header['magic'] = _MMAP_FORMAT_MAGIC
+        header['version'] = _MMAP_FORMAT_VERSION
+        header['flags'] = flags
+        header['count'] = num_vectors
+        header['vector_size'] = self.vector_size
+        header['dtype'] = datatype.str
+        header['keys_offset'] = _MMAP_FORMAT_HEADER.itemsize
+        counts_offset = _align(_MMAP_FORMAT_HEADER.itemsize + len(keys), 8)
+        header['counts_offset'] = counts_offset if counts else 0
+        header['vectors_offset'] = _align(counts_offset + len(counts), _MMAP_FORMAT_ALIGNMENT)
+
+        logger.info("storing %sx%s vectors of type %s into %s", num_vectors, self.vector_size, datatype, fname)
+        with utils.open(fname, 'wb') as fout:
+            fout.write(header.tobytes())
+            fout.write(keys)
+            fout.write(b'\0' * (counts_offset - _MMAP_FORMAT_HEADER.itemsize - len(keys)))
+            fout.write(counts)
+            fout.write(b'\0' * int(header['vectors_offset'][0] - counts_offset - len(counts)))
+            # write the vectors in chunks, to avoid a full in-memory copy when converting their type
+            for start in range(0, num_vectors, 65536):
+                fout.write(self.vectors[start:start + 65536].astype(datatype, copy=False).tobytes())
+
+    @classmethod
+    def load_mmap_format(cls, fname, mmap='r'):
+        """Load KeyedVectors stored by :meth:`~gensim.models.keyedvectors.KeyedVectors.save_mmap_format`.
+
+        With the default `mmap='r'`, the vectors are not read at all: they are memory-mapped straight from
+        the file, so loading is nearly instant, and all processes that load the same file share the same
+        physical memory pages. Only the keys are read into memory.
+
+        Parameters
+        ----------
+        fname : str
+            The file path to the saved vectors.
+        mmap : {None, 'r', 'r+', 'c'}, optional
+            Memory-map the vectors using this mode. If None, read the vectors into a regular in-memory array.
+            Use 'c' (copy-on-write) if you need to modify the vectors without changing the file.
+
+        Returns
+        -------
+        :class:`~gensim.models.keyedvectors.KeyedVectors`
+            Loaded vectors.
+
+        """
+        with open(fname, 'rb') as fin:
+            header = np.fromfile(fin, dtype=_MMAP_FORMAT_HEADER, count=1)
+            if len(header) != 1 or header['magic'][0] != _MMAP_FORMAT_MAGIC:
+                raise ValueError(f"{fname} is not a file saved by save_mmap_format()")
+            header = header[0]
+            if header['version'] > _MMAP_FORMAT_VERSION:
+                raise ValueError(f"unsupported format version {header['version']} of {fname}")
+            num_vectors, vector_size = int(header['count']), int(header['vector_size'])
+            datatype = np.dtype(header['dtype'].decode('ascii'))
+
+            fin.seek(int(header['keys_offset']))
+            if header['flags'] & _MMAP_FORMAT_INT_KEYS:
+                index_to_key = np.fromfile(fin, dtype='<i8', count=num_vectors).tolist()
+            else:
+                offsets = np.fromfile(fin, dtype='<u8', count=num_vectors + 1).tolist()
+                blob = fin.read(offsets[-1])
+                index_to_key = blob.decode('utf8').split('\0')[:-1]
+                if len(index_to_key) != num_vectors:  # some keys contain a null character themselves
+                    index_to_key = [
+                        blob[start:end - 1].decode('utf8') for start, end in zip(offsets[:-1], offsets[1:])
+                    ]
+
+            counts = None
+            if header['counts_offset']:
+                fin.seek(int(header['counts_offset']))
+                counts = np.fromfile(fin, dtype='<i8', count=num_vectors).astype(np.int64)
+
+            if mmap is None:
+                fin.seek(int(header['vectors_offset']))
+                vectors = np.fromfile(fin, dtype=datatype, count=num_vectors * vector_size)
+                vectors = vectors.reshape(num_vectors, vector_size)
+
+        if mmap is not None:
+            vectors = np.memmap(
+                fname, dtype=datatype, mode=mmap, offset=int(header['vectors_offset']),
+                shape=(num_vectors, vector_size),
+            )
+            logger.info("memory-mapped %s vectors from %s", vectors.shape, fname)
+
+        kv = cls(vector_size, 0, dtype=datatype)
+        kv.index_to_key = index_to_key
+        kv.key_to_index = {key: index for index, key in enumerate(index_to_key)}
+        kv.next_index = num_vectors
+        kv.vectors = vectors
+        if counts is not None:
+            kv.expandos['count'] = counts
+        kv.add_lifecycle_event(
+            "load_mmap_format",
+            msg=f"loaded {vectors.shape} matrix of type {vectors.dtype} from {fname}",
+            mmap=mmap,
         )
+        return kv
 
     def intersect_word2vec_format(self, fname, lockf=0.0, binary=False, encoding='utf8', unicode_errors='strict'):
         """Merge in an input-hidden weight matrix loaded from the original C word2vec-tool format,
@@ -1690,6 +2147,8 @@ class KeyedVectors(utils.SaveLoad):
                         overlap_count += 1
                         self.vectors[self.get_index(word)] = weights
                         self.vectors_lockf[self.get_index(word)] = lockf  # lock-factor: 0.0=no changes
+        self.norms = None
+        self._drop_quantized()
         self.add_lifecycle_event(
             "intersect_word2vec_format",
             msg=f"merged {overlap_count} vectors into {self.vectors.shape} matrix from {fname}",
@@ -1725,6 +2184,133 @@ Doc2VecKeyedVectors = KeyedVectors
 EuclideanKeyedVectors = KeyedVectors
 
 
+class CompactKeyIndex(utils.SaveLoad):
+    """Compact, read-only store of string keys, as an alternative to the `key_to_index` dict and `index_to_key`
+    list of :class:`~gensim.models.keyedvectors.KeyedVectors`.
+
+    All keys are kept utf8-encoded in a single byte array, delimited by an array of offsets. Lookups go through
+    a hash table of (on average) single-entry buckets, stored in CSR form as two integer arrays. As everything
+    is stored in numpy arrays, a saved store is loaded instantly, and can be memory-mapped.
+
+    Don't use this class directly; use :meth:`~gensim.models.keyedvectors.KeyedVectors.compact_keys` instead.
+
+    """
+    def __init__(self, keys):
+        """
+
+        Parameters
+        ----------
+        keys : list of str
+            Keys, in the order of their index.
+
+        """
+        if not all(isinstance(key, str) for key in keys):
+            raise ValueError("only string keys can be stored compactly")
+        encoded = [key.encode('utf8') for key in keys]
+        num_keys = len(encoded)
+        index_type = np.uint32 if num_keys < 2**32 else np.int64
+
+        self.blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        self.offsets = np.zeros(num_keys + 1, dtype=np.int64)
+        np.cumsum([len(key) for key in encoded], out=self.offsets[1:])
+
+        # hash table with a power-of-2 number of buckets, at least as many as keys
+        self.num_buckets = 1 << max(0, num_keys - 1).bit_length()
+        buckets = np.fromiter((zlib.crc32(key) for key in encoded), dtype=np.int64, count=num_keys)
+        buckets &= self.num_buckets - 1
+        self.bucket_entries = np.argsort(buckets, kind='stable').astype(index_type)
+        self.bucket_offsets = np.zeros(self.num_buckets + 1, dtype=index_type)
+        np.cumsum(np.bincount(buckets, minlength=self.num_buckets), out=self.bucket_offsets[1:])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get_key(self, index):
+        """Get the key stored at `index`."""
+        return self.blob[self.offsets[index]:self.offsets[index + 1]].tobytes().decode('utf8')
+
+    def get_index(self, key):
+        """Get the index of `key`, or -1 if not present."""
+        if not isinstance(key, str):
+            return -1
+        encoded = key.encode('utf8')
+        bucket = zlib.crc32(encoded) & (self.num_buckets - 1)
+        for index in self.bucket_entries[self.bucket_offsets[bucket]:self.bucket_offsets[bucket + 1]]:
+            if self.blob[self.offsets[index]:self.offsets[index + 1]].tobytes() == encoded:
+                return int(index)
+        return -1
+
+
+class CompactKeyToIndex(collections.abc.Mapping):
+    """Read-only `key_to_index` mapping, backed by a :class:`~gensim.models.keyedvectors.CompactKeyIndex`."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, key):
+        index = self.store.get_index(key)
+        if index < 0:
+            raise KeyError(key)
+        return index
+
+    def get(self, key, default=None):
+        index = self.store.get_index(key)
+        return default if index < 0 else index
+
+    def __contains__(self, key):
+        return self.store.get_index(key) >= 0
+
+    def __len__(self):
+        return len(self.store)
+
+    def __iter__(self):
+        return iter(CompactIndexToKey(self.store))
+
+    def __setitem__(self, key, index):
+        raise TypeError("compact keys are read-only, call KeyedVectors.expand_keys() before adding keys")
+
+
+class CompactIndexToKey(collections.abc.Sequence):
+    """Read-only `index_to_key` list, backed by a :class:`~gensim.models.keyedvectors.CompactKeyIndex`."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.store.get_key(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("key index out of range")
+        return self.store.get_key(index)
+
+    def __len__(self):
+        return len(self.store)
+
+    def __iter__(self):
+        blob, offsets = self.store.blob.tobytes(), self.store.offsets.tolist()
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            yield blob[start:end].decode('utf8')
+
+    def index(self, key):
+        index = self.store.get_index(key)
+        if index < 0:
+            raise ValueError(f"{key!r} is not in list")
+        return index
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(key == other_key for key, other_key in zip(self, other))
+
+    def __setitem__(self, index, key):
+        raise TypeError("compact keys are read-only, call KeyedVectors.expand_keys() before adding keys")
+
+    def append(self, key):
+        raise TypeError("compact keys are read-only, call KeyedVectors.expand_keys() before adding keys")
+
+
 class CompatVocab:
 
     def __init__(self, **kwargs):
@@ -1748,8 +2334,39 @@ class CompatVocab:
 Vocab = CompatVocab
 
 
+# Layout of the header of files written by KeyedVectors.save_mmap_format(), all fields little-endian.
+_MMAP_FORMAT_HEADER = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('flags', '<u4'),
+    ('count', '<u8'),  # number of vectors
+    ('vector_size', '<u8'),
+    ('dtype', 'S8'),  # numpy type string of the vectors, e.g. '<f4'
+    ('keys_offset', '<u8'),  # start of the key offsets table followed by the keys, or of the int64 keys
+    ('counts_offset', '<u8'),  # start of the int64 counts, or 0 if not stored
+    ('vectors_offset', '<u8'),  # start of the vectors array
+])
+_MMAP_FORMAT_MAGIC = b'GSMKVEC\n'
+_MMAP_FORMAT_VERSION = 1
+_MMAP_FORMAT_INT_KEYS = 1  # flag: keys are stored as an array of int64, not as strings
+_MMAP_FORMAT_ALIGNMENT = 4096  # alignment of the vectors array, so that it starts on a memory page boundary
+
+
+def _align(offset, alignment):
+    """Round `offset` up to the nearest multiple of `alignment`."""
+    return -(-offset // alignment) * alignment
+
+
+def load_mmap_format(*args, **kwargs):
+    """Alias for :meth:`~gensim.models.keyedvectors.KeyedVectors.load_mmap_format`."""
+    return KeyedVectors.load_mmap_format(*args, **kwargs)
+
+
 # Functions for internal use by _load_word2vec_format function
 
+_COMPRESSED_EXTENSIONS = ('.bz2', '.gz', '.xz', '.zst')  # files transparently decompressed by smart_open
+
+
 def _add_word_to_kv(kv, counts, word, weights, vocab_size):
 
     if kv.has_index_for(word):
@@ -1825,6 +2442,231 @@ def _word2vec_line_to_vector(line, datatype, unicode_errors, encoding):
     return word, weights
 
 
+def _word2vec_read_range(args):
+    """Parse all vectors stored in the byte range `[start, end)` of a word2vec-format file.
+
+    Helper for :func:`~gensim.models.keyedvectors._word2vec_read_parallel`, run in a worker process.
+    The range must start at a record boundary. Binary records are parsed strictly: if the last record doesn't
+    end exactly at `end` (or at the end of the file), `end` is not a record boundary, and EOFError is raised.
+
+    Returns
+    -------
+    (list of str, numpy.ndarray)
+        Words and their vectors, in the order they appear in the file.
+
+    """
+    fname, start, end, binary, vector_size, datatype, unicode_errors, encoding = args
+    with open(fname, 'rb') as fin:
+        fin.seek(start)
+        chunk = fin.read(end - start)
+
+    words = []
+    if binary:
+        bytes_per_vector = vector_size * dtype(REAL).itemsize
+        offsets = []
+        pos = 0
+        while pos < len(chunk):
+            i_space = chunk.find(b' ', pos)
+            if i_space == -1 and not chunk[pos:].strip():
+                break  # trailing newline at the end of the file
+            if i_space == -1 or len(chunk) - (i_space + 1) < bytes_per_vector:
+                raise EOFError("unexpected end of input; is count incorrect or file otherwise damaged?")
+            # Some binary files are reported to have obsolete new line in the beginning of word, remove it
+            words.append(chunk[pos:i_space].decode("utf-8", errors=unicode_errors).lstrip('\n'))
+            offsets.append(i_space + 1)
+            pos = i_space + 1 + bytes_per_vector
+        vectors = empty((len(words), vector_size), dtype=datatype)
+        for row, offset in enumerate(offsets):
+            vectors[row] = frombuffer(chunk, offset=offset, count=vector_size, dtype=REAL)
+    else:
+        lines = chunk.split(b'\n')
+        if not lines[-1].strip():
+            lines.pop()  # the range ends with a newline; otherwise it ends with the last line of the file
+        weights = []
+        for line in lines:
+            parts = utils.to_unicode(line.rstrip(), encoding=encoding, errors=unicode_errors).split(" ")
+            if len(parts) != vector_size + 1:
+                raise ValueError(f"invalid vector on line {line!r}: expected {vector_size} dimensions")
+            words.append(parts[0])
+            weights.extend(parts[1:])
+        vectors = array(weights, dtype=datatype).reshape(len(words), vector_size)
+    return words, vectors
+
+
+# Bytes that can't occur in a word of a binary word2vec file, except for leading newlines.
+_WORD2VEC_CONTROL_BYTES = bytes(range(32))
+_WORD2VEC_RESYNC_RECORDS = 8  # number of consecutive records that must parse from a candidate record boundary
+
+
+def _word2vec_is_binary_record_start(data, pos, bytes_per_vector):
+    """Does a binary word2vec record start at offset `pos` of `data`?
+
+    Checks that the bytes just before `pos` look like the end of a record (a space then a vector of finite
+    values), and that the next few records parse: valid UTF-8 words without control bytes, each followed by
+    a space and a vector of finite values. Vector bytes taken for words or the other way round fail these
+    checks, except rarely for a first "word" that also covers the tail of the previous vector.
+
+    """
+    vector_size = bytes_per_vector // dtype(REAL).itemsize
+
+    def is_vector(offset):
+        return 0 <= offset <= len(data) - bytes_per_vector and np.isfinite(
+            frombuffer(data, offset=offset, count=vector_size, dtype=REAL)).all()
+
+    if pos <= bytes_per_vector or not is_vector(pos - bytes_per_vector) or data[pos - bytes_per_vector - 1] != 32:
+        return False
+    for _ in range(_WORD2VEC_RESYNC_RECORDS):
+        if not data[pos:pos + 1024].strip() and not data[pos:].strip():
+            return True  # reached the end of the file
+        i_space = data.find(b' ', pos)
+        word = data[pos:i_space].lstrip(b'\n')
+        if i_space == -1 or not word or len(word.translate(None, _WORD2VEC_CONTROL_BYTES)) != len(word):
+            return False
+        try:
+            word.decode('utf8')
+        except UnicodeDecodeError:
+            return False
+        if not is_vector(i_space + 1):
+            return False
+        pos = i_space + 1 + bytes_per_vector
+    return True
+
+
+def _word2vec_record_start(data, pos, vector_size, binary):
+    """Find the first record boundary at or after offset `pos` of a word2vec-format file's `data`.
+
+    Text records are lines, so their boundaries are certain. Binary boundaries are only a (usually right) guess,
+    verified while parsing the records before them, see :func:`~gensim.models.keyedvectors._word2vec_read_range`.
+
+    Returns
+    -------
+    int
+        Offset of the boundary, or `len(data)` if there is none.
+
+    """
+    if not binary:
+        # records are lines
+        if pos and data[pos - 1:pos] != b'\n':
+            pos = data.find(b'\n', pos) + 1 or len(data)
+        return pos
+    bytes_per_vector = vector_size * dtype(REAL).itemsize
+    # a record boundary is preceded by a space and a vector
+    pos = data.find(b' ', max(pos - bytes_per_vector - 1, 0))
+    while pos != -1:
+        start = pos + bytes_per_vector + 1
+        if _word2vec_is_binary_record_start(data, start, bytes_per_vector):
+            # The candidate may still start inside the previous vector, its first "word" swallowing the end of
+            # that vector and the real word. The record after it starts at a real boundary.
+            i_space = data.find(b' ', start)
+            return min(i_space + 1 + bytes_per_vector, len(data)) if i_space != -1 else len(data)
+        pos = data.find(b' ', pos + 1)
+    return len(data)
+
+
+def _word2vec_range_starts(fname, data_start, vector_size, binary, num_ranges, fraction=1.0):
+    """Split the records of a word2vec-format file into byte ranges of similar size, by cutting the file at
+    equally spaced offsets and moving each cut forward to the next record boundary.
+
+    If `fraction` < 1, that fraction of the records is expected to be read, from the start of the file:
+    `num_ranges` ranges cover (a little over) that many of the bytes, and another `num_ranges` ranges the rest.
+
+    Returns
+    -------
+    list of int
+        Start offsets of the byte ranges, followed by the end of the file.
+
+    """
+    with open(fname, 'rb') as fin, mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        size = len(data)
+        spans = [(data_start, size)]
+        if fraction < 1.0:
+            middle = data_start + int((size - data_start) * min(1.0, 1.05 * fraction))
+            spans = [(data_start, middle), (middle, size)]
+        cuts = [
+            span_start + (span_end - span_start) * i // num_ranges
+            for span_start, span_end in spans for i in range(num_ranges)
+        ]
+        starts = {data_start}
+        starts.update(_word2vec_record_start(data, cut, vector_size, binary) for cut in cuts if cut > data_start)
+        return sorted(start for start in starts if start < size) + [size]
+
+
+def _word2vec_read_parallel(
+        fname, data_start, kv, counts, vocab_size, vector_size, datatype, unicode_errors, encoding, binary, workers,
+        header_size=None,
+    ):
+    """Read vectors from a word2vec-format file by parsing byte ranges of it in `workers` parallel processes.
+
+    `header_size` is the number of vectors in the file, of which only the first `vocab_size` are read.
+
+    Each range is parsed from its start up to exactly its end, so starting from the (known) first record, every
+    successfully parsed range proves that the next range starts at a record boundary too. A binary file whose
+    record boundaries were guessed wrong thus fails to parse, rather than loading wrong vectors.
+
+    Returns
+    -------
+    bool
+        False if a binary file couldn't be split into records: `kv` is then partially filled, and the file must
+        be read serially instead.
+
+    """
+    fraction = vocab_size / header_size if header_size else 1.0
+    starts = _word2vec_range_starts(fname, data_start, vector_size, binary, 4 * workers, fraction=fraction)
+    ranges = [
+        (fname, start, end, binary, vector_size, datatype, unicode_errors, encoding)
+        for start, end in zip(starts[:-1], starts[1:])
+    ]
+    logger.info("parsing %i byte ranges of %s in %i processes", len(ranges), fname, workers)
+
+    # Copy the parsed vectors into the preallocated array in file order, skipping duplicate words.
+    row = 0
+    pool = multiprocessing.Pool(workers)
+    try:
+        results = pool.imap(_word2vec_read_range, ranges)
+        while True:
+            try:
+                words, vectors = next(results)
+            except StopIteration:
+                break
+            except (EOFError, ValueError):
+                if binary:
+                    return False  # a wrongly guessed range start
+                raise
+            words = words[:vocab_size - row]
+            row += len(words)
+            keep = []
+            for i, word in enumerate(words):
+                if word in kv.key_to_index:
+                    logger.warning("duplicate word '%s' in word2vec file, ignoring all but first", word)
+                    continue
+                kv.key_to_index[word] = kv.next_index + len(keep)
+                keep.append(i)
+            new_rows = slice(kv.next_index, kv.next_index + len(keep))
+            kv.index_to_key[new_rows] = [words[i] for i in keep]
+            kv.vectors[new_rows] = vectors[:len(words)] if len(keep) == len(words) else vectors[keep]
+            kv.next_index += len(keep)
+            if row == vocab_size:
+                break  # skip any remaining ranges, past `limit`
+    finally:
+        pool.terminate()
+    if row != vocab_size:
+        if binary:
+            return False
+        raise EOFError("unexpected end of input; is count incorrect or file otherwise damaged?")
+    kv.index_to_key = kv.index_to_key[:kv.next_index]
+
+    if counts is None:
+        # Just make up some bogus counts in descending order, same as _add_word_to_kv().
+        kv.allocate_vecattrs(['count'], [int])
+        kv.expandos['count'][:] = vocab_size - np.arange(kv.next_index)
+    else:
+        for word in kv.index_to_key:
+            if word not in counts:
+                logger.warning("vocabulary file is incomplete: '%s' is missing", word)
+            kv.set_vecattr(word, 'count', counts.get(word))
+    return True
+
+
 def _word2vec_detect_sizes_text(fin, limit, datatype, unicode_errors, encoding):
     vector_size = None
     for vocab_size in itertools.count():
@@ -1840,7 +2682,7 @@ def _word2vec_detect_sizes_text(fin, limit, datatype, unicode_errors, encoding):
 
 def _load_word2vec_format(
         cls, fname, fvocab=None, binary=False, encoding='utf8', unicode_errors='strict',
-        limit=sys.maxsize, datatype=REAL, no_header=False, binary_chunk_size=100 * 1024,
+        limit=sys.maxsize, datatype=REAL, no_header=False, binary_chunk_size=100 * 1024, workers=1,
     ):
     """Load the input-hidden weight matrix from the original C word2vec-tool format.
 
@@ -1872,6 +2714,8 @@ def _load_word2vec_format(
         Such types may result in much slower bulk operations or incompatibility with optimized routines.)
     binary_chunk_size : int, optional
         Read input file in chunks of this many bytes for performance reasons.
+    workers : int, optional
+        Parse the file in this many parallel processes. Only used for local, uncompressed files.
 
     Returns
     -------
@@ -1901,16 +2745,36 @@ def _load_word2vec_format(
         else:
             header = utils.to_unicode(fin.readline(), encoding=encoding)
             vocab_size, vector_size = [int(x) for x in header.split()]  # throws for invalid file format
+        header_size = vocab_size
         if limit:
             vocab_size = min(vocab_size, limit)
         kv = cls(vector_size, vocab_size, dtype=datatype)
 
-        if binary:
-            _word2vec_read_binary(
-                fin, kv, counts, vocab_size, vector_size, datatype, unicode_errors, binary_chunk_size,
+        parallel = workers > 1 and isinstance(fname, str) and os.path.isfile(fname) \
+            and not fname.endswith(_COMPRESSED_EXTENSIONS)
+        if workers > 1 and not parallel:
+            logger.warning("%s is not a local uncompressed file, ignoring workers=%i", fname, workers)
+        if parallel:
+            data_start = fin.tell()
+            parallel = _word2vec_read_parallel(
+                fname, data_start, kv, counts, vocab_size, vector_size, datatype, unicode_errors, encoding,
+                binary, workers, header_size=header_size,
             )
-        else:
-            _word2vec_read_text(fin, kv, counts, vocab_size, vector_size, datatype, unicode_errors, encoding)
+            if not parallel:
+                logger.warning("couldn't split the records of %s, reading it in a single process", fname)
+                kv = cls(vector_size, vocab_size, dtype=datatype)
+                fin.seek(data_start)
+        if not parallel:
+            if binary:
+                _word2vec_read_binary(
+                    fin, kv, counts, vocab_size, vector_size, datatype, unicode_errors, binary_chunk_size,
+                )
+            else:
+                _word2vec_read_text(fin, kv, counts, vocab_size, vector_size, datatype, unicode_errors, encoding)
+    if kv.next_index != len(kv):
+        # duplicate words leave unused slots at the end of the preallocated index
+        kv.index_to_key = kv.index_to_key[:kv.next_index]
+        kv.allocate_vecattrs()
     if kv.vectors.shape[0] != len(kv):
         logger.info(
             "duplicate words detected, shrinking matrix size from %i to %i",
@@ -1945,10 +2809,16 @@ def pseudorandom_weak_vector(size, seed_string=None, hashfxn=hash):
     return (once.random(size).astype(REAL) - 0.5) / size
 
 
-def prep_vectors(target_shape, prior_vectors=None, seed=0, dtype=REAL):
+_MAPFILE_BLOCK_SIZE = 2**20  # number of values initialized at a time by prep_vectors(mapfile_path=...)
+
+
+def prep_vectors(target_shape, prior_vectors=None, seed=0, dtype=REAL, mapfile_path=None):
     """Return a numpy array of the given shape. Reuse prior_vectors object or values
     to extent possible. Initialize new values randomly if requested.
 
+    If `mapfile_path` is given, return a `numpy.memmap` backed by that file instead, initialized block by block
+    so that the vectors never need to fit in RAM at once. The values are the same as without `mapfile_path`.
+
     """
     if prior_vectors is None:
         prior_vectors = np.zeros((0, 0))
@@ -1956,9 +2826,29 @@ def prep_vectors(target_shape, prior_vectors=None, seed=0, dtype=REAL):
         return prior_vectors
     target_count, vector_size = target_shape
     rng = np.random.default_rng(seed=seed)  # use new instance of numpy's recommended generator/algorithm
-    new_vectors = rng.random(target_shape, dtype=dtype)  # [0.0, 1.0)
-    new_vectors *= 2.0  # [0.0, 2.0)
-    new_vectors -= 1.0  # [-1.0, 1.0)
-    new_vectors /= vector_size
-    new_vectors[0:prior_vectors.shape[0], 0:prior_vectors.shape[1]] = prior_vectors
-    return new_vectors
+    if mapfile_path is None:
+        new_vectors = rng.random(target_shape, dtype=dtype)  # [0.0, 1.0)
+        new_vectors *= 2.0  # [0.0, 2.0)
+        new_vectors -= 1.0  # [-1.0, 1.0)
+        new_vectors /= vector_size
+        new_vectors[0:prior_vectors.shape[0], 0:prior_vectors.shape[1]] = prior_vectors
+        return new_vectors
+
+    # fill a new file, as prior_vectors may still be mapped from mapfile_path
+    tmp_path = mapfile_path + '.tmp'
+    new_vectors = np.memmap(tmp_path, dtype=dtype, mode='w+', shape=target_shape)
+    block_rows = max(1, _MAPFILE_BLOCK_SIZE // max(vector_size, 1))
+    for start in range(0, target_count, block_rows):
+        block = new_vectors[start:start + block_rows]
+        block[:] = rng.random(block.shape, dtype=dtype)  # same stream as a single draw of the full shape
+        block *= 2.0
+        block -= 1.0
+        block /= vector_size
+    prior_count = min(prior_vectors.shape[0], target_count)
+    for start in range(0, prior_count, block_rows):
+        stop = min(start + block_rows, prior_count)
+        new_vectors[start:stop, 0:prior_vectors.shape[1]] = prior_vectors[start:stop]
+    new_vectors.flush()
+    del new_vectors
+    os.replace(tmp_path, mapfile_path)
+    return np.memmap(mapfile_path, dtype=dtype, mode='r+', shape=target_shape)
@@ -0,0 +1,418 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Store and query vector sets that span several memory-mapped files.
+
+A :class:`~gensim.models.sharded_keyedvectors.ShardedKeyedVectors` keeps its vectors in a series of shard files,
+each stored in the format of :meth:`~gensim.models.keyedvectors.KeyedVectors.save_mmap_format`. Shards are
+memory-mapped on first use, so the vector set can be much larger than the available RAM, and new vectors are
+appended as new shards, without rewriting the existing ones.
+
+Example usage
+-------------
+
+.. sourcecode:: pycon
+
+    >>> from gensim.models.sharded_keyedvectors import ShardedKeyedVectors
+    >>> from gensim.models import KeyedVectors
+    >>> from gensim.test.utils import datapath, get_tmpfile
+    >>>
+    >>> wv = KeyedVectors.load_word2vec_format(datapath('euclidean_vectors.bin'), binary=True)
+    >>>
+    >>> index = ShardedKeyedVectors(get_tmpfile('sharded_vectors'), wv.vector_size, shardsize=1000)
+    >>> index.add_vectors(wv.index_to_key, wv.vectors)  # stored into 3 shards of up to 1000 vectors
+    >>> vector = index['war']
+    >>> result = index.most_similar('war', topn=5)
+    >>>
+    >>> index.save()
+    >>> index = ShardedKeyedVectors.load(index.output_prefix)
+
+"""
+
+import hashlib
+import heapq
+import itertools
+import logging
+import os
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from gensim import utils, matutils
+from gensim.models.keyedvectors import KeyedVectors, KEY_TYPES, REAL
+
+logger = logging.getLogger(__name__)
+
+
+def routing_hash(key):
+    """Get a 64-bit hash of `key` that is stable across processes, unlike the builtin `hash()` of strings.
+
+    Parameters
+    ----------
+    key : {str, int}
+        Key to hash.
+
+    Returns
+    -------
+    int
+        The hash.
+
+    """
+    if isinstance(key, str):
+        encoded = b's' + key.encode('utf8')
+    else:
+        encoded = b'i' + str(int(key)).encode('ascii')
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'little')
+
+
+class KeyedVectorsShard(utils.SaveLoad):
+    """A proxy for a single shard file of :class:`~gensim.models.sharded_keyedvectors.ShardedKeyedVectors`,
+    which memory-maps the shard's vectors from disk on first use."""
+
+    def __init__(self, fname, length):
+        """
+
+        Parameters
+        ----------
+        fname : str
+            Path to the shard file, stored by :meth:`~gensim.models.keyedvectors.KeyedVectors.save_mmap_format`.
+        length : int
+            Number of vectors in the shard.
+
+        """
+        self.dirname, self.fname = os.path.split(fname)
+        self.length = length
+
+    def fullname(self):
+        """Get full path to shard file."""
+        return os.path.join(self.dirname, self.fname)
+
+    def __len__(self):
+        return self.length
+
+    def __getstate__(self):
+        result = self.__dict__.copy()
+        # the memory-mapped vectors must be opened by load_mmap_format(), not pickled
+        result.pop('kv', None)
+        return result
+
+    def __str__(self):
+        return "%s(%i vectors in %s)" % (self.__class__.__name__, len(self), self.fullname())
+
+    def get_kv(self):
+        """Load & get the vectors of this shard.
+
+        Returns
+        -------
+        :class:`~gensim.models.keyedvectors.KeyedVectors`
+            Vectors of the shard, memory-mapped read-only.
+
+        """
+        if not hasattr(self, 'kv'):
+            logger.debug("mmaping vectors from %s", self.fullname())
+            self.kv = KeyedVectors.load_mmap_format(self.fullname(), mmap='r')
+        return self.kv
+
+
+class ShardedKeyedVectors(utils.SaveLoad):
+    """Mapping between keys and vectors, with the vectors split into several memory-mapped shard files.
+
+    Each key lives in exactly one shard. Its index is the position of its shard's first vector plus its position
+    within the shard, so indexes stay stable as new shards are appended.
+
+    A global routing table maps the :func:`~gensim.models.sharded_keyedvectors.routing_hash` of each key to its
+    shard, as two sorted numpy arrays, so that looking up a key only touches the shard that holds it.
+
+    """
+    def __init__(self, output_prefix, vector_size, shardsize=1000000, workers=None):
+        """
+
+        Parameters
+        ----------
+        output_prefix : str
+            Prefix of the shard files; shards are stored as `output_prefix.0`, `output_prefix.1`, ...
+        vector_size : int
+            Number of dimensions of all vectors.
+        shardsize : int, optional
+            Maximum number of vectors stored in each new shard.
+        workers : int, optional
+            Number of threads used to search the shards in parallel in
+            :meth:`~gensim.models.sharded_keyedvectors.ShardedKeyedVectors.most_similar`.
+            Defaults to one thread per shard.
+
+        """
+        self.output_prefix = output_prefix
+        self.vector_size = vector_size
+        self.shardsize = int(shardsize)
+        self.workers = workers
+        self.shards = []
+        self.key_hashes = np.empty(0, dtype=np.uint64)  # routing table: sorted key hashes...
+        self.key_shards = np.empty(0, dtype=np.int32)  # ...and the shard number of each
+
+    def __len__(self):
+        return sum(len(shard) for shard in self.shards)
+
+    def __str__(self):
+        return "%s<%i vectors in %i shards, %i features>" % (
+            self.__class__.__name__, len(self), len(self.shards), self.vector_size,
+        )
+
+    def shardid2filename(self, shardid):
+        """Get shard file name by shard id.
+
+        Parameters
+        ----------
+        shardid : int
+            Shard index.
+
+        Return
+        ------
+        str
+            Path to the shard file.
+
+        """
+        if self.output_prefix.endswith('.'):
+            return "%s%s" % (self.output_prefix, shardid)
+        else:
+            return "%s.%s" % (self.output_prefix, shardid)
+
+    def _shard_offsets(self):
+        """Get the index of the first vector of each shard."""
+        return np.concatenate([[0], np.cumsum([len(shard) for shard in self.shards])]).astype(np.int64)
+
+    def _route(self, keys, shardno):
+        """Add `keys`, stored in shard number `shardno`, to the routing table."""
+        hashes = np.fromiter((routing_hash(key) for key in keys), dtype=np.uint64, count=len(keys))
+        hashes.sort()
+        # a linear merge of the two sorted tables, rather than re-sorting everything
+        positions = np.searchsorted(self.key_hashes, hashes)
+        self.key_hashes = np.insert(self.key_hashes, positions, hashes)
+        self.key_shards = np.insert(self.key_shards, positions, np.int32(shardno))
+
+    def _locate(self, key):
+        """Find the shard number and the position within that shard of `key`, or (None, None) if not found."""
+        key_hash = np.uint64(routing_hash(key))
+        start = np.searchsorted(self.key_hashes, key_hash, side='left')
+        end = np.searchsorted(self.key_hashes, key_hash, side='right')
+        for shardno in self.key_shards[start:end]:  # more than one shard only on a hash collision
+            index = self.shards[shardno].get_kv().key_to_index.get(key)
+            if index is not None:
+                return int(shardno), index
+        return None, None
+
+    def has_index_for(self, key):
+        """Can this model return a vector for `key`?"""
+        return self._locate(key)[0] is not None
+
+    def __contains__(self, key):
+        return self.has_index_for(key)
+
+    def get_index(self, key, default=None):
+        """Get the global integer index of `key`, across all shards.
+
+        Parameters
+        ----------
+        key : {str, int}
+            Key to look up.
+        default : int, optional
+            Returned if `key` is not found. If not set, a KeyError is raised instead.
+
+        """
+        shardno, index = self._locate(key)
+        if shardno is not None:
+            return int(self._shard_offsets()[shardno]) + index
+        elif default is not None:
+            return default
+        raise KeyError(f"Key '{key}' not present")
+
+    def get_key(self, index):
+        """Get the key stored at global integer `index`."""
+        offsets = self._shard_offsets()
+        if not 0 <= index < offsets[-1]:
+            raise IndexError(f"index {index} out of range for {offsets[-1]} vectors")
+        shardno = int(np.searchsorted(offsets, index, side='right')) - 1
+        return self.shards[shardno].get_kv().index_to_key[index - offsets[shardno]]
+
+    def get_vector(self, key, norm=False):
+        """Get the key's vector, as a 1D numpy array.
+
+        Parameters
+        ----------
+        key : {str, int}
+            Key for vector to return.
+        norm : bool, optional
+            If True, the resulting vector will be L2-normalized (unit Euclidean length).
+
+        Raises
+        ------
+        KeyError
+            If `key` not present in any shard.
+
+        """
+        shardno, index = self._locate(key)
+        if shardno is None:
+            raise KeyError(f"Key '{key}' not present")
+        kv = self.shards[shardno].get_kv()
+        if norm:
+            kv.fill_norms()
+            return kv.vectors[index] / kv.norms[index]
+        return np.array(kv.vectors[index])
+
+    def __getitem__(self, key_or_keys):
+        """Get vector representation of `key_or_keys`.
+
+        Parameters
+        ----------
+        key_or_keys : {str, list of str, int, list of int}
+            Requested key or list-of-keys.
+
+        Returns
+        -------
+        numpy.ndarray
+            Vector representation for `key_or_keys` (1D if `key_or_keys` is single key, otherwise - 2D).
+
+        """
+        if isinstance(key_or_keys, KEY_TYPES):
+            return self.get_vector(key_or_keys)
+        return np.vstack([self.get_vector(key) for key in key_or_keys])
+
+    def add_vectors(self, keys, weights):
+        """Append keys and their vectors, stored in new shards of up to `shardsize` vectors each.
+
+        Existing shards are never modified. Keys that are already present are ignored, keeping their old vector.
+
+        Parameters
+        ----------
+        keys : list of (str or int)
+            Keys specified by string or int ids.
+        weights : numpy.ndarray
+            2D array of vectors, one per key.
+
+        """
+        weights = np.asarray(weights, dtype=REAL).reshape(len(keys), -1)
+        if len(keys) and weights.shape[1] != self.vector_size:
+            raise ValueError(f"incompatible vector size {weights.shape[1]}, expected {self.vector_size}")
+        seen = set()
+        in_vocab = []
+        for key in keys:
+            in_vocab.append(key in seen or self.has_index_for(key))
+            seen.add(key)
+        in_vocab = np.array(in_vocab, dtype=bool)
+        if in_vocab.any():
+            logger.warning("ignoring %i keys that are already present", in_vocab.sum())
+            keys = [key for key, present in zip(keys, in_vocab) if not present]
+            weights = weights[~in_vocab]
+
+        for start in range(0, len(keys), self.shardsize):
+            shard_keys = keys[start:start + self.shardsize]
+            kv = KeyedVectors(self.vector_size)
+            kv.add_vectors(shard_keys, weights[start:start + self.shardsize])
+            fname = self.shardid2filename(len(self.shards))
+            logger.info("storing %i vectors into shard %s", len(shard_keys), fname)
+            kv.save_mmap_format(fname)
+            self._route(shard_keys, len(self.shards))
+            self.shards.append(KeyedVectorsShard(fname, len(shard_keys)))
+
+    def add_shard(self, fname):
+        """Append an existing file as a new shard, without copying it.
+
+        Parameters
+        ----------
+        fname : str
+            Path to vectors stored by :meth:`~gensim.models.keyedvectors.KeyedVectors.save_mmap_format`,
+            for example by :mod:`gensim.scripts.vectors2mmap`.
+
+        Raises
+        ------
+        ValueError
+            If the vectors have a different dimensionality, or some of their keys are already present.
+
+        """
+        shard = KeyedVectorsShard(fname, 0)
+        kv = shard.get_kv()
+        shard.length = len(kv)
+        if kv.vector_size != self.vector_size:
+            raise ValueError(f"incompatible vector size {kv.vector_size}, expected {self.vector_size}")
+        for key in kv.index_to_key:
+            shardno, _ = self._locate(key)
+            if shardno is not None:
+                raise ValueError(f"{fname} contains keys already present in shard {self.shards[shardno].fullname()}")
+        self._route(kv.index_to_key, len(self.shards))
+        self.shards.append(shard)
+
+    # the weighted mean of the query keys and vectors, through get_vector(), has_index_for() and get_index()
+    _query_mean = KeyedVectors._query_mean
+
+    def most_similar(self, positive=None, negative=None, topn=10):
+        """Find the top-N most similar keys across all shards.
+
+        Each shard is searched in its own thread, and the per-shard results are merged.
+
+        Parameters
+        ----------
+        positive : list of (str or int or ndarray) or list of ((str,float) or (int,float) or (ndarray,float)), optional
+            List of keys that contribute positively. If tuple, second element specifies the weight (default `1.0`)
+        negative : list of (str or int or ndarray) or list of ((str,float) or (int,float) or (ndarray,float)), optional
+            List of keys that contribute negatively. If tuple, second element specifies the weight (default `-1.0`)
+        topn : int, optional
+            Number of top-N similar keys to return.
+
+        Returns
+        -------
+        list of (str, float)
+            Sequence of (key, similarity), in descending order of similarity.
+
+        """
+        if topn < 1:
+            return []
+        positive = [positive] if isinstance(positive, KEY_TYPES + (np.ndarray,)) else list(positive or [])
+        negative = [negative] if isinstance(negative, KEY_TYPES + (np.ndarray,)) else list(negative or [])
+        mean, all_keys = self._query_mean(positive, negative)
+        offsets = self._shard_offsets()
+
+        def search_shard(shardno):
+            kv = self.shards[shardno].get_kv()
+            kv.fill_norms()
+            dists = np.dot(kv.vectors, mean) / kv.norms
+            best = matutils.argsort(dists, topn=topn + len(all_keys), reverse=True)
+            return [
+                (float(dists[index]), kv.index_to_key[index]) for index in best
+                if offsets[shardno] + index not in all_keys
+            ][:topn]
+
+        workers = min(self.workers or len(self.shards), len(self.shards))
+        if workers > 1:
+            pool = ThreadPool(workers)
+            try:
+                results = pool.map(search_shard, range(len(self.shards)))
+            finally:
+                pool.terminate()
+        else:
+            results = [search_shard(shardno) for shardno in range(len(self.shards))]
+        best = heapq.nlargest(topn, itertools.chain.from_iterable(results), key=lambda result: result[0])
+        return [(key, sim) for sim, key in best]
+
+    def check_moved(self):
+        """Update shard locations, for case where the prefix location changed on the filesystem."""
+        dirname = os.path.dirname(self.output_prefix)
+        for shard in self.shards:
+            shard.dirname = dirname
+
+    def save(self, fname=None, *args, **kwargs):
+        """Save the shard list via pickling under `fname`. The shards themselves are already stored in their files.
+
+        Parameters
+        ----------
+        fname : str, optional
+            Path to save to. Defaults to `self.output_prefix`.
+        *args : object
+            Arguments, see :meth:`gensim.utils.SaveLoad.save`.
+        **kwargs : object
+            Keyword arguments, see :meth:`gensim.utils.SaveLoad.save`.
+
+        """
+        if fname is None:
+            fname = self.output_prefix
+        super(ShardedKeyedVectors, self).save(fname, *args, **kwargs)
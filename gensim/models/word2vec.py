@@ -52,6 +52,18 @@ to stream over your dataset multiple times. For some examples of streamed iterab
 see :class:`~gensim.models.word2vec.BrownCorpus`,
 :class:`~gensim.models.word2vec.Text8Corpus` or :class:`~gensim.models.word2vec.LineSentence`.
 
+Streaming means re-reading and re-tokenizing the corpus in every epoch. To avoid that, convert the corpus
+to vocabulary indexes once, after building the vocabulary, and train on the memory-mapped result:
+
+.. sourcecode:: pycon
+
+    >>> from gensim.models.word2vec import IndexedSentences
+    >>> from gensim.test.utils import get_tmpfile
+    >>>
+    >>> corpus = IndexedSentences.serialize(get_tmpfile("indexed_sentences"), common_texts, model.wv)
+    >>> model.train(corpus, total_examples=model.corpus_count, epochs=model.epochs)
+    (17, 145)
+
 If you save the model you can continue training it later:
 
 .. sourcecode:: pycon
@@ -183,21 +195,25 @@ from __future__ import division  # py3 "true division"
 import logging
 import sys
 import os
-import heapq
+import multiprocessing
+import zlib
 from timeit import default_timer
-from collections import defaultdict, namedtuple
+from collections import defaultdict
 from collections.abc import Iterable
+from array import array
 from types import GeneratorType
 import threading
 import itertools
 import copy
+import pickle
 from queue import Queue, Empty
 
 from numpy import float32 as REAL
 import numpy as np
 
 from gensim.utils import keep_vocab_item, call_on_class_only, deprecated
-from gensim.models.keyedvectors import KeyedVectors, pseudorandom_weak_vector
+from gensim.models.keyedvectors import KeyedVectors, pseudorandom_weak_vector, _COMPRESSED_EXTENSIONS
+from gensim.models.callbacks import TrainingMetrics
 from gensim import utils, matutils
 
 
@@ -207,8 +223,12 @@ try:
     from gensim.models.word2vec_inner import (  # noqa: F401
         train_batch_sg,
         train_batch_cbow,
+        train_batch_indexed_sg,
+        train_batch_indexed_cbow,
         score_sentence_sg,
         score_sentence_cbow,
+        build_alias_table,
+        batch_negatives_work_size,
         MAX_WORDS_IN_BATCH,
         FAST_VERSION,
     )
@@ -234,13 +254,293 @@ except ImportError:
         raise RuntimeError("Training with corpus_file argument is not supported")
 
 
+class _IndexedBatch:
+    """Batch of training sentences, already converted to the vocabulary indexes of their in-vocabulary words."""
+    def __init__(self, indexes, offsets, raw_words):
+        self.indexes = indexes  # np.uint32 vocabulary indexes of all sentences, concatenated
+        self.offsets = offsets  # np.int64 sentence boundaries in `indexes`, one more than there are sentences
+        self.raw_words = raw_words  # number of words in the sentences, including out-of-vocabulary words
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+def _produce_indexed_batches(partitions, key_to_index, batch_words, task_queue, batch_queue):
+    """Convert the corpus partitions requested through `task_queue` to :class:`_IndexedBatch` jobs in `batch_queue`.
+
+    Runs in the worker processes of :class:`_PartitionProducers`. Each finished partition is marked by a None
+    in `batch_queue`, preceded by the exception that stopped it, if any.
+
+    """
+    while True:
+        partition_id = task_queue.get()
+        if partition_id is None:
+            break  # no more partitions => quit this producer
+        try:
+            indexes, offsets, batch_size = [], [0], 0
+            for sentence in partitions[partition_id]:
+                # can we fit this sentence into the existing batch? if not, push the batch first
+                if batch_size + len(sentence) > batch_words and len(offsets) > 1:
+                    batch_queue.put(_IndexedBatch(
+                        np.array(indexes, dtype=np.uint32), np.array(offsets, dtype=np.int64), batch_size,
+                    ))
+                    indexes, offsets, batch_size = [], [0], 0
+                indexes.extend([key_to_index[word] for word in sentence if word in key_to_index])
+                offsets.append(len(indexes))
+                batch_size += len(sentence)
+            if len(offsets) > 1:
+                batch_queue.put(_IndexedBatch(
+                    np.array(indexes, dtype=np.uint32), np.array(offsets, dtype=np.int64), batch_size,
+                ))
+        except Exception as err:
+            logger.exception("failed to read corpus partition %i", partition_id)
+            batch_queue.put(RuntimeError(f"failed to read corpus partition {partition_id}: {err!r}"))
+        batch_queue.put(None)
+
+
+class _PartitionProducers:
+    """Worker processes that read partitions of a corpus and convert them to batches of vocabulary indexes.
+
+    Used by :meth:`~gensim.models.word2vec.Word2Vec.train` with `producers`, so that reading and tokenizing
+    the corpus isn't limited to the single job producer thread.
+
+    """
+    def __init__(self, partitions, key_to_index, batch_words, processes, maxsize):
+        self.partitions = partitions
+        self.error = None
+        self.unfinished = 0
+        self.task_queue = multiprocessing.Queue()
+        self.batch_queue = multiprocessing.Queue(maxsize=maxsize)
+        self.processes = [
+            multiprocessing.Process(
+                target=_produce_indexed_batches,
+                args=(partitions, key_to_index, batch_words, self.task_queue, self.batch_queue),
+            )
+            for _ in range(processes)
+        ]
+        for process in self.processes:
+            process.daemon = True
+            process.start()
+
+    def epoch(self):
+        """Iterate over the batches of one pass over all partitions, in the order they're produced.
+
+        Stops early, keeping the exception in `self.error`, if any partition failed.
+
+        """
+        self.unfinished = len(self.partitions)
+        for partition_id in range(len(self.partitions)):
+            self.task_queue.put(partition_id)
+        while self.unfinished:
+            batch = self.batch_queue.get()
+            if batch is None:
+                self.unfinished -= 1
+            elif isinstance(batch, Exception):
+                self.error = batch
+                return
+            else:
+                yield batch
+
+    def close(self):
+        """Stop the worker processes; kill them if they're still busy with an unfinished pass."""
+        if self.unfinished or self.error is not None:
+            for process in self.processes:
+                process.terminate()
+        else:
+            for _ in self.processes:
+                self.task_queue.put(None)
+        for process in self.processes:
+            process.join()
+
+
+class _Checkpointer:
+    """Write checkpoints of :meth:`~gensim.models.word2vec.Word2Vec.train` into a directory, in a background thread.
+
+    Each checkpoint consists of the trained weights, one ``.npy`` file per array so that they can be memory-mapped,
+    and the training state, pickled into `STATE_FILE`. The state file is written last and moved into place
+    atomically, so the directory always holds one complete checkpoint, even if training crashes in the middle
+    of a write. Only the newest snapshot waits to be written, so slow writes never stall the training.
+
+    """
+    STATE_FILE = 'state.pkl'
+
+    def __init__(self, path, delay=None):
+        """
+
+        Parameters
+        ----------
+        path : str
+            Path to the checkpoint directory, created if it doesn't exist.
+        delay : float, optional
+            Minimum number of seconds between two checkpoints in the middle of an epoch. If None, checkpoints
+            are only taken at the end of each epoch.
+
+        """
+        self.path = path
+        self.delay = delay
+        self.error = None
+        os.makedirs(path, exist_ok=True)
+        state_fname = os.path.join(path, self.STATE_FILE)
+        # continue the numbering, so that no file of the checkpoint already there gets overwritten
+        state = utils.unpickle(state_fname) if os.path.exists(state_fname) else {'generation': 0, 'arrays': {}}
+        self.generation = state['generation']
+        self._written = set(state['arrays'].values())  # array files of the latest checkpoint
+        self.last_save = default_timer()
+        self._pending = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._write_loop)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def due(self):
+        """Is it time for a checkpoint in the middle of an epoch?"""
+        return self.delay is not None and default_timer() - self.last_save >= self.delay
+
+    def save(self, model, epoch, examples=0, words=0):
+        """Take a snapshot of `model`, to be written in the background.
+
+        Must only be called while no worker is training, so that the weights match the training state.
+
+        Parameters
+        ----------
+        model : :class:`~gensim.models.word2vec.Word2Vec`
+            The model being trained.
+        epoch : int
+            The epoch to resume training from.
+        examples : int, optional
+            Number of examples of `epoch` already trained, to be skipped when resuming.
+        words : int, optional
+            Number of raw words in those examples.
+
+        """
+        self.last_save = default_timer()
+        arrays = {name: weights.copy() for name, weights in model._checkpoint_arrays().items()}
+        state = {
+            'epoch': epoch,
+            'examples': examples,
+            'words': words,
+            'epochs': model.epochs,
+            'random': copy.deepcopy(model.random),
+            'running_training_loss': model.running_training_loss,
+        }
+        with self._cond:
+            self._pending = (arrays, state)
+            self._cond.notify()
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                arrays, state = self._pending
+                self._pending = None
+            try:
+                self._write(arrays, state)
+            except Exception as err:
+                logger.exception("failed to write checkpoint into %s", self.path)
+                self.error = err
+
+    def _write(self, arrays, state):
+        self.generation += 1
+        fnames = {}
+        for name, weights in arrays.items():
+            fnames[name] = '%s.%i.npy' % (name, self.generation)
+            with open(os.path.join(self.path, fnames[name]), 'wb') as fout:
+                np.save(fout, weights)
+                fout.flush()
+                os.fsync(fout.fileno())
+        state['arrays'] = fnames
+        state['generation'] = self.generation
+        state_fname = os.path.join(self.path, self.STATE_FILE)
+        with open(state_fname + '.tmp', 'wb') as fout:
+            pickle.dump(state, fout, protocol=utils.PICKLE_PROTOCOL)
+            fout.flush()
+            os.fsync(fout.fileno())
+        os.replace(state_fname + '.tmp', state_fname)
+
+        # the arrays of the previous checkpoint aren't needed anymore; leave any other file alone
+        for fname in self._written.difference(fnames.values()):
+            try:
+                os.remove(os.path.join(self.path, fname))
+            except FileNotFoundError:
+                pass
+        self._written = set(fnames.values())
+        logger.info(
+            "saved checkpoint at epoch %i, %i examples into %s", state['epoch'] + 1, state['examples'], self.path,
+        )
+
+    def close(self):
+        """Write the pending snapshot, if any, and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+
+def _scan_sentences(sentences, max_vocab_size, trim_rule, vocab_sketch):
+    """Count the words in `sentences`, pruning rare words the same way as :meth:`Word2Vec._scan_vocab`.
+
+    Returns
+    -------
+    (dict of (str, int) or :class:`~gensim.utils.SpaceSaving`, int, int, int, None)
+        The word counts, number of words, number of sentences, the next `min_reduce` threshold for pruning,
+        and no extra per-partition statistics.
+
+    """
+    total_words, sentence_count, min_reduce = 0, 0, 1
+    if vocab_sketch and max_vocab_size:
+        sketch = utils.SpaceSaving(max_vocab_size)
+        for sentence in sentences:
+            sketch.update(sentence)
+            total_words += len(sentence)
+            sentence_count += 1
+        return sketch, total_words, sentence_count, min_reduce, None
+
+    vocab = defaultdict(int)
+    for sentence in sentences:
+        for word in sentence:
+            vocab[word] += 1
+        total_words += len(sentence)
+        sentence_count += 1
+        if max_vocab_size and len(vocab) > max_vocab_size:
+            utils.prune_vocab(vocab, min_reduce, trim_rule=trim_rule)
+            min_reduce += 1
+    return dict(vocab), total_words, sentence_count, min_reduce, None
+
+
+_vocab_scanner = {}  # state of the worker processes of Word2Vec._scan_vocab_partitions
+
+
+def _init_vocab_scanner(scan_partition, partitions, max_vocab_size, trim_rule, vocab_sketch):
+    """Set up a worker process of :meth:`Word2Vec._scan_vocab_partitions`.
+
+    Inherited, rather than pickled, where processes are forked, so that `trim_rule` may be a lambda.
+
+    """
+    _vocab_scanner.update(
+        scan_partition=scan_partition, partitions=partitions, max_vocab_size=max_vocab_size, trim_rule=trim_rule,
+        vocab_sketch=vocab_sketch,
+    )
+
+
+def _scan_vocab_partition(partition_id):
+    """Count the words of one partition, in a worker process of :meth:`Word2Vec._scan_vocab_partitions`."""
+    return _vocab_scanner['scan_partition'](
+        _vocab_scanner['partitions'][partition_id], _vocab_scanner['max_vocab_size'], _vocab_scanner['trim_rule'],
+        _vocab_scanner['vocab_sketch'],
+    )
+
+
 class Word2Vec(utils.SaveLoad):
     def __init__(
             self, sentences=None, corpus_file=None, vector_size=100, alpha=0.025, window=5, min_count=5,
             max_vocab_size=None, sample=1e-3, seed=1, workers=3, min_alpha=0.0001,
             sg=0, hs=0, negative=5, ns_exponent=0.75, cbow_mean=1, hashfxn=hash, epochs=5, null_word=0,
             trim_rule=None, sorted_vocab=1, batch_words=MAX_WORDS_IN_BATCH, compute_loss=False, callbacks=(),
-            comment=None, max_final_vocab=None,
+            comment=None, max_final_vocab=None, batch_negatives=False, vocab_sketch=False,
         ):
         """Train, use and evaluate neural networks described in https://code.google.com/p/word2vec/.
 
@@ -313,6 +613,13 @@ class Word2Vec(utils.SaveLoad):
             Limits the vocab to a target vocab size by automatically picking a matching min_count. If the specified
             min_count is more than the calculated min_count, the specified min_count will be used.
             Set to `None` if not required.
+        vocab_sketch : bool, optional
+            If True, count the words during vocabulary building with a Space-Saving sketch of `max_vocab_size`
+            words (see :class:`~gensim.utils.SpaceSaving`), instead of repeatedly pruning the infrequent ones.
+            The memory stays fixed, and the counts have explicit error bounds: every word more frequent than
+            the total number of words divided by `max_vocab_size` is kept, with its count overestimated by at most
+            that much. Ignored without `max_vocab_size`. A `trim_rule` is applied to the counted words once the scan
+            is over: it can discard words, but it can't keep words that the sketch didn't count.
         sample : float, optional
             The threshold for configuring which higher-frequency words are randomly downsampled,
             useful range is (0, 1e-5).
@@ -345,6 +652,11 @@ class Word2Vec(utils.SaveLoad):
             :meth:`~gensim.models.word2vec.Word2Vec.get_latest_training_loss`.
         callbacks : iterable of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
             Sequence of callbacks to be executed at specific stages during training.
+        batch_negatives : bool, optional
+            If True, skip-gram with negative sampling draws one set of negative words per context window, shared
+            by all the words of that window, instead of one per (word, context word) pair. The updates of a whole
+            window then run as matrix-matrix multiplications, which is considerably faster per core, for
+            a slightly different training trajectory. Ignored for CBOW, or without negative sampling.
 
         Examples
         --------
@@ -384,6 +696,7 @@ class Word2Vec(utils.SaveLoad):
         self.ns_exponent = ns_exponent
         self.cbow_mean = int(cbow_mean)
         self.compute_loss = bool(compute_loss)
+        self.batch_negatives = bool(batch_negatives)
         self.running_training_loss = 0
         self.min_alpha_yet_reached = float(alpha)
         self.corpus_count = 0
@@ -391,11 +704,13 @@ class Word2Vec(utils.SaveLoad):
 
         self.max_final_vocab = max_final_vocab
         self.max_vocab_size = max_vocab_size
+        self.vocab_sketch = bool(vocab_sketch)
         self.min_count = min_count
         self.sample = sample
         self.sorted_vocab = sorted_vocab
         self.null_word = null_word
         self.cum_table = None  # for negative sampling
+        self.alias_table = None
         self.raw_vocab = None
 
         if not hasattr(self, 'wv'):  # set unless subclass already set (eg: FastText)
@@ -437,7 +752,7 @@ class Word2Vec(utils.SaveLoad):
 
     def build_vocab(
             self, corpus_iterable=None, corpus_file=None, update=False, progress_per=10000,
-            keep_raw_vocab=False, trim_rule=None, **kwargs,
+            keep_raw_vocab=False, trim_rule=None, producers=0, **kwargs,
     ):
         """Build vocabulary from a sequence of sentences (can be a once-only generator stream).
 
@@ -472,13 +787,18 @@ class Word2Vec(utils.SaveLoad):
                 * `count` (int) - the word's frequency count in the corpus
                 * `min_count` (int) - the minimum count threshold.
 
+        producers : int, optional
+            Number of worker processes that count the words, see :meth:`~gensim.models.word2vec.Word2Vec.scan_vocab`.
+            By default (0), the corpus is scanned in this process.
         **kwargs : object
             Keyword arguments propagated to `self.prepare_vocab`.
 
         """
         self._check_corpus_sanity(corpus_iterable=corpus_iterable, corpus_file=corpus_file, passes=1)
         total_words, corpus_count = self.scan_vocab(
-            corpus_iterable=corpus_iterable, corpus_file=corpus_file, progress_per=progress_per, trim_rule=trim_rule)
+            corpus_iterable=corpus_iterable, corpus_file=corpus_file, progress_per=progress_per, trim_rule=trim_rule,
+            producers=producers,
+        )
         self.corpus_count = corpus_count
         self.corpus_total_words = total_words
         report_values = self.prepare_vocab(update=update, keep_raw_vocab=keep_raw_vocab, trim_rule=trim_rule, **kwargs)
@@ -539,7 +859,8 @@ class Word2Vec(utils.SaveLoad):
         sentence_no = -1
         total_words = 0
         min_reduce = 1
-        vocab = defaultdict(int)
+        sketch = utils.SpaceSaving(self.max_vocab_size) if self.vocab_sketch and self.max_vocab_size else None
+        vocab = defaultdict(int) if sketch is None else sketch
         checked_string_types = 0
         for sentence_no, sentence in enumerate(sentences):
             if not checked_string_types:
@@ -555,24 +876,96 @@ class Word2Vec(utils.SaveLoad):
                     "PROGRESS: at sentence #%i, processed %i words, keeping %i word types",
                     sentence_no, total_words, len(vocab),
                 )
-            for word in sentence:
-                vocab[word] += 1
+            if sketch is not None:
+                sketch.update(sentence)
+            else:
+                for word in sentence:
+                    vocab[word] += 1
             total_words += len(sentence)
 
-            if self.max_vocab_size and len(vocab) > self.max_vocab_size:
+            if sketch is None and self.max_vocab_size and len(vocab) > self.max_vocab_size:
                 utils.prune_vocab(vocab, min_reduce, trim_rule=trim_rule)
                 min_reduce += 1
 
         corpus_count = sentence_no + 1
-        self.raw_vocab = vocab
+        self.raw_vocab = vocab if sketch is None else self._sketch_counts(sketch, trim_rule)
         return total_words, corpus_count
 
-    def scan_vocab(self, corpus_iterable=None, corpus_file=None, progress_per=10000, workers=None, trim_rule=None):
-        logger.info("collecting all words and their counts")
-        if corpus_file:
-            corpus_iterable = LineSentence(corpus_file)
+    def _sketch_counts(self, sketch, trim_rule=None):
+        """Get the raw vocabulary counted by a :class:`~gensim.utils.SpaceSaving` sketch, logging its error bound.
+
+        Parameters
+        ----------
+        sketch : :class:`~gensim.utils.SpaceSaving`
+            The word counts.
+        trim_rule : function, optional
+            Vocabulary trimming rule, applied to the counted words like when pruning the vocabulary
+            during a scan without a sketch, see :func:`~gensim.utils.keep_vocab_item`.
 
-        total_words, corpus_count = self._scan_vocab(corpus_iterable, progress_per, trim_rule)
+        Returns
+        -------
+        dict of (str, int)
+            Upper bounds of the counts of the most frequent words.
+
+        """
+        logger.info(
+            "counted the %i most frequent words with a Space-Saving sketch: each count is at most %i too high, "
+            "and any word more frequent than that is counted",
+            len(sketch), sketch.max_error(),
+        )
+        counts = sketch.counts
+        if trim_rule is not None:
+            counts = {word: count for word, count in counts.items() if utils.keep_vocab_item(word, count, 1, trim_rule)}
+            logger.info("trim_rule kept %i of the %i counted words", len(counts), len(sketch))
+        return counts
+
+    def scan_vocab(
+            self, corpus_iterable=None, corpus_file=None, progress_per=10000, workers=None, trim_rule=None,
+            producers=0,
+        ):
+        """Collect the raw vocabulary: a mapping from unique words in the corpus to their frequency count.
+
+        Parameters
+        ----------
+        corpus_iterable : iterable of list of str, optional
+            The sentences to scan.
+        corpus_file : str, optional
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, instead of
+            `corpus_iterable`.
+        progress_per : int, optional
+            Progress will be logged every `progress_per` sentences.
+        workers : int, optional
+            Unused.
+        trim_rule : function, optional
+            Vocabulary trimming rule applied when pruning to `max_vocab_size`,
+            see :meth:`~gensim.models.word2vec.Word2Vec.build_vocab`.
+        producers : int, optional
+            Number of worker processes that count the words, each over its own partitions of the corpus.
+            Their counts are then merged, and pruned to `max_vocab_size` like in a single pass, or merged into
+            a single sketch with `vocab_sketch`.
+            With `producers`, `corpus_iterable` must be a sequence of partitions of the corpus, each an iterable
+            of sentences, like in :meth:`~gensim.models.word2vec.Word2Vec.train`, while an (uncompressed)
+            `corpus_file` is split into `producers` ranges of lines.
+
+        Returns
+        -------
+        (int, int)
+            Number of words and of sentences in the corpus.
+
+        """
+        logger.info("collecting all words and their counts")
+        if producers and corpus_file:
+            partitions = _LineSentenceRange.split(corpus_file, producers)
+            total_words, corpus_count, _ = self._scan_vocab_partitions(
+                partitions, producers, _scan_sentences, trim_rule)
+        elif producers and corpus_iterable is not None:
+            partitions = self._check_corpus_partitions(corpus_iterable)
+            total_words, corpus_count, _ = self._scan_vocab_partitions(
+                partitions, producers, _scan_sentences, trim_rule)
+        else:
+            if corpus_file:
+                corpus_iterable = LineSentence(corpus_file)
+            total_words, corpus_count = self._scan_vocab(corpus_iterable, progress_per, trim_rule)
 
         logger.info(
             "collected %i word types from a corpus of %i raw words and %i sentences",
@@ -581,6 +974,70 @@ class Word2Vec(utils.SaveLoad):
 
         return total_words, corpus_count
 
+    def _scan_vocab_partitions(self, partitions, producers, scan_partition, trim_rule):
+        """Count the words of corpus `partitions` in `producers` worker processes, into `self.raw_vocab`.
+
+        The counts of each partition are merged in the order of `partitions`. Partitions that had to be pruned
+        to `max_vocab_size` on their own raise the pruning threshold of the merged counts too, so that the rare
+        words dropped from one partition don't survive with the partial counts of another one. With `vocab_sketch`,
+        the sketches of the partitions are merged instead, adding up their error bounds.
+
+        Parameters
+        ----------
+        partitions : list of iterable
+            The corpus, split into partitions.
+        producers : int
+            Number of worker processes.
+        scan_partition : function
+            Module-level function that counts the words of a single partition, with the signature and results of
+            :func:`~gensim.models.word2vec._scan_sentences`.
+        trim_rule : function, optional
+            Vocabulary trimming rule applied when pruning.
+
+        Returns
+        -------
+        (int, int, list)
+            Number of words and of examples in the corpus, and the extra statistics of each partition.
+
+        """
+        logger.info("scanning %i corpus partitions in %i processes", len(partitions), producers)
+        vocab = defaultdict(int)
+        sketch = None
+        total_words, corpus_count, min_reduce, extras = 0, 0, 1, []
+        pool = multiprocessing.Pool(
+            producers, initializer=_init_vocab_scanner,
+            initargs=(scan_partition, partitions, self.max_vocab_size, trim_rule, self.vocab_sketch),
+        )
+        try:
+            results = pool.imap(_scan_vocab_partition, range(len(partitions)))
+            for partition_no, (counts, words, examples, partition_min_reduce, extra) in enumerate(results):
+                if isinstance(counts, utils.SpaceSaving):
+                    if sketch is None:
+                        sketch = vocab = counts
+                    else:
+                        sketch.merge(counts)
+                else:
+                    utils.merge_counts(vocab, counts)
+                total_words += words
+                corpus_count += examples
+                extras.append(extra)
+                if partition_min_reduce > min_reduce:
+                    utils.prune_vocab(vocab, partition_min_reduce - 1, trim_rule=trim_rule)
+                    min_reduce = partition_min_reduce
+                if sketch is None and self.max_vocab_size and len(vocab) > self.max_vocab_size:
+                    utils.prune_vocab(vocab, min_reduce, trim_rule=trim_rule)
+                    min_reduce += 1
+                logger.info(
+                    "PROGRESS: at partition #%i of %i, processed %i words, keeping %i word types",
+                    partition_no + 1, len(partitions), total_words, len(vocab),
+                )
+        finally:
+            pool.terminate()
+            pool.join()
+
+        self.raw_vocab = vocab if sketch is None else self._sketch_counts(sketch, trim_rule)
+        return total_words, corpus_count, extras
+
     def prepare_vocab(
             self, update=False, keep_raw_vocab=False, trim_rule=None,
             min_count=None, sample=None, dry_run=False,
@@ -645,8 +1102,11 @@ class Word2Vec(utils.SaveLoad):
                     drop_total += v
             if not dry_run:
                 # now update counts
-                for word in self.wv.index_to_key:
-                    self.wv.set_vecattr(word, 'count', self.raw_vocab[word])
+                self.wv.allocate_vecattrs(attrs=['count'], types=[type(0)])
+                self.wv.expandos['count'][:] = np.fromiter(
+                    (self.raw_vocab[word] for word in self.wv.index_to_key),
+                    dtype=np.int64, count=len(self.wv.index_to_key),
+                )
             original_unique_total = len(retain_words) + drop_unique
             retain_unique_pct = len(retain_words) * 100 / max(original_unique_total, 1)
             self.add_lifecycle_event(
@@ -690,8 +1150,10 @@ class Word2Vec(utils.SaveLoad):
             if not dry_run:
                 # now update counts
                 self.wv.allocate_vecattrs(attrs=['count'], types=[type(0)])
-                for word in self.wv.index_to_key:
-                    self.wv.set_vecattr(word, 'count', self.wv.get_vecattr(word, 'count') + self.raw_vocab.get(word, 0))
+                self.wv.expandos['count'] += np.fromiter(
+                    (self.raw_vocab.get(word, 0) for word in self.wv.index_to_key),
+                    dtype=np.int64, count=len(self.wv.index_to_key),
+                )
             original_unique_total = len(pre_exist_words) + len(new_words) + drop_unique
             pre_exist_unique_pct = len(pre_exist_words) * 100 / max(original_unique_total, 1)
             new_unique_pct = len(new_words) * 100 / max(original_unique_total, 1)
@@ -717,18 +1179,19 @@ class Word2Vec(utils.SaveLoad):
             # new shorthand: sample >= 1 means downsample all words with higher count than sample
             threshold_count = int(sample * (3 + np.sqrt(5)) / 2)
 
-        downsample_total, downsample_unique = 0, 0
-        for w in retain_words:
-            v = self.raw_vocab[w]
-            word_probability = (np.sqrt(v / threshold_count) + 1) * (threshold_count / v)
-            if word_probability < 1.0:
-                downsample_unique += 1
-                downsample_total += word_probability * v
-            else:
-                word_probability = 1.0
-                downsample_total += v
-            if not dry_run:
-                self.wv.set_vecattr(w, 'sample_int', np.uint32(word_probability * (2**32 - 1)))
+        retain_counts = np.fromiter(
+            (self.raw_vocab[word] for word in retain_words), dtype=np.float64, count=len(retain_words),
+        )
+        word_probability = (np.sqrt(retain_counts / threshold_count) + 1) * (threshold_count / retain_counts)
+        downsample_unique = int(np.count_nonzero(word_probability < 1.0))
+        word_probability = np.minimum(word_probability, 1.0)
+        downsample_total = float(np.sum(word_probability * retain_counts))
+        if not dry_run:
+            retain_indexes = np.fromiter(
+                (self.wv.key_to_index[word] for word in retain_words), dtype=np.int64, count=len(retain_words),
+            )
+            self.wv.allocate_vecattrs(attrs=['sample_int'], types=[np.uint32])
+            self.wv.expandos['sample_int'][retain_indexes] = (word_probability * (2**32 - 1)).astype(np.uint32)
 
         if not dry_run and not keep_raw_vocab:
             logger.info("deleting the raw counts dictionary of %i items", len(self.raw_vocab))
@@ -819,21 +1282,22 @@ class Word2Vec(utils.SaveLoad):
         then finding that integer's sorted insertion point (as if by `bisect_left` or `ndarray.searchsorted()`).
         That insertion point is the drawn index, coming up in proportion equal to the increment at that slot.
 
+        The training routines draw from the same distribution in constant time instead, using the Walker alias table
+        `alias_table` built here as well, see :func:`~gensim.models.word2vec_inner.build_alias_table`.
+
         """
         vocab_size = len(self.wv.index_to_key)
-        self.cum_table = np.zeros(vocab_size, dtype=np.uint32)
-        # compute sum of all power (Z in paper)
-        train_words_pow = 0.0
-        for word_index in range(vocab_size):
-            count = self.wv.get_vecattr(word_index, 'count')
-            train_words_pow += count**self.ns_exponent
-        cumulative = 0.0
-        for word_index in range(vocab_size):
-            count = self.wv.get_vecattr(word_index, 'count')
-            cumulative += count**self.ns_exponent
-            self.cum_table[word_index] = round(cumulative / train_words_pow * domain)
-        if len(self.cum_table) > 0:
-            assert self.cum_table[-1] == domain
+        if not vocab_size:
+            self.cum_table = np.zeros(0, dtype=np.uint32)
+            self.alias_table = np.zeros((0, 2), dtype=np.uint32)
+            return
+        counts = self.wv.expandos['count'][:vocab_size].astype(np.float64)
+        weights = counts ** self.ns_exponent
+        # the last cumulative value is the sum of all powers (Z in paper)
+        cumulative = np.cumsum(weights)
+        self.cum_table = np.round(cumulative / cumulative[-1] * domain).astype(np.uint32)
+        assert self.cum_table[-1] == domain
+        self.alias_table = build_alias_table(weights)
 
     def prepare_weights(self, update=False):
         """Build tables and model weights based on final vocabulary settings."""
@@ -926,7 +1390,8 @@ class Word2Vec(utils.SaveLoad):
         Parameters
         ----------
         sentences : iterable of list of str
-            Corpus chunk to be used in this training batch.
+            Corpus chunk to be used in this training batch, or the same chunk already converted to vocabulary
+            indexes by the `producers` of :meth:`~gensim.models.word2vec.Word2Vec.train`.
         alpha : float
             The learning rate used in this batch.
         inits : (np.ndarray, np.ndarray)
@@ -939,6 +1404,16 @@ class Word2Vec(utils.SaveLoad):
 
         """
         work, neu1 = inits
+        if isinstance(sentences, _IndexedBatch):
+            if self.sg:
+                tally = train_batch_indexed_sg(
+                    self, sentences.indexes, sentences.offsets, alpha, work, self.compute_loss,
+                )
+            else:
+                tally = train_batch_indexed_cbow(
+                    self, sentences.indexes, sentences.offsets, alpha, work, neu1, self.compute_loss,
+                )
+            return tally, sentences.raw_words
         tally = 0
         if self.sg:
             tally += train_batch_sg(self, sentences, alpha, work, self.compute_loss)
@@ -949,12 +1424,75 @@ class Word2Vec(utils.SaveLoad):
     def _clear_post_train(self):
         """Clear any cached values that training may have invalidated."""
         self.wv.norms = None
+        self.wv._drop_quantized()
+
+    def _checkpoint_arrays(self):
+        """Get the weights updated by training, which make up a checkpoint of
+        :meth:`~gensim.models.word2vec.Word2Vec.train`.
+
+        Returns
+        -------
+        dict of (str, numpy.ndarray)
+            The arrays, by the name of their attribute.
+
+        """
+        arrays = {'wv.vectors': self.wv.vectors}
+        if self.hs:
+            arrays['syn1'] = self.syn1
+        if self.negative:
+            arrays['syn1neg'] = self.syn1neg
+        return arrays
+
+    def _resume_checkpoint(self, path):
+        """Load the weights and training state of a checkpoint written by
+        :meth:`~gensim.models.word2vec.Word2Vec.train` into this model.
+
+        Parameters
+        ----------
+        path : str
+            Path to the checkpoint directory.
+
+        Returns
+        -------
+        dict
+            The training state: the `epoch` to resume from, and the number of `examples` and raw `words` of that
+            epoch already trained.
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint was written with a different number of epochs, or its weights don't fit this model.
+
+        """
+        state = utils.unpickle(os.path.join(path, _Checkpointer.STATE_FILE))
+        if state['epochs'] != self.epochs:
+            raise ValueError(
+                f"checkpoint in {path} was written when training for {state['epochs']} epochs, "
+                f"can't resume training for {self.epochs} epochs"
+            )
+        arrays = self._checkpoint_arrays()
+        if sorted(arrays) != sorted(state['arrays']):
+            raise ValueError(f"checkpoint in {path} has weights {sorted(state['arrays'])}, expected {sorted(arrays)}")
+        for name, fname in state['arrays'].items():
+            saved = np.load(os.path.join(path, fname), mmap_mode='r')
+            if saved.shape != arrays[name].shape:
+                raise ValueError(
+                    f"checkpoint in {path} has {name} of shape {saved.shape}, expected {arrays[name].shape}"
+                )
+            arrays[name][...] = saved
+        self.random = state['random']
+        self.running_training_loss = state['running_training_loss']
+        logger.info(
+            "resuming training from checkpoint in %s, at epoch %i after %i examples",
+            path, state['epoch'] + 1, state['examples'],
+        )
+        return state
 
     def train(
             self, corpus_iterable=None, corpus_file=None, total_examples=None, total_words=None,
             epochs=None, start_alpha=None, end_alpha=None, word_count=0,
-            queue_factor=2, report_delay=1.0, compute_loss=False, callbacks=(),
-            **kwargs,
+            queue_factor=2, report_delay=1.0, compute_loss=False, callbacks=(), producers=0,
+            checkpoint_path=None, checkpoint_delay=None, resume_from=None, **kwargs,
         ):
         """Update the model's neural weights from a sequence of sentences.
 
@@ -981,10 +1519,14 @@ class Word2Vec(utils.SaveLoad):
             or :class:`~gensim.models.word2vec.LineSentence` in :mod:`~gensim.models.word2vec` module for such examples.
             See also the `tutorial on data streaming in Python
             <https://rare-technologies.com/data-streaming-in-python-generators-iterators-iterables/>`_.
+            An :class:`~gensim.models.word2vec.IndexedSentences` corpus, already converted to the vocabulary
+            indexes of this model, is trained on without re-reading and re-tokenizing it in every epoch.
         corpus_file : str, optional
             Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
             You may use this argument instead of `sentences` to get performance boost. Only one of `sentences` or
             `corpus_file` arguments need to be passed (not both of them).
+            The lines of the file are indexed once, into a :class:`~gensim.models.word2vec.CorpusFileIndex` stored
+            next to it, which splits the file among the worker threads in later calls without rescanning it.
         total_examples : int
             Count of sentences.
         total_words : int
@@ -1012,7 +1554,33 @@ class Word2Vec(utils.SaveLoad):
             If True, computes and stores loss value which can be retrieved using
             :meth:`~gensim.models.word2vec.Word2Vec.get_latest_training_loss`.
         callbacks : iterable of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
-            Sequence of callbacks to be executed at specific stages during training.
+            Sequence of callbacks to be executed at specific stages during training. Progress and throughput
+            are passed to their :meth:`~gensim.models.callbacks.CallbackAny2Vec.on_progress` once every
+            `report_delay` seconds, see :class:`~gensim.models.callbacks.TrainingMetrics`.
+        producers : int, optional
+            Number of worker processes that read the corpus and convert it to vocabulary indexes.
+            By default (0), a single thread does that, which limits the training throughput once there are
+            more than about 8 `workers`. With `producers`, `corpus_iterable` must be a sequence of partitions
+            of the corpus, each a restartable iterable of sentences, such as one
+            :class:`~gensim.models.word2vec.LineSentence` per file. The partitions are handed out to
+            the processes in turn, and the `workers` threads train on the batches they produce, updating
+            the shared weights in place as usual. The learning rate still decays with the overall progress
+            over all partitions, so `total_examples` or `total_words` must count the whole corpus.
+            Not supported by :class:`~gensim.models.doc2vec.Doc2Vec`. For many epochs over the same corpus,
+            consider converting it once with :meth:`~gensim.models.word2vec.IndexedSentences.serialize` instead.
+        checkpoint_path : str, optional
+            Directory to keep a checkpoint of the training in, written at the end of each epoch. The weights
+            are saved as ``.npy`` arrays, which can be memory-mapped, and replaced atomically, in a background
+            thread that doesn't stall the training.
+        checkpoint_delay : float, optional
+            Also write a checkpoint in the middle of an epoch, at most once every `checkpoint_delay` seconds.
+            To take a consistent snapshot, the job producer waits until the workers have finished all queued jobs.
+            Only supported with `corpus_iterable`, without `producers`.
+        resume_from : str, optional
+            Directory of a checkpoint written with `checkpoint_path`, to resume training from. The model must
+            have the same vocabulary and parameters as when the checkpoint was written, and `train` must be called
+            with the same corpus and `epochs`: the weights, random state and learning rate schedule are restored,
+            and the already trained epochs and examples are skipped. Can be the same as `checkpoint_path`.
 
         Examples
         --------
@@ -1026,6 +1594,30 @@ class Word2Vec(utils.SaveLoad):
             >>> model.train(sentences, total_examples=model.corpus_count, epochs=model.epochs)  # train word vectors
             (1, 30)
 
+        Train on a corpus split into partitions, each read by one of two producer processes:
+
+        .. sourcecode:: pycon
+
+            >>> partitions = [sentences[:1], sentences[1:]]
+            >>> model.train(partitions, total_examples=model.corpus_count, epochs=model.epochs, producers=2)
+            (1, 30)
+
+        Keep a checkpoint of the training, to resume from after a crash:
+
+        .. sourcecode:: pycon
+
+            >>> from gensim.test.utils import get_tmpfile
+            >>>
+            >>> checkpoint = get_tmpfile("word2vec_checkpoint")
+            >>> trained_words, raw_words = model.train(
+            ...     sentences, total_examples=model.corpus_count, epochs=model.epochs,
+            ...     checkpoint_path=checkpoint, checkpoint_delay=600)
+            >>>
+            >>> # after a crash, rebuild the model as it was before training, then
+            >>> trained_words, raw_words = model.train(
+            ...     sentences, total_examples=model.corpus_count, epochs=model.epochs,
+            ...     checkpoint_path=checkpoint, resume_from=checkpoint)
+
         """
         self.alpha = start_alpha or self.alpha
         self.min_alpha = end_alpha or self.min_alpha
@@ -1046,6 +1638,15 @@ class Word2Vec(utils.SaveLoad):
         self.compute_loss = compute_loss
         self.running_training_loss = 0.0
 
+        resume = {'epoch': 0, 'examples': 0, 'words': 0}
+        if resume_from is not None:
+            resume = self._resume_checkpoint(resume_from)
+            if resume['examples'] and (
+                    corpus_iterable is None or producers or isinstance(corpus_iterable, IndexedSentences)):
+                raise ValueError(
+                    "can only resume training in the middle of an epoch with corpus_iterable, without producers"
+                )
+
         for callback in callbacks:
             callback.on_train_begin(self)
 
@@ -1054,26 +1655,66 @@ class Word2Vec(utils.SaveLoad):
         start = default_timer() - 0.00001
         job_tally = 0
 
-        for cur_epoch in range(self.epochs):
-            for callback in callbacks:
-                callback.on_epoch_begin(self)
-
-            if corpus_iterable is not None:
-                trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch(
-                    corpus_iterable, cur_epoch=cur_epoch, total_examples=total_examples,
-                    total_words=total_words, queue_factor=queue_factor, report_delay=report_delay,
-                    callbacks=callbacks, **kwargs)
-            else:
-                trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch_corpusfile(
-                    corpus_file, cur_epoch=cur_epoch, total_examples=total_examples, total_words=total_words,
-                    callbacks=callbacks, **kwargs)
+        partition_producers = None
+        if isinstance(corpus_iterable, IndexedSentences):
+            self._check_indexed_training()
+            corpus_iterable.check_vocab(self.wv)
+        elif producers and corpus_iterable is not None:
+            partition_producers = self._start_partition_producers(corpus_iterable, producers, queue_factor)
 
-            trained_word_count += trained_word_count_epoch
-            raw_word_count += raw_word_count_epoch
-            job_tally += job_tally_epoch
+        checkpointer = None
+        if checkpoint_path is not None:
+            mid_epoch = corpus_iterable is not None and not producers and not isinstance(
+                corpus_iterable, IndexedSentences)
+            checkpointer = _Checkpointer(checkpoint_path, checkpoint_delay if mid_epoch else None)
 
-            for callback in callbacks:
-                callback.on_epoch_end(self)
+        try:
+            for cur_epoch in range(resume['epoch'], self.epochs):
+                for callback in callbacks:
+                    callback.on_epoch_begin(self)
+
+                if partition_producers is not None:
+                    trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch_batches(
+                        partition_producers.epoch(), cur_epoch=cur_epoch, total_examples=total_examples,
+                        total_words=total_words, queue_factor=queue_factor, report_delay=report_delay,
+                        callbacks=callbacks)
+                    if partition_producers.error is not None:
+                        raise partition_producers.error
+                elif isinstance(corpus_iterable, IndexedSentences):
+                    trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch_batches(
+                        corpus_iterable.batches(self.batch_words), cur_epoch=cur_epoch, total_examples=total_examples,
+                        total_words=total_words, queue_factor=queue_factor, report_delay=report_delay,
+                        callbacks=callbacks)
+                elif corpus_iterable is not None:
+                    start_examples, start_words = (0, 0)
+                    if cur_epoch == resume['epoch']:
+                        start_examples, start_words = resume['examples'], resume['words']
+                    trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch(
+                        corpus_iterable, cur_epoch=cur_epoch, total_examples=total_examples,
+                        total_words=total_words, queue_factor=queue_factor, report_delay=report_delay,
+                        callbacks=callbacks, start_examples=start_examples, start_words=start_words,
+                        checkpointer=checkpointer, **kwargs)
+                else:
+                    trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch_corpusfile(
+                        corpus_file, cur_epoch=cur_epoch, total_examples=total_examples, total_words=total_words,
+                        callbacks=callbacks, **kwargs)
+
+                trained_word_count += trained_word_count_epoch
+                raw_word_count += raw_word_count_epoch
+                job_tally += job_tally_epoch
+
+                if checkpointer is not None:
+                    checkpointer.save(self, cur_epoch + 1)
+
+                for callback in callbacks:
+                    callback.on_epoch_end(self)
+        finally:
+            if partition_producers is not None:
+                partition_producers.close()
+            if checkpointer is not None:
+                checkpointer.close()
+        if checkpointer is not None and checkpointer.error is not None:
+            raise checkpointer.error
 
         # Log overall time
         total_elapsed = default_timer() - start
@@ -1106,25 +1747,28 @@ class Word2Vec(utils.SaveLoad):
             Offset (in bytes) in the `corpus_file` for particular worker.
         cython_vocab : :class:`~gensim.models.word2vec_inner.CythonVocab`
             Copy of the vocabulary in order to access it without GIL.
-        progress_queue : Queue of (int, int, int)
-            A queue of progress reports. Each report is represented as a tuple of these 3 elements:
+        progress_queue : Queue of (int, int, int, (int, float, float))
+            A queue of progress reports. Each report is represented as a tuple of these 4 elements:
                 * Size of data chunk processed, for example number of sentences in the corpus chunk.
                 * Effective word count used in training (after ignoring unknown words and trimming the sentence length).
                 * Total word count used in training.
+                * Timings of the worker: its `thread_id`, seconds spent waiting for the data chunk and seconds
+                  spent training on it.
         **kwargs : object
             Additional key word parameters for the specific model inheriting from this class.
 
         """
         thread_private_mem = self._get_thread_working_mem()
 
+        start = default_timer()
         examples, tally, raw_tally = self._do_train_epoch(
             corpus_file, thread_id, offset, cython_vocab, thread_private_mem, cur_epoch,
             total_examples=total_examples, total_words=total_words, **kwargs)
 
-        progress_queue.put((examples, tally, raw_tally))
+        progress_queue.put((examples, tally, raw_tally, (thread_id, 0.0, default_timer() - start)))
         progress_queue.put(None)
 
-    def _worker_loop(self, job_queue, progress_queue):
+    def _worker_loop(self, job_queue, progress_queue, thread_id=0):
         """Train the model, lifting batches of data from the queue.
 
         This function will be called in parallel by multiple workers (threads or processes) to make
@@ -1136,29 +1780,41 @@ class Word2Vec(utils.SaveLoad):
             A queue of jobs still to be processed. The worker will take up jobs from this queue.
             Each job is represented by a tuple where the first element is the corpus chunk to be processed and
             the second is the floating-point learning rate.
-        progress_queue : Queue of (int, int, int)
-            A queue of progress reports. Each report is represented as a tuple of these 3 elements:
+        progress_queue : Queue of (int, int, int, (int, float, float))
+            A queue of progress reports. Each report is represented as a tuple of these 4 elements:
                 * Size of data chunk processed, for example number of sentences in the corpus chunk.
                 * Effective word count used in training (after ignoring unknown words and trimming the sentence length).
                 * Total word count used in training.
+                * Timings of the worker: its `thread_id`, seconds spent waiting for the data chunk and seconds
+                  spent training on it.
+        thread_id : int, optional
+            Thread index starting from 0 to `number of workers - 1`, used to tell apart the timings of workers.
 
         """
         thread_private_mem = self._get_thread_working_mem()
         jobs_processed = 0
         while True:
+            waiting = default_timer()
             job = job_queue.get()
             if job is None:
                 progress_queue.put(None)
+                job_queue.task_done()
                 break  # no more jobs => quit this worker
             data_iterable, alpha = job
 
+            training = default_timer()
             tally, raw_tally = self._do_train_job(data_iterable, alpha, thread_private_mem)
+            timings = (thread_id, training - waiting, default_timer() - training)
 
-            progress_queue.put((len(data_iterable), tally, raw_tally))  # report back progress
+            progress_queue.put((len(data_iterable), tally, raw_tally, timings))  # report back progress
+            job_queue.task_done()  # lets the job producer wait for all queued jobs before a checkpoint
             jobs_processed += 1
         logger.debug("worker exiting, processed %i jobs", jobs_processed)
 
-    def _job_producer(self, data_iterator, job_queue, cur_epoch=0, total_examples=None, total_words=None):
+    def _job_producer(
+            self, data_iterator, job_queue, cur_epoch=0, total_examples=None, total_words=None,
+            start_examples=0, start_words=0, checkpointer=None,
+        ):
         """Fill the jobs queue using the data found in the input stream.
 
         Each job is represented by a tuple where the first element is the corpus chunk to be processed and
@@ -1181,67 +1837,135 @@ class Word2Vec(utils.SaveLoad):
         total_words : int, optional
             Count of total objects in `data_iterator`. In the usual case this would correspond to the number of raw
             words in a corpus. Used to log progress.
+        start_examples : int, optional
+            Number of objects at the start of `data_iterator` to skip, because they were already trained
+            before the checkpoint that training resumed from.
+        start_words : int, optional
+            Count of total objects in the skipped `start_examples`.
+        checkpointer : :class:`_Checkpointer`, optional
+            Takes a checkpoint whenever it's due, after the workers finished all jobs queued so far.
 
         """
         job_batch, batch_size = [], 0
-        pushed_words, pushed_examples = 0, 0
-        next_alpha = self._get_next_alpha(0.0, cur_epoch)
+        pushed_words, pushed_examples = start_words, start_examples
+        if total_examples:
+            next_alpha = self._get_next_alpha(1.0 * pushed_examples / total_examples, cur_epoch)
+        else:
+            next_alpha = self._get_next_alpha(1.0 * pushed_words / total_words, cur_epoch)
         job_no = 0
+        if start_examples:
+            data_iterator = itertools.islice(data_iterator, start_examples, None)
 
-        for data_idx, data in enumerate(data_iterator):
-            data_length = self._raw_word_count([data])
+        try:
+            for data_idx, data in enumerate(data_iterator):
+                data_length = self._raw_word_count([data])
+
+                # can we fit this sentence into the existing job batch?
+                if batch_size + data_length <= self.batch_words:
+                    # yes => add it to the current job
+                    job_batch.append(data)
+                    batch_size += data_length
+                else:
+                    job_no += 1
+                    job_queue.put((job_batch, next_alpha))
 
-            # can we fit this sentence into the existing job batch?
-            if batch_size + data_length <= self.batch_words:
-                # yes => add it to the current job
-                job_batch.append(data)
-                batch_size += data_length
-            else:
+                    # update the learning rate for the next job
+                    pushed_examples += len(job_batch)
+                    pushed_words += batch_size
+                    if total_examples:
+                        # examples-based decay
+                        epoch_progress = 1.0 * pushed_examples / total_examples
+                    else:
+                        # words-based decay
+                        epoch_progress = 1.0 * pushed_words / total_words
+                    next_alpha = self._get_next_alpha(epoch_progress, cur_epoch)
+
+                    if checkpointer is not None and checkpointer.due():
+                        job_queue.join()  # wait for the workers, so that the weights match the pushed examples
+                        checkpointer.save(self, cur_epoch, pushed_examples, pushed_words)
+
+                    # add the sentence that didn't fit as the first item of a new job
+                    job_batch, batch_size = [data], data_length
+            # add the last job too (may be significantly smaller than batch_words)
+            if job_batch:
                 job_no += 1
                 job_queue.put((job_batch, next_alpha))
 
+            if job_no == 0 and self.train_count == 0:
+                logger.warning(
+                    "train() called with an empty iterator (if not intended, "
+                    "be sure to provide a corpus that offers restartable iteration = an iterable)."
+                )
+        finally:
+            # give the workers heads up that they can finish -- no more work!
+            for _ in range(self.workers):
+                job_queue.put(None)
+        logger.debug("job loop exiting, total %i jobs", job_no)
+
+    def _batch_job_producer(self, batches, job_queue, cur_epoch=0, total_examples=None, total_words=None):
+        """Fill the jobs queue with batches of sentences that were already converted to vocabulary indexes.
+
+        Like :meth:`~gensim.models.word2vec.Word2Vec._job_producer`, but for batches made elsewhere, such as by
+        the `producers` of :meth:`~gensim.models.word2vec.Word2Vec.train`. The learning rate of each job follows
+        the progress over all batches pushed so far, whichever producer made them.
+
+        Parameters
+        ----------
+        batches : iterable of :class:`_IndexedBatch`
+            Batches of one training epoch.
+        job_queue : Queue of (:class:`_IndexedBatch`, float)
+            A queue of jobs still to be processed. The worker will take up jobs from this queue.
+            Each job is represented by a tuple where the first element is the batch to be processed and
+            the second is the floating-point learning rate.
+        cur_epoch : int, optional
+            The current training epoch, needed to compute the learning rate for each job.
+        total_examples : int, optional
+            Count of sentences in all batches, used for the learning rate decay.
+        total_words : int, optional
+            Count of raw words in all batches, used for the learning rate decay if `total_examples` is not given.
+
+        """
+        pushed_words, pushed_examples = 0, 0
+        next_alpha = self._get_next_alpha(0.0, cur_epoch)
+        job_no = 0
+
+        try:
+            for batch in batches:
+                job_no += 1
+                job_queue.put((batch, next_alpha))
+
                 # update the learning rate for the next job
                 if total_examples:
                     # examples-based decay
-                    pushed_examples += len(job_batch)
+                    pushed_examples += len(batch)
                     epoch_progress = 1.0 * pushed_examples / total_examples
                 else:
                     # words-based decay
-                    pushed_words += self._raw_word_count(job_batch)
+                    pushed_words += batch.raw_words
                     epoch_progress = 1.0 * pushed_words / total_words
                 next_alpha = self._get_next_alpha(epoch_progress, cur_epoch)
-
-                # add the sentence that didn't fit as the first item of a new job
-                job_batch, batch_size = [data], data_length
-        # add the last job too (may be significantly smaller than batch_words)
-        if job_batch:
-            job_no += 1
-            job_queue.put((job_batch, next_alpha))
-
-        if job_no == 0 and self.train_count == 0:
-            logger.warning(
-                "train() called with an empty iterator (if not intended, "
-                "be sure to provide a corpus that offers restartable iteration = an iterable)."
-            )
-
-        # give the workers heads up that they can finish -- no more work!
-        for _ in range(self.workers):
-            job_queue.put(None)
+        finally:
+            # give the workers heads up that they can finish -- no more work!
+            for _ in range(self.workers):
+                job_queue.put(None)
         logger.debug("job loop exiting, total %i jobs", job_no)
 
     def _log_epoch_progress(
             self, progress_queue=None, job_queue=None, cur_epoch=0, total_examples=None,
-            total_words=None, report_delay=1.0, is_corpus_file_mode=None,
+            total_words=None, report_delay=1.0, is_corpus_file_mode=None, callbacks=(), start_examples=0,
+            start_words=0,
         ):
         """Get the progress report for a single training epoch.
 
         Parameters
         ----------
-        progress_queue : Queue of (int, int, int)
-            A queue of progress reports. Each report is represented as a tuple of these 3 elements:
+        progress_queue : Queue of (int, int, int, (int, float, float))
+            A queue of progress reports. Each report is represented as a tuple of these 4 elements:
                 * size of data chunk processed, for example number of sentences in the corpus chunk.
                 * Effective word count used in training (after ignoring unknown words and trimming the sentence length).
                 * Total word count used in training.
+                * Timings of the worker: its thread id, seconds spent waiting for the data chunk and seconds
+                  spent training on it.
         job_queue : Queue of (list of object, float)
             A queue of jobs still to be processed. The worker will take up jobs from this queue.
             Each job is represented by a tuple where the first element is the corpus chunk to be processed and
@@ -1259,6 +1983,13 @@ class Word2Vec(utils.SaveLoad):
             Number of seconds between two consecutive progress report messages in the logger.
         is_corpus_file_mode : bool, optional
             Whether training is file-based (corpus_file argument) or not.
+        callbacks : iterable of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
+            Callbacks to pass the :class:`~gensim.models.callbacks.TrainingMetrics` of each progress report to.
+        start_examples : int, optional
+            Number of examples of this epoch trained before the checkpoint that training resumed from, counted
+            in the reported progress.
+        start_words : int, optional
+            Number of raw words in those examples.
 
         Returns
         -------
@@ -1269,10 +2000,25 @@ class Word2Vec(utils.SaveLoad):
                 * Total word count used in training.
 
         """
-        example_count, trained_word_count, raw_word_count = 0, 0, 0
+        example_count, trained_word_count, raw_word_count = start_examples, 0, start_words
         start, next_report = default_timer() - 0.00001, 1.0
         job_tally = 0
         unfinished_worker_count = self.workers
+        worker_words, worker_starved_time, worker_kernel_time = defaultdict(int), defaultdict(float), defaultdict(float)
+
+        def report_metrics(elapsed, epoch_end=False):
+            metrics = TrainingMetrics(
+                cur_epoch, elapsed, self.min_alpha_yet_reached, example_count=example_count,
+                total_examples=total_examples, raw_word_count=raw_word_count, total_words=total_words,
+                trained_word_count=trained_word_count,
+                job_queue_size=-1 if job_queue is None else utils.qsize(job_queue),
+                progress_queue_size=utils.qsize(progress_queue), worker_words=worker_words,
+                worker_starved_time=worker_starved_time, worker_kernel_time=worker_kernel_time, epoch_end=epoch_end,
+            )
+            if job_queue is None:  # with corpus_file, the learning rate decays inside the workers, as here
+                metrics.alpha = self._get_next_alpha(metrics.progress, cur_epoch)
+            for callback in callbacks:
+                callback.on_progress(self, metrics)
 
         while unfinished_worker_count > 0:
             report = progress_queue.get()  # blocks if workers too slow
@@ -1280,13 +2026,18 @@ class Word2Vec(utils.SaveLoad):
                 unfinished_worker_count -= 1
                 logger.info("worker thread finished; awaiting finish of %i more threads", unfinished_worker_count)
                 continue
-            examples, trained_words, raw_words = report
+            examples, trained_words, raw_words = report[:3]
             job_tally += 1
 
             # update progress stats
             example_count += examples
             trained_word_count += trained_words  # only words in vocab & sampled
             raw_word_count += raw_words
+            if len(report) > 3:
+                thread_id, starved_time, kernel_time = report[3]
+                worker_words[thread_id] += trained_words
+                worker_starved_time[thread_id] += starved_time
+                worker_kernel_time[thread_id] += kernel_time
 
             # log progress once every report_delay seconds
             elapsed = default_timer() - start
@@ -1294,14 +2045,16 @@ class Word2Vec(utils.SaveLoad):
                 self._log_progress(
                     job_queue, progress_queue, cur_epoch, example_count, total_examples,
                     raw_word_count, total_words, trained_word_count, elapsed)
+                report_metrics(elapsed)
                 next_report = elapsed + report_delay
         # all done; report the final stats
         elapsed = default_timer() - start
         self._log_epoch_end(
             cur_epoch, example_count, total_examples, raw_word_count, total_words,
             trained_word_count, elapsed, is_corpus_file_mode)
+        report_metrics(elapsed, epoch_end=True)
         self.total_train_time += elapsed
-        return trained_word_count, raw_word_count, job_tally
+        return trained_word_count, raw_word_count - start_words, job_tally
 
     def _train_epoch_corpusfile(
             self, corpus_file, cur_epoch=0, total_examples=None, total_words=None, callbacks=(), **kwargs,
@@ -1318,9 +2071,10 @@ class Word2Vec(utils.SaveLoad):
         total_examples : int, optional
             Count of objects in the `data_iterator`. In the usual case this would correspond to the number of sentences
             in a corpus, used to log progress.
-        total_words : int
+        total_words : int, optional
             Count of total objects in `data_iterator`. In the usual case this would correspond to the number of raw
-            words in a corpus, used to log progress. Must be provided in order to seek in `corpus_file`.
+            words in a corpus, used to log progress. Defaults to the number of words counted by the
+            :class:`~gensim.models.word2vec.CorpusFileIndex` of `corpus_file`.
         **kwargs : object
             Additional key word parameters for the specific model inheriting from this class.
 
@@ -1333,8 +2087,10 @@ class Word2Vec(utils.SaveLoad):
                 * Total word count used in training.
 
         """
+        index = CorpusFileIndex.load_or_build(corpus_file)
         if not total_words:
-            raise ValueError("total_words must be provided alongside corpus_file argument.")
+            total_words = index.total_words
+        offsets, _ = index.split(self.workers)
 
         from gensim.models.word2vec_corpusfile import CythonVocab
         from gensim.models.fasttext import FastText
@@ -1342,8 +2098,6 @@ class Word2Vec(utils.SaveLoad):
 
         progress_queue = Queue()
 
-        corpus_file_size = os.path.getsize(corpus_file)
-
         thread_kwargs = copy.copy(kwargs)
         thread_kwargs['cur_epoch'] = cur_epoch
         thread_kwargs['total_examples'] = total_examples
@@ -1352,7 +2106,7 @@ class Word2Vec(utils.SaveLoad):
             threading.Thread(
                 target=self._worker_loop_corpusfile,
                 args=(
-                    corpus_file, thread_id, corpus_file_size / self.workers * thread_id, cython_vocab, progress_queue
+                    corpus_file, thread_id, offsets[thread_id], cython_vocab, progress_queue
                 ),
                 kwargs=thread_kwargs
             ) for thread_id in range(self.workers)
@@ -1364,13 +2118,13 @@ class Word2Vec(utils.SaveLoad):
 
         trained_word_count, raw_word_count, job_tally = self._log_epoch_progress(
             progress_queue=progress_queue, job_queue=None, cur_epoch=cur_epoch,
-            total_examples=total_examples, total_words=total_words, is_corpus_file_mode=True)
+            total_examples=total_examples, total_words=total_words, is_corpus_file_mode=True, callbacks=callbacks)
 
         return trained_word_count, raw_word_count, job_tally
 
     def _train_epoch(
             self, data_iterable, cur_epoch=0, total_examples=None, total_words=None,
-            queue_factor=2, report_delay=1.0, callbacks=(),
+            queue_factor=2, report_delay=1.0, callbacks=(), start_examples=0, start_words=0, checkpointer=None,
         ):
         """Train the model for a single epoch.
 
@@ -1391,6 +2145,146 @@ class Word2Vec(utils.SaveLoad):
             Multiplier for size of queue -> size = number of workers * queue_factor.
         report_delay : float, optional
             Number of seconds between two consecutive progress report messages in the logger.
+        callbacks : iterable of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
+            Callbacks to pass the progress reports to.
+        start_examples : int, optional
+            Number of objects at the start of `data_iterable` to skip, when resuming from a checkpoint.
+        start_words : int, optional
+            Count of total objects in the skipped `start_examples`.
+        checkpointer : :class:`_Checkpointer`, optional
+            Takes checkpoints in the middle of the epoch.
+
+        Returns
+        -------
+        (int, int, int)
+            The training report for this epoch consisting of three elements:
+                * Size of data chunk processed, for example number of sentences in the corpus chunk.
+                * Effective word count used in training (after ignoring unknown words and trimming the sentence length).
+                * Total word count used in training.
+
+        Raises
+        ------
+        Exception
+            Whatever `data_iterable` raised, after the workers finished the jobs queued before.
+
+        """
+        job_queue = Queue(maxsize=queue_factor * self.workers)
+        progress_queue = Queue(maxsize=(queue_factor + 1) * self.workers)
+        producer_errors = []
+
+        def job_producer():
+            try:
+                self._job_producer(
+                    data_iterable, job_queue, cur_epoch=cur_epoch, total_examples=total_examples,
+                    total_words=total_words, start_examples=start_examples, start_words=start_words,
+                    checkpointer=checkpointer,
+                )
+            except Exception as err:
+                producer_errors.append(err)
+
+        workers = [
+            threading.Thread(
+                target=self._worker_loop,
+                args=(job_queue, progress_queue, thread_id))
+            for thread_id in range(self.workers)
+        ]
+
+        workers.append(threading.Thread(target=job_producer))
+
+        for thread in workers:
+            thread.daemon = True  # make interrupting the process with ctrl+c easier
+            thread.start()
+
+        trained_word_count, raw_word_count, job_tally = self._log_epoch_progress(
+            progress_queue, job_queue, cur_epoch=cur_epoch, total_examples=total_examples,
+            total_words=total_words, report_delay=report_delay, is_corpus_file_mode=False, callbacks=callbacks,
+            start_examples=start_examples, start_words=start_words,
+        )
+        if producer_errors:
+            raise producer_errors[0]
+
+        return trained_word_count, raw_word_count, job_tally
+
+    def _check_indexed_training(self):
+        """Raise NotImplementedError if this model can't train on sentences converted to vocabulary indexes."""
+        from gensim.models.doc2vec import Doc2Vec
+        if isinstance(self, Doc2Vec):  # documents have tags, too
+            raise NotImplementedError(f"{type(self).__name__} can only be trained on its own documents")
+
+    def _check_corpus_partitions(self, partitions):
+        """Check that `partitions` is a sequence of partitions of a corpus, as expected with `producers`.
+
+        Returns
+        -------
+        list of iterable
+            The partitions.
+
+        Raises
+        ------
+        TypeError
+            If `partitions` look like a plain corpus, or any partition can only be iterated once.
+
+        """
+        partitions = list(partitions)
+        for partition in partitions:
+            if isinstance(partition, str) or (
+                    isinstance(partition, (list, tuple)) and partition and isinstance(partition[0], str)):
+                raise TypeError(
+                    "With producers, corpus_iterable must be a sequence of partitions, each an iterable of "
+                    f"sentences, got a partition starting with {partition[:1]!r} instead"
+                )
+            if isinstance(partition, GeneratorType):
+                raise TypeError("With producers, each partition of corpus_iterable must be a restartable iterable")
+        return partitions
+
+    def _start_partition_producers(self, partitions, producers, queue_factor=2):
+        """Start the `producers` processes of :meth:`~gensim.models.word2vec.Word2Vec.train`.
+
+        Parameters
+        ----------
+        partitions : sequence of iterable of list of str
+            The training corpus, split into partitions.
+        producers : int
+            Number of worker processes to start.
+        queue_factor : int, optional
+            Multiplier for size of the queue of produced batches -> size = number of workers * queue_factor.
+
+        Returns
+        -------
+        :class:`_PartitionProducers`
+            The started processes.
+
+        """
+        self._check_indexed_training()
+        partitions = self._check_corpus_partitions(partitions)
+        logger.info("starting %i producer processes for %i corpus partitions", producers, len(partitions))
+        return _PartitionProducers(
+            partitions, self.wv.key_to_index, self.batch_words, producers, maxsize=queue_factor * self.workers,
+        )
+
+    def _train_epoch_batches(
+            self, batches, cur_epoch=0, total_examples=None, total_words=None, queue_factor=2, report_delay=1.0,
+            callbacks=(),
+        ):
+        """Train the model for a single epoch, on batches already converted to vocabulary indexes.
+
+        Parameters
+        ----------
+        batches : iterable of :class:`_IndexedBatch`
+            The input corpus of this epoch.
+        cur_epoch : int, optional
+            The current training epoch, needed to compute the training parameters for each job.
+            For example in many implementations the learning rate would be dropping with the number of epochs.
+        total_examples : int, optional
+            Count of sentences in all batches, used to log progress.
+        total_words : int, optional
+            Count of raw words in all batches, used to log progress.
+        queue_factor : int, optional
+            Multiplier for size of queue -> size = number of workers * queue_factor.
+        report_delay : float, optional
+            Number of seconds between two consecutive progress report messages in the logger.
+        callbacks : iterable of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
+            Callbacks to pass the progress reports to.
 
         Returns
         -------
@@ -1407,13 +2301,13 @@ class Word2Vec(utils.SaveLoad):
         workers = [
             threading.Thread(
                 target=self._worker_loop,
-                args=(job_queue, progress_queue,))
-            for _ in range(self.workers)
+                args=(job_queue, progress_queue, thread_id))
+            for thread_id in range(self.workers)
         ]
 
         workers.append(threading.Thread(
-            target=self._job_producer,
-            args=(data_iterable, job_queue),
+            target=self._batch_job_producer,
+            args=(batches, job_queue),
             kwargs={'cur_epoch': cur_epoch, 'total_examples': total_examples, 'total_words': total_words}))
 
         for thread in workers:
@@ -1422,7 +2316,7 @@ class Word2Vec(utils.SaveLoad):
 
         trained_word_count, raw_word_count, job_tally = self._log_epoch_progress(
             progress_queue, job_queue, cur_epoch=cur_epoch, total_examples=total_examples,
-            total_words=total_words, report_delay=report_delay, is_corpus_file_mode=False,
+            total_words=total_words, report_delay=report_delay, is_corpus_file_mode=False, callbacks=callbacks,
         )
 
         return trained_word_count, raw_word_count, job_tally
@@ -1460,7 +2354,11 @@ class Word2Vec(utils.SaveLoad):
             Each worker threads private work memory.
 
         """
-        work = matutils.zeros_aligned(self.layer1_size, dtype=REAL)  # per-thread private work memory
+        work_size = self.layer1_size
+        if self.sg and self.negative and self.batch_negatives:
+            # room for the window matrices of the batch negatives kernel, after the usual work vector
+            work_size += batch_negatives_work_size(self.window, self.negative, self.layer1_size)
+        work = matutils.zeros_aligned(work_size, dtype=REAL)  # per-thread private work memory
         neu1 = matutils.zeros_aligned(self.layer1_size, dtype=REAL)
         return work, neu1
 
@@ -1861,6 +2759,7 @@ class Word2Vec(utils.SaveLoad):
         self.wv.key_to_index = other_model.wv.key_to_index
         self.wv.expandos = other_model.wv.expandos
         self.cum_table = other_model.cum_table
+        self.alias_table = other_model.alias_table
         self.corpus_count = other_model.corpus_count
         self.init_weights()
 
@@ -1894,7 +2793,7 @@ class Word2Vec(utils.SaveLoad):
     def _save_specials(self, fname, separately, sep_limit, ignore, pickle_protocol, compress, subname):
         """Arrange any special handling for the `gensim.utils.SaveLoad` protocol."""
         # don't save properties that are merely calculated from others
-        ignore = set(ignore).union(['cum_table', ])
+        ignore = set(ignore).union(['cum_table', 'alias_table', ])
         return super(Word2Vec, self)._save_specials(
             fname, separately, sep_limit, ignore, pickle_protocol, compress, subname)
 
@@ -1958,6 +2857,10 @@ class Word2Vec(utils.SaveLoad):
             del self.iter
         if not hasattr(self, 'max_final_vocab'):
             self.max_final_vocab = None
+        if not hasattr(self, 'batch_negatives'):
+            self.batch_negatives = False
+        if not hasattr(self, 'vocab_sketch'):
+            self.vocab_sketch = False
         if hasattr(self, 'vocabulary'):  # re-integrate state that had been moved
             for a in ('max_vocab_size', 'min_count', 'sample', 'sorted_vocab', 'null_word', 'raw_vocab'):
                 setattr(self, a, getattr(self.vocabulary, a))
@@ -2086,6 +2989,58 @@ class LineSentence:
                         i += self.max_sentence_length
 
 
+class _LineSentenceRange:
+    """The sentences of a :class:`~gensim.models.word2vec.LineSentence` file, restricted to the lines that start
+    within a range of byte offsets.
+
+    Used to split a `corpus_file` among the worker processes of :meth:`Word2Vec.scan_vocab`.
+
+    """
+    def __init__(self, source, start, end, max_sentence_length=MAX_WORDS_IN_BATCH):
+        self.source = source
+        self.start = start
+        self.end = end
+        self.max_sentence_length = max_sentence_length
+
+    @classmethod
+    def split(cls, source, parts, **kwargs):
+        """Split the file `source` into `parts` ranges of about the same size.
+
+        Raises
+        ------
+        ValueError
+            If `source` is compressed: its byte offsets don't correspond to lines.
+
+        """
+        if source.endswith(_COMPRESSED_EXTENSIONS):
+            raise ValueError(
+                f"cannot split the compressed corpus_file {source} among producers, decompress it first"
+            )
+        size = os.path.getsize(source)
+        bounds = [size * part // parts for part in range(parts + 1)]
+        return [cls(source, start, end, **kwargs) for start, end in zip(bounds, bounds[1:])]
+
+    def lines(self):
+        """Iterate over the raw lines that start in this range."""
+        with open(self.source, 'rb') as fin:
+            if self.start:
+                fin.seek(self.start - 1)
+                fin.readline()  # skip the rest of a line that started in the previous range
+            while fin.tell() < self.end:
+                line = fin.readline()
+                if not line:
+                    break
+                yield line
+
+    def __iter__(self):
+        for line in self.lines():
+            line = utils.to_unicode(line).split()
+            i = 0
+            while i < len(line):
+                yield line[i: i + self.max_sentence_length]
+                i += self.max_sentence_length
+
+
 class PathLineSentences:
     def __init__(self, source, max_sentence_length=MAX_WORDS_IN_BATCH, limit=None):
         """Like :class:`~gensim.models.word2vec.LineSentence`, but process all files in a directory
@@ -2140,6 +3095,359 @@ class PathLineSentences:
                         i += self.max_sentence_length
 
 
+class IndexedSentences:
+    def __init__(self, fname):
+        """Sentences already converted to the vocabulary indexes of a model, memory-mapped from a file written by
+        :meth:`~gensim.models.word2vec.IndexedSentences.serialize`.
+
+        Passing this corpus to :meth:`~gensim.models.word2vec.Word2Vec.train` skips reading, tokenizing and
+        looking up every word in each epoch: the batches are slices of the memory-mapped indexes, which
+        the worker threads train on without any further Python work per word.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the file.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.models.word2vec import Word2Vec, IndexedSentences
+            >>> from gensim.test.utils import common_texts, get_tmpfile
+            >>>
+            >>> model = Word2Vec(min_count=1)
+            >>> model.build_vocab(common_texts)
+            >>>
+            >>> corpus = IndexedSentences.serialize(get_tmpfile("indexed_sentences"), common_texts, model.wv)
+            >>> model.train(corpus, total_examples=model.corpus_count, epochs=model.epochs)
+            (17, 145)
+
+        """
+        self.fname = fname
+        with open(fname, 'rb') as fin:
+            header = np.fromfile(fin, dtype=_INDEXED_SENTENCES_HEADER, count=1)
+        if len(header) != 1 or header['magic'][0] != _INDEXED_SENTENCES_MAGIC:
+            raise ValueError(f"{fname} is not a file written by IndexedSentences.serialize()")
+        header = header[0]
+        if header['version'] > _INDEXED_SENTENCES_VERSION:
+            raise ValueError(f"unsupported format version {header['version']} of {fname}")
+        self.vocab_size = int(header['vocab_size'])
+        self.vocab_crc = int(header['vocab_crc'])
+        num_sentences, num_words = int(header['num_sentences']), int(header['num_words'])
+        offsets_offset = int(header['offsets_offset'])
+
+        self.indexes = _memmap_array(fname, '<u4', _INDEXED_SENTENCES_HEADER.itemsize, num_words)
+        self.offsets = _memmap_array(fname, '<i8', offsets_offset, num_sentences + 1)
+        # cumulative count of all words of the sentences, including the out-of-vocabulary words dropped in `indexes`
+        self.raw_offsets = _memmap_array(fname, '<i8', offsets_offset + 8 * (num_sentences + 1), num_sentences + 1)
+
+    @classmethod
+    def serialize(cls, fname, corpus_iterable, wv):
+        """Convert `corpus_iterable` to the vocabulary indexes of `wv` and store them in `fname`.
+
+        Out-of-vocabulary words are dropped. The corpus is streamed to the file, so it doesn't need to fit in RAM.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the output file.
+        corpus_iterable : iterable of list of str
+            The sentences to convert.
+        wv : :class:`~gensim.models.keyedvectors.KeyedVectors`
+            The vocabulary of the model that will be trained on the sentences. The file is only valid for
+            this exact vocabulary: rebuilding or growing the vocabulary requires serializing the corpus again.
+
+        Returns
+        -------
+        :class:`~gensim.models.word2vec.IndexedSentences`
+            The serialized corpus, memory-mapped from `fname`.
+
+        """
+        key_to_index = wv.key_to_index
+        offsets, raw_offsets = array('q', [0]), array('q', [0])
+        chunk, num_words, raw_words = [], 0, 0
+
+        header = np.zeros(1, dtype=_INDEXED_SENTENCES_HEADER)
+        with open(fname, 'wb') as fout:
+            fout.write(header.tobytes())  # placeholder, filled in once the counts are known
+            for sentence_no, sentence in enumerate(corpus_iterable):
+                if sentence_no % 100000 == 0:
+                    logger.info("PROGRESS: at sentence #%i, stored %i word indexes", sentence_no, num_words)
+                chunk.extend([key_to_index[word] for word in sentence if word in key_to_index])
+                raw_words += len(sentence)
+                offsets.append(num_words + len(chunk))
+                raw_offsets.append(raw_words)
+                if len(chunk) >= 1048576:
+                    fout.write(np.array(chunk, dtype='<u4').tobytes())
+                    num_words += len(chunk)
+                    chunk = []
+            fout.write(np.array(chunk, dtype='<u4').tobytes())
+            num_words += len(chunk)
+
+            offsets_offset = -(-fout.tell() // 8) * 8  # align the int64 offsets
+            fout.write(b'\0' * (offsets_offset - fout.tell()))
+            fout.write(np.frombuffer(offsets, dtype=np.int64).astype('<i8').tobytes())
+            fout.write(np.frombuffer(raw_offsets, dtype=np.int64).astype('<i8').tobytes())
+
+            header['magic'] = _INDEXED_SENTENCES_MAGIC
+            header['version'] = _INDEXED_SENTENCES_VERSION
+            header['vocab_crc'] = _vocab_crc(wv)
+            header['vocab_size'] = len(wv)
+            header['num_sentences'] = len(offsets) - 1
+            header['num_words'] = num_words
+            header['offsets_offset'] = offsets_offset
+            fout.seek(0)
+            fout.write(header.tobytes())
+
+        logger.info(
+            "stored %i sentences with %i in-vocabulary words out of %i raw words in %s",
+            len(offsets) - 1, num_words, raw_words, fname,
+        )
+        return cls(fname)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        """Iterate over the sentences, each an array of vocabulary indexes."""
+        for start, end in zip(self.offsets[:-1], self.offsets[1:]):
+            yield self.indexes[start:end]
+
+    def check_vocab(self, wv):
+        """Raise ValueError if the sentences were not serialized with the vocabulary of `wv`."""
+        if self.vocab_size != len(wv) or self.vocab_crc != _vocab_crc(wv):
+            raise ValueError(
+                f"{self.fname} was serialized for a different vocabulary: "
+                "rerun IndexedSentences.serialize() after building or updating the vocabulary"
+            )
+
+    def batches(self, batch_words=MAX_WORDS_IN_BATCH):
+        """Split the sentences into training batches of up to `batch_words` words.
+
+        The batches are the same as those that :meth:`~gensim.models.word2vec.Word2Vec.train` makes from
+        the original corpus: their size counts the out-of-vocabulary words, too.
+
+        Parameters
+        ----------
+        batch_words : int, optional
+            Target size of the batches. A longer sentence makes a batch of its own.
+
+        Yields
+        ------
+        :class:`_IndexedBatch`
+            Batch of sentences, referring to a slice of the memory-mapped indexes.
+
+        """
+        num_sentences, start = len(self), 0
+        while start < num_sentences:
+            end = int(np.searchsorted(self.raw_offsets, self.raw_offsets[start] + batch_words, side='right')) - 1
+            end = min(max(end, start + 1), num_sentences)
+            raw_words = int(self.raw_offsets[end] - self.raw_offsets[start])
+            yield _IndexedBatch(self.indexes, self.offsets[start:end + 1], raw_words)
+            start = end
+
+
+class CorpusFileIndex:
+    def __init__(self, corpus_file, line_offsets, word_offsets):
+        """Byte offsets and cumulative word counts of the lines of a `corpus_file`, in
+        :class:`~gensim.models.word2vec.LineSentence` format.
+
+        Lets the `corpus_file` training mode split the file among any number of worker threads, and know its
+        total number of words, without scanning it. Use :meth:`~gensim.models.word2vec.CorpusFileIndex.load_or_build`
+        to get the index of a file, which is stored next to it and only rebuilt once the file changes.
+
+        Parameters
+        ----------
+        corpus_file : str
+            Path to the indexed corpus file.
+        line_offsets : numpy.ndarray
+            Byte offset of the start of each line, followed by the size of the file.
+        word_offsets : numpy.ndarray
+            Number of words before each line, followed by the total number of words.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.models.word2vec import CorpusFileIndex
+            >>> from gensim.test.utils import datapath
+            >>>
+            >>> index = CorpusFileIndex.build(datapath('lee_background.cor'))
+            >>> offsets, start_lines = index.split(workers=4)
+
+        """
+        self.corpus_file = corpus_file
+        self.line_offsets = line_offsets
+        self.word_offsets = word_offsets
+
+    @classmethod
+    def build(cls, corpus_file):
+        """Scan `corpus_file` to index its lines."""
+        line_offsets, word_offsets = array('q', [0]), array('q', [0])
+        with open(corpus_file, 'rb') as fin:
+            for line in fin:
+                line_offsets.append(line_offsets[-1] + len(line))
+                word_offsets.append(word_offsets[-1] + len(line.split()))
+        return cls(
+            corpus_file, np.frombuffer(line_offsets, dtype=np.int64), np.frombuffer(word_offsets, dtype=np.int64),
+        )
+
+    @classmethod
+    def load(cls, corpus_file, index_file):
+        """Load the index of `corpus_file` stored in `index_file`.
+
+        Returns
+        -------
+        :class:`~gensim.models.word2vec.CorpusFileIndex` or None
+            The index, memory-mapped from `index_file`, or None if `index_file` is missing or was written for a
+            different size or modification time of `corpus_file`.
+
+        """
+        try:
+            with open(index_file, 'rb') as fin:
+                header = np.fromfile(fin, dtype=_CORPUS_FILE_INDEX_HEADER, count=1)
+        except OSError:
+            return None
+        stat = os.stat(corpus_file)
+        if (
+            len(header) != 1 or header['magic'][0] != _CORPUS_FILE_INDEX_MAGIC
+            or header['version'][0] > _CORPUS_FILE_INDEX_VERSION
+            or header['file_size'][0] != stat.st_size or header['file_mtime_ns'][0] != stat.st_mtime_ns
+        ):
+            return None
+        length = int(header['num_lines'][0]) + 1
+        offset = _CORPUS_FILE_INDEX_HEADER.itemsize
+        return cls(
+            corpus_file,
+            _memmap_array(index_file, '<i8', offset, length),
+            _memmap_array(index_file, '<i8', offset + 8 * length, length),
+        )
+
+    def save(self, index_file):
+        """Store the index into `index_file`, along with the size and modification time of the corpus file."""
+        stat = os.stat(self.corpus_file)
+        header = np.zeros(1, dtype=_CORPUS_FILE_INDEX_HEADER)
+        header['magic'] = _CORPUS_FILE_INDEX_MAGIC
+        header['version'] = _CORPUS_FILE_INDEX_VERSION
+        header['file_size'] = stat.st_size
+        header['file_mtime_ns'] = stat.st_mtime_ns
+        header['num_lines'] = len(self)
+        tmp_file = index_file + '.tmp'
+        with open(tmp_file, 'wb') as fout:
+            fout.write(header.tobytes())
+            fout.write(np.asarray(self.line_offsets, dtype='<i8').tobytes())
+            fout.write(np.asarray(self.word_offsets, dtype='<i8').tobytes())
+        os.replace(tmp_file, index_file)
+
+    @classmethod
+    def load_or_build(cls, corpus_file, index_file=None):
+        """Load the index of `corpus_file`, or build it and store it for the next time.
+
+        Parameters
+        ----------
+        corpus_file : str
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+        index_file : str, optional
+            Path to the stored index. Defaults to `corpus_file` with an added `.lineidx` extension. If this file
+            can't be written, the index is still built, but not stored.
+
+        Returns
+        -------
+        :class:`~gensim.models.word2vec.CorpusFileIndex`
+            The index of `corpus_file`.
+
+        """
+        if index_file is None:
+            index_file = corpus_file + _CORPUS_FILE_INDEX_SUFFIX
+        index = cls.load(corpus_file, index_file)
+        if index is None:
+            logger.info("indexing the lines of %s", corpus_file)
+            index = cls.build(corpus_file)
+            try:
+                index.save(index_file)
+            except OSError as err:
+                logger.warning("couldn't store the index of %s into %s: %s", corpus_file, index_file, err)
+        return index
+
+    def __len__(self):
+        """Number of lines in the corpus file."""
+        return len(self.line_offsets) - 1
+
+    @property
+    def total_words(self):
+        """Number of words in the corpus file."""
+        return int(self.word_offsets[-1])
+
+    def split(self, workers):
+        """Split the corpus file among `workers` parts of about the same number of words.
+
+        Each part starts at the line containing its approximate first word. The corpus_file workers stop after
+        their share of the total number of words, so parts cut on bytes would overlap or leave gaps between them
+        whenever the lines differ in length.
+
+        Parameters
+        ----------
+        workers : int
+            Number of parts.
+
+        Returns
+        -------
+        list of int, list of int
+            Byte offset and number of the first line of each part.
+
+        """
+        if not len(self):
+            return [0] * workers, [0] * workers
+        approx_words = [self.total_words * i // workers for i in range(workers)]
+        start_lines = np.searchsorted(self.word_offsets[:-1], approx_words, side='right') - 1
+        return [int(offset) for offset in self.line_offsets[start_lines]], [int(line) for line in start_lines]
+
+
+# Layout of the header of files written by IndexedSentences.serialize(), all fields little-endian.
+_INDEXED_SENTENCES_HEADER = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('vocab_crc', '<u4'),  # crc32 of the vocabulary keys, in index order
+    ('vocab_size', '<u8'),
+    ('num_sentences', '<u8'),
+    ('num_words', '<u8'),  # number of stored in-vocabulary word indexes, which follow the header as uint32
+    ('offsets_offset', '<u8'),  # start of the int64 sentence offsets, followed by the cumulative raw word counts
+    ('reserved', '<u8'),
+])
+_INDEXED_SENTENCES_MAGIC = b'GSMSENT\n'
+_INDEXED_SENTENCES_VERSION = 1
+
+# Layout of the header of files written by CorpusFileIndex.save(), all fields little-endian.
+_CORPUS_FILE_INDEX_HEADER = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('reserved', '<u4'),
+    ('file_size', '<u8'),  # size and modification time of the indexed corpus file, to detect changes
+    ('file_mtime_ns', '<i8'),
+    ('num_lines', '<u8'),  # followed by num_lines + 1 int64 line offsets, then num_lines + 1 cumulative word counts
+])
+_CORPUS_FILE_INDEX_MAGIC = b'GSMLIDX\n'
+_CORPUS_FILE_INDEX_VERSION = 1
+_CORPUS_FILE_INDEX_SUFFIX = '.lineidx'
+
+
+def _vocab_crc(wv):
+    """Checksum of the keys of `wv`, in index order."""
+    crc = 0
+    for start in range(0, len(wv.index_to_key), 65536):
+        keys = wv.index_to_key[start:start + 65536]
+        crc = zlib.crc32(''.join(f'{key}\n' for key in keys).encode('utf8'), crc)
+    return crc
+
+
+def _memmap_array(fname, dtype, offset, length):
+    """Memory-map `length` items of `dtype` from `fname`, starting at byte `offset`."""
+    if not length:
+        return np.zeros(0, dtype=dtype)  # numpy can't map empty ranges
+    return np.memmap(fname, dtype=dtype, mode='r', offset=offset, shape=(length,))
+
+
 class Word2VecVocab(utils.SaveLoad):
     """Obsolete class retained for now as load-compatibility state capture."""
     pass
@@ -2150,20 +3458,52 @@ class Word2VecTrainables(utils.SaveLoad):
     pass
 
 
-class Heapitem(namedtuple('Heapitem', 'count, index, left, right')):
-    def __lt__(self, other):
-        return self.count < other.count
+def _build_huffman_tree(counts):
+    """Build a Huffman tree over `counts`, with the two-queue method of the original C word2vec.
 
+    After sorting the words by ascending count, each merge pops the two smallest nodes from the heads of two queues:
+    the words not merged yet, and the inner nodes created so far, which come out of the merges in ascending count
+    order as well.
 
-def _build_heap(wv):
-    heap = list(Heapitem(wv.get_vecattr(i, 'count'), i, None, None) for i in range(len(wv.index_to_key)))
-    heapq.heapify(heap)
-    for i in range(len(wv) - 1):
-        min1, min2 = heapq.heappop(heap), heapq.heappop(heap)
-        heapq.heappush(
-            heap, Heapitem(count=min1.count + min2.count, index=i + len(wv), left=min1, right=min2)
-        )
-    return heap
+    Parameters
+    ----------
+    counts : numpy.ndarray
+        Count of each word.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        For each of the `2 * len(counts) - 1` tree nodes, first the words and then the inner nodes in the order
+        they were created: the index of the parent node, and whether the node is the left (0) or right (1) child.
+        The last node is the root.
+
+    """
+    vocab_size = len(counts)
+    order = np.argsort(counts, kind='stable')
+    word_counts = counts[order].tolist()
+    order = order.tolist()
+    inner_counts = []
+    parent = [0] * (2 * vocab_size - 1)
+    binary = bytearray(2 * vocab_size - 1)
+    word = inner = 0
+    for new_node in range(vocab_size - 1):
+        # on ties, merge words first, same as the C word2vec
+        if word < vocab_size and (inner == new_node or word_counts[word] <= inner_counts[inner]):
+            left, left_count = order[word], word_counts[word]
+            word += 1
+        else:
+            left, left_count = vocab_size + inner, inner_counts[inner]
+            inner += 1
+        if word < vocab_size and (inner == new_node or word_counts[word] <= inner_counts[inner]):
+            right, right_count = order[word], word_counts[word]
+            word += 1
+        else:
+            right, right_count = vocab_size + inner, inner_counts[inner]
+            inner += 1
+        inner_counts.append(left_count + right_count)
+        parent[left] = parent[right] = vocab_size + new_node
+        binary[right] = 1
+    return np.array(parent, dtype=np.int64), np.frombuffer(binary, dtype=np.uint8)
 
 
 def _assign_binary_codes(wv):
@@ -2177,38 +3517,44 @@ def _assign_binary_codes(wv):
 
     Sets the .code and .point attributes of each node.
     Each code is a numpy.array containing 0s and 1s.
-    Each point is an integer.
+    Each point is a numpy.array of the inner nodes on the path from the root.
 
     """
     logger.info("constructing a huffman tree from %i words", len(wv))
-
-    heap = _build_heap(wv)
-    if not heap:
-        #
-        # TODO: how can we end up with an empty heap?
-        #
+    vocab_size = len(wv)
+    if not vocab_size:
         logger.info("built huffman tree with maximum node depth 0")
         return
 
-    # recurse over the tree, assigning a binary code to each vocabulary word
-    max_depth = 0
-    stack = [(heap[0], [], [])]
-    while stack:
-        node, codes, points = stack.pop()
-        if node[1] < len(wv):  # node[1] = index
-            # leaf node => store its path from the root
-            k = node[1]
-            wv.set_vecattr(k, 'code', codes)
-            wv.set_vecattr(k, 'point', points)
-            # node.code, node.point = codes, points
-            max_depth = max(len(codes), max_depth)
-        else:
-            # inner node => continue recursion
-            points = np.array(list(points) + [node.index - len(wv)], dtype=np.uint32)
-            stack.append((node.left, np.array(list(codes) + [0], dtype=np.uint8), points))
-            stack.append((node.right, np.array(list(codes) + [1], dtype=np.uint8), points))
-
-    logger.info("built huffman tree with maximum node depth %i", max_depth)
+    parent, binary = _build_huffman_tree(wv.expandos['count'][:vocab_size])
+    root = 2 * vocab_size - 2
+
+    # walk up from all words at once: first to measure the code lengths, then to fill in the codes from their ends
+    depth = np.zeros(vocab_size, dtype=np.int64)
+    words, nodes = np.arange(vocab_size), np.arange(vocab_size)
+    while len(words):
+        climbing = nodes != root
+        words, nodes = words[climbing], nodes[climbing]
+        depth[words] += 1
+        nodes = parent[nodes]
+    ends = np.cumsum(depth)
+    codes = np.empty(ends[-1], dtype=np.uint8)
+    points = np.empty(ends[-1], dtype=np.uint32)
+    nodes, positions = np.arange(vocab_size), ends - 1
+    while len(nodes):
+        climbing = nodes != root
+        nodes, positions = nodes[climbing], positions[climbing]
+        codes[positions] = binary[nodes]
+        points[positions] = parent[nodes] - vocab_size
+        nodes, positions = parent[nodes], positions - 1
+
+    wv.allocate_vecattrs(attrs=['code', 'point'], types=[object, object])
+    vocab_codes, vocab_points = wv.expandos['code'], wv.expandos['point']
+    for word, (start, end) in enumerate(zip((ends - depth).tolist(), ends.tolist())):
+        vocab_codes[word] = codes[start:end]
+        vocab_points[word] = points[start:end]
+
+    logger.info("built huffman tree with maximum node depth %i", depth.max())
 
 
 # Example: ./word2vec.py -train data.txt -output vec.txt -size 200 -window 5 -sample 1e-4 \
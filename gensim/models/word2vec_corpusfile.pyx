@@ -23,12 +23,11 @@ from libcpp.vector cimport vector
 from libcpp cimport bool as bool_t
 
 from gensim.models.word2vec_inner cimport (
-    w2v_fast_sentence_sg_hs,
-    w2v_fast_sentence_sg_neg,
     w2v_fast_sentence_cbow_hs,
     w2v_fast_sentence_cbow_neg,
     random_int32,
     init_w2v_config,
+    sg_train_sentences,
     Word2VecConfig
 )
 
@@ -290,11 +289,9 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
     cdef CythonVocab vocab = _cython_vocab
 
-    cdef int i, j, k
     cdef int effective_words = 0, effective_sentences = 0
     cdef long long total_sentences = 0
     cdef long long total_effective_words = 0, total_words = 0
-    cdef int sent_idx, idx_start, idx_end
 
     init_w2v_config(&c, model, _alpha, compute_loss, _work)
 
@@ -313,30 +310,7 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
                 &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,
                 c.codelens, c.codes, c.points, c.reduced_windows)
 
-            for sent_idx in range(effective_sentences):
-                idx_start = c.sentence_idx[sent_idx]
-                idx_end = c.sentence_idx[sent_idx + 1]
-                for i in range(idx_start, idx_end):
-                    j = i - c.window + c.reduced_windows[i]
-                    if j < idx_start:
-                        j = idx_start
-                    k = i + c.window + 1 - c.reduced_windows[i]
-                    if k > idx_end:
-                        k = idx_end
-                    for j in range(j, k):
-                        if j == i:
-                            continue
-                        if c.hs:
-                            w2v_fast_sentence_sg_hs(
-                                c.points[i], c.codes[i], c.codelens[i], c.syn0, c.syn1, c.size, c.indexes[j],
-                                c.alpha, c.work, c.words_lockf, c.words_lockf_len, c.compute_loss,
-                                &c.running_training_loss)
-                        if c.negative:
-                            c.next_random = w2v_fast_sentence_sg_neg(
-                                c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size,
-                                c.indexes[i], c.indexes[j], c.alpha, c.work, c.next_random,
-                                c.words_lockf, c.words_lockf_len,
-                                c.compute_loss, &c.running_training_loss)
+            sg_train_sentences(&c, effective_sentences)
 
             total_sentences += sentences.size()
             total_effective_words += effective_words
@@ -431,7 +405,7 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
 
                     if c.negative:
                         c.next_random = w2v_fast_sentence_cbow_neg(
-                            c.negative, c.cum_table, c.cum_table_len, c.codelens, c.neu1, c.syn0,
+                            c.negative, c.alias_table, c.alias_table_len, c.codelens, c.neu1, c.syn0,
                             c.syn1neg, c.size, c.indexes, c.alpha, c.work, i, j, k, c.cbow_mean,
                             c.next_random, c.words_lockf, c.words_lockf_len, c.compute_loss,
                             &c.running_training_loss)
@@ -0,0 +1,408 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Data-parallel training of :class:`~gensim.models.word2vec.Word2Vec` across several nodes.
+
+Each node trains its own copy of the model on its own shard of the corpus, which it reads locally. Every
+`sync_words` words, the nodes send the rows of the weights they changed to the driver, which averages each
+row over the nodes that changed it and sends the result back, so that all nodes continue from the same
+weights. Only the changed rows of `wv.vectors`, `syn1neg` and `syn1` travel over the network.
+
+The nodes are either local processes, standing in for a cluster (handy for testing), or
+:mod:`gensim.models.word2vec_worker` Pyro4 workers running on your machines.
+
+How to use distributed :class:`~gensim.models.word2vec.Word2Vec`
+---------------------------------------------------------------
+
+#. Install needed dependencies (Pyro4) ::
+
+    pip install gensim[distributed]
+
+#. Setup serialization (on each machine) ::
+
+    export PYRO_SERIALIZERS_ACCEPTED=pickle
+    export PYRO_SERIALIZER=pickle
+
+#. Run nameserver ::
+
+    python -m Pyro4.naming -n 0.0.0.0 &
+
+#. Run workers (on each machine) ::
+
+    python -m gensim.models.word2vec_worker &
+
+#. Build the vocabulary and train, with one corpus shard per worker, using paths valid on the workers:
+
+.. sourcecode:: pycon
+
+    >>> import itertools
+    >>> from gensim.models import Word2Vec
+    >>> from gensim.models.word2vec import LineSentence
+    >>> from gensim.models.word2vec_distributed import pyro_nodes, train_distributed
+    >>>
+    >>> shards = [LineSentence('/data/corpus.part0.txt'), LineSentence('/data/corpus.part1.txt')]
+    >>> model = Word2Vec(min_count=5)
+    >>> model.build_vocab(itertools.chain.from_iterable(shards))
+    >>> train_distributed(model, shards, nodes=pyro_nodes())
+
+Without `nodes`, one local process per shard is used instead:
+
+.. sourcecode:: pycon
+
+    >>> from gensim.models import Word2Vec
+    >>> from gensim.models.word2vec_distributed import train_distributed
+    >>> from gensim.test.utils import common_texts
+    >>>
+    >>> model = Word2Vec(min_count=1)
+    >>> model.build_vocab(common_texts)
+    >>> trained_word_count, raw_word_count = train_distributed(model, [common_texts[:5], common_texts[5:]])
+
+"""
+
+import itertools
+import logging
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from gensim import utils
+from gensim.models.word2vec import Word2Vec
+
+logger = logging.getLogger(__name__)
+
+WORD2VEC_WORKER_PREFIX = 'gensim.word2vec_worker'
+DIFF_CHUNK_ROWS = 8192  # number of rows compared at once, when looking for all changed rows of an array
+
+
+def _synced_arrays(model):
+    """Get the weights that the nodes keep in sync, by name."""
+    arrays = {'vectors': model.wv.vectors}
+    if model.negative:
+        arrays['syn1neg'] = model.syn1neg
+    if model.hs:
+        arrays['syn1'] = model.syn1
+    return arrays
+
+
+def _changed_rows(array, snapshot):
+    """Get the indexes of the rows that differ between `array` and `snapshot`, comparing a few rows at a time."""
+    return np.concatenate([
+        start + np.flatnonzero((array[start:start + DIFF_CHUNK_ROWS] != snapshot[start:start + DIFF_CHUNK_ROWS]).any(1))
+        for start in range(0, len(array), DIFF_CHUNK_ROWS)
+    ])
+
+
+class Word2VecNode:
+    """Trains a copy of a :class:`~gensim.models.word2vec.Word2Vec` model on one shard of the corpus,
+    in rounds driven by :func:`~gensim.models.word2vec_distributed.train_distributed`.
+
+    """
+    def __init__(self):
+        self.model = None
+
+    def initialize(self, model, shard, epochs, shard_no=0):
+        """Receive the model to train and the shard of the corpus to train it on.
+
+        Parameters
+        ----------
+        model : :class:`~gensim.models.word2vec.Word2Vec`
+            Model with its vocabulary built and weights initialized.
+        shard : iterable of list of str
+            This node's part of the corpus, as a restartable iterable that can be read on this node.
+        epochs : int
+            Number of passes over the shard.
+        shard_no : int, optional
+            Number of the shard, seeding this node's random draws (of negative words, downsampled words and
+            reduced windows) differently from the other nodes.
+
+        Returns
+        -------
+        int
+            Number of raw words in the shard.
+
+        """
+        self.model = model
+        self.model.random = np.random.RandomState([model.seed, shard_no])
+        self.shard = shard
+        self.epochs = epochs
+        self.shard_words = sum(len(sentence) for sentence in shard)
+        self.words_done = 0
+        self.stream = itertools.chain.from_iterable(itertools.repeat(shard, epochs))
+        self.snapshot = {name: np.array(array) for name, array in _synced_arrays(model).items()}
+        logger.info("node initialized with a shard of %i words, for %i epochs", self.shard_words, epochs)
+        return self.shard_words
+
+    def train_round(self, sync_words):
+        """Train on the next `sync_words` raw words of the shard.
+
+        The learning rate decays linearly with the progress of this node over all its epochs.
+
+        Parameters
+        ----------
+        sync_words : int
+            Number of words to train on, rounded up to whole sentences.
+
+        Returns
+        -------
+        (dict of (str, (numpy.ndarray, numpy.ndarray)), int, int)
+            For each synchronized weights array, the indexes of the rows that changed in this round and
+            the changes themselves; the effective and raw count of the trained words. No words mean that
+            the node went through all its epochs.
+
+        """
+        chunk, chunk_words = [], 0
+        for sentence in self.stream:
+            chunk.append(sentence)
+            chunk_words += len(sentence)
+            if chunk_words >= sync_words:
+                break
+        if not chunk_words:
+            return {}, 0, 0
+
+        total_words = max(1, self.shard_words * self.epochs)
+        start_alpha = self._get_alpha(self.words_done / total_words)
+        end_alpha = self._get_alpha(min(1.0, (self.words_done + chunk_words) / total_words))
+        self.words_done += chunk_words
+        alpha, min_alpha = self.model.alpha, self.model.min_alpha
+        trained_words, raw_words = self.model.train(
+            chunk, total_words=chunk_words, epochs=1, start_alpha=start_alpha, end_alpha=end_alpha,
+        )
+        self.model.alpha, self.model.min_alpha = alpha, min_alpha
+
+        deltas = {}
+        touched = self._touched_rows(chunk)
+        for name, array in _synced_arrays(self.model).items():
+            snapshot = self.snapshot[name]
+            rows = touched.get(name)
+            if rows is None:
+                rows = _changed_rows(array, snapshot)
+            delta = array[rows] - snapshot[rows]
+            changed = delta.any(axis=1)
+            deltas[name] = (rows[changed].astype(np.int32), delta[changed])
+        return deltas, trained_words, raw_words
+
+    def _touched_rows(self, chunk):
+        """Get the rows of the synchronized arrays that training on `chunk` may have changed.
+
+        Training only changes the vectors of the words in `chunk` and, with hierarchical softmax, the rows of
+        `syn1` on their paths through the Huffman tree. Negative sampling can change any row of `syn1neg`,
+        which is missing from the result: all of its rows must be compared.
+
+        Returns
+        -------
+        dict of (str, numpy.ndarray)
+            Sorted row indexes, by array name.
+
+        """
+        key_to_index = self.model.wv.key_to_index
+        indexes = (key_to_index.get(word) for word in itertools.chain.from_iterable(chunk))
+        words = np.unique(np.fromiter((index for index in indexes if index is not None), dtype=np.int64))
+        touched = {'vectors': words}
+        if self.model.hs:
+            points = self.model.wv.expandos['point'][words]
+            touched['syn1'] = np.unique(np.concatenate([np.empty(0, dtype=np.int64)] + list(points)))
+        return touched
+
+    def _get_alpha(self, progress):
+        """Learning rate at `progress` (between 0.0 and 1.0) through all epochs."""
+        return self.model.alpha - (self.model.alpha - self.model.min_alpha) * progress
+
+    def apply_update(self, update):
+        """Overwrite rows of the weights with their values averaged over all nodes.
+
+        Parameters
+        ----------
+        update : dict of (str, (numpy.ndarray, numpy.ndarray))
+            For each synchronized weights array, the indexes of the updated rows and their new values.
+
+        """
+        arrays = _synced_arrays(self.model)
+        for name, (rows, values) in update.items():
+            arrays[name][rows] = values
+            self.snapshot[name][rows] = values
+
+    def ping(self):
+        """Test the connectivity with the node."""
+        return True
+
+
+def _serve_node(connection):
+    """Run a :class:`Word2VecNode` in this process, executing the method calls received through `connection`."""
+    node = Word2VecNode()
+    while True:
+        call = connection.recv()
+        if call is None:
+            break
+        method, args = call
+        try:
+            result = getattr(node, method)(*args)
+        except Exception as err:
+            logger.exception("node failed in %s", method)
+            result = err
+        connection.send(result)
+
+
+class LocalNode:
+    """A :class:`Word2VecNode` running in a separate local process: a stand-in for a Pyro4 worker on another
+    machine, with the same interface.
+
+    """
+    def __init__(self):
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_serve_node, args=(child_connection,))
+        self.process.daemon = True
+        self.process.start()
+
+    def _call(self, method, *args):
+        self.connection.send((method, args))
+        result = self.connection.recv()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def initialize(self, model, shard, epochs, shard_no=0):
+        return self._call('initialize', model, shard, epochs, shard_no)
+
+    def train_round(self, sync_words):
+        return self._call('train_round', sync_words)
+
+    def apply_update(self, update):
+        return self._call('apply_update', update)
+
+    def ping(self):
+        return self._call('ping')
+
+    def close(self):
+        """Stop the node process."""
+        self.connection.send(None)
+        self.process.join()
+
+
+def pyro_nodes(**ns_conf):
+    """Get proxies of all :mod:`gensim.models.word2vec_worker` workers registered with the Pyro4 name server.
+
+    Parameters
+    ----------
+    **ns_conf
+        Key word parameters propagated to :func:`gensim.utils.getNS` to get a Pyro4 nameserver.
+
+    Returns
+    -------
+    list of :class:`Pyro4.core.Proxy`
+        Proxies of the workers, to be passed to :func:`~gensim.models.word2vec_distributed.train_distributed`.
+
+    Raises
+    ------
+    RuntimeError
+        When no workers are found (the :mod:`gensim.models.word2vec_worker` script must be run beforehand).
+
+    """
+    import Pyro4
+    nodes = []
+    with utils.getNS(**ns_conf) as ns:
+        for name, uri in sorted(ns.list(prefix=WORD2VEC_WORKER_PREFIX).items()):
+            try:
+                node = Pyro4.Proxy(uri)
+                node.ping()
+                logger.info("found word2vec worker %s", name)
+                nodes.append(node)
+            except Pyro4.errors.PyroError:
+                logger.warning("unresponsive worker at %s, deleting it from the name server", uri)
+                ns.remove(name)
+    if not nodes:
+        raise RuntimeError('no workers found; run some word2vec_worker scripts on your machines first!')
+    return nodes
+
+
+def train_distributed(model, shards, nodes=None, epochs=None, sync_words=1000000):
+    """Train `model` on `shards` of a corpus in parallel, on several nodes.
+
+    Parameters
+    ----------
+    model : :class:`~gensim.models.word2vec.Word2Vec`
+        Model with its vocabulary already built, by :meth:`~gensim.models.word2vec.Word2Vec.build_vocab` over
+        the whole corpus. Its weights are updated in place.
+    shards : list of iterable of list of str
+        The corpus split into shards, one per node. Each shard is sent to its node, so it must be picklable
+        and restartable, and readable on that node, such as a :class:`~gensim.models.word2vec.LineSentence`
+        of a file that each node has a copy of.
+    nodes : list of object, optional
+        The nodes, as returned by :func:`~gensim.models.word2vec_distributed.pyro_nodes`. The default, None,
+        starts one :class:`~gensim.models.word2vec_distributed.LocalNode` process per shard.
+    epochs : int, optional
+        Number of passes over each shard. Defaults to `model.epochs`.
+    sync_words : int, optional
+        Number of raw words each node trains on between two synchronizations of the weights. Synchronizing
+        more often keeps the nodes closer to sequential training, for more network traffic.
+
+    Returns
+    -------
+    (int, int)
+        Effective and raw count of the trained words, summed over all nodes.
+
+    """
+    if type(model) is not Word2Vec:
+        raise NotImplementedError(f"distributed training of {type(model).__name__} is not supported")
+    if not len(model.wv):
+        raise RuntimeError("you must first build vocabulary before training the model")
+    local = nodes is None
+    if local:
+        nodes = [LocalNode() for _ in shards]
+    if len(nodes) != len(shards):
+        raise ValueError(f"got {len(shards)} shards for {len(nodes)} nodes, expected one shard per node")
+    epochs = model.epochs if epochs is None else epochs
+    arrays = _synced_arrays(model)
+
+    pool = ThreadPool(len(nodes))
+    try:
+        shard_words = pool.starmap(
+            lambda shard_no, node, shard: node.initialize(model, shard, epochs, shard_no),
+            zip(itertools.count(), nodes, shards),
+        )
+        logger.info("training on %i shards of %s words", len(shards), shard_words)
+        active = list(nodes)
+        trained_word_count, raw_word_count, sync_no = 0, 0, 0
+        while active:
+            results = pool.map(lambda node: node.train_round(sync_words), active)
+            active = [node for node, (_, _, raw_words) in zip(active, results) if raw_words]
+
+            # average each changed row over the nodes that changed it, accumulating only the changed rows
+            update = {}
+            for name, array in arrays.items():
+                node_deltas = [deltas[name] for deltas, _, _ in results if name in deltas]
+                if not node_deltas:
+                    continue
+                rows, positions, counts = np.unique(
+                    np.concatenate([node_rows for node_rows, _ in node_deltas]),
+                    return_inverse=True, return_counts=True,
+                )
+                sums = np.zeros((len(rows), array.shape[1]), dtype=np.float64)
+                np.add.at(sums, positions, np.concatenate([delta for _, delta in node_deltas]))
+                array[rows] += (sums / counts[:, np.newaxis]).astype(array.dtype)
+                update[name] = (rows, array[rows])
+            pool.map(lambda node: node.apply_update(update), nodes)
+
+            sync_no += 1
+            trained_word_count += sum(result[1] for result in results)
+            raw_word_count += sum(result[2] for result in results)
+            logger.info(
+                "synchronization #%i: %i raw words done out of %i, %i nodes still training",
+                sync_no, raw_word_count, epochs * sum(shard_words), len(active),
+            )
+    finally:
+        pool.close()
+        if local:
+            for node in nodes:
+                node.close()
+
+    model.train_count += 1
+    model.min_alpha_yet_reached = model.min_alpha
+    model._clear_post_train()
+    model.add_lifecycle_event(
+        "train_distributed",
+        msg=f"trained on {len(shards)} shards: {raw_word_count} raw words, {trained_word_count} effective words",
+    )
+    return trained_word_count, raw_word_count
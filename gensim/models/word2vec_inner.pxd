@@ -25,6 +25,9 @@ ctypedef float (*sdot_ptr) (const int *N, const float *X, const int *incX, const
 ctypedef double (*dsdot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
 ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil
 ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil
+ctypedef void (*sgemm_ptr) (
+    const char *transA, const char *transB, const int *M, const int *N, const int *K, const float *alpha,
+    const float *A, const int *lda, const float *B, const int *ldb, const float *beta, float *C, const int *ldc) nogil
 
 cdef scopy_ptr scopy
 cdef saxpy_ptr saxpy
@@ -32,6 +35,7 @@ cdef sdot_ptr sdot
 cdef dsdot_ptr dsdot
 cdef snrm2_ptr snrm2
 cdef sscal_ptr sscal
+cdef sgemm_ptr sgemm
 
 # precalculated sigmoid table
 DEF EXP_TABLE_SIZE = 1000
@@ -49,7 +53,7 @@ cdef our_saxpy_ptr our_saxpy
 
 
 cdef struct Word2VecConfig:
-    int hs, negative, sample, compute_loss, size, window, cbow_mean, workers
+    int hs, negative, sample, compute_loss, size, window, cbow_mean, workers, batch_negatives
     REAL_t running_training_loss, alpha
 
     REAL_t *syn0
@@ -70,8 +74,10 @@ cdef struct Word2VecConfig:
 
     # For negative sampling
     REAL_t *syn1neg
-    np.uint32_t *cum_table
-    unsigned long long cum_table_len
+    REAL_t *window_work  # private memory of the batch negatives kernel, or NULL to train pair by pair
+    np.uint32_t *targets
+    const np.uint32_t *alias_table
+    unsigned long long alias_table_len
     # for sampling (negative and frequent-word downsampling)
     unsigned long long next_random
 
@@ -89,6 +95,19 @@ cdef void our_saxpy_noblas(const int *N, const float *alpha, const float *X, con
 # to support random draws from negative-sampling cum_table
 cdef unsigned long long bisect_left(np.uint32_t *a, unsigned long long x, unsigned long long lo, unsigned long long hi) nogil
 
+# to support random draws from the negative-sampling alias_table, built by build_alias_table() in word2vec_inner.pyx:
+# pick a column uniformly at random, then the word of that column if a random 31-bit integer is below the column's
+# threshold, or else the column's alias. Advances the random generator `next_random` twice.
+cdef inline unsigned long long alias_draw(
+        const np.uint32_t *alias_table, unsigned long long alias_table_len, unsigned long long *next_random) nogil:
+    cdef unsigned long long column = ((next_random[0] >> 16) * alias_table_len) >> 32
+    next_random[0] = (next_random[0] * <unsigned long long>25214903917ULL + 11) & 281474976710655ULL
+    cdef unsigned long long coin = next_random[0] >> 17
+    next_random[0] = (next_random[0] * <unsigned long long>25214903917ULL + 11) & 281474976710655ULL
+    if coin < alias_table[2 * column]:
+        return column
+    return alias_table[2 * column + 1]
+
 cdef unsigned long long random_int32(unsigned long long *next_random) nogil
 
 
@@ -100,13 +119,21 @@ cdef void w2v_fast_sentence_sg_hs(
 
 
 cdef unsigned long long w2v_fast_sentence_sg_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len,
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len,
     REAL_t *syn0, REAL_t *syn1neg, const int size, const np.uint32_t word_index,
     const np.uint32_t word2_index, const REAL_t alpha, REAL_t *work,
     unsigned long long next_random, REAL_t *words_lockf,
     const np.uint32_t lockf_len, const int _compute_loss, REAL_t *_running_training_loss_param) nogil
 
 
+cdef unsigned long long w2v_fast_window_sg_neg(
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len,
+    REAL_t *syn0, REAL_t *syn1neg, const int size, const np.uint32_t indexes[MAX_SENTENCE_LEN],
+    const REAL_t alpha, REAL_t *window_work, np.uint32_t *targets, int i, int j, int k,
+    unsigned long long next_random, REAL_t *words_lockf,
+    const np.uint32_t lockf_len, const int _compute_loss, REAL_t *_running_training_loss_param) nogil
+
+
 cdef void w2v_fast_sentence_cbow_hs(
     const np.uint32_t *word_point, const np.uint8_t *word_code, int codelens[MAX_SENTENCE_LEN],
     REAL_t *neu1, REAL_t *syn0, REAL_t *syn1, const int size,
@@ -116,7 +143,7 @@ cdef void w2v_fast_sentence_cbow_hs(
 
 
 cdef unsigned long long w2v_fast_sentence_cbow_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len, int codelens[MAX_SENTENCE_LEN],
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len, int codelens[MAX_SENTENCE_LEN],
     REAL_t *neu1,  REAL_t *syn0, REAL_t *syn1neg, const int size,
     const np.uint32_t indexes[MAX_SENTENCE_LEN], const REAL_t alpha, REAL_t *work,
     int i, int j, int k, int cbow_mean, unsigned long long next_random, REAL_t *words_lockf,
@@ -124,3 +151,6 @@ cdef unsigned long long w2v_fast_sentence_cbow_neg(
 
 
 cdef init_w2v_config(Word2VecConfig *c, model, alpha, compute_loss, _work, _neu1=*)
+
+
+cdef void sg_train_sentences(Word2VecConfig *c, const int effective_sentences) nogil
@@ -17,7 +17,7 @@ cimport numpy as np
 
 from libc.math cimport exp
 from libc.math cimport log
-from libc.string cimport memset
+from libc.string cimport memset, memcpy
 
 # scipy <= 0.15
 try:
@@ -36,15 +36,21 @@ cdef sdot_ptr sdot=<sdot_ptr>PyCObject_AsVoidPtr(fblas.sdot._cpointer)  # float
 cdef dsdot_ptr dsdot=<dsdot_ptr>PyCObject_AsVoidPtr(fblas.sdot._cpointer)  # double = dot(x, y)
 cdef snrm2_ptr snrm2=<snrm2_ptr>PyCObject_AsVoidPtr(fblas.snrm2._cpointer)  # sqrt(x^2)
 cdef sscal_ptr sscal=<sscal_ptr>PyCObject_AsVoidPtr(fblas.sscal._cpointer) # x = alpha * x
+cdef sgemm_ptr sgemm=<sgemm_ptr>PyCObject_AsVoidPtr(fblas.sgemm._cpointer)  # C = alpha * op(A) * op(B) + beta * C
 
 DEF EXP_TABLE_SIZE = 1000
 DEF MAX_EXP = 6
 
+cdef long long ALIAS_DOMAIN = 2147483648  # 2**31 slots in each column of a negative-sampling alias table
+
 cdef REAL_t[EXP_TABLE_SIZE] EXP_TABLE
 cdef REAL_t[EXP_TABLE_SIZE] LOG_TABLE
 
 cdef int ONE = 1
 cdef REAL_t ONEF = <REAL_t>1.0
+cdef REAL_t ZEROF = <REAL_t>0.0
+cdef char TRANS = b'T'
+cdef char NOTRANS = b'N'
 
 
 # for when fblas.sdot returns a double
@@ -149,6 +155,77 @@ cdef inline unsigned long long bisect_left(np.uint32_t *a, unsigned long long x,
             lo = mid + 1
     return lo
 
+def build_alias_table(weights):
+    """Build a Walker alias table, to draw word indexes in proportion to `weights` in constant time.
+
+    Each word gets a column of the table. A draw picks a column uniformly at random, and then either the word of
+    that column or the column's alias word, depending on a second random number, see `alias_draw`
+    in word2vec_inner.pxd.
+
+    The weights are first rounded to integers that fill the `len(weights)` columns of 2**31 slots each exactly,
+    so that the table draws each word with its weight's probability up to that resolution.
+
+    Parameters
+    ----------
+    weights : numpy.ndarray
+        Non-negative weight of each word.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape `(len(weights), 2)` and type uint32. For each column: the threshold up to 2**31, below which
+        a random 31-bit integer draws the word of that column, and the index of the word drawn otherwise.
+
+    """
+    cdef long long n = len(weights)
+    cdef long long n_small = 0, n_large = 0, i, small_word, large_word
+    table = np.empty((n, 2), dtype=np.uint32)
+    if not n:
+        return table
+
+    total = n * ALIAS_DOMAIN
+    scaled = np.asarray(weights, dtype=np.float64) * (total / np.sum(weights))
+    quantized = np.floor(scaled).astype(np.int64)
+    shortfall = int(total - quantized.sum())
+    if shortfall:  # round the words with the largest remainders up, or those with the smallest down
+        by_remainder = np.argsort(quantized - scaled)
+        if shortfall > 0:
+            quantized[by_remainder[:shortfall]] += 1
+        else:
+            by_remainder = by_remainder[quantized[by_remainder] > 0]
+            quantized[by_remainder[shortfall:]] -= 1
+
+    small_words = np.empty(n, dtype=np.int64)
+    large_words = np.empty(n, dtype=np.int64)
+    cdef np.int64_t *w = <np.int64_t *>np.PyArray_DATA(quantized)
+    cdef np.uint32_t *t = <np.uint32_t *>np.PyArray_DATA(table)
+    cdef np.int64_t *small = <np.int64_t *>np.PyArray_DATA(small_words)
+    cdef np.int64_t *large = <np.int64_t *>np.PyArray_DATA(large_words)
+    with nogil:
+        for i in range(n):
+            t[2 * i] = ALIAS_DOMAIN
+            t[2 * i + 1] = i
+            if w[i] < ALIAS_DOMAIN:
+                small[n_small] = i
+                n_small += 1
+            else:
+                large[n_large] = i
+                n_large += 1
+        # fill up each underfull column with the weight of an overfull word, which may become underfull in turn
+        while n_small and n_large:
+            n_small -= 1
+            small_word = small[n_small]
+            large_word = large[n_large - 1]
+            t[2 * small_word] = w[small_word]
+            t[2 * small_word + 1] = large_word
+            w[large_word] -= ALIAS_DOMAIN - w[small_word]
+            if w[large_word] < ALIAS_DOMAIN:
+                n_large -= 1
+                small[n_small] = large_word
+                n_small += 1
+    return table
+
+
 # this quick & dirty RNG apparently matches Java's (non-Secure)Random
 # note this function side-effects next_random to set up the next number
 cdef inline unsigned long long random_int32(unsigned long long *next_random) nogil:
@@ -157,7 +234,7 @@ cdef inline unsigned long long random_int32(unsigned long long *next_random) nog
     return this_random
 
 cdef unsigned long long w2v_fast_sentence_sg_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len,
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len,
     REAL_t *syn0, REAL_t *syn1neg, const int size, const np.uint32_t word_index,
     const np.uint32_t word2_index, const REAL_t alpha, REAL_t *work,
     unsigned long long next_random, REAL_t *words_lockf,
@@ -172,11 +249,11 @@ cdef unsigned long long w2v_fast_sentence_sg_neg(
     ----------
     negative
         Number of negative words to be sampled.
-    cum_table
-        Cumulative-distribution table using stored vocabulary word counts for
-        drawing random words (with a negative label).
-    cum_table_len
-        Length of the `cum_table`
+    alias_table
+        Walker alias table built from the stored vocabulary word counts, for
+        drawing random words (with a negative label), see `alias_draw`.
+    alias_table_len
+        Number of words in the `alias_table`.
     syn0
         Embeddings for the words in the vocabulary (`model.wv.vectors`)
     syn1neg
@@ -219,8 +296,7 @@ cdef unsigned long long w2v_fast_sentence_sg_neg(
             target_index = word_index
             label = ONEF
         else:
-            target_index = bisect_left(cum_table, (next_random >> 16) % cum_table[cum_table_len-1], 0, cum_table_len)
-            next_random = (next_random * <unsigned long long>25214903917ULL + 11) & modulo
+            target_index = alias_draw(alias_table, alias_table_len, &next_random)
             if target_index == word_index:
                 continue
             label = <REAL_t>0.0
@@ -247,6 +323,141 @@ cdef unsigned long long w2v_fast_sentence_sg_neg(
     return next_random
 
 
+cdef unsigned long long w2v_fast_window_sg_neg(
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len,
+    REAL_t *syn0, REAL_t *syn1neg, const int size, const np.uint32_t indexes[MAX_SENTENCE_LEN],
+    const REAL_t alpha, REAL_t *window_work, np.uint32_t *targets, int i, int j, int k,
+    unsigned long long next_random, REAL_t *words_lockf,
+    const np.uint32_t lockf_len, const int _compute_loss, REAL_t *_running_training_loss_param) nogil:
+    """Train on a whole context window of a single effective word, using the Skip-Gram model.
+
+    Unlike :func:`w2v_fast_sentence_sg_neg`, which draws new negative words for every (word, context word) pair,
+    all context words of the window share the same negative words, as in
+    `Ji et al., "Parallelizing Word2Vec in Shared and Distributed Memory" <https://arxiv.org/abs/1604.04661>`_.
+    The dot products and the gradients of the whole window then become three matrix-matrix multiplications
+    (level-3 BLAS), instead of many vector operations.
+
+    Parameters
+    ----------
+    negative
+        Number of negative words to be sampled.
+    alias_table
+        Walker alias table built from the stored vocabulary word counts, for
+        drawing random words (with a negative label), see `alias_draw`.
+    alias_table_len
+        Number of words in the `alias_table`.
+    syn0
+        Embeddings for the words in the vocabulary (`model.wv.vectors`)
+    syn1neg
+        Weights of the hidden layer in the model's trainable neural network.
+    size
+        Length of the embeddings.
+    indexes
+        Indexes of the effective words of the current batch in the vocabulary.
+    alpha
+        Learning rate.
+    window_work
+        Private working memory, for `(2 * (k - j - 1) + 2 * (negative + 1)) * size + (k - j - 1) * (negative + 1)`
+        values.
+    targets
+        Private working memory, for `negative + 1` vocabulary indexes.
+    i
+        Index of the current training word in `indexes`.
+    j
+        Index of the first word of the context window in `indexes`.
+    k
+        Index one past the last word of the context window in `indexes`.
+    next_random
+        Seed to produce the index for the next word to be randomly sampled.
+    words_lockf
+        Lock factors for each word. A value of 0 will block training.
+    _compute_loss
+        Whether or not the loss should be computed at this step.
+    _running_training_loss_param
+        Running loss, used to debug or inspect how training progresses.
+
+    Returns
+    -------
+    Seed to draw the training word for the next iteration of the same routine.
+
+    """
+    cdef unsigned long long modulo = 281474976710655ULL
+    cdef np.uint32_t word_index = indexes[i]
+    cdef int num_context = k - j - 1, num_targets = negative + 1
+    cdef int m, n, d
+    cdef REAL_t f, g, label, f_dot, log_e_f_dot
+    cdef size_t row_bytes = size * cython.sizeof(REAL_t)
+
+    if num_context <= 0:
+        return next_random
+
+    # row-major layout: each matrix below is stored as its transpose, in BLAS (column-major) terms
+    cdef REAL_t *inputs = window_work  # num_context x size, rows of syn0
+    cdef REAL_t *outputs = inputs + num_context * size  # num_targets x size, rows of syn1neg
+    cdef REAL_t *grads = outputs + num_targets * size  # num_context x num_targets
+    cdef REAL_t *inputs_update = grads + num_context * num_targets  # num_context x size
+    cdef REAL_t *outputs_update = inputs_update + num_context * size  # num_targets x size
+
+    n = 0
+    for m in range(j, k):
+        if m == i:
+            continue
+        memcpy(&inputs[n * size], &syn0[<long long>indexes[m] * <long long>size], row_bytes)
+        n += 1
+
+    targets[0] = word_index
+    for d in range(1, num_targets):
+        targets[d] = alias_draw(alias_table, alias_table_len, &next_random)
+    for d in range(num_targets):
+        memcpy(&outputs[d * size], &syn1neg[<long long>targets[d] * <long long>size], row_bytes)
+
+    # grads = inputs . outputs^T
+    sgemm(
+        &TRANS, &NOTRANS, &num_targets, &num_context, &size, &ONEF,
+        outputs, &size, inputs, &size, &ZEROF, grads, &num_targets)
+
+    for n in range(num_context):
+        for d in range(num_targets):
+            f_dot = grads[n * num_targets + d]
+            grads[n * num_targets + d] = <REAL_t>0.0
+            if d > 0 and targets[d] == word_index:
+                continue
+            if f_dot <= -MAX_EXP or f_dot >= MAX_EXP:
+                continue
+            label = ONEF if d == 0 else <REAL_t>0.0
+            f = EXP_TABLE[<int>((f_dot + MAX_EXP) * (EXP_TABLE_SIZE / MAX_EXP / 2))]
+            g = (label - f) * alpha
+            grads[n * num_targets + d] = g
+
+            if _compute_loss == 1:
+                f_dot = (f_dot if d == 0 else -f_dot)
+                if f_dot <= -MAX_EXP or f_dot >= MAX_EXP:
+                    continue
+                log_e_f_dot = LOG_TABLE[<int>((f_dot + MAX_EXP) * (EXP_TABLE_SIZE / MAX_EXP / 2))]
+                _running_training_loss_param[0] = _running_training_loss_param[0] - log_e_f_dot
+
+    # inputs_update = grads . outputs, outputs_update = grads^T . inputs
+    sgemm(
+        &NOTRANS, &NOTRANS, &size, &num_context, &num_targets, &ONEF,
+        outputs, &size, grads, &num_targets, &ZEROF, inputs_update, &size)
+    sgemm(
+        &NOTRANS, &TRANS, &size, &num_targets, &num_context, &ONEF,
+        inputs, &size, grads, &num_targets, &ZEROF, outputs_update, &size)
+
+    for d in range(num_targets):
+        our_saxpy(&size, &ONEF, &outputs_update[d * size], &ONE, &syn1neg[<long long>targets[d] * <long long>size], &ONE)
+    n = 0
+    for m in range(j, k):
+        if m == i:
+            continue
+        our_saxpy(
+            &size, &words_lockf[indexes[m] % lockf_len], &inputs_update[n * size], &ONE,
+            &syn0[<long long>indexes[m] * <long long>size], &ONE)
+        n += 1
+
+    return next_random
+
+
 cdef void w2v_fast_sentence_cbow_hs(
     const np.uint32_t *word_point, const np.uint8_t *word_code, int codelens[MAX_SENTENCE_LEN],
     REAL_t *neu1, REAL_t *syn0, REAL_t *syn1, const int size,
@@ -346,7 +557,7 @@ cdef void w2v_fast_sentence_cbow_hs(
 
 
 cdef unsigned long long w2v_fast_sentence_cbow_neg(
-    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len, int codelens[MAX_SENTENCE_LEN],
+    const int negative, const np.uint32_t *alias_table, unsigned long long alias_table_len, int codelens[MAX_SENTENCE_LEN],
     REAL_t *neu1,  REAL_t *syn0, REAL_t *syn1neg, const int size,
     const np.uint32_t indexes[MAX_SENTENCE_LEN], const REAL_t alpha, REAL_t *work,
     int i, int j, int k, int cbow_mean, unsigned long long next_random, REAL_t *words_lockf,
@@ -361,11 +572,11 @@ cdef unsigned long long w2v_fast_sentence_cbow_neg(
     ----------
     negative
         Number of negative words to be sampled.
-    cum_table
-        Cumulative-distribution table using stored vocabulary word counts for
-        drawing random words (with a negative label).
-    cum_table_len
-        Length of the `cum_table`
+    alias_table
+        Walker alias table built from the stored vocabulary word counts, for
+        drawing random words (with a negative label), see `alias_draw`.
+    alias_table_len
+        Number of words in the `alias_table`.
     codelens
         Number of characters (length) for all words in the context.
     neu1
@@ -429,8 +640,7 @@ cdef unsigned long long w2v_fast_sentence_cbow_neg(
             target_index = word_index
             label = ONEF
         else:
-            target_index = bisect_left(cum_table, (next_random >> 16) % cum_table[cum_table_len-1], 0, cum_table_len)
-            next_random = (next_random * <unsigned long long>25214903917ULL + 11) & modulo
+            target_index = alias_draw(alias_table, alias_table_len, &next_random)
             if target_index == word_index:
                 continue
             label = <REAL_t>0.0
@@ -464,6 +674,28 @@ cdef unsigned long long w2v_fast_sentence_cbow_neg(
     return next_random
 
 
+def batch_negatives_work_size(window, negative, size):
+    """Get the number of values of private working memory needed by :func:`w2v_fast_window_sg_neg`.
+
+    Parameters
+    ----------
+    window : int
+        Maximum distance between the current and predicted word within a sentence.
+    negative : int
+        Number of negative words to be sampled.
+    size : int
+        Length of the embeddings.
+
+    Returns
+    -------
+    int
+        Number of float32 values, for its `window_work` of up to `2 * window` context words followed by its
+        `negative + 1` (32-bit) `targets`.
+
+    """
+    return (4 * window + 2 * (negative + 1)) * size + 2 * window * (negative + 1) + negative + 1
+
+
 cdef init_w2v_config(Word2VecConfig *c, model, alpha, compute_loss, _work, _neu1=None):
     c[0].hs = model.hs
     c[0].negative = model.negative
@@ -471,6 +703,8 @@ cdef init_w2v_config(Word2VecConfig *c, model, alpha, compute_loss, _work, _neu1
     c[0].cbow_mean = model.cbow_mean
     c[0].window = model.window
     c[0].workers = model.workers
+    # the shared negatives kernel needs level-3 BLAS
+    c[0].batch_negatives = model.batch_negatives and FAST_VERSION != 2
 
     c[0].compute_loss = (1 if compute_loss else 0)
     c[0].running_training_loss = model.running_training_loss
@@ -486,18 +720,143 @@ cdef init_w2v_config(Word2VecConfig *c, model, alpha, compute_loss, _work, _neu1
 
     if c[0].negative:
         c[0].syn1neg = <REAL_t *>(np.PyArray_DATA(model.syn1neg))
-        c[0].cum_table = <np.uint32_t *>(np.PyArray_DATA(model.cum_table))
-        c[0].cum_table_len = len(model.cum_table)
+        c[0].alias_table = <np.uint32_t *>(np.PyArray_DATA(model.alias_table))
+        c[0].alias_table_len = len(model.alias_table)
     if c[0].negative or c[0].sample:
         c[0].next_random = (2**24) * model.random.randint(0, 2**24) + model.random.randint(0, 2**24)
 
     # convert Python structures to primitive types, so we can release the GIL
     c[0].work = <REAL_t *>np.PyArray_DATA(_work)
 
+    # the batch negatives kernel works in the private memory after `work`, see Word2Vec._get_thread_working_mem()
+    cdef long long window_work_len
+    c[0].window_work = NULL
+    c[0].targets = NULL
+    if c[0].negative and c[0].batch_negatives:
+        window_work_len = batch_negatives_work_size(c[0].window, c[0].negative, c[0].size)
+        if len(_work) >= c[0].size + window_work_len:
+            c[0].window_work = c[0].work + c[0].size
+            c[0].targets = <np.uint32_t *>(c[0].window_work + window_work_len - (c[0].negative + 1))
+
     if _neu1 is not None:
         c[0].neu1 = <REAL_t *>np.PyArray_DATA(_neu1)
 
 
+cdef void sg_train_sentences(Word2VecConfig *c, const int effective_sentences) nogil:
+    """Train skip-gram on the sentences prepared in `c.indexes`, delimited by `c.sentence_idx`."""
+    cdef int sent_idx, idx_start, idx_end, i, j, k, m
+
+    for sent_idx in range(effective_sentences):
+        idx_start = c.sentence_idx[sent_idx]
+        idx_end = c.sentence_idx[sent_idx + 1]
+        for i in range(idx_start, idx_end):
+            j = i - c.window + c.reduced_windows[i]
+            if j < idx_start:
+                j = idx_start
+            k = i + c.window + 1 - c.reduced_windows[i]
+            if k > idx_end:
+                k = idx_end
+            if c.window_work != NULL:
+                if c.hs:
+                    for m in range(j, k):
+                        if m == i:
+                            continue
+                        w2v_fast_sentence_sg_hs(c.points[i], c.codes[i], c.codelens[i], c.syn0, c.syn1, c.size, c.indexes[m], c.alpha, c.work, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
+                c.next_random = w2v_fast_window_sg_neg(c.negative, c.alias_table, c.alias_table_len, c.syn0, c.syn1neg, c.size, c.indexes, c.alpha, c.window_work, c.targets, i, j, k, c.next_random, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
+                continue
+            for j in range(j, k):
+                if j == i:
+                    continue
+                if c.hs:
+                    w2v_fast_sentence_sg_hs(c.points[i], c.codes[i], c.codelens[i], c.syn0, c.syn1, c.size, c.indexes[j], c.alpha, c.work, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
+                if c.negative:
+                    c.next_random = w2v_fast_sentence_sg_neg(c.negative, c.alias_table, c.alias_table_len, c.syn0, c.syn1neg, c.size, c.indexes[i], c.indexes[j], c.alpha, c.work, c.next_random, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
+
+
+cdef void cbow_train_sentences(Word2VecConfig *c, const int effective_sentences) nogil:
+    """Train CBOW on the sentences prepared in `c.indexes`, delimited by `c.sentence_idx`."""
+    cdef int sent_idx, idx_start, idx_end, i, j, k
+
+    for sent_idx in range(effective_sentences):
+        idx_start = c.sentence_idx[sent_idx]
+        idx_end = c.sentence_idx[sent_idx + 1]
+        for i in range(idx_start, idx_end):
+            j = i - c.window + c.reduced_windows[i]
+            if j < idx_start:
+                j = idx_start
+            k = i + c.window + 1 - c.reduced_windows[i]
+            if k > idx_end:
+                k = idx_end
+            if c.hs:
+                w2v_fast_sentence_cbow_hs(c.points[i], c.codes[i], c.codelens, c.neu1, c.syn0, c.syn1, c.size, c.indexes, c.alpha, c.work, i, j, k, c.cbow_mean, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
+            if c.negative:
+                c.next_random = w2v_fast_sentence_cbow_neg(c.negative, c.alias_table, c.alias_table_len, c.codelens, c.neu1, c.syn0, c.syn1neg, c.size, c.indexes, c.alpha, c.work, i, j, k, c.cbow_mean, c.next_random, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
+
+
+cdef int prepare_indexed_sentences(
+        Word2VecConfig *c, const np.uint32_t *word_indexes, const np.int64_t *offsets, const long long num_sentences,
+        const np.uint32_t *vocab_sample_ints) nogil:
+    """Copy sentences of already known vocabulary indexes into `c.indexes`, downsampling frequent words.
+
+    Sentence number X spans `word_indexes[offsets[X]:offsets[X + 1]]`. Returns the number of prepared sentences;
+    like in :func:`train_batch_sg`, the batch is truncated after `MAX_SENTENCE_LEN` effective words.
+
+    """
+    cdef int effective_words = 0, effective_sentences = 0
+    cdef long long sent_idx, pos
+    cdef np.uint32_t word_index
+
+    c.sentence_idx[0] = 0
+    for sent_idx in range(num_sentences):
+        for pos in range(offsets[sent_idx], offsets[sent_idx + 1]):
+            word_index = word_indexes[pos]
+            if c.sample and vocab_sample_ints[word_index] < random_int32(&c.next_random):
+                continue
+            c.indexes[effective_words] = word_index
+            effective_words += 1
+            if effective_words == MAX_SENTENCE_LEN:
+                break
+        effective_sentences += 1
+        c.sentence_idx[effective_sentences] = effective_words
+        if effective_words == MAX_SENTENCE_LEN:
+            break
+    return effective_sentences
+
+
+cdef int init_indexed_batch(Word2VecConfig *c, model, indexes, offsets) except -1:
+    """Prepare a batch of indexed sentences for :func:`train_batch_indexed_sg` or :func:`train_batch_indexed_cbow`.
+
+    Returns the number of effective words in the prepared batch.
+
+    """
+    cdef np.uint32_t *vocab_sample_ints = NULL
+    cdef np.uint32_t *word_indexes = <np.uint32_t *>np.PyArray_DATA(indexes)
+    cdef np.int64_t *sentence_offsets = <np.int64_t *>np.PyArray_DATA(offsets)
+    cdef long long num_sentences = len(offsets) - 1
+    cdef int i, effective_words, effective_sentences
+
+    if c.sample:
+        vocab_sample_ints = <np.uint32_t *>np.PyArray_DATA(model.wv.expandos['sample_int'])
+
+    with nogil:
+        effective_sentences = prepare_indexed_sentences(
+            c, word_indexes, sentence_offsets, num_sentences, vocab_sample_ints)
+    effective_words = c.sentence_idx[effective_sentences]
+
+    if c.hs:
+        vocab_codes = model.wv.expandos['code']
+        vocab_points = model.wv.expandos['point']
+        for i in range(effective_words):
+            c.codelens[i] = <int>len(vocab_codes[c.indexes[i]])
+            c.codes[i] = <np.uint8_t *>np.PyArray_DATA(vocab_codes[c.indexes[i]])
+            c.points[i] = <np.uint32_t *>np.PyArray_DATA(vocab_points[c.indexes[i]])
+
+    # precompute "reduced window" offsets in a single randint() call
+    for i, item in enumerate(model.random.randint(0, c.window, effective_words)):
+        c.reduced_windows[i] = item
+    return effective_sentences
+
+
 def train_batch_sg(model, sentences, alpha, _work, compute_loss):
     """Update skip-gram model by training on a batch of sentences.
 
@@ -524,9 +883,8 @@ def train_batch_sg(model, sentences, alpha, _work, compute_loss):
 
     """
     cdef Word2VecConfig c
-    cdef int i, j, k
+    cdef int i
     cdef int effective_words = 0, effective_sentences = 0
-    cdef int sent_idx, idx_start, idx_end
     cdef np.uint32_t *vocab_sample_ints
 
     init_w2v_config(&c, model, alpha, compute_loss, _work)
@@ -571,23 +929,7 @@ def train_batch_sg(model, sentences, alpha, _work, compute_loss):
 
     # release GIL & train on all sentences
     with nogil:
-        for sent_idx in range(effective_sentences):
-            idx_start = c.sentence_idx[sent_idx]
-            idx_end = c.sentence_idx[sent_idx + 1]
-            for i in range(idx_start, idx_end):
-                j = i - c.window + c.reduced_windows[i]
-                if j < idx_start:
-                    j = idx_start
-                k = i + c.window + 1 - c.reduced_windows[i]
-                if k > idx_end:
-                    k = idx_end
-                for j in range(j, k):
-                    if j == i:
-                        continue
-                    if c.hs:
-                        w2v_fast_sentence_sg_hs(c.points[i], c.codes[i], c.codelens[i], c.syn0, c.syn1, c.size, c.indexes[j], c.alpha, c.work, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
-                    if c.negative:
-                        c.next_random = w2v_fast_sentence_sg_neg(c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size, c.indexes[i], c.indexes[j], c.alpha, c.work, c.next_random, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
+        sg_train_sentences(&c, effective_sentences)
 
     model.running_training_loss = c.running_training_loss
     return effective_words
@@ -620,9 +962,8 @@ def train_batch_cbow(model, sentences, alpha, _work, _neu1, compute_loss):
         and were not discarded by negative sampling).
     """
     cdef Word2VecConfig c
-    cdef int i, j, k
+    cdef int i
     cdef int effective_words = 0, effective_sentences = 0
-    cdef int sent_idx, idx_start, idx_end
     cdef np.uint32_t *vocab_sample_ints
 
     init_w2v_config(&c, model, alpha, compute_loss, _work, _neu1)
@@ -667,25 +1008,102 @@ def train_batch_cbow(model, sentences, alpha, _work, _neu1, compute_loss):
 
     # release GIL & train on all sentences
     with nogil:
-        for sent_idx in range(effective_sentences):
-            idx_start = c.sentence_idx[sent_idx]
-            idx_end = c.sentence_idx[sent_idx + 1]
-            for i in range(idx_start, idx_end):
-                j = i - c.window + c.reduced_windows[i]
-                if j < idx_start:
-                    j = idx_start
-                k = i + c.window + 1 - c.reduced_windows[i]
-                if k > idx_end:
-                    k = idx_end
-                if c.hs:
-                    w2v_fast_sentence_cbow_hs(c.points[i], c.codes[i], c.codelens, c.neu1, c.syn0, c.syn1, c.size, c.indexes, c.alpha, c.work, i, j, k, c.cbow_mean, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
-                if c.negative:
-                    c.next_random = w2v_fast_sentence_cbow_neg(c.negative, c.cum_table, c.cum_table_len, c.codelens, c.neu1, c.syn0, c.syn1neg, c.size, c.indexes, c.alpha, c.work, i, j, k, c.cbow_mean, c.next_random, c.words_lockf, c.words_lockf_len, c.compute_loss, &c.running_training_loss)
+        cbow_train_sentences(&c, effective_sentences)
 
     model.running_training_loss = c.running_training_loss
     return effective_words
 
 
+def train_batch_indexed_sg(model, indexes, offsets, alpha, _work, compute_loss):
+    """Update skip-gram model by training on a batch of sentences already converted to vocabulary indexes.
+
+    Unlike :func:`train_batch_sg`, no vocabulary lookups are needed, so the GIL is held only briefly
+    (for the whole batch, unless hierarchical softmax is used).
+
+    Parameters
+    ----------
+    model : :class:`~gensim.models.word2Vec.Word2Vec`
+        The Word2Vec model instance to train.
+    indexes : np.ndarray of np.uint32
+        Vocabulary indexes of the in-vocabulary words of the sentences, concatenated.
+    offsets : np.ndarray of np.int64
+        Sentence boundaries: sentence number X spans `indexes[offsets[X]:offsets[X + 1]]`.
+    alpha : float
+        The learning rate
+    _work : np.ndarray
+        Private working memory for each worker.
+    compute_loss : bool
+        Whether or not the training loss should be computed in this batch.
+
+    Returns
+    -------
+    int
+        Number of words in the vocabulary actually used for training (They were not discarded by
+        frequent-word downsampling).
+
+    """
+    cdef Word2VecConfig c
+    cdef int effective_sentences
+
+    indexes = np.ascontiguousarray(indexes, dtype=np.uint32)
+    offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+    init_w2v_config(&c, model, alpha, compute_loss, _work)
+    effective_sentences = init_indexed_batch(&c, model, indexes, offsets)
+
+    # release GIL & train on all sentences
+    with nogil:
+        sg_train_sentences(&c, effective_sentences)
+
+    model.running_training_loss = c.running_training_loss
+    return c.sentence_idx[effective_sentences]
+
+
+def train_batch_indexed_cbow(model, indexes, offsets, alpha, _work, _neu1, compute_loss):
+    """Update CBOW model by training on a batch of sentences already converted to vocabulary indexes.
+
+    Unlike :func:`train_batch_cbow`, no vocabulary lookups are needed, so the GIL is held only briefly
+    (for the whole batch, unless hierarchical softmax is used).
+
+    Parameters
+    ----------
+    model : :class:`~gensim.models.word2vec.Word2Vec`
+        The Word2Vec model instance to train.
+    indexes : np.ndarray of np.uint32
+        Vocabulary indexes of the in-vocabulary words of the sentences, concatenated.
+    offsets : np.ndarray of np.int64
+        Sentence boundaries: sentence number X spans `indexes[offsets[X]:offsets[X + 1]]`.
+    alpha : float
+        The learning rate.
+    _work : np.ndarray
+        Private working memory for each worker.
+    _neu1 : np.ndarray
+        Private working memory for each worker.
+    compute_loss : bool
+        Whether or not the training loss should be computed in this batch.
+
+    Returns
+    -------
+    int
+        Number of words in the vocabulary actually used for training (They were not discarded by
+        frequent-word downsampling).
+
+    """
+    cdef Word2VecConfig c
+    cdef int effective_sentences
+
+    indexes = np.ascontiguousarray(indexes, dtype=np.uint32)
+    offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+    init_w2v_config(&c, model, alpha, compute_loss, _work, _neu1)
+    effective_sentences = init_indexed_batch(&c, model, indexes, offsets)
+
+    # release GIL & train on all sentences
+    with nogil:
+        cbow_train_sentences(&c, effective_sentences)
+
+    model.running_training_loss = c.running_training_loss
+    return c.sentence_idx[effective_sentences]
+
+
 def score_sentence_sg(model, sentence, _work):
     """Obtain likelihood score for a single sentence in a fitted skip-gram representation.
 
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Worker process used in distributed training of :class:`~gensim.models.word2vec.Word2Vec`,
+see :mod:`gensim.models.word2vec_distributed`.
+
+Run this script on every node in your cluster. Each worker trains on one shard of the corpus, using as many
+threads as the `workers` parameter of the model, so a single worker per machine is usually enough.
+
+
+How to use distributed :class:`~gensim.models.word2vec.Word2Vec`
+---------------------------------------------------------------
+
+#. Install needed dependencies (Pyro4) ::
+
+    pip install gensim[distributed]
+
+#. Setup serialization (on each machine) ::
+
+    export PYRO_SERIALIZERS_ACCEPTED=pickle
+    export PYRO_SERIALIZER=pickle
+
+#. Run nameserver ::
+
+    python -m Pyro4.naming -n 0.0.0.0 &
+
+#. Run workers (on each machine) ::
+
+    python -m gensim.models.word2vec_worker &
+
+#. Train the model with :func:`~gensim.models.word2vec_distributed.train_distributed`, passing
+   :func:`~gensim.models.word2vec_distributed.pyro_nodes` as its `nodes`.
+
+
+Command line arguments
+----------------------
+
+.. program-output:: python -m gensim.models.word2vec_worker --help
+   :ellipsis: 0, -7
+
+"""
+
+import os
+import sys
+import logging
+import threading
+import argparse
+
+import Pyro4
+from gensim import utils
+from gensim.models.word2vec_distributed import Word2VecNode, WORD2VEC_WORKER_PREFIX
+
+logger = logging.getLogger('gensim.models.word2vec_worker')
+
+
+class Worker(Word2VecNode):
+    """Used as a Pyro4 class with exposed methods.
+
+    Exposes the methods of :class:`~gensim.models.word2vec_distributed.Word2VecNode` for remote access.
+
+    """
+    def __init__(self):
+        super().__init__()
+        self.lock_update = threading.Lock()
+
+    @Pyro4.expose
+    @utils.synchronous('lock_update')
+    def initialize(self, model, shard, epochs, shard_no=0):
+        logger.info("initializing worker for shard #%i", shard_no)
+        return super().initialize(model, shard, epochs, shard_no)
+
+    @Pyro4.expose
+    @utils.synchronous('lock_update')
+    def train_round(self, sync_words):
+        return super().train_round(sync_words)
+
+    @Pyro4.expose
+    @utils.synchronous('lock_update')
+    def apply_update(self, update):
+        return super().apply_update(update)
+
+    @Pyro4.expose
+    def ping(self):
+        return super().ping()
+
+    @Pyro4.oneway
+    def exit(self):
+        """Terminate the worker."""
+        logger.info("terminating worker")
+        os._exit(0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__[:-130], formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--host", help="Nameserver hostname (default: %(default)s)", default=None)
+    parser.add_argument("--port", help="Nameserver port (default: %(default)s)", default=None, type=int)
+    parser.add_argument(
+        "--no-broadcast", help="Disable broadcast (default: %(default)s)", action='store_const',
+        default=True, const=False
+    )
+    parser.add_argument("--hmac", help="Nameserver hmac key (default: %(default)s)", default=None)
+    parser.add_argument(
+        '-v', '--verbose', help='Verbose flag', action='store_const', dest="loglevel",
+        const=logging.INFO, default=logging.WARNING
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=args.loglevel)
+    logger.info("running %s", " ".join(sys.argv))
+
+    ns_conf = {
+        "broadcast": args.no_broadcast,
+        "host": args.host,
+        "port": args.port,
+        "hmac_key": args.hmac
+    }
+    utils.pyro_daemon(WORD2VEC_WORKER_PREFIX, Worker(), random_suffix=True, ns_conf=ns_conf)
+    logger.info("finished running %s", " ".join(sys.argv))
+
+
+if __name__ == '__main__':
+    main()
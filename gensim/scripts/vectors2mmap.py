@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+
+"""This script converts word vectors from the word2vec text or binary format, or from the fastText `.bin` format,
+into the memory-mappable format of :meth:`~gensim.models.keyedvectors.KeyedVectors.save_mmap_format`.
+
+Vectors in this format are loaded by :meth:`~gensim.models.keyedvectors.KeyedVectors.load_mmap_format`
+without any parsing, in a fraction of a second, and the memory they take is shared by all processes that
+load the same file.
+
+Notes
+-----
+Only the vectors of the in-vocabulary words of a fastText model are converted: the character n-gram buckets
+used for out-of-vocabulary words are dropped.
+
+How to use
+----------
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import datapath, get_tmpfile
+    >>> from gensim.models import KeyedVectors
+    >>> from gensim.scripts.vectors2mmap import vectors2mmap
+    >>>
+    >>> output_file = get_tmpfile("euclidean_vectors.mmap")
+    >>> _ = vectors2mmap(datapath('euclidean_vectors.bin'), output_file, input_format='word2vec-binary')
+    >>>
+    >>> model = KeyedVectors.load_mmap_format(output_file)
+
+Command line arguments
+----------------------
+
+.. program-output:: python -m gensim.scripts.vectors2mmap --help
+   :ellipsis: 0, -5
+
+"""
+
+import sys
+import logging
+import argparse
+
+import numpy as np
+
+from gensim.models.keyedvectors import KeyedVectors
+from gensim.models.fasttext import load_facebook_vectors
+
+logger = logging.getLogger(__name__)
+
+INPUT_FORMATS = ('word2vec-text', 'word2vec-binary', 'fasttext')
+
+
+def vectors2mmap(input_file, output_file, input_format='word2vec-text', limit=None, datatype=np.float32):
+    """Convert `input_file` to the memory-mappable vectors format and write it to `output_file`.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to the input vectors.
+    output_file : str
+        Path to the output file.
+    input_format : {'word2vec-text', 'word2vec-binary', 'fasttext'}, optional
+        Format of `input_file`: the text or binary format of the original C word2vec tool, or Facebook's
+        native fastText `.bin` format.
+    limit : int, optional
+        Convert only this many vectors from the start of a word2vec-format file. The default, None, means all.
+    datatype : type, optional
+        Float type of the stored vectors.
+
+    Returns
+    -------
+    (int, int)
+        Number of converted vectors and their dimensionality.
+
+    """
+    if input_format == 'fasttext':
+        kv = load_facebook_vectors(input_file)
+    elif input_format in INPUT_FORMATS:
+        kv = KeyedVectors.load_word2vec_format(
+            input_file, binary=input_format == 'word2vec-binary', limit=limit, datatype=datatype,
+        )
+    else:
+        raise ValueError(f"unknown input format {input_format!r}, expected one of {INPUT_FORMATS}")
+
+    logger.info("converting %i vectors from %s to %s", len(kv), input_file, output_file)
+    kv.save_mmap_format(output_file, datatype=datatype)
+    return len(kv), kv.vector_size
+
+
+if __name__ == "__main__":
+    logging.basicConfig(format='%(asctime)s - %(module)s - %(levelname)s - %(message)s', level=logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__[:-133], formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-i", "--input", required=True, help="Path to input vectors")
+    parser.add_argument("-o", "--output", required=True, help="Path to output file")
+    parser.add_argument(
+        "-f", "--format", choices=INPUT_FORMATS, default='word2vec-text', help="Format of the input vectors",
+    )
+    parser.add_argument("-l", "--limit", type=int, help="Convert only this many vectors (word2vec formats only)")
+    parser.add_argument(
+        "-t", "--float16", action="store_true", help="Store the vectors as float16, to halve the file size",
+    )
+    args = parser.parse_args()
+
+    logger.info("running %s", ' '.join(sys.argv))
+    num_vectors, vector_size = vectors2mmap(
+        args.input, args.output, input_format=args.format, limit=args.limit,
+        datatype=np.float16 if args.float16 else np.float32,
+    )
+    logger.info('Converted %i vectors of %i dimensions', num_vectors, vector_size)
@@ -75,6 +75,7 @@ import heapq
 
 import numpy
 import scipy.sparse
+from scipy.spatial.distance import cdist
 
 from gensim import interfaces, utils, matutils
 
@@ -231,6 +232,33 @@ def query_shard(args):
     return result
 
 
+_wmd_worker_kv = None  # KeyedVectors of the current WmdSimilarity worker process
+
+
+def _wmd_worker_init(kv):
+    """Initialize a :class:`~gensim.similarities.docsim.WmdSimilarity` worker process with the word vectors to use."""
+    global _wmd_worker_kv
+    _wmd_worker_kv = kv
+
+
+def _wmd_worker_distance(args):
+    """Helper for computing the exact WMD of one (document, query) pair in a worker process.
+
+    Parameters
+    ----------
+    args : (list of str, list of str)
+        Document and query.
+
+    Returns
+    -------
+    float
+        Word Mover's distance between the document and the query.
+
+    """
+    document, query = args
+    return _wmd_worker_kv.wmdistance(document, query)
+
+
 def _nlargest(n, iterable):
     """Helper for extracting n documents with maximum similarity.
 
@@ -1019,8 +1047,17 @@ class WmdSimilarity(interfaces.SimilarityABC):
         >>> query = ['trees']
         >>> sims = index[query]
 
+    Notes
+    -----
+    When `num_best` is set, most documents never reach the (slow) exact WMD solver. Documents are visited
+    in the order of their word centroid distance (WCD) to the query, which is a cheap lower bound of WMD,
+    and the search stops as soon as this bound exceeds the `num_best`-th best distance found so far.
+    Documents that pass the WCD test are further filtered by the tighter relaxed WMD (RWMD) bound.
+    The similarities of pruned documents are computed from their lower bound, so only the `num_best`
+    returned results are exact. See section 4 of Kusner et al. for details.
+
     """
-    def __init__(self, corpus, kv_model, num_best=None, chunksize=256):
+    def __init__(self, corpus, kv_model, num_best=None, chunksize=256, workers=1):
         """
 
         Parameters
@@ -1032,13 +1069,17 @@ class WmdSimilarity(interfaces.SimilarityABC):
         num_best: int, optional
             Number of results to retrieve.
         chunksize : int, optional
-            Size of chunk.
+            Number of candidate documents whose lower bounds are checked, and whose exact WMD is computed,
+            in one batch.
+        workers : int, optional
+            Number of processes used to compute the exact WMD. Use 1 to compute it in the current process.
 
         """
         self.corpus = corpus
         self.wv = kv_model
         self.num_best = num_best
         self.chunksize = chunksize
+        self.workers = workers
 
         # Normalization of features is not possible, as corpus is a list (of lists) of strings.
         self.normalize = False
@@ -1046,10 +1087,100 @@ class WmdSimilarity(interfaces.SimilarityABC):
         # index is simply an array from 0 to size of corpus.
         self.index = numpy.arange(len(corpus))
 
+        # Word centroid of each document, for the WCD lower bound; NaN for documents with no in-vocabulary words.
+        self.centroids = numpy.full((len(corpus), self.wv.vector_size), numpy.nan, dtype=numpy.float64)
+        for docno, document in enumerate(corpus):
+            vectors, weights = self._nbow(document)
+            if len(weights):
+                self.centroids[docno] = weights @ vectors
+
     def __len__(self):
         """Get size of corpus."""
         return len(self.corpus)
 
+    def _nbow(self, document):
+        """Get the unit-normed vectors and normalized frequencies of the in-vocabulary words of `document`.
+
+        Parameters
+        ----------
+        document : list of str
+            Input document.
+
+        Returns
+        -------
+        (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+            2D array of the vectors of unique words, and 1D array of their normalized word frequencies.
+
+        """
+        counts = {}
+        for token in document:
+            if token in self.wv:
+                counts[token] = counts.get(token, 0) + 1
+        if not counts:
+            return numpy.zeros((0, self.wv.vector_size)), numpy.zeros(0)
+        vectors = numpy.vstack([self.wv.get_vector(token, norm=True) for token in counts]).astype(numpy.float64)
+        weights = numpy.fromiter(counts.values(), dtype=numpy.float64, count=len(counts))
+        return vectors, weights / weights.sum()
+
+    def _relaxed_distance(self, query_vectors, query_weights, document):
+        """Get the relaxed WMD (RWMD) lower bound of the WMD between a query and `document`."""
+        vectors, weights = self._nbow(document)
+        if not len(weights):
+            return numpy.inf
+        distances = cdist(query_vectors, vectors)
+        return max(query_weights @ distances.min(axis=1), weights @ distances.min(axis=0))
+
+    def _exact_distances(self, docnos, query, pool):
+        """Compute the exact WMD between `query` and each document in `docnos`, in `pool` if given."""
+        args = [(self.corpus[docno], query) for docno in docnos]
+        if pool is None:
+            return numpy.array([self.wv.wmdistance(document, query) for document, query in args])
+        return numpy.array(pool.map(_wmd_worker_distance, args, chunksize=1 + len(args) // (4 * self.workers)))
+
+    def _pruned_distances(self, query, pool):
+        """Compute the WMD between `query` and all documents, exactly for the `num_best` nearest documents
+        and as a lower bound for all others."""
+        distances = numpy.full(len(self.corpus), numpy.inf)
+        query_vectors, query_weights = self._nbow(query)
+        if not len(query_weights):
+            return distances  # no query words in the vocabulary => infinite distance to all documents
+
+        # Visit documents in the order of increasing WCD lower bound; empty documents are never visited.
+        lower_bounds = numpy.linalg.norm(self.centroids - query_weights @ query_vectors, axis=1)
+        order = numpy.argsort(lower_bounds)
+        order = order[:numpy.count_nonzero(~numpy.isnan(lower_bounds))]
+
+        num_best = min(self.num_best, len(order))
+        distances[order[:num_best]] = self._exact_distances(order[:num_best], query, pool)
+        # The WMD solver may round differently from the bounds: don't prune documents that merely tie.
+        threshold = numpy.max(distances[order[:num_best]], initial=-numpy.inf) * (1 + 1e-9)
+        exact = list(order[:num_best])
+        num_exact = num_best
+
+        for start in range(num_best, len(order), self.chunksize):
+            chunk = order[start:start + self.chunksize]
+            distances[chunk] = lower_bounds[chunk]
+            candidates = chunk[lower_bounds[chunk] < threshold]
+            if not len(candidates):
+                distances[order[start + self.chunksize:]] = lower_bounds[order[start + self.chunksize:]]
+                break  # documents are sorted by WCD => no document from here on can make it to the top
+            relaxed = numpy.array([
+                self._relaxed_distance(query_vectors, query_weights, self.corpus[docno]) for docno in candidates
+            ])
+            distances[candidates] = relaxed
+            candidates = candidates[relaxed < threshold]
+            if not len(candidates):
+                continue
+            distances[candidates] = self._exact_distances(candidates, query, pool)
+            num_exact += len(candidates)
+            exact.extend(candidates)
+            exact.sort(key=lambda docno: distances[docno])
+            del exact[num_best:]
+            threshold = distances[exact[-1]] * (1 + 1e-9)
+
+        logger.debug("computed exact WMD for %i out of %i documents", num_exact, len(self.corpus))
+        return distances
+
     def get_similarities(self, query):
         """Get similarity between `query` and this index.
 
@@ -1075,16 +1206,26 @@ class WmdSimilarity(interfaces.SimilarityABC):
         if not query or not isinstance(query[0], list):
             query = [query]
 
-        n_queries = len(query)
-        result = []
-        for qidx in range(n_queries):
-            # Compute similarity for each query.
-            qresult = [self.wv.wmdistance(document, query[qidx]) for document in self.corpus]
-            qresult = numpy.array(qresult)
-            qresult = 1. / (1. + qresult)  # Similarity is the negative of the distance.
+        pool = None
+        if self.workers > 1:
+            logger.debug("spawning %i WMD processes", self.workers)
+            pool = multiprocessing.Pool(self.workers, initializer=_wmd_worker_init, initargs=(self.wv,))
 
-            # Append single query result to list of all results.
-            result.append(qresult)
+        try:
+            result = []
+            for qidx in range(len(query)):
+                # Compute similarity for each query.
+                if self.num_best is None:
+                    qresult = self._exact_distances(self.index, query[qidx], pool)
+                else:
+                    qresult = self._pruned_distances(query[qidx], pool)
+                qresult = 1. / (1. + qresult)  # Similarity is the negative of the distance.
+
+                # Append single query result to list of all results.
+                result.append(qresult)
+        finally:
+            if pool is not None:
+                pool.terminate()
 
         if len(result) == 1:
             # Only one query.
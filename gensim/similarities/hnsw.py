@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+This module implements a native Hierarchical Navigable Small World (HNSW) graph index for approximate nearest
+neighbour search over Gensim's :class:`~gensim.models.word2vec.Word2Vec`, :class:`~gensim.models.doc2vec.Doc2Vec`,
+:class:`~gensim.models.fasttext.FastText` and :class:`~gensim.models.keyedvectors.KeyedVectors` vectors.
+
+Unlike :class:`~gensim.similarities.nmslib.NmslibIndexer`, it doesn't need any external library: the graph
+is built and searched by compiled Cython routines, which release the GIL so the graph can be built by
+several threads at once. The graph is stored in flat `int32` arrays, so a saved index can be memory-mapped
+back by :meth:`~gensim.similarities.hnsw.HnswIndexer.load`.
+
+To use it, instantiate a :class:`~gensim.similarities.hnsw.HnswIndexer` and pass it as the `indexer` parameter
+to your model's `most_similar()` method.
+
+Example usage
+-------------
+
+.. sourcecode:: pycon
+
+    >>> from gensim.similarities.hnsw import HnswIndexer
+    >>> from gensim.models import Word2Vec
+    >>> from gensim.test.utils import common_texts, get_tmpfile
+    >>>
+    >>> model = Word2Vec(common_texts, min_count=1)
+    >>> indexer = HnswIndexer(model, workers=2)
+    >>> result = model.wv.most_similar("human", topn=2, indexer=indexer)
+    >>>
+    >>> # keep the index up to date as new vectors are added
+    >>> model.wv.add_vectors(['robot'], [model.wv['computer']])
+    >>> indexer.update(model)
+    >>>
+    >>> fname = get_tmpfile('hnsw.index')
+    >>> indexer.save(fname)
+    >>> indexer = HnswIndexer.load(fname, mmap='r')
+
+For more details, see `Yu. A. Malkov, D. A. Yashunin "Efficient and robust approximate nearest neighbor search
+using Hierarchical Navigable Small World graphs" <https://arxiv.org/abs/1603.09320>`_.
+
+"""
+
+import logging
+import threading
+
+import numpy as np
+
+from gensim import utils, matutils
+from gensim.models.doc2vec import Doc2Vec
+from gensim.models.word2vec import Word2Vec
+from gensim.models.fasttext import FastText
+from gensim.models import KeyedVectors
+
+try:
+    from gensim.similarities.hnsw_inner import NodeLocks, insert_nodes, search_knn
+except ImportError:
+    raise utils.NO_CYTHON
+
+logger = logging.getLogger(__name__)
+
+REAL = np.float32
+
+
+def _keyed_vectors(model):
+    """Extract the KeyedVectors object from whatever model we were given."""
+    if isinstance(model, Doc2Vec):
+        return model.dv
+    elif isinstance(model, (Word2Vec, FastText)):
+        return model.wv
+    elif isinstance(model, (KeyedVectors,)):
+        return model
+    raise ValueError("Only a Word2Vec, Doc2Vec, FastText or KeyedVectors instance can be used")
+
+
+class HnswIndexer(utils.SaveLoad):
+    """Approximate nearest neighbour index using a Hierarchical Navigable Small World graph,
+    for the `most_similar()` method of :class:`~gensim.models.word2vec.Word2Vec`,
+    :class:`~gensim.models.doc2vec.Doc2Vec`, :class:`~gensim.models.fasttext.FastText` and
+    :class:`~gensim.models.keyedvectors.KeyedVectors`.
+
+    """
+
+    def __init__(self, model=None, max_links=16, ef_construction=200, ef_search=50, workers=3, seed=0):
+        """
+        Parameters
+        ----------
+        model : trained model, optional
+            Use vectors from this model as the source for the index.
+        max_links : int, optional
+            Maximum number of links of each node in the upper layers of the graph; nodes in the bottom layer
+            have up to `2 * max_links` links. Higher values give better recall, for more memory and build time.
+        ef_construction : int, optional
+            Size of the candidate list used to find the neighbours of each inserted vector.
+            Higher values give a better graph, for more build time.
+        ef_search : int, optional
+            Size of the candidate list used in queries. Higher values give better recall, for slower queries.
+        workers : int, optional
+            Number of threads used to build the graph.
+        seed : int, optional
+            Seed for the random number generator used to draw the layer of each node.
+
+        """
+        self.max_links = max_links
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.workers = workers
+        self.seed = seed
+        self.random = np.random.default_rng(seed)
+
+        self.labels = []
+        self.vectors = None  # (num_nodes, vector_size) unit-normed copy of the indexed vectors
+        self.levels = np.zeros(0, dtype=np.int32)  # top layer of each node
+        self.links0 = np.zeros((0, 2 * max_links), dtype=np.int32)  # bottom layer links, padded by -1
+        self.links_upper = np.zeros(0, dtype=np.int32)  # upper layer links: `max_links` per layer of each node
+        self.upper_offsets = np.zeros(0, dtype=np.int64)  # start of each node's links in `links_upper`
+        self.entry = np.array([-1, -1], dtype=np.int32)  # graph entry point node and its level
+
+        if model is not None:
+            self.update(model)
+
+    def update(self, model):
+        """Index all vectors of `model` that are not indexed yet.
+
+        Use this to keep the index in sync with a model whose vocabulary grows by
+        :meth:`~gensim.models.keyedvectors.KeyedVectors.add_vectors`.
+
+        Parameters
+        ----------
+        model : trained model
+            Model whose vectors to index. Must be the same model, or a grown copy of the model, that the index
+            was built from: vectors are matched up by their position.
+
+        """
+        kv = _keyed_vectors(model)
+        start = len(self.labels)
+        if start < len(kv):
+            self.add_vectors(kv.index_to_key[start:], kv.vectors[start:])
+
+    def add_vectors(self, keys, weights):
+        """Insert new vectors into the index.
+
+        Parameters
+        ----------
+        keys : list of (str or int)
+            Labels returned by :meth:`~gensim.similarities.hnsw.HnswIndexer.most_similar` for the new vectors.
+        weights : numpy.ndarray
+            2D array of the new vectors, one per key.
+
+        """
+        weights = np.asarray(weights, dtype=REAL).reshape(len(keys), -1)
+        if not len(keys):
+            return
+        if self.vectors is not None and weights.shape[1] != self.vectors.shape[1]:
+            raise ValueError(f"incompatible vector size {weights.shape[1]}, expected {self.vectors.shape[1]}")
+        norms = np.linalg.norm(weights, axis=1)
+        norms[norms == 0.0] = 1.0
+        weights = weights / norms[:, np.newaxis]
+
+        # draw the top layer of each new node from the exponentially decaying distribution of the HNSW paper
+        start = len(self.labels)
+        levels = np.floor(-np.log(1.0 - self.random.random(len(keys))) / np.log(self.max_links)).astype(np.int32)
+        upper_offsets = len(self.links_upper) + np.concatenate([[0], np.cumsum(levels[:-1])]) * self.max_links
+
+        self.vectors = weights if self.vectors is None else np.vstack([self.vectors, weights])
+        self.levels = np.concatenate([self.levels, levels])
+        self.upper_offsets = np.concatenate([self.upper_offsets, upper_offsets.astype(np.int64)])
+        self.links0 = np.vstack([self.links0, np.full((len(keys), self.links0.shape[1]), -1, dtype=np.int32)])
+        self.links_upper = np.concatenate([
+            self.links_upper, np.full(int(levels.sum()) * self.max_links, -1, dtype=np.int32),
+        ])
+        self.entry = np.array(self.entry, dtype=np.int32)  # ensure a writable copy, if memory-mapped
+        self.labels = list(self.labels) + list(keys)
+
+        logger.info("inserting %i vectors into HNSW graph using %i threads", len(keys), self.workers)
+        nodes = np.arange(start, start + len(keys), dtype=np.int32)
+        node_locks = NodeLocks()
+        workers = max(1, min(self.workers, len(nodes)))
+        threads = [
+            threading.Thread(
+                target=insert_nodes, args=(self, nodes[i::workers], node_locks, self.ef_construction),
+            )
+            for i in range(workers)
+        ]
+        for thread in threads:
+            thread.daemon = True  # make interrupting the process with ctrl+c easier
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def __len__(self):
+        return len(self.labels)
+
+    def most_similar(self, vector, num_neighbors):
+        """Find the approximate `num_neighbors` most similar items.
+
+        Parameters
+        ----------
+        vector : numpy.array
+            Vector for a word or document.
+        num_neighbors : int
+            How many most similar items to look for?
+
+        Returns
+        -------
+        list of (str, float)
+            List of most similar items in the format `[(item, cosine_similarity), ... ]`.
+            Empty if nothing has been indexed yet.
+
+        """
+        if self.vectors is None:
+            return []
+        vector = matutils.unitvec(np.asarray(vector, dtype=REAL)).astype(REAL)
+        ids, sims = search_knn(self, vector, num_neighbors, self.ef_search)
+        return [(self.labels[id_], float(sim)) for id_, sim in zip(ids, sims)]
@@ -0,0 +1,498 @@
+#!/usr/bin/env cython
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+# cython: embedsignature=True
+# coding: utf-8
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Optimized cython functions for building and querying the HNSW graph of
+:class:`~gensim.similarities.hnsw.HnswIndexer`."""
+
+import cython
+import numpy as np
+cimport numpy as np
+
+from cpython.pythread cimport (
+    PyThread_type_lock, PyThread_allocate_lock, PyThread_free_lock,
+    PyThread_acquire_lock, PyThread_release_lock, WAIT_LOCK,
+)
+from libc.stdlib cimport malloc, calloc, realloc, free, qsort
+from libc.string cimport memcpy, memset
+
+from scipy.linalg.cython_blas cimport sdot
+
+ctypedef np.float32_t REAL_t
+
+cdef int ONE = 1
+
+
+cdef struct HeapItem:
+    REAL_t dist
+    np.int32_t node
+
+
+cdef struct Heap:
+    HeapItem *items
+    int size
+    int capacity
+    bint is_max  # max-heap (largest distance on top) if True, else min-heap
+
+
+cdef struct HnswGraph:
+    REAL_t *vectors
+    int vector_size
+    np.int32_t *levels
+    np.int32_t *links0  # (num_nodes, max_links0) links at layer 0, padded by -1
+    np.int32_t *links_upper  # links at layers > 0: `max_links` per layer of each node, padded by -1
+    np.int64_t *upper_offsets  # start of each node's links in `links_upper`
+    np.int32_t *entry  # [entry point node, its level]; -1 if the graph is still empty
+    int max_links
+    int max_links0
+    int num_nodes
+
+
+cdef struct Scratch:
+    # per-thread working memory for graph searches
+    np.uint32_t *visited  # node was visited in the current search iff `visited[node] == visit_tag`
+    np.uint32_t visit_tag
+    Heap candidates
+    Heap results
+    HeapItem *selected
+    np.int32_t *links
+
+
+cdef inline bint _above(Heap *h, REAL_t a, REAL_t b) nogil:
+    return a > b if h.is_max else a < b
+
+
+cdef int heap_init(Heap *h, int capacity, bint is_max) nogil:
+    h.items = <HeapItem *>malloc(capacity * cython.sizeof(HeapItem))
+    h.size = 0
+    h.capacity = capacity
+    h.is_max = is_max
+    return 0 if h.items != NULL else -1
+
+
+cdef int heap_push(Heap *h, REAL_t dist, np.int32_t node) nogil:
+    cdef int i, parent
+    cdef HeapItem *grown
+    if h.size == h.capacity:
+        grown = <HeapItem *>realloc(h.items, 2 * h.capacity * cython.sizeof(HeapItem))
+        if grown == NULL:
+            return -1
+        h.items = grown
+        h.capacity *= 2
+    i = h.size
+    h.size += 1
+    while i > 0:
+        parent = (i - 1) // 2
+        if not _above(h, dist, h.items[parent].dist):
+            break
+        h.items[i] = h.items[parent]
+        i = parent
+    h.items[i].dist = dist
+    h.items[i].node = node
+    return 0
+
+
+cdef HeapItem heap_pop(Heap *h) nogil:
+    cdef HeapItem top = h.items[0], last
+    cdef int i = 0, child
+    h.size -= 1
+    last = h.items[h.size]
+    while True:
+        child = 2 * i + 1
+        if child >= h.size:
+            break
+        if child + 1 < h.size and _above(h, h.items[child + 1].dist, h.items[child].dist):
+            child += 1
+        if not _above(h, h.items[child].dist, last.dist):
+            break
+        h.items[i] = h.items[child]
+        i = child
+    if h.size > 0:
+        h.items[i] = last
+    return top
+
+
+cdef int _compare_items(const void *a, const void *b) nogil:
+    cdef REAL_t da = (<HeapItem *>a).dist, db = (<HeapItem *>b).dist
+    return (da > db) - (da < db)
+
+
+cdef inline REAL_t distance(HnswGraph *g, const REAL_t *query, np.int32_t node) nogil:
+    return 1.0 - sdot(&g.vector_size, <REAL_t *>query, &ONE, &g.vectors[<long long>node * g.vector_size], &ONE)
+
+
+cdef inline np.int32_t *node_links(HnswGraph *g, np.int32_t node, int layer, int *max_links) nogil:
+    if layer == 0:
+        max_links[0] = g.max_links0
+        return &g.links0[<long long>node * g.max_links0]
+    max_links[0] = g.max_links
+    return &g.links_upper[g.upper_offsets[node] + <long long>(layer - 1) * g.max_links]
+
+
+cdef inline PyThread_type_lock node_lock(PyThread_type_lock *locks, int num_locks, np.int32_t node) nogil:
+    return locks[node % num_locks]
+
+
+cdef int copy_links(
+        HnswGraph *g, np.int32_t node, int layer, np.int32_t *out,
+        PyThread_type_lock *locks, int num_locks) nogil:
+    """Copy the links of `node` at `layer` into `out`, under the node's lock if `locks` is given."""
+    cdef int max_links, i, count = 0
+    cdef np.int32_t *links = node_links(g, node, layer, &max_links)
+    if locks != NULL:
+        PyThread_acquire_lock(node_lock(locks, num_locks, node), WAIT_LOCK)
+    for i in range(max_links):
+        if links[i] < 0:
+            break
+        out[i] = links[i]
+        count += 1
+    if locks != NULL:
+        PyThread_release_lock(node_lock(locks, num_locks, node))
+    return count
+
+
+cdef int scratch_init(Scratch *s, HnswGraph *g, int ef) nogil:
+    s.candidates.items = NULL
+    s.results.items = NULL
+    s.visited = <np.uint32_t *>calloc(g.num_nodes, cython.sizeof(np.uint32_t))
+    s.visit_tag = 0
+    s.selected = <HeapItem *>malloc((g.max_links0 + 1) * cython.sizeof(HeapItem))
+    s.links = <np.int32_t *>malloc(g.max_links0 * cython.sizeof(np.int32_t))
+    if s.visited == NULL or s.selected == NULL or s.links == NULL:
+        return -1
+    if heap_init(&s.candidates, ef + 1, False) or heap_init(&s.results, ef + 1, True):
+        return -1
+    return 0
+
+
+cdef void scratch_free(Scratch *s) nogil:
+    free(s.visited)
+    free(s.selected)
+    free(s.links)
+    free(s.candidates.items)
+    free(s.results.items)
+
+
+cdef REAL_t greedy_search(
+        HnswGraph *g, const REAL_t *query, np.int32_t *node, REAL_t dist, int layer, Scratch *s,
+        PyThread_type_lock *locks, int num_locks) nogil:
+    """Walk `layer` from `node` to the closest node to `query` reachable by always moving to a closer neighbour."""
+    cdef bint changed = True
+    cdef int i, count
+    cdef REAL_t d
+    cdef np.int32_t neighbour
+    while changed:
+        changed = False
+        count = copy_links(g, node[0], layer, s.links, locks, num_locks)
+        for i in range(count):
+            neighbour = s.links[i]
+            d = distance(g, query, neighbour)
+            if d < dist:
+                dist = d
+                node[0] = neighbour
+                changed = True
+    return dist
+
+
+cdef int search_layer(
+        HnswGraph *g, const REAL_t *query, np.int32_t entry, REAL_t entry_dist, int ef, int layer,
+        Scratch *s, PyThread_type_lock *locks, int num_locks) nogil:
+    """Beam search of `layer` from `entry`, leaving the `ef` nodes closest to `query` in `s.results`."""
+    cdef HeapItem current
+    cdef int i, count
+    cdef REAL_t d
+    cdef np.int32_t neighbour
+
+    s.visit_tag += 1
+    if s.visit_tag == 0:  # tag overflow: forget all previous visits
+        memset(s.visited, 0, g.num_nodes * cython.sizeof(np.uint32_t))
+        s.visit_tag = 1
+    s.candidates.size = 0
+    s.results.size = 0
+
+    s.visited[entry] = s.visit_tag
+    if heap_push(&s.candidates, entry_dist, entry) or heap_push(&s.results, entry_dist, entry):
+        return -1
+    while s.candidates.size:
+        current = heap_pop(&s.candidates)
+        if s.results.size >= ef and current.dist > s.results.items[0].dist:
+            break
+        count = copy_links(g, current.node, layer, s.links, locks, num_locks)
+        for i in range(count):
+            neighbour = s.links[i]
+            if s.visited[neighbour] == s.visit_tag:
+                continue
+            s.visited[neighbour] = s.visit_tag
+            d = distance(g, query, neighbour)
+            if s.results.size < ef or d < s.results.items[0].dist:
+                if heap_push(&s.candidates, d, neighbour) or heap_push(&s.results, d, neighbour):
+                    return -1
+                if s.results.size > ef:
+                    heap_pop(&s.results)
+    return 0
+
+
+cdef int select_neighbours(HnswGraph *g, HeapItem *items, int count, int max_links) nogil:
+    """Keep at most `max_links` diverse neighbours out of the `count` candidates in `items`, in place.
+
+    This is the neighbour selection heuristic of Malkov & Yashunin: candidates are considered from the closest,
+    and a candidate is dropped if it's closer to some already selected neighbour than to the base node.
+
+    """
+    cdef int i, j, selected = 0
+    cdef bint keep
+    cdef REAL_t *candidate_vector
+    qsort(items, count, cython.sizeof(HeapItem), _compare_items)
+    for i in range(count):
+        if selected >= max_links:
+            break
+        keep = True
+        candidate_vector = &g.vectors[<long long>items[i].node * g.vector_size]
+        for j in range(selected):
+            if distance(g, candidate_vector, items[j].node) < items[i].dist:
+                keep = False
+                break
+        if keep:
+            items[selected] = items[i]
+            selected += 1
+    return selected
+
+
+cdef void connect(
+        HnswGraph *g, np.int32_t node, np.int32_t new_neighbour, int layer, Scratch *s,
+        PyThread_type_lock *locks, int num_locks) nogil:
+    """Add a link from `node` to `new_neighbour`, pruning the links of `node` if it has too many."""
+    cdef int max_links, i, count = 0
+    cdef np.int32_t *links = node_links(g, node, layer, &max_links)
+    cdef REAL_t *node_vector = &g.vectors[<long long>node * g.vector_size]
+
+    PyThread_acquire_lock(node_lock(locks, num_locks, node), WAIT_LOCK)
+    while count < max_links and links[count] >= 0:
+        if links[count] == new_neighbour:
+            PyThread_release_lock(node_lock(locks, num_locks, node))
+            return
+        count += 1
+    if count < max_links:
+        links[count] = new_neighbour
+    else:
+        for i in range(max_links):
+            s.selected[i].node = links[i]
+            s.selected[i].dist = distance(g, node_vector, links[i])
+        s.selected[max_links].node = new_neighbour
+        s.selected[max_links].dist = distance(g, node_vector, new_neighbour)
+        count = select_neighbours(g, s.selected, max_links + 1, max_links)
+        for i in range(max_links):
+            links[i] = s.selected[i].node if i < count else -1
+    PyThread_release_lock(node_lock(locks, num_locks, node))
+
+
+cdef int insert_node(
+        HnswGraph *g, np.int32_t node, int ef_construction, Scratch *s,
+        PyThread_type_lock *locks, int num_locks, PyThread_type_lock entry_lock) nogil:
+    cdef int level = g.levels[node], max_level, layer, i, count, max_links
+    cdef np.int32_t entry
+    cdef np.int32_t *links
+    cdef REAL_t entry_dist
+    cdef const REAL_t *query = &g.vectors[<long long>node * g.vector_size]
+    cdef bint holds_entry_lock = False
+
+    PyThread_acquire_lock(entry_lock, WAIT_LOCK)
+    entry, max_level = g.entry[0], g.entry[1]
+    if entry < 0:
+        # the first node becomes the entry point of the graph
+        g.entry[0], g.entry[1] = node, level
+        PyThread_release_lock(entry_lock)
+        return 0
+    if level > max_level:
+        # this node will become the new entry point: keep the entry point locked until it's connected
+        holds_entry_lock = True
+    else:
+        PyThread_release_lock(entry_lock)
+
+    entry_dist = distance(g, query, entry)
+    layer = max_level
+    while layer > level:
+        entry_dist = greedy_search(g, query, &entry, entry_dist, layer, s, locks, num_locks)
+        layer -= 1
+
+    layer = level if level < max_level else max_level
+    while layer >= 0:
+        if search_layer(g, query, entry, entry_dist, ef_construction, layer, s, locks, num_locks):
+            if holds_entry_lock:
+                PyThread_release_lock(entry_lock)
+            return -1
+        # selection never keeps more than `max_links0` neighbours, so only the closest candidates matter
+        while s.results.size > g.max_links0 + 1:
+            heap_pop(&s.results)
+        count = s.results.size
+        memcpy(s.selected, s.results.items, count * cython.sizeof(HeapItem))
+        qsort(s.selected, count, cython.sizeof(HeapItem), _compare_items)
+        entry, entry_dist = s.selected[0].node, s.selected[0].dist  # closest node seeds the next layer
+
+        links = node_links(g, node, layer, &max_links)
+        count = select_neighbours(g, s.selected, count, max_links)
+        PyThread_acquire_lock(node_lock(locks, num_locks, node), WAIT_LOCK)
+        for i in range(max_links):
+            links[i] = s.selected[i].node if i < count else -1
+        PyThread_release_lock(node_lock(locks, num_locks, node))
+        # `connect` reuses `s.selected`, and other threads may already be pruning our links: work from a copy
+        for i in range(count):
+            s.links[i] = s.selected[i].node
+        for i in range(count):
+            connect(g, s.links[i], node, layer, s, locks, num_locks)
+        layer -= 1
+
+    if holds_entry_lock:
+        g.entry[0], g.entry[1] = node, level
+        PyThread_release_lock(entry_lock)
+    return 0
+
+
+cdef init_hnsw_graph(HnswGraph *g, indexer):
+    g.vectors = <REAL_t *>(np.PyArray_DATA(indexer.vectors))
+    g.vector_size = indexer.vectors.shape[1]
+    g.levels = <np.int32_t *>(np.PyArray_DATA(indexer.levels))
+    g.links0 = <np.int32_t *>(np.PyArray_DATA(indexer.links0))
+    g.links_upper = <np.int32_t *>(np.PyArray_DATA(indexer.links_upper))
+    g.upper_offsets = <np.int64_t *>(np.PyArray_DATA(indexer.upper_offsets))
+    g.entry = <np.int32_t *>(np.PyArray_DATA(indexer.entry))
+    g.max_links = indexer.max_links
+    g.max_links0 = indexer.links0.shape[1]
+    g.num_nodes = len(indexer.vectors)
+
+
+cdef class NodeLocks:
+    """Pool of locks guarding the links of graph nodes, shared by all threads building one graph."""
+    cdef PyThread_type_lock *locks
+    cdef int num_locks
+    cdef PyThread_type_lock entry_lock
+
+    def __cinit__(self, int num_locks=65536):
+        cdef int i
+        self.num_locks = num_locks
+        self.locks = <PyThread_type_lock *>calloc(<size_t>num_locks, cython.sizeof(PyThread_type_lock))
+        if self.locks == NULL:
+            raise MemoryError()
+        for i in range(num_locks):
+            self.locks[i] = PyThread_allocate_lock()
+            if self.locks[i] == NULL:
+                raise MemoryError()
+        self.entry_lock = PyThread_allocate_lock()
+        if self.entry_lock == NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        cdef int i
+        if self.locks != NULL:
+            for i in range(self.num_locks):
+                if self.locks[i] != NULL:
+                    PyThread_free_lock(self.locks[i])
+            free(self.locks)
+        if self.entry_lock != NULL:
+            PyThread_free_lock(self.entry_lock)
+
+
+def insert_nodes(indexer, nodes, NodeLocks node_locks, int ef_construction):
+    """Insert the given nodes into the graph of `indexer`, releasing the GIL.
+
+    Safe to call concurrently from several threads, for disjoint `nodes`, as long as all calls share
+    the same `node_locks`. The vectors, levels and (empty) link slots of all nodes must already be allocated.
+
+    Parameters
+    ----------
+    indexer : :class:`~gensim.similarities.hnsw.HnswIndexer`
+        The index whose graph to extend.
+    nodes : numpy.ndarray of numpy.int32
+        Positions of the vectors to insert.
+    node_locks : :class:`~gensim.similarities.hnsw_inner.NodeLocks`
+        Locks shared by all threads inserting into the same graph.
+    ef_construction : int
+        Size of the dynamic candidate list used to find the neighbours of each inserted node.
+
+    """
+    cdef HnswGraph g
+    cdef Scratch s
+    cdef np.int32_t[:] nodes_view = np.ascontiguousarray(nodes, dtype=np.int32)
+    cdef int i, num = len(nodes_view), failed = 0
+
+    init_hnsw_graph(&g, indexer)
+    with nogil:
+        if scratch_init(&s, &g, ef_construction):
+            failed = 1
+        else:
+            for i in range(num):
+                if insert_node(
+                        &g, nodes_view[i], ef_construction, &s,
+                        node_locks.locks, node_locks.num_locks, node_locks.entry_lock):
+                    failed = 1
+                    break
+        scratch_free(&s)
+    if failed:
+        raise MemoryError("failed to allocate memory for HNSW graph construction")
+
+
+def search_knn(indexer, query, int k, int ef):
+    """Find the (approximately) `k` nearest neighbours of `query` in the graph of `indexer`.
+
+    Parameters
+    ----------
+    indexer : :class:`~gensim.similarities.hnsw.HnswIndexer`
+        The index to query.
+    query : numpy.ndarray
+        Unit-normed float32 query vector.
+    k : int
+        Number of neighbours to return.
+    ef : int
+        Size of the dynamic candidate list. Higher values are slower, but more accurate.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        Positions of the nearest neighbours and their cosine similarities to `query`, most similar first.
+
+    """
+    cdef HnswGraph g
+    cdef Scratch s
+    cdef np.float32_t[:] query_view = np.ascontiguousarray(query, dtype=np.float32)
+    cdef np.int32_t entry
+    cdef REAL_t entry_dist
+    cdef int layer, i, count = 0, failed = 0
+
+    init_hnsw_graph(&g, indexer)
+    if g.entry[0] < 0:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    ef = max(ef, k)
+    result_nodes = np.empty(ef, dtype=np.int32)
+    result_sims = np.empty(ef, dtype=np.float32)
+    cdef np.int32_t[:] nodes_view = result_nodes
+    cdef np.float32_t[:] sims_view = result_sims
+
+    with nogil:
+        if scratch_init(&s, &g, ef):
+            failed = 1
+        else:
+            entry = g.entry[0]
+            entry_dist = distance(&g, &query_view[0], entry)
+            layer = g.entry[1]
+            while layer > 0:
+                entry_dist = greedy_search(&g, &query_view[0], &entry, entry_dist, layer, &s, NULL, 0)
+                layer -= 1
+            if search_layer(&g, &query_view[0], entry, entry_dist, ef, 0, &s, NULL, 0):
+                failed = 1
+            else:
+                count = s.results.size
+                qsort(s.results.items, count, cython.sizeof(HeapItem), _compare_items)
+                for i in range(count):
+                    nodes_view[i] = s.results.items[i].node
+                    sims_view[i] = 1.0 - s.results.items[i].dist
+        scratch_free(&s)
+    if failed:
+        raise MemoryError("failed to allocate memory for HNSW search")
+    count = min(count, k)
+    return result_nodes[:count], result_sims[:count]
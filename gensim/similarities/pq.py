@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+This module implements an inverted-file, product-quantization (IVF-PQ) index for approximate nearest neighbour
+search over Gensim's :class:`~gensim.models.word2vec.Word2Vec`, :class:`~gensim.models.doc2vec.Doc2Vec`,
+:class:`~gensim.models.fasttext.FastText` and :class:`~gensim.models.keyedvectors.KeyedVectors` vectors.
+
+Unlike :class:`~gensim.similarities.annoy.AnnoyIndexer` and :class:`~gensim.similarities.nmslib.NmslibIndexer`,
+it has no dependencies beyond NumPy.
+
+To use it, instantiate a :class:`~gensim.similarities.pq.PQIndexer` and pass it as the `indexer` parameter
+to your model's `most_similar()` method.
+
+Example usage
+-------------
+
+.. sourcecode:: pycon
+
+    >>> from gensim.similarities.pq import PQIndexer
+    >>> from gensim.models import KeyedVectors
+    >>> from gensim.test.utils import datapath, get_tmpfile
+    >>>
+    >>> wv = KeyedVectors.load_word2vec_format(datapath('euclidean_vectors.bin'), binary=True)
+    >>> indexer = PQIndexer(wv, num_lists=16, num_subvectors=10, num_probes=4)
+    >>> result = wv.most_similar('war', topn=5, indexer=indexer)
+    >>>
+    >>> fname = get_tmpfile('pq.index')
+    >>> indexer.save(fname)
+    >>> indexer = PQIndexer.load(fname, mmap='r')
+
+How it works
+------------
+
+All vectors are unit-normalized and clustered by k-means into `num_lists` coarse clusters ("inverted lists").
+Each vector is stored only as the id of its cluster, plus its residual from the cluster centroid compressed
+by product quantization: the residual is cut into `num_subvectors` pieces, and each piece is replaced by
+the 1-byte id of its nearest centroid from a per-piece codebook of 256 centroids.
+A 300-dimensional float32 vector (1200 bytes) quantized with `num_subvectors=50` thus takes only 50 bytes.
+
+A query scans only the `num_probes` lists whose centroids are closest to the query vector. Similarities
+to all vectors in these lists are computed by asymmetric distance computation: a small lookup table of
+dot products between the (unquantized) query and all codebook centroids is precomputed once per query,
+after which the similarity of each stored vector is just a sum of `num_subvectors` table lookups.
+
+For more details, see `Hervé Jégou et al. "Product quantization for nearest neighbor search"
+<https://hal.inria.fr/inria-00514462v2/document>`_.
+
+"""
+
+import logging
+
+import numpy as np
+
+from gensim import utils, matutils
+from gensim.models.doc2vec import Doc2Vec
+from gensim.models.word2vec import Word2Vec
+from gensim.models.fasttext import FastText
+from gensim.models import KeyedVectors
+
+logger = logging.getLogger(__name__)
+
+REAL = np.float32
+
+
+class PQIndexer(utils.SaveLoad):
+    """Approximate nearest neighbour index using an inverted file with product-quantized residuals (IVF-PQ),
+    for the `most_similar()` method of :class:`~gensim.models.word2vec.Word2Vec`,
+    :class:`~gensim.models.doc2vec.Doc2Vec`, :class:`~gensim.models.fasttext.FastText` and
+    :class:`~gensim.models.keyedvectors.KeyedVectors`.
+
+    """
+
+    def __init__(
+            self, model=None, num_lists=None, num_subvectors=None, num_probes=8,
+            train_size=100000, iterations=20, seed=0,
+        ):
+        """
+        Parameters
+        ----------
+        model : trained model, optional
+            Use vectors from this model as the source for the index.
+        num_lists : int, optional
+            Number of coarse k-means clusters (inverted lists). Defaults to about `4 * sqrt(number_of_vectors)`.
+        num_subvectors : int, optional
+            Number of pieces each vector residual is cut into, i.e. number of bytes used per stored vector.
+            Must divide the vector dimensionality. Defaults to `vector_size / 4` when possible, for a 16x
+            compression of float32 vectors.
+        num_probes : int, optional
+            Number of inverted lists scanned per query. Higher values are slower but more accurate.
+        train_size : int, optional
+            Number of randomly sampled vectors used for training the k-means quantizers.
+        iterations : int, optional
+            Number of k-means iterations used for training the quantizers.
+        seed : int, optional
+            Seed for the random number generator used while training the quantizers.
+
+        """
+        self.num_lists = num_lists
+        self.num_subvectors = num_subvectors
+        self.num_probes = num_probes
+        self.train_size = train_size
+        self.iterations = iterations
+        self.seed = seed
+
+        self.labels = None
+        self.coarse_centroids = None  # (num_lists, vector_size) centroids of the inverted lists
+        self.codebooks = None  # (num_subvectors, 256, subvector_size) residual codebooks
+        self.codes = None  # (num_vectors, num_subvectors) uint8 residual codes, grouped by inverted list
+        self.ids = None  # (num_vectors, ) position in `labels` of each row of `codes`
+        self.list_offsets = None  # (num_lists + 1, ) start of each inverted list in `codes` and `ids`
+
+        if model is not None:
+            # Extract the KeyedVectors object from whatever model we were given.
+            if isinstance(model, Doc2Vec):
+                kv = model.dv
+            elif isinstance(model, (Word2Vec, FastText)):
+                kv = model.wv
+            elif isinstance(model, (KeyedVectors,)):
+                kv = model
+            else:
+                raise ValueError("Only a Word2Vec, Doc2Vec, FastText or KeyedVectors instance can be used")
+            self._build_from_model(kv.get_normed_vectors(), kv.index_to_key, kv.vector_size)
+
+    def _build_from_model(self, vectors, labels, num_features, chunksize=65536):
+        num_vectors = len(vectors)
+        if not num_vectors:
+            raise ValueError("cannot build an index over no vectors")
+        if self.num_lists is None:
+            self.num_lists = max(1, min(num_vectors, int(4 * np.sqrt(num_vectors))))
+        if self.num_subvectors is None:
+            self.num_subvectors = num_features // 4 if num_features % 4 == 0 else num_features
+        if num_features % self.num_subvectors:
+            raise ValueError(
+                f"num_subvectors={self.num_subvectors} must divide the vector dimensionality {num_features}"
+            )
+        subvector_size = num_features // self.num_subvectors
+
+        rng = np.random.default_rng(self.seed)
+        sample = vectors
+        if num_vectors > self.train_size:
+            sample = vectors[np.sort(rng.choice(num_vectors, self.train_size, replace=False))]
+
+        logger.info("training %i coarse centroids on %i vectors", self.num_lists, len(sample))
+        self.coarse_centroids = matutils.kmeans(sample, self.num_lists, self.iterations, rng)
+        self.num_lists = len(self.coarse_centroids)
+
+        logger.info("training %i residual codebooks of %i dimensions", self.num_subvectors, subvector_size)
+        residuals = sample - self.coarse_centroids[matutils.nearest_centroids(sample, self.coarse_centroids)]
+        codebooks = np.zeros((self.num_subvectors, 256, subvector_size), dtype=REAL)
+        for i in range(self.num_subvectors):
+            piece = np.ascontiguousarray(residuals[:, i * subvector_size:(i + 1) * subvector_size])
+            centroids = matutils.kmeans(piece, 256, self.iterations, rng)
+            codebooks[i, :len(centroids)] = centroids
+        self.codebooks = codebooks
+
+        logger.info("encoding %i vectors into %i inverted lists", num_vectors, self.num_lists)
+        assignments = matutils.nearest_centroids(vectors, self.coarse_centroids)
+        codes = np.empty((num_vectors, self.num_subvectors), dtype=np.uint8)
+        for start in range(0, num_vectors, chunksize):
+            chunk = slice(start, start + chunksize)
+            residuals = vectors[chunk] - self.coarse_centroids[assignments[chunk]]
+            for i in range(self.num_subvectors):
+                piece = residuals[:, i * subvector_size:(i + 1) * subvector_size]
+                codes[chunk, i] = matutils.nearest_centroids(piece, codebooks[i])
+
+        # store vectors grouped by their inverted list, so each list is a contiguous slice
+        self.ids = np.argsort(assignments, kind='stable')
+        self.codes = codes[self.ids]
+        self.list_offsets = np.zeros(self.num_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=self.num_lists), out=self.list_offsets[1:])
+        self.labels = labels
+
+    def most_similar(self, vector, num_neighbors):
+        """Find the approximate `num_neighbors` most similar items.
+
+        Parameters
+        ----------
+        vector : numpy.array
+            Vector for a word or document.
+        num_neighbors : int
+            How many most similar items to look for?
+
+        Returns
+        -------
+        list of (str, float)
+            List of most similar items in the format `[(item, cosine_similarity), ... ]`.
+
+        """
+        vector = np.asarray(vector, dtype=REAL)
+        coarse_sims = np.dot(self.coarse_centroids, vector)
+        num_probes = min(self.num_probes, self.num_lists)
+        probes = np.argpartition(-coarse_sims, num_probes - 1)[:num_probes]
+
+        # asymmetric distance lookup table: dot products of each query piece with each codebook centroid
+        query_pieces = vector.reshape(self.num_subvectors, 1, -1)
+        table = (self.codebooks * query_pieces).sum(axis=2)  # (num_subvectors, 256)
+
+        ids, sims = [], []
+        subvectors = np.arange(self.num_subvectors)
+        for probe in probes:
+            start, end = self.list_offsets[probe], self.list_offsets[probe + 1]
+            if start == end:
+                continue
+            sims.append(coarse_sims[probe] + table[subvectors, self.codes[start:end]].sum(axis=1))
+            ids.append(self.ids[start:end])
+        if not ids:
+            return []
+        ids, sims = np.concatenate(ids), np.concatenate(sims)
+
+        if num_neighbors < len(sims):
+            best = np.argpartition(-sims, num_neighbors - 1)[:num_neighbors]
+        else:
+            best = np.arange(len(sims))
+        best = best[np.argsort(-sims[best])]
+        return [(self.labels[ids[i]], float(sims[i])) for i in best]
@@ -318,6 +318,29 @@ class TestDoc2VecModel(unittest.TestCase):
         # make sure mmaping the arrays back works, too
         self.models_equal(model, doc2vec.Doc2Vec.load(tmpf, mmap='r'))
 
+    def test_dv_mapfile(self):
+        """Are memory-mapped doc-vectors trained and saved like in-RAM ones?"""
+        corpus = list(DocsLeeCorpus())
+        mapfile = get_tmpfile('gensim_doc2vec_dv.mmap')
+        model = doc2vec.Doc2Vec(corpus, dm=0, vector_size=10, min_count=2, epochs=2, workers=1, dv_mapfile=mapfile)
+        self.assertIsInstance(model.dv.vectors, np.memmap)
+        self.assertEqual(os.path.getsize(mapfile), model.dv.vectors.nbytes)
+        self.assertNotIn('doctag_syn0', model.estimate_memory())
+
+        # same initial and trained values as without mapping
+        in_ram = doc2vec.Doc2Vec(corpus, dm=0, vector_size=10, min_count=2, epochs=2, workers=1)
+        np.testing.assert_array_equal(model.dv.vectors, in_ram.dv.vectors)
+        np.testing.assert_array_equal(np.memmap(mapfile, dtype=np.float32, mode='r'), in_ram.dv.vectors.ravel())
+
+        # growing the vectors keeps the prior rows, even while they are mapped from the same file
+        grown = keyedvectors.prep_vectors((len(model.dv) + 5, 10), model.dv.vectors, seed=3, mapfile_path=mapfile)
+        np.testing.assert_array_equal(grown[:len(model.dv)], in_ram.dv.vectors)
+        np.testing.assert_array_equal(grown, keyedvectors.prep_vectors(grown.shape, in_ram.dv.vectors, seed=3))
+
+        tmpf = get_tmpfile('gensim_doc2vec.tst')
+        model.save(tmpf, sep_limit=0)
+        np.testing.assert_array_equal(doc2vec.Doc2Vec.load(tmpf, mmap='r').dv.vectors, model.dv.vectors)
+
     def test_int_doctags(self):
         """Test doc2vec doctag alternatives"""
         corpus = DocsLeeCorpus()
@@ -360,6 +383,33 @@ class TestDoc2VecModel(unittest.TestCase):
         # verify dv.most_similar() returns string doctags rather than indexes
         self.assertEqual(model.dv.index_to_key[0], model.dv.most_similar([model.dv[0]])[0][0])
 
+    def test_scan_vocab_producers(self):
+        """Do worker processes collect the same words and tags as a single pass?"""
+        corpus = list(DocsLeeCorpus(True))
+        corpus = [doc2vec.TaggedDocument(doc.words, doc.tags + [i]) for i, doc in enumerate(corpus[0:10] + corpus)]
+        model = doc2vec.Doc2Vec(min_count=1)
+        model.build_vocab(corpus)
+        model2 = doc2vec.Doc2Vec(min_count=1)
+        model2.build_vocab([corpus[:100], corpus[100:200], corpus[200:]], producers=2)
+        self.assertEqual(model.wv.index_to_key, model2.wv.index_to_key)
+        self.assertEqual(model.dv.index_to_key, model2.dv.index_to_key)
+        self.assertEqual(model.dv.key_to_index, model2.dv.key_to_index)
+        for key in ('word_count', 'doc_count'):
+            self.assertEqual(model.dv.get_vecattr('_*5', key), model2.dv.get_vecattr('_*5', key))
+
+        with temporary_file(get_tmpfile('gensim_doc2vec.tst')) as corpus_file:
+            save_lee_corpus_as_line_sentence(corpus_file)
+            model = doc2vec.Doc2Vec(min_count=1)
+            model.build_vocab(corpus_file=corpus_file)
+            model2 = doc2vec.Doc2Vec(min_count=1)
+            model2.build_vocab(corpus_file=corpus_file, producers=3)
+            self.assertEqual(model.wv.index_to_key, model2.wv.index_to_key)
+            self.assertEqual(len(model.dv), len(model2.dv))
+            self.assertEqual(model.corpus_count, model2.corpus_count)
+
+        with self.assertRaises(TypeError):
+            model2.build_vocab(corpus, producers=2)
+
     def test_empty_errors(self):
         # no input => "RuntimeError: you must first build vocabulary before training the model"
         self.assertRaises(RuntimeError, doc2vec.Doc2Vec, [])
@@ -380,6 +430,26 @@ class TestDoc2VecModel(unittest.TestCase):
             > model.similarity_unseen_docs(rome_words, car_words)
         )
 
+    def test_infer_vectors(self):
+        """Are bulk-inferred vectors independent of the threads and of the other documents?"""
+        corpus = list(DocsLeeCorpus())
+        documents = [doc.words for doc in corpus[:50]]
+        model = doc2vec.Doc2Vec(corpus, vector_size=20, min_count=2, epochs=5)
+
+        vectors = model.infer_vectors(documents, workers=1)
+        self.assertEqual(vectors.shape, (len(documents), model.dv.vector_size))
+        np.testing.assert_array_equal(model.infer_vectors(documents, workers=3, chunksize=7), vectors)
+        np.testing.assert_array_equal(model.infer_vectors(documents[10:20], seeds=range(10, 20)), vectors[10:20])
+        self.assertFalse(np.array_equal(model.infer_vectors(documents[10:20]), vectors[10:20]))
+
+        out = np.zeros((len(documents), model.dv.vector_size), dtype=np.float32)
+        self.assertIs(model.infer_vectors(documents, out=out), out)
+        np.testing.assert_array_equal(out, vectors)
+
+        self.assertRaises(TypeError, model.infer_vectors, ['a single string'])
+        self.assertRaises(ValueError, model.infer_vectors, documents, seeds=[0])
+        self.assertRaises(ValueError, model.infer_vectors, documents, out=out[:, :10])
+
     def model_sanity(self, model, keep_training=True):
         """Any non-trivial model on DocsLeeCorpus can pass these sanity checks"""
         fire1 = 0  # doc 0 sydney fires
@@ -394,6 +464,11 @@ class TestDoc2VecModel(unittest.TestCase):
         f_rank = sims_ids.index(fire1)
         self.assertLess(f_rank, 10)
 
+        # as should the bulk-inferred one
+        docs_inferred = model.infer_vectors([doc.words for doc in list(DocsLeeCorpus())[:2]])
+        sims_ids = [docid for docid, sim in model.dv.most_similar([docs_inferred[0]], topn=len(model.dv))]
+        self.assertLess(sims_ids.index(fire1), 10)
+
         # fire2 should be top30 close to fire1
         sims = model.dv.most_similar(fire1, topn=len(model.dv))
         f2_rank = [docid for docid, sim in sims].index(fire2)
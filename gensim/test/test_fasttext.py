@@ -15,7 +15,7 @@ import sys
 import numpy as np
 
 from gensim import utils
-from gensim.models.word2vec import LineSentence
+from gensim.models.word2vec import LineSentence, IndexedSentences
 from gensim.models.fasttext import FastText as FT_gensim, FastTextKeyedVectors, _unpack
 from gensim.models.keyedvectors import KeyedVectors
 from gensim.test.utils import (
@@ -23,7 +23,7 @@ from gensim.test.utils import (
 )
 from gensim.test.test_word2vec import TestWord2VecModel
 import gensim.models._fasttext_bin
-from gensim.models.fasttext_inner import compute_ngrams, compute_ngrams_bytes, ft_hash_bytes
+from gensim.models.fasttext_inner import compute_ngrams, compute_ngrams_bytes, ft_hash_bytes, ft_ngram_hashes_batch
 
 import gensim.models.fasttext
 
@@ -136,6 +136,17 @@ class TestFastTextModel(unittest.TestCase):
             oov_vec = model.wv['minor']  # oov word
             self.assertEqual(len(oov_vec), 12)
 
+    def test_training_indexed_sentences(self):
+        model = FT_gensim(vector_size=12, min_count=1, hs=1, negative=0, seed=42, workers=1, bucket=BUCKET)
+        model.build_vocab(sentences)
+        model.train(sentences, total_examples=model.corpus_count, epochs=model.epochs)
+
+        model2 = FT_gensim(vector_size=12, min_count=1, hs=1, negative=0, seed=42, workers=1, bucket=BUCKET)
+        model2.build_vocab(sentences)
+        corpus = IndexedSentences.serialize(get_tmpfile('gensim_fasttext.idx'), sentences, model2.wv)
+        model2.train(corpus, total_examples=model2.corpus_count, epochs=model2.epochs)
+        self.models_equal(model, model2)
+
     def models_equal(self, model, model2):
         self.assertEqual(len(model.wv), len(model2.wv))
         self.assertEqual(model.wv.bucket, model2.wv.bucket)
@@ -380,6 +391,39 @@ class TestFastTextModel(unittest.TestCase):
         self.assertFalse('nights' in self.test_model.wv.key_to_index)
         self.assertTrue(np.allclose(self.test_model.wv['nights'], self.test_model.wv[['nights']]))
 
+    def test_get_vectors(self):
+        words = ['night', 'nights', 'the', 'forests', 'nights', 'a']
+        wv = self.test_model.wv
+        for norm in (False, True):
+            expected = np.vstack([wv.get_vector(word, norm=norm) for word in words])
+            np.testing.assert_allclose(wv.get_vectors(words, norm=norm), expected, rtol=1e-5, atol=1e-7)
+        self.assertEqual(wv.get_vectors([]).shape, (0, wv.vector_size))
+
+    def test_oov_cache(self):
+        wv = self.test_model.wv
+        self.assertEqual(tuple(wv.oov_cache_info()), (0, 0, 0, 0))
+        expected = wv.get_vectors(['nights', 'forests', 'payments'])
+
+        wv.set_oov_cache_size(2)
+        try:
+            vectors = wv.get_vectors(['nights', 'forests', 'night'])
+            np.testing.assert_array_equal(vectors[:2], expected[:2])
+            np.testing.assert_array_equal(vectors[2], wv['night'])
+            self.assertEqual(tuple(wv.oov_cache_info()), (0, 2, 2, 2))
+            np.testing.assert_array_equal(wv.get_vectors(['nights', 'payments']), expected[[0, 2]])
+            self.assertEqual(tuple(wv.oov_cache_info()), (1, 3, 2, 2))
+            # 'forests' was least recently used
+            np.testing.assert_array_equal(wv['forests'], expected[1])
+            self.assertEqual(tuple(wv.oov_cache_info()), (1, 4, 2, 2))
+            np.testing.assert_array_equal(wv['payments'], expected[2])
+            self.assertEqual(tuple(wv.oov_cache_info()), (2, 4, 2, 2))
+
+            wv.adjust_vectors()
+            self.assertEqual(wv.oov_cache_info().currsize, 0)
+            self.assertEqual(wv.oov_cache_size, 2)
+        finally:
+            wv.set_oov_cache_size(0)
+
     def test_contains(self):
         # In vocab, sanity check
         self.assertTrue('night' in self.test_model.wv.key_to_index)
@@ -1205,6 +1249,15 @@ class FTHashFunctionsTest(unittest.TestCase):
         actual = {k: ft_hash_bytes(k.encode('utf-8')) for k in self.expected}
         self.assertEqual(self.expected, actual)
 
+    def test_ngram_hashes_batch(self):
+        words = list(self.expected) + ['', 'a', 'ab']
+        for minn, maxn in [(3, 6), (1, 1), (2, 4), (5, 3)]:
+            buckets, offsets = ft_ngram_hashes_batch(words, minn, maxn, 2000000)
+            self.assertEqual(len(offsets), len(words) + 1)
+            for k, word in enumerate(words):
+                expected = gensim.models.fasttext.ft_ngram_hashes(word, minn, maxn, 2000000)
+                self.assertEqual(buckets[offsets[k]:offsets[k + 1]].tolist(), expected)
+
 
 #
 # Run with:
@@ -1398,6 +1451,60 @@ class ZeroBucketTest(unittest.TestCase):
         TestWord2VecModel.model_sanity(self, model)
 
 
+class CompressNgramsTest(unittest.TestCase):
+    def setUp(self):
+        self.model = gensim.models.fasttext.load_facebook_model(datapath('lee_fasttext.bin'))
+        self.wv = self.model.wv
+        self.oov_words = ['nights', 'forests', 'payments', 'governmental', 'xyzzy']
+
+    def test_prune(self):
+        expected_vectors = self.wv.vectors.copy()
+        vectors_ngrams = self.wv.vectors_ngrams.copy()
+        self.wv.compress_ngrams(sentences=list_corpus, max_buckets=300)
+
+        self.assertEqual(self.wv.ngram_buckets.shape, (300, ))
+        self.assertEqual(self.wv.vectors_ngrams.shape, (300, self.wv.vector_size))
+        np.testing.assert_array_equal(self.wv.vectors, expected_vectors)
+        kept = set(self.wv.ngram_buckets)
+        for word in self.oov_words:
+            hashes = [h for h in gensim.models.fasttext.ft_ngram_hashes(word, 3, 6, self.wv.bucket) if h in kept]
+            expected = vectors_ngrams[hashes].mean(axis=0) if hashes else np.zeros(self.wv.vector_size)
+            np.testing.assert_allclose(self.wv[word], expected, rtol=1e-5, atol=1e-7)
+
+    def test_quantize(self):
+        expected = self.wv.get_vectors(self.oov_words)
+        self.wv.compress_ngrams(min_count=0, subvectors=5, centroids=16, seed=1)
+
+        self.assertIsNone(self.wv.vectors_ngrams)
+        self.assertEqual(self.wv.vectors_ngrams_codes.shape, (self.wv.bucket, 5))
+        self.assertEqual(self.wv.vectors_ngrams_codebooks.shape, (5, 16, 2))
+        actual = self.wv.get_vectors(self.oov_words)
+        similarities = (actual * expected).sum(axis=1)
+        similarities /= np.linalg.norm(actual, axis=1) * np.linalg.norm(expected, axis=1)
+        self.assertGreater(similarities.min(), 0.9)
+
+    def test_persistence(self):
+        self.wv.compress_ngrams(sentences=list_corpus, subvectors=2, centroids=32)
+        expected = self.wv.get_vectors(self.oov_words + ['night'])
+        tmpf = get_tmpfile('gensim_fasttext_compressed.tst')
+        self.model.save(tmpf)
+        loaded = FT_gensim.load(tmpf)
+        np.testing.assert_array_equal(loaded.wv.get_vectors(self.oov_words + ['night']), expected)
+        self.wv.save(tmpf)
+        loaded_wv = FastTextKeyedVectors.load(tmpf)
+        np.testing.assert_array_equal(loaded_wv.get_vectors(self.oov_words + ['night']), expected)
+        np.testing.assert_array_equal(loaded_wv.vectors, self.wv.vectors)
+
+    def test_no_training(self):
+        self.wv.compress_ngrams()
+        with self.assertRaises(RuntimeError):
+            self.model.train(list_corpus, total_examples=len(list_corpus), epochs=1)
+        with self.assertRaises(RuntimeError):
+            self.wv.compress_ngrams()
+        with self.assertRaises(ValueError):
+            gensim.models.fasttext.save_facebook_model(self.model, get_tmpfile('gensim_fasttext_compressed.bin'))
+
+
 class UnicodeVocabTest(unittest.TestCase):
     def test_ascii(self):
         buf = io.BytesIO()
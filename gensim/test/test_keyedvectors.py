@@ -15,7 +15,7 @@ import unittest
 import numpy as np
 
 from gensim.models.keyedvectors import KeyedVectors, REAL, pseudorandom_weak_vector
-from gensim.test.utils import datapath
+from gensim.test.utils import datapath, get_tmpfile
 import gensim.models.keyedvectors
 
 logger = logging.getLogger(__name__)
@@ -97,6 +97,143 @@ class TestKeyedVectors(unittest.TestCase):
         predicted = [result[0] for result in self.vectors.most_similar([input_vector], topn=5)]
         self.assertEqual(expected, predicted)
 
+    def test_most_similar_batch(self):
+        """Test most_similar_batch returns the same results as repeated most_similar calls."""
+        queries = ['war', 'peace', self.vectors['israel'], ['war', 'terrorism'], (['king', 'woman'], ['man'])]
+        predicted = self.vectors.most_similar_batch(queries, topn=5, batch_size=2)
+        self.assertEqual(len(predicted), len(queries))
+        for query, result in zip(queries, predicted):
+            if isinstance(query, tuple):
+                expected = self.vectors.most_similar(positive=query[0], negative=query[1], topn=5)
+            elif isinstance(query, list):
+                expected = self.vectors.most_similar(positive=query, topn=5)
+            else:
+                expected = self.vectors.most_similar(positive=[query], topn=5)
+            self.assertEqual([key for key, _ in expected], [key for key, _ in result])
+            self.assertTrue(np.allclose([sim for _, sim in expected], [sim for _, sim in result], atol=1e-6))
+
+    def test_most_similar_batch_topn(self):
+        """Test most_similar_batch handles `topn`, `restrict_vocab` and clipping correctly."""
+        queries = ['war', 'peace']
+        predicted = self.vectors.most_similar_batch(queries, topn=None)
+        self.assertEqual(predicted.shape, (2, len(self.vectors)))
+        self.assertTrue(np.allclose(predicted[0], self.vectors.most_similar('war', topn=None), atol=1e-6))
+
+        self.assertEqual(self.vectors.most_similar_batch(queries, topn=0), [[], []])
+
+        expected = set(self.vectors.index_to_key[:5]) - {'war'}
+        predicted = self.vectors.most_similar_batch(queries, topn=5, restrict_vocab=5)
+        self.assertEqual(expected, set(key for key, _ in predicted[0]))
+
+        expected = self.vectors.most_similar('war', topn=3, clip_start=10, clip_end=50)
+        predicted = self.vectors.most_similar_batch(queries, topn=3, clip_start=10, clip_end=50)
+        self.assertEqual([key for key, _ in expected], [key for key, _ in predicted[0]])
+
+    def test_most_similar_quantized(self):
+        """Test most_similar over quantized vectors returns the same results as over the full vectors."""
+        expected = self.vectors.most_similar('war', topn=10)
+        for dtype in (np.int8, np.float16):
+            self.vectors.quantize_vectors(dtype=dtype)
+            self.assertEqual(self.vectors.vectors_quantized.dtype, dtype)
+            predicted = self.vectors.most_similar('war', topn=10)
+            self.assertEqual([key for key, _ in expected], [key for key, _ in predicted])
+            self.assertTrue(np.allclose([sim for _, sim in expected], [sim for _, sim in predicted]))
+
+        # modifying the vectors must discard the now stale quantized copy
+        self.vectors['war'] = -self.vectors['war']
+        self.assertIsNone(self.vectors.vectors_quantized)
+        self.assertIsNone(self.vectors.quantized_scales)
+        self.assertIsNone(self.vectors.quantized_rerank)
+
+        self.vectors.quantize_vectors(dtype=np.int8)
+        self.vectors.fill_norms(force=True)
+        self.assertIsNone(self.vectors.vectors_quantized)
+        self.assertIsNone(self.vectors.quantized_scales)
+
+        self.vectors.quantize_vectors(dtype=np.int8)
+        tmpfname = get_tmpfile('intersect.txt')
+        self.vectors.save_word2vec_format(tmpfname, binary=False)
+        self.vectors.vectors_lockf = np.ones(len(self.vectors), dtype=np.float32)
+        self.vectors.intersect_word2vec_format(tmpfname, binary=False)
+        self.assertIsNone(self.vectors.vectors_quantized)
+        self.assertIsNone(self.vectors.quantized_scales)
+
+        with self.assertRaises(ValueError):
+            self.vectors.quantize_vectors(dtype=np.int16)
+
+    def test_save_reload_quantized(self):
+        """Test the quantized vectors survive a save/load roundtrip."""
+        self.vectors.quantize_vectors(dtype=np.int8, rerank=8)
+        tmpfname = get_tmpfile('quantized.kv')
+        self.vectors.save(tmpfname)
+        loaded = KeyedVectors.load(tmpfname, mmap='r')
+        self.assertTrue(np.array_equal(self.vectors.vectors_quantized, loaded.vectors_quantized))
+        self.assertTrue(np.array_equal(self.vectors.quantized_scales, loaded.quantized_scales))
+        self.assertEqual(loaded.quantized_rerank, 8)
+        self.assertEqual(self.vectors.most_similar('war'), loaded.most_similar('war'))
+
+    def test_evaluate_word_analogies(self):
+        # random analogy questions over the model's vocabulary, checked against answers from most_similar*()
+        rng = np.random.default_rng(0)
+        quadruplets = [list(rng.choice(self.vectors.index_to_key[:200], 4, replace=False)) for _ in range(60)]
+        quadruplets[::3] = [
+            [a, b, c, self.vectors.most_similar(positive=[b, c], negative=[a], topn=1)[0][0]]
+            for a, b, c, _ in quadruplets[::3]
+        ]
+        analogies = get_tmpfile('analogies.txt')
+        with open(analogies, 'w') as fout:
+            fout.write(': section\n')
+            fout.writelines(' '.join(quadruplet) + '\n' for quadruplet in quadruplets)
+            fout.write(': oov section\nfoo bar war baz\n')
+
+        methods = {'3CosAdd': self.vectors.most_similar, '3CosMul': self.vectors.most_similar_cosmul}
+        for similarity_function, most_similar in methods.items():
+            expected = [
+                tuple(quadruplet) for quadruplet in quadruplets
+                if most_similar(positive=quadruplet[1:3], negative=quadruplet[:1], topn=1)[0][0] == quadruplet[3]
+            ]
+            for batch_size in (1, 7, 64):
+                score, sections = self.vectors.evaluate_word_analogies(
+                    analogies, case_insensitive=False, dummy4unknown=True,
+                    similarity_function=similarity_function, batch_size=batch_size,
+                )
+                self.assertEqual(sections[0]['correct'], expected)
+                self.assertEqual(len(sections[0]['incorrect']), len(quadruplets) - len(expected))
+                self.assertEqual(sections[1]['incorrect'], [('foo', 'bar', 'war', 'baz')])
+                self.assertEqual(score, len(expected) / (len(quadruplets) + 1))
+            self.assertGreater(len(expected), 0)
+
+    def test_compact_keys(self):
+        keys = list(self.vectors.index_to_key)
+        expected = self.vectors.most_similar('war')
+        self.vectors.compact_keys()
+        self.assertEqual(len(self.vectors), len(keys))
+        self.assertEqual(self.vectors.index_to_key, keys)
+        self.assertEqual(list(self.vectors.key_to_index), keys)
+        self.assertEqual(self.vectors.index_to_key[-3:], keys[-3:])
+        for index, key in enumerate(keys):
+            self.assertEqual(self.vectors.get_index(key), index)
+            self.assertEqual(self.vectors.key_to_index[key], index)
+            self.assertEqual(self.vectors.index_to_key[index], key)
+        self.assertNotIn('no such key', self.vectors)
+        self.assertEqual(self.vectors.key_to_index.get('no such key', -1), -1)
+        self.assertEqual(self.vectors.get_index(3), 3)  # integer indexes still work
+        self.assertEqual(self.vectors.most_similar('war'), expected)
+        self.assertRaises(TypeError, self.vectors.add_vectors, ['no such key'], np.ones((1, self.vectors.vector_size)))
+
+        tmpfile = get_tmpfile('kv_compact')
+        self.vectors.save(tmpfile, sep_limit=0)
+        loaded = KeyedVectors.load(tmpfile, mmap='r')
+        self.assertIsInstance(loaded.compact_key_index.blob, np.memmap)
+        self.assertEqual(loaded.get_index('war'), self.vectors.get_index('war'))
+        self.assertEqual(loaded.most_similar('war'), expected)
+
+        loaded.expand_keys()
+        self.assertIsInstance(loaded.key_to_index, dict)
+        self.assertEqual(loaded.index_to_key, keys)
+        loaded.add_vectors(['no such key'], np.ones((1, self.vectors.vector_size)))
+        self.assertEqual(loaded.get_index('no such key'), len(keys))
+
     def test_most_similar_to_given(self):
         """Test most_similar_to_given returns correct results."""
         predicted = self.vectors.most_similar_to_given('war', ['terrorism', 'call', 'waging'])
@@ -278,6 +415,39 @@ class TestKeyedVectors(unittest.TestCase):
         self.assertEqual(randkv.index_to_key, reloadbinkv.index_to_key)
         self.assertTrue((randkv.vectors == reloadbinkv.vectors).all())
 
+    def test_save_reload_mmap_format(self):
+        tmpfile = get_tmpfile("tmp_kv.mmap")
+        self.vectors.add_vectors(['ключ', 'null\0key'], np.ones((2, self.vectors.vector_size)))
+        self.vectors.save_mmap_format(tmpfile)
+        for mmap in (None, 'r', 'c'):
+            reloaded = KeyedVectors.load_mmap_format(tmpfile, mmap=mmap)
+            self.assertEqual(self.vectors.index_to_key, reloaded.index_to_key)
+            self.assertEqual(self.vectors.key_to_index, reloaded.key_to_index)
+            np.testing.assert_array_equal(self.vectors.vectors, reloaded.vectors)
+            self.assertEqual(self.vectors.get_vecattr('war', 'count'), reloaded.get_vecattr('war', 'count'))
+            self.assertEqual(self.vectors.most_similar('war'), reloaded.most_similar('war'))
+        self.assertIsInstance(KeyedVectors.load_mmap_format(tmpfile).vectors, np.memmap)
+
+        # the vectors array starts on a page boundary
+        with open(tmpfile, 'rb') as fin:
+            header = np.frombuffer(fin.read(gensim.models.keyedvectors._MMAP_FORMAT_HEADER.itemsize),
+                dtype=gensim.models.keyedvectors._MMAP_FORMAT_HEADER)
+        self.assertEqual(header['vectors_offset'][0] % 4096, 0)
+
+    def test_save_reload_mmap_format_int_keys(self):
+        kv = KeyedVectors(vector_size=10)
+        kv.add_vectors([3, 1, 2], np.arange(30, dtype=REAL).reshape(3, 10))
+        tmpfile = get_tmpfile("tmp_kv.mmap")
+        kv.save_mmap_format(tmpfile, datatype=np.float16)
+        reloaded = KeyedVectors.load_mmap_format(tmpfile)
+        self.assertEqual(reloaded.index_to_key, [3, 1, 2])
+        self.assertEqual(reloaded.vectors.dtype, np.float16)
+        np.testing.assert_array_equal(reloaded[1], kv[1])
+
+        kv.add_vector('mixed', np.zeros(10))
+        self.assertRaises(ValueError, kv.save_mmap_format, tmpfile)
+        self.assertRaises(ValueError, KeyedVectors.load_mmap_format, datapath('euclidean_vectors.bin'))
+
     def test_no_header(self):
         randkv = KeyedVectors(vector_size=100)
         count = 20
@@ -390,6 +560,67 @@ class LoadWord2VecFormatTest(unittest.TestCase):
         self.verify_load2vec_binary_result(w2v_dict, binary_chunk_size=5, limit=None)
         self.verify_load2vec_binary_result(w2v_dict, binary_chunk_size=5, limit=1)
 
+    def test_load_word2vec_format_parallel(self):
+        kv = KeyedVectors.load_word2vec_format(datapath('euclidean_vectors.bin'), binary=True)
+        # include a non-ascii word, and a duplicate word which must be ignored
+        records = list(zip(kv.index_to_key, kv.vectors)) + [('мир', kv['war']), ('war', np.ones(kv.vector_size))]
+        for binary in (False, True):
+            tmpfile = get_tmpfile("tmp_w2v")
+            with gensim.utils.open(tmpfile, 'wb') as fout:
+                fout.write(f"{len(records)} {kv.vector_size}\n".encode('utf8'))
+                for word, vector in records:
+                    if binary:
+                        fout.write(f"{word} ".encode('utf8') + vector.astype(REAL).tobytes())
+                    else:
+                        fout.write(f"{word} {' '.join(repr(val) for val in vector)}\n".encode('utf8'))
+            for limit in (None, 1, 10, len(records) - 1):
+                expected = KeyedVectors.load_word2vec_format(tmpfile, binary=binary, limit=limit)
+                loaded = KeyedVectors.load_word2vec_format(tmpfile, binary=binary, limit=limit, workers=3)
+                self.assertEqual(expected.index_to_key, loaded.index_to_key)
+                np.testing.assert_array_equal(expected.vectors, loaded.vectors)
+                np.testing.assert_array_equal(expected.expandos['count'], loaded.expandos['count'])
+
+    def test_load_word2vec_format_parallel_layouts(self):
+        rng = np.random.default_rng(0)
+        tmpfile = get_tmpfile("tmp_w2v")
+        for binary, newlines in [(False, False), (True, False), (True, True)]:
+            words = ['w%i' % i for i in range(500)] + ['мир'] + (['\nabc'] if binary else [])
+            vectors = rng.standard_normal((len(words), 7)).astype(REAL)
+            # text without a trailing newline, binary as written by gensim or by word2vec.c (newline-terminated)
+            with gensim.utils.open(tmpfile, 'wb') as fout:
+                fout.write(f"{len(words)} {vectors.shape[1]}\n".encode('utf8'))
+                for i, (word, vector) in enumerate(zip(words, vectors)):
+                    if binary:
+                        fout.write(f"{word} ".encode('utf8') + vector.tobytes() + (b'\n' if newlines else b''))
+                    else:
+                        line = f"{word} {' '.join(repr(val) for val in vector)}"
+                        fout.write(line.encode('utf8') + (b'\n' if i < len(words) - 1 else b''))
+            expected = KeyedVectors.load_word2vec_format(tmpfile, binary=binary)
+            self.assertEqual(len(expected), len(words))
+            for workers in (2, 7):
+                loaded = KeyedVectors.load_word2vec_format(tmpfile, binary=binary, workers=workers)
+                self.assertEqual(expected.index_to_key, loaded.index_to_key)
+                np.testing.assert_array_equal(expected.vectors, loaded.vectors)
+
+        # a small text file without a trailing newline
+        with gensim.utils.open(tmpfile, 'wb') as fout:
+            fout.write(b"3 2\na 1.0 2.0\nb 3.0 4.0\nc 5.0 6.0")
+        loaded = KeyedVectors.load_word2vec_format(tmpfile, workers=2)
+        self.assertEqual(loaded.index_to_key, ['a', 'b', 'c'])
+        np.testing.assert_array_equal(loaded['c'], [5.0, 6.0])
+
+    def test_load_word2vec_format_parallel_ambiguous(self):
+        """Are binary vectors whose bytes look like words loaded correctly, although they can't be split?"""
+        rng = np.random.default_rng(0)
+        vectors = np.frombuffer(rng.choice(list(b' abcABC'), size=3000 * 8).astype(np.uint8).tobytes(), dtype=REAL)
+        kv = KeyedVectors(2)
+        kv.add_vectors(['w%i' % i for i in range(3000)], vectors.reshape(3000, 2))
+        tmpfile = get_tmpfile("tmp_w2v")
+        kv.save_word2vec_format(tmpfile, binary=True)
+        loaded = KeyedVectors.load_word2vec_format(tmpfile, binary=True, workers=8)
+        self.assertEqual(kv.index_to_key, loaded.index_to_key)
+        np.testing.assert_array_equal(kv.vectors, loaded.vectors)
+
 
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
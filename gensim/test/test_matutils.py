@@ -141,6 +141,42 @@ class TestLdaModelInner(unittest.TestCase):
                 msg = "dirichlet_expectation_2d failed for dtype={}".format(dtype)
                 self.assertTrue(np.allclose(known_good, test_values), msg)
 
+    def test_product_quantize(self):
+        rng = np.random.default_rng(0)
+        # vectors around 4 well separated centers
+        centers = rng.normal(size=(4, 6)).astype(np.float32) * 10
+        vectors = centers[rng.integers(0, 4, size=200)] + rng.normal(scale=0.01, size=(200, 6)).astype(np.float32)
+        centroids = matutils.kmeans(vectors, 4, 10, rng)
+        self.assertEqual(centroids.shape, (4, 6))
+        nearest = matutils.nearest_centroids(vectors, centroids)
+        self.assertTrue(np.allclose(centroids[nearest], vectors, atol=0.1))
+
+        # with more centroids than distinct pieces, the quantization is lossless
+        vectors = centers[rng.integers(0, 4, size=200)]
+        codes, codebooks = matutils.product_quantize(vectors, 3, 256, 10, rng)
+        self.assertEqual(codes.shape, (200, 3))
+        self.assertEqual(codebooks.shape, (3, 256, 2))
+        decoded = codebooks[np.arange(3), codes].reshape(200, 6)
+        self.assertTrue(np.allclose(decoded, vectors))
+
+    def test_quantized_dot(self):
+        rs = self.random_state
+        for num_columns in [1, 7, 16, 300]:
+            quantized = rs.randint(-127, 128, size=(50, num_columns)).astype(np.int8)
+            vector = rs.randint(-127, 128, size=num_columns).astype(np.int8)
+            out = np.empty(50, dtype=np.int32)
+            matutils.quantized_dot(quantized, vector, out)
+            self.assertTrue(np.array_equal(out, quantized.astype(np.int32) @ vector.astype(np.int32)))
+
+            # include zeros and float16 subnormals
+            quantized = rs.uniform(-1, 1, size=(50, num_columns)).astype(np.float16)
+            quantized[::3, 0] = 0.0
+            quantized[1::3, 0] = -3e-6
+            vector = rs.uniform(-1, 1, size=num_columns).astype(np.float32)
+            out = np.empty(50, dtype=np.float32)
+            matutils.quantized_dot(quantized, vector, out)
+            self.assertTrue(np.allclose(out, quantized.astype(np.float32) @ vector, atol=1e-5))
+
 
 def manual_unitvec(vec):
     # manual unit vector calculation for UnitvecTestCase
@@ -23,6 +23,7 @@ from gensim.scripts.segment_wiki import segment_all_articles, segment_and_write_
 from gensim.test.utils import datapath, get_tmpfile
 
 from gensim.scripts.word2vec2tensor import word2vec2tensor
+from gensim.scripts.vectors2mmap import vectors2mmap
 from gensim.models import KeyedVectors
 
 
@@ -154,6 +155,27 @@ class TestWord2Vec2Tensor(unittest.TestCase):
             np.testing.assert_almost_equal(orig_model[word_string], vector_array, decimal=5)
 
 
+class TestVectors2Mmap(unittest.TestCase):
+    def setUp(self):
+        self.output_file = get_tmpfile('vectors2mmap_test.mmap')
+
+    def test_word2vec_conversion(self):
+        inputs = [('word2vec_pre_kv_c', 'word2vec-text'), ('euclidean_vectors.bin', 'word2vec-binary')]
+        for fname, input_format in inputs:
+            num_vectors, vector_size = vectors2mmap(datapath(fname), self.output_file, input_format=input_format)
+            orig_model = KeyedVectors.load_word2vec_format(datapath(fname), binary=input_format == 'word2vec-binary')
+            model = KeyedVectors.load_mmap_format(self.output_file)
+            self.assertEqual((num_vectors, vector_size), model.vectors.shape)
+            self.assertEqual(orig_model.index_to_key, model.index_to_key)
+            np.testing.assert_array_equal(orig_model.vectors, model.vectors)
+
+    def test_fasttext_conversion(self):
+        vectors2mmap(datapath('lee_fasttext.bin'), self.output_file, input_format='fasttext', datatype=np.float16)
+        model = KeyedVectors.load_mmap_format(self.output_file)
+        self.assertEqual(model.vectors.dtype, np.float16)
+        self.assertIn('night', model)
+
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.DEBUG)
     unittest.main()
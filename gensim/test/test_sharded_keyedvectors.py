@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Automated tests for checking the sharded_keyedvectors module from the models package.
+"""
+
+import logging
+import unittest
+
+import numpy as np
+
+from gensim.models.keyedvectors import KeyedVectors
+from gensim.models.sharded_keyedvectors import ShardedKeyedVectors
+from gensim.test.utils import datapath, get_tmpfile
+
+logger = logging.getLogger(__name__)
+
+
+class TestShardedKeyedVectors(unittest.TestCase):
+    def setUp(self):
+        self.vectors = KeyedVectors.load_word2vec_format(datapath('euclidean_vectors.bin'), binary=True)
+        self.index = ShardedKeyedVectors(get_tmpfile('sharded_kv'), self.vectors.vector_size, shardsize=1000)
+        self.index.add_vectors(self.vectors.index_to_key, self.vectors.vectors)
+
+    def test_lookup(self):
+        self.assertEqual(len(self.index.shards), 3)
+        self.assertEqual(len(self.index), len(self.vectors))
+        for key in ('the', 'war', self.vectors.index_to_key[1500], self.vectors.index_to_key[-1]):
+            self.assertIn(key, self.index)
+            self.assertEqual(self.index.get_index(key), self.vectors.get_index(key))
+            self.assertEqual(self.index.get_key(self.index.get_index(key)), key)
+            np.testing.assert_array_equal(self.index[key], self.vectors[key])
+            np.testing.assert_allclose(self.index.get_vector(key, norm=True), self.vectors.get_vector(key, norm=True))
+        self.assertNotIn('no such key', self.index)
+        self.assertRaises(KeyError, self.index.get_vector, 'no such key')
+        self.assertEqual(self.index[['the', 'war']].shape, (2, self.vectors.vector_size))
+
+    def test_lookup_routing(self):
+        fname = get_tmpfile('sharded_kv.index')
+        self.index.save(fname)
+        loaded = ShardedKeyedVectors.load(fname)
+        key = self.vectors.index_to_key[1500]
+        self.assertEqual(loaded.get_index(key), 1500)
+        self.assertNotIn('no such key', loaded)
+        # only the shard holding the key was opened
+        self.assertEqual([hasattr(shard, 'kv') for shard in loaded.shards], [False, True, False])
+
+    def test_most_similar(self):
+        for workers in (1, 3):
+            self.index.workers = workers
+            for positive, negative in [(['war'], []), (['war', 'peace'], ['the']), ([self.vectors['war']], [])]:
+                expected = self.vectors.most_similar(positive=positive, negative=negative, topn=7)
+                result = self.index.most_similar(positive=positive, negative=negative, topn=7)
+                self.assertEqual([key for key, _ in result], [key for key, _ in expected])
+                np.testing.assert_allclose([sim for _, sim in result], [sim for _, sim in expected], rtol=1e-5)
+
+    def test_add_vectors(self):
+        weights = np.random.default_rng(0).random((3, self.vectors.vector_size)).astype(np.float32)
+        self.index.add_vectors(['new1', 'war', 'new2'], weights)  # 'war' is already present
+        self.assertEqual(len(self.index.shards), 4)
+        self.assertEqual(len(self.index), len(self.vectors) + 2)
+        np.testing.assert_array_equal(self.index['new2'], weights[2])
+        np.testing.assert_array_equal(self.index['war'], self.vectors['war'])
+        self.assertEqual(self.index.most_similar(positive=[weights[0]], topn=1)[0][0], 'new1')
+
+    def test_add_shard(self):
+        fname = get_tmpfile('extra_shard.mmap')
+        extra = KeyedVectors(self.vectors.vector_size)
+        extra.add_vectors(['extra_key'], np.ones((1, self.vectors.vector_size)))
+        extra.save_mmap_format(fname)
+        self.index.add_shard(fname)
+        self.assertEqual(self.index.get_index('extra_key'), len(self.vectors))
+        self.assertRaises(ValueError, self.index.add_shard, fname)  # keys already present
+
+    def test_save_load(self):
+        fname = get_tmpfile('sharded_kv.index')
+        self.index.save(fname)
+        loaded = ShardedKeyedVectors.load(fname)
+        self.assertEqual(len(loaded), len(self.index))
+        self.assertIsInstance(loaded.shards[0].get_kv().vectors, np.memmap)
+        self.assertEqual(loaded.most_similar('war', topn=5), self.index.most_similar('war', topn=5))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
+    unittest.main()
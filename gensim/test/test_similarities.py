@@ -372,6 +372,29 @@ class TestWmdSimilarity(_TestSimilarityABC):
             self.assertTrue(numpy.alltrue(sims >= 0.0))
             self.assertTrue(numpy.alltrue(sims <= 1.0))
 
+    @unittest.skipIf(PYEMD_EXT is False, "pyemd not installed")
+    def test_pruned_num_best(self):
+        # the WCD/RWMD pruning must not change the `num_best` most similar documents
+        rng = numpy.random.default_rng(0)
+        vocab = self.w2v_model.index_to_key
+        corpus = [list(rng.choice(vocab, rng.integers(1, 6))) for _ in range(60)]
+        exact = self.cls(corpus, self.w2v_model)
+        pruned = self.cls(corpus, self.w2v_model, num_best=5, chunksize=4)
+        for query in corpus[:5] + [['human', 'graph'], ['unknown_word']]:
+            expected = matutils.full2sparse_clipped(exact[query], 5)
+            sims = pruned[query]
+            self.assertEqual(len(sims), len(expected))
+            numpy.testing.assert_allclose([sim for _, sim in sims], [sim for _, sim in expected], rtol=1e-6)
+
+    @unittest.skipIf(PYEMD_EXT is False, "pyemd not installed")
+    def test_workers(self):
+        index = self.cls(TEXTS, self.w2v_model)
+        parallel = self.cls(TEXTS, self.w2v_model, workers=2)
+        numpy.testing.assert_allclose(parallel[TEXTS[:3]], index[TEXTS[:3]])
+        parallel.num_best = 3
+        index.num_best = 3
+        self.assertEqual(parallel[TEXTS[0]], index[TEXTS[0]])
+
 
 class TestSoftCosineSimilarity(_TestSimilarityABC):
     def setUp(self):
@@ -839,6 +862,153 @@ class TestDoc2VecNmslibIndexer(unittest.TestCase):
         self.assertEqual(self.index.query_time_params, self.index2.query_time_params)
 
 
+class TestPQIndexer(unittest.TestCase):
+
+    def setUp(self):
+        from gensim.similarities.pq import PQIndexer
+        self.indexer = PQIndexer
+        self.model = KeyedVectors.load_word2vec_format(datapath('lee_fasttext.vec'))
+
+    def test_word2vec(self):
+        model = word2vec.Word2Vec(TEXTS, min_count=1, vector_size=20)
+        index = self.indexer(model, num_lists=2, num_subvectors=5, num_probes=2)
+
+        self.assertVectorIsSimilarToItself(model.wv, index)
+
+    def test_doc2vec(self):
+        model = doc2vec.Doc2Vec(SENTENCES, min_count=1, vector_size=20)
+        index = self.indexer(model, num_lists=2, num_subvectors=5, num_probes=2)
+
+        self.assertVectorIsSimilarToItself(model.dv, index)
+
+    def test_indexing_keyedvectors(self):
+        index = self.indexer(self.model, num_lists=8, num_subvectors=10, num_probes=8)
+
+        self.assertEqual(index.codes.shape, (len(self.model), 10))
+        self.assertEqual(index.codes.dtype, numpy.uint8)
+        self.assertVectorIsSimilarToItself(self.model, index)
+        self.assertApproxNeighborsMatchExact(self.model, index)
+
+    def test_invalid_num_subvectors(self):
+        self.assertRaises(ValueError, self.indexer, self.model, num_subvectors=3)
+
+    def test_save_load(self):
+        index = self.indexer(self.model, num_lists=8, num_subvectors=10, num_probes=8)
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index.save(fname, sep_limit=0)
+
+        index2 = self.indexer.load(fname, mmap='r')
+        self.assertTrue(isinstance(index2.codes, numpy.memmap))
+        self.assertTrue(numpy.array_equal(index.codes, index2.codes))
+        self.assertEqual(index.labels, index2.labels)
+        vector = self.model.get_normed_vectors()[0]
+        self.assertEqual(index.most_similar(vector, 5), index2.most_similar(vector, 5))
+
+    def assertVectorIsSimilarToItself(self, wv, index):
+        vector = wv.get_normed_vectors()[0]
+        label = wv.index_to_key[0]
+        approx_neighbors = index.most_similar(vector, 1)
+        word, similarity = approx_neighbors[0]
+
+        self.assertEqual(word, label)
+        self.assertAlmostEqual(similarity, 1.0, places=1)
+
+    def assertApproxNeighborsMatchExact(self, wv, index):
+        vector = wv.get_normed_vectors()[0]
+        approx_neighbors = wv.most_similar([vector], topn=5, indexer=index)
+        exact_neighbors = wv.most_similar([vector], topn=5)
+
+        approx_words = [neighbor[0] for neighbor in approx_neighbors]
+        exact_words = [neighbor[0] for neighbor in exact_neighbors]
+
+        self.assertEqual(approx_words, exact_words)
+
+
+class TestHnswIndexer(unittest.TestCase):
+
+    def setUp(self):
+        from gensim.similarities.hnsw import HnswIndexer
+        self.indexer = HnswIndexer
+        self.model = KeyedVectors.load_word2vec_format(datapath('lee_fasttext.vec'))
+
+    def test_word2vec(self):
+        model = word2vec.Word2Vec(TEXTS, min_count=1)
+        index = self.indexer(model)
+
+        self.assertVectorIsSimilarToItself(model.wv, index)
+        self.assertApproxNeighborsMatchExact(model.wv, index)
+
+    def test_doc2vec(self):
+        model = doc2vec.Doc2Vec(SENTENCES, min_count=1)
+        index = self.indexer(model)
+
+        self.assertVectorIsSimilarToItself(model.dv, index)
+        self.assertApproxNeighborsMatchExact(model.dv, index)
+
+    def test_indexing_keyedvectors(self):
+        index = self.indexer(self.model, workers=4)
+
+        self.assertEqual(len(index), len(self.model))
+        self.assertEqual(index.links0.dtype, numpy.int32)
+        self.assertVectorIsSimilarToItself(self.model, index)
+        self.assertApproxNeighborsMatchExact(self.model, index)
+
+    def test_update(self):
+        model = KeyedVectors(self.model.vector_size)
+        model.add_vectors(self.model.index_to_key[:1000], self.model.vectors[:1000])
+        index = self.indexer(model)
+
+        model.add_vectors(self.model.index_to_key[1000:], self.model.vectors[1000:])
+        index.update(model)
+        self.assertEqual(len(index), len(self.model))
+        self.assertVectorIsSimilarToItself(self.model, index, position=-1)
+        self.assertApproxNeighborsMatchExact(self.model, index, position=-1)
+
+    def test_empty(self):
+        index = self.indexer()
+        vector = self.model.get_normed_vectors()[0]
+        self.assertEqual(index.most_similar(vector, 3), [])
+
+        # an empty index fills up like any other
+        index.add_vectors(['first'], [vector])
+        self.assertEqual(index.most_similar(vector, 3)[0][0], 'first')
+
+    def test_save_load(self):
+        index = self.indexer(self.model)
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index.save(fname, sep_limit=0)
+
+        index2 = self.indexer.load(fname, mmap='r')
+        self.assertTrue(isinstance(index2.links0, numpy.memmap))
+        self.assertTrue(numpy.array_equal(index.links0, index2.links0))
+        self.assertEqual(index.labels, index2.labels)
+        vector = self.model.get_normed_vectors()[0]
+        self.assertEqual(index.most_similar(vector, 5), index2.most_similar(vector, 5))
+
+        # a memory-mapped index can still grow
+        index2.add_vectors(['new'], [-vector])
+        self.assertEqual(index2.most_similar(-vector, 1)[0][0], 'new')
+
+    def assertVectorIsSimilarToItself(self, wv, index, position=0):
+        vector = wv.get_normed_vectors()[position]
+        label = wv.index_to_key[position]
+        approx_neighbors = index.most_similar(vector, 1)
+        word, similarity = approx_neighbors[0]
+
+        self.assertEqual(word, label)
+        self.assertAlmostEqual(similarity, 1.0, places=4)
+
+    def assertApproxNeighborsMatchExact(self, wv, index, position=0):
+        vector = wv.get_normed_vectors()[position]
+        approx_neighbors = wv.most_similar([vector], topn=5, indexer=index)
+        exact_neighbors = wv.most_similar([vector], topn=5)
+
+        approx_words = [neighbor[0] for neighbor in approx_neighbors]
+        exact_words = [neighbor[0] for neighbor in exact_neighbors]
+
+        self.assertEqual(approx_words, exact_words)
+
+
 class TestUniformTermSimilarityIndex(unittest.TestCase):
     def setUp(self):
         self.documents = [[u"government", u"denied", u"holiday"], [u"holiday", u"slowing", u"hollingworth"]]
@@ -8,6 +8,7 @@ Automated tests for checking various utils functions.
 """
 
 import logging
+import pickle
 import unittest
 
 import numpy as np
@@ -141,6 +142,54 @@ class TestMergeDicts(unittest.TestCase):
         self.assertEqual(res_dict, expected_dict)
 
 
+class TestSpaceSaving(unittest.TestCase):
+    def setUp(self):
+        # a Zipf-like stream, with a long tail of rare items
+        rng = np.random.RandomState(42)
+        self.stream = [str(item) for item in rng.zipf(1.3, 20000)]
+        self.true_counts = {}
+        for item in self.stream:
+            self.true_counts[item] = self.true_counts.get(item, 0) + 1
+
+    def assert_bounds(self, sketch):
+        """Are all counts within their error bounds, and all frequent items counted?"""
+        self.assertLessEqual(len(sketch), sketch.capacity)
+        self.assertLessEqual(sketch.max_error(), sketch.total / sketch.capacity)
+        for item, count in sketch.counts.items():
+            self.assertLessEqual(self.true_counts[item], count)
+            self.assertLessEqual(sketch.lower_bound(item), self.true_counts[item])
+            self.assertLessEqual(count - self.true_counts[item], sketch.max_error())
+        for item, count in self.true_counts.items():
+            if count > sketch.max_error():
+                self.assertIn(item, sketch)
+
+    def test_exact_under_capacity(self):
+        sketch = utils.SpaceSaving(len(self.true_counts))
+        sketch.update(self.stream)
+        self.assertEqual(sketch.counts, self.true_counts)
+        self.assertEqual(sketch.max_error(), 0)
+
+    def test_bounds(self):
+        sketch = utils.SpaceSaving(100)
+        for start in range(0, len(self.stream), 10):
+            sketch.update(self.stream[start:start + 10])
+        self.assertEqual(sketch.total, len(self.stream))
+        self.assert_bounds(sketch)
+
+    def test_merge(self):
+        sketch, sketch2 = utils.SpaceSaving(100), utils.SpaceSaving(100)
+        sketch.update(self.stream[:5000])
+        sketch2.update(self.stream[5000:])
+        sketch.merge(pickle.loads(pickle.dumps(sketch2)))
+        self.assertEqual(sketch.total, len(self.stream))
+        self.assert_bounds(sketch)
+        sketch.update(self.stream[:10])  # still usable after merging
+        self.assertEqual(sketch.total, len(self.stream) + 10)
+
+    def test_capacity(self):
+        self.assertRaises(ValueError, utils.SpaceSaving, 0)
+
+
 class TestWindowing(unittest.TestCase):
 
     arr10_5 = np.array([
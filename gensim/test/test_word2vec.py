@@ -13,6 +13,8 @@ import unittest
 import os
 import bz2
 import sys
+import copy
+import heapq
 
 import numpy as np
 
@@ -26,6 +28,7 @@ except (ImportError, ValueError):
 
 from gensim import utils
 from gensim.models import word2vec, keyedvectors
+from gensim.models.callbacks import CallbackAny2Vec, PrometheusExporter
 from gensim.test.utils import (
     datapath, get_tmpfile, temporary_file, common_texts as sentences,
     LeeCorpus, lee_corpus_list,
@@ -49,6 +52,17 @@ def _rule(word, count, min_count):
         return utils.RULE_DEFAULT  # apply default rule, i.e. min_count
 
 
+def _rule_discard_the(word, count, min_count):
+    return utils.RULE_DISCARD if word == 'the' else utils.RULE_DEFAULT
+
+
+class _FailingCorpus:
+    """Corpus that fails halfway through."""
+    def __iter__(self):
+        yield ['human', 'interface']
+        raise IOError("corpus went away")
+
+
 def load_on_instance():
     # Save and load a Word2Vec Model on instance for test
     tmpf = get_tmpfile('gensim_word2vec.tst')
@@ -115,6 +129,70 @@ class TestWord2VecModel(unittest.TestCase):
         self.assertEqual(model.wv.get_vecattr('minors', 'count'), 3)
         self.assertEqual(model.wv.get_vecattr('system', 'count'), 4)
 
+    def test_scan_vocab_producers(self):
+        """Do worker processes count the same vocabulary as a single pass?"""
+        model = word2vec.Word2Vec(min_count=1)
+        model.build_vocab(lee_corpus_list, keep_raw_vocab=True)
+
+        partitions = [lee_corpus_list[i::3] for i in range(3)]
+        model2 = word2vec.Word2Vec(min_count=1)
+        model2.build_vocab(partitions, keep_raw_vocab=True, producers=2)
+        self.assertEqual(dict(model.raw_vocab), dict(model2.raw_vocab))
+        self.assertEqual(model.corpus_count, model2.corpus_count)
+        self.assertEqual(model.corpus_total_words, model2.corpus_total_words)
+
+        model3 = word2vec.Word2Vec(min_count=1)
+        model3.build_vocab(corpus_file=datapath('lee_background.cor'), keep_raw_vocab=True, producers=3)
+        model4 = word2vec.Word2Vec(min_count=1)
+        model4.build_vocab(corpus_file=datapath('lee_background.cor'), keep_raw_vocab=True)
+        self.assertEqual(dict(model3.raw_vocab), dict(model4.raw_vocab))
+        self.assertEqual(model3.corpus_count, model4.corpus_count)
+        self.assertEqual(model3.corpus_total_words, model4.corpus_total_words)
+        with self.assertRaises(ValueError):
+            model3.build_vocab(corpus_file=datapath('head500.noblanks.cor.bz2'), producers=3)
+
+        model5 = word2vec.Word2Vec(min_count=1, max_vocab_size=1000)
+        model5.build_vocab(partitions, keep_raw_vocab=True, producers=2)
+        self.assertLessEqual(len(model5.raw_vocab), 1000)
+        for word, count in model5.raw_vocab.items():
+            self.assertLessEqual(count, model.raw_vocab[word])
+
+        with self.assertRaises(TypeError):
+            model5.build_vocab(lee_corpus_list, producers=2)
+
+    def test_vocab_sketch(self):
+        """Does a Space-Saving sketch keep the frequent words, with bounded counts?"""
+        model = word2vec.Word2Vec(min_count=1)
+        model.build_vocab(lee_corpus_list, keep_raw_vocab=True)
+        true_counts = model.raw_vocab
+
+        partitions = [lee_corpus_list[i::3] for i in range(3)]
+        for producers in (0, 2):
+            model2 = word2vec.Word2Vec(min_count=1, max_vocab_size=500, vocab_sketch=True)
+            model2.build_vocab(
+                partitions if producers else lee_corpus_list, keep_raw_vocab=True, producers=producers,
+            )
+            self.assertEqual(len(model2.raw_vocab), 500)
+            self.assertEqual(model2.corpus_total_words, model.corpus_total_words)
+            # every word more frequent than total words / capacity is kept, and overcounted by at most that much
+            max_error = model.corpus_total_words / 500
+            for word, count in true_counts.items():
+                if count > max_error:
+                    self.assertIn(word, model2.raw_vocab)
+                    self.assertLessEqual(count, model2.raw_vocab[word])
+                    self.assertLessEqual(model2.raw_vocab[word], count + max_error)
+
+            # trim_rule applies to the sketched counts too
+            model3 = word2vec.Word2Vec(min_count=1, max_vocab_size=500, vocab_sketch=True)
+            model3.build_vocab(
+                partitions if producers else lee_corpus_list, keep_raw_vocab=True, producers=producers,
+                trim_rule=_rule_discard_the,
+            )
+            self.assertIn('the', model2.raw_vocab)
+            self.assertNotIn('the', model3.raw_vocab)
+            self.assertNotIn('the', model3.wv)
+            self.assertEqual(len(model3.raw_vocab), 499)
+
     def test_total_word_count(self):
         model = word2vec.Word2Vec(vector_size=10, min_count=0, seed=42)
         total_words = model.scan_vocab(sentences)[0]
@@ -477,6 +555,45 @@ class TestWord2VecModel(unittest.TestCase):
         # input not empty, but rather completely filtered out
         self.assertRaises(RuntimeError, word2vec.Word2Vec, corpus, min_count=total_words + 1)
 
+    def test_vocab_tables(self):
+        """Are the Huffman codes optimal, and the negative sampling table proportional to the word counts?"""
+        model = word2vec.Word2Vec(min_count=1, hs=1, negative=5)
+        model.build_vocab(LeeCorpus())
+        counts = model.wv.expandos['count']
+
+        codes = [tuple(model.wv.get_vecattr(i, 'code')) for i in range(len(model.wv))]
+        points = [model.wv.get_vecattr(i, 'point') for i in range(len(model.wv))]
+        unique_codes = set(codes)
+        self.assertEqual(len(unique_codes), len(codes))
+        for code, point in zip(codes, points):
+            self.assertEqual(len(code), len(point))
+            self.assertEqual(point[0], len(model.wv) - 2)  # every path starts at the root
+            for prefix_length in range(1, len(code)):
+                self.assertNotIn(code[:prefix_length], unique_codes)  # prefix-free
+        # the total length of the encoded corpus is optimal, as computed by the textbook Huffman algorithm
+        heap = sorted(counts.tolist())
+        optimal_length = 0
+        while len(heap) > 1:
+            merged = heapq.heappop(heap) + heapq.heappop(heap)
+            optimal_length += merged
+            heapq.heappush(heap, merged)
+        self.assertEqual(sum(len(code) * count for code, count in zip(codes, counts)), optimal_length)
+
+        expected = np.cumsum(counts ** model.ns_exponent)
+        expected = np.round(expected / expected[-1] * (2**31 - 1))
+        np.testing.assert_array_equal(model.cum_table, expected)
+
+        # every word is drawn from the alias table with the same probability as from the cumulative table
+        vocab_size, domain = len(model.wv), 2**31
+        thresholds, aliases = model.alias_table[:, 0].astype(np.int64), model.alias_table[:, 1]
+        self.assertTrue(np.all(thresholds <= domain))
+        drawn = thresholds.copy()
+        np.add.at(drawn, aliases, domain - thresholds)
+        self.assertEqual(drawn.sum(), vocab_size * domain)
+        np.testing.assert_allclose(
+            drawn / (vocab_size * domain), np.diff(expected, prepend=0) / expected[-1], atol=1e-9,
+        )
+
     def test_training(self):
         """Test word2vec training."""
         # build vocabulary, don't train yet
@@ -522,6 +639,113 @@ class TestWord2VecModel(unittest.TestCase):
             sims2 = [(w, sim) for w, sim in sims2 if w != 'graph']  # ignore 'graph' itself
             self.assertEqual(sims, sims2)
 
+    def test_progress_metrics(self):
+        """Are progress and throughput metrics passed to the callbacks at the end of each epoch?"""
+        class MetricsRecorder(CallbackAny2Vec):
+            def __init__(self):
+                self.metrics = []
+
+            def on_progress(self, model, metrics):
+                self.metrics.append(metrics)
+
+        corpus = list(LeeCorpus())
+        with temporary_file(get_tmpfile('gensim_word2vec.tst')) as tf:
+            utils.save_as_line_sentence(corpus, tf)
+            for train_kwargs in ({'corpus_iterable': corpus}, {'corpus_file': tf}):
+                recorder = MetricsRecorder()
+                model = word2vec.Word2Vec(min_count=1, workers=2, epochs=3)
+                model.build_vocab(**train_kwargs)
+                model.train(
+                    total_examples=model.corpus_count, total_words=model.corpus_total_words, epochs=model.epochs,
+                    callbacks=[recorder], **train_kwargs,
+                )
+                epoch_ends = [metrics for metrics in recorder.metrics if metrics.epoch_end]
+                self.assertEqual([metrics.epoch for metrics in epoch_ends], [0, 1, 2])
+                for metrics in epoch_ends:
+                    self.assertAlmostEqual(metrics.progress, 1.0)
+                    if 'corpus_iterable' in train_kwargs:
+                        self.assertEqual(metrics.raw_word_count, model.corpus_total_words)
+                    self.assertEqual(sum(metrics.worker_words.values()), metrics.trained_word_count)
+                    self.assertTrue(0 < metrics.kernel_time)
+                    self.assertTrue(model.min_alpha <= metrics.alpha <= model.alpha)
+                    self.assertTrue(metrics.words_per_sec > 0)
+                # the learning rate decays over the epochs
+                self.assertTrue(epoch_ends[0].alpha > epoch_ends[-1].alpha)
+                self.assertEqual(epoch_ends[0].job_queue_size, -1 if 'corpus_file' in train_kwargs else 0)
+
+    def test_prometheus_exporter(self):
+        """Are the progress metrics written in the Prometheus text format?"""
+        path = get_tmpfile('gensim_word2vec.prom')
+        exporter = PrometheusExporter(path, labels={'model': 'w2v'})
+        model = word2vec.Word2Vec(sentences, min_count=1, sample=0, workers=2, epochs=2, callbacks=[exporter])
+        with utils.open(path, 'r', encoding='utf8') as fin:
+            text = fin.read()
+        self.assertEqual(text, exporter.to_text())
+
+        samples = {}
+        for line in text.splitlines():
+            if not line.startswith('#'):
+                name, value = line.rsplit(' ', 1)
+                samples[name] = float(value)
+        self.assertEqual(samples['gensim_any2vec_epoch{model="w2v"}'], 1)
+        self.assertEqual(samples['gensim_any2vec_epoch_progress{model="w2v"}'], 1.0)
+        self.assertAlmostEqual(samples['gensim_any2vec_alpha{model="w2v"}'], model.min_alpha_yet_reached)
+        self.assertEqual(samples['gensim_any2vec_trained_words_total{model="w2v"}'], 2 * model.corpus_total_words)
+        worker = next(iter(exporter.metrics.worker_kernel_time))
+        self.assertIn('gensim_any2vec_worker_kernel_seconds{model="w2v",worker="%i"}' % worker, samples)
+        self.assertIn('# TYPE gensim_any2vec_trained_words_total counter', text)
+
+    def test_checkpoint_resume(self):
+        """Does training resumed from a checkpoint end up exactly where uninterrupted training does?"""
+        class CrashingCorpus:
+            """Fails in the middle of the second epoch."""
+            def __init__(self, corpus):
+                self.corpus = corpus
+                self.passes = 0
+
+            def __iter__(self):
+                self.passes += 1
+                for i, sentence in enumerate(self.corpus):
+                    if self.passes == 2 and i == len(self.corpus) // 2:
+                        raise IOError("disk failure")
+                    yield sentence
+
+        corpus = list(LeeCorpus())
+        initial = word2vec.Word2Vec(vector_size=10, min_count=1, workers=1, epochs=3, batch_words=1000, seed=42)
+        initial.build_vocab(corpus)
+        train_kwargs = {'total_examples': initial.corpus_count, 'epochs': initial.epochs}
+
+        model = copy.deepcopy(initial)
+        checkpoint_path = get_tmpfile('gensim_word2vec_checkpoint')
+        os.makedirs(checkpoint_path, exist_ok=True)
+        np.save(os.path.join(checkpoint_path, 'mine.npy'), np.arange(3))  # must survive checkpointing
+        model.train(corpus, checkpoint_path=checkpoint_path, **train_kwargs)
+        state = utils.unpickle(os.path.join(checkpoint_path, 'state.pkl'))
+        self.assertEqual(
+            sorted(fname for fname in os.listdir(checkpoint_path) if fname.endswith('.npy')),
+            sorted(list(state['arrays'].values()) + ['mine.npy']),
+        )
+
+        checkpoint_path = get_tmpfile('gensim_word2vec_crashed')
+        crashed = copy.deepcopy(initial)
+        with self.assertRaises(IOError):
+            crashed.train(CrashingCorpus(corpus), checkpoint_path=checkpoint_path, checkpoint_delay=0, **train_kwargs)
+
+        # the checkpoint is in the middle of the second epoch
+        state = utils.unpickle(os.path.join(checkpoint_path, 'state.pkl'))
+        self.assertEqual(state['epoch'], 1)
+        self.assertTrue(0 < state['examples'] <= len(corpus) // 2)
+
+        resumed = copy.deepcopy(initial)
+        resumed.train(corpus, checkpoint_path=checkpoint_path, resume_from=checkpoint_path, **train_kwargs)
+        np.testing.assert_array_equal(resumed.wv.vectors, model.wv.vectors)
+        np.testing.assert_array_equal(resumed.syn1neg, model.syn1neg)
+
+        # nothing left to train
+        self.assertEqual(resumed.train(corpus, resume_from=checkpoint_path, **train_kwargs), (0, 0))
+        with self.assertRaises(ValueError):
+            resumed.train(corpus, total_examples=initial.corpus_count, epochs=5, resume_from=checkpoint_path)
+
     def test_scoring(self):
         """Test word2vec scoring."""
         model = word2vec.Word2Vec(sentences, vector_size=2, min_count=1, hs=1, negative=0)
@@ -589,7 +813,7 @@ class TestWord2VecModel(unittest.TestCase):
             self.assertTrue(0.1 < spearman < 1.0, f"spearman {spearman} not between 0.1 and 1.0")
             self.assertTrue(0.0 <= oov < 90.0, f"OOV {oov} not between 0.0 and 90.0")
 
-    def model_sanity(self, model, train=True, with_corpus_file=False, ranks=None):
+    def model_sanity(self, model, train=True, with_corpus_file=False, with_producers=False, ranks=None):
         """Even tiny models trained on LeeCorpus should pass these sanity checks"""
         # run extra before/after training tests if train=True
         if train:
@@ -600,6 +824,10 @@ class TestWord2VecModel(unittest.TestCase):
                 tmpfile = get_tmpfile('gensim_word2vec.tst')
                 utils.save_as_line_sentence(lee_corpus_list, tmpfile)
                 model.train(corpus_file=tmpfile, total_words=model.corpus_total_words, epochs=model.epochs)
+            elif with_producers:
+                partitions = [lee_corpus_list[i::3] for i in range(3)]
+                model.train(partitions, total_examples=model.corpus_count, epochs=model.epochs, producers=2)
+                self.assertAlmostEqual(model.min_alpha_yet_reached, model.min_alpha)
             else:
                 model.train(lee_corpus_list, total_examples=model.corpus_count, epochs=model.epochs)
             self.assertFalse((orig0 == model.wv.vectors[1]).all())  # vector should vary after training
@@ -634,6 +862,120 @@ class TestWord2VecModel(unittest.TestCase):
         model = word2vec.Word2Vec(sg=1, window=4, hs=0, negative=15, min_count=5, epochs=10, workers=2)
         self.model_sanity(model, with_corpus_file=True)
 
+    def test_sg_neg_batch_negatives(self):
+        """Test skipgram w/ negative sampling, sharing negatives across each window"""
+        model = word2vec.Word2Vec(
+            sg=1, window=4, hs=0, negative=15, min_count=5, epochs=10, workers=2, batch_negatives=True,
+        )
+        self.model_sanity(model)
+
+    def test_sg_neg_batch_negatives_fromfile(self):
+        model = word2vec.Word2Vec(
+            sg=1, window=4, hs=0, negative=15, min_count=5, epochs=10, workers=2, batch_negatives=True,
+        )
+        self.model_sanity(model, with_corpus_file=True)
+
+    def test_batch_negatives_loss(self):
+        """Is the loss reported, and training reproducible, with shared negatives?"""
+        models = []
+        for _ in range(2):
+            model = word2vec.Word2Vec(
+                sentences, sg=1, hs=1, negative=5, min_count=1, seed=42, workers=1,
+                batch_negatives=True, compute_loss=True,
+            )
+            self.assertGreater(model.get_latest_training_loss(), 0)
+            models.append(model)
+        self.models_equal(models[0], models[1])
+
+        # the shared negatives kernel must have been used, with its memory sized by _get_thread_working_mem()
+        model = word2vec.Word2Vec(
+            sentences, sg=1, hs=1, negative=5, min_count=1, seed=42, workers=1, compute_loss=True,
+        )
+        self.assertFalse(np.allclose(model.wv.vectors, models[0].wv.vectors))
+        self.assertGreater(len(models[0]._get_thread_working_mem()[0]), len(model._get_thread_working_mem()[0]))
+
+    def test_sg_neg_producers(self):
+        model = word2vec.Word2Vec(sg=1, window=4, hs=0, negative=15, min_count=5, epochs=10, workers=2)
+        self.model_sanity(model, with_producers=True)
+
+    def test_cbow_hs_producers(self):
+        model = word2vec.Word2Vec(
+            sg=0, cbow_mean=1, alpha=0.1, window=2, hs=1, negative=0,
+            min_count=5, epochs=60, workers=2, batch_words=1000,
+        )
+        self.model_sanity(model, with_producers=True)
+
+    def test_train_producers_errors(self):
+        model = word2vec.Word2Vec(sentences, min_count=1)
+        # a plain list of sentences is not a list of partitions
+        with self.assertRaises(TypeError):
+            model.train(sentences, total_examples=model.corpus_count, epochs=1, producers=2)
+        with self.assertRaises(RuntimeError):
+            model.train(
+                [sentences, _FailingCorpus()], total_examples=model.corpus_count, epochs=1, producers=2,
+            )
+
+    def test_indexed_sentences(self):
+        model = word2vec.Word2Vec(vector_size=12, min_count=5, seed=42, workers=1)
+        model.build_vocab(lee_corpus_list)
+        corpus = word2vec.IndexedSentences.serialize(get_tmpfile('gensim_word2vec.idx'), lee_corpus_list, model.wv)
+        self.assertEqual(len(corpus), len(lee_corpus_list))
+        self.assertEqual(corpus.raw_offsets[-1], model.corpus_total_words)
+        for sentence, indexes in zip(lee_corpus_list, corpus):
+            self.assertEqual([model.wv.key_to_index[word] for word in sentence if word in model.wv], list(indexes))
+
+        # with a single worker, training on the indexes must match training on the original corpus exactly
+        model2 = word2vec.Word2Vec(vector_size=12, min_count=5, seed=42, workers=1)
+        model2.build_vocab(lee_corpus_list)
+        model.train(lee_corpus_list, total_examples=model.corpus_count, epochs=model.epochs)
+        model2.train(
+            word2vec.IndexedSentences(corpus.fname), total_examples=model2.corpus_count, epochs=model2.epochs,
+        )
+        self.assertTrue(np.allclose(model.wv.vectors, model2.wv.vectors))
+        self.assertTrue(np.allclose(model.syn1neg, model2.syn1neg))
+
+        # the indexes are only valid for the vocabulary they were made with
+        model3 = word2vec.Word2Vec(lee_corpus_list, vector_size=12, min_count=3, epochs=1)
+        with self.assertRaises(ValueError):
+            model3.train(corpus, total_examples=model3.corpus_count, epochs=1)
+
+    def test_corpus_file_index(self):
+        with temporary_file(get_tmpfile('gensim_word2vec.tst')) as corpus_file:
+            utils.save_as_line_sentence(lee_corpus_list, corpus_file)
+            index = word2vec.CorpusFileIndex.load_or_build(corpus_file)
+            self.assertEqual(len(index), len(lee_corpus_list))
+            self.assertEqual(index.total_words, sum(len(sentence) for sentence in lee_corpus_list))
+            with open(corpus_file, 'rb') as fin:
+                for offset, sentence in zip(index.line_offsets, lee_corpus_list):
+                    fin.seek(offset)
+                    self.assertEqual(utils.to_unicode(fin.readline()).split(), sentence)
+
+            # workers start at the line containing their share of the words
+            offsets, start_lines = index.split(4)
+            self.assertEqual(offsets, [int(index.line_offsets[line]) for line in start_lines])
+            for worker, line in enumerate(start_lines):
+                self.assertTrue(
+                    index.word_offsets[line] <= index.total_words * worker // 4 < index.word_offsets[line + 1]
+                )
+
+            # and not their share of the bytes, which would skew with the line lengths
+            skewed = word2vec.CorpusFileIndex(
+                corpus_file, np.array([0, 1000, 1010, 1020, 1030]), np.array([0, 100, 200, 300, 400]),
+            )
+            self.assertEqual(skewed.split(4), ([0, 1000, 1010, 1020], [0, 1, 2, 3]))
+
+            # the stored index is reused, until the corpus file changes
+            stored = word2vec.CorpusFileIndex.load(corpus_file, corpus_file + '.lineidx')
+            self.assertIsInstance(stored.line_offsets, np.memmap)
+            np.testing.assert_array_equal(stored.word_offsets, index.word_offsets)
+            utils.save_as_line_sentence(lee_corpus_list[:10], corpus_file)
+            self.assertIsNone(word2vec.CorpusFileIndex.load(corpus_file, corpus_file + '.lineidx'))
+            self.assertEqual(len(word2vec.CorpusFileIndex.load_or_build(corpus_file)), 10)
+
+            # the index also provides the number of words to decay the learning rate over
+            model = word2vec.Word2Vec(corpus_file=corpus_file, vector_size=12, min_count=1, workers=3)
+            model.train(corpus_file=corpus_file, total_examples=model.corpus_count, epochs=1)
+
     @unittest.skipIf('BULK_TEST_REPS' not in os.environ, reason="bulk test only occasionally run locally")
     def test_method_in_bulk(self):
         """Not run by default testing, but can be run locally to help tune stochastic aspects of tests
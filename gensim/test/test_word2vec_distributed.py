@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Automated tests for distributed training of Word2Vec, on local nodes.
+"""
+
+import copy
+import logging
+import unittest
+
+import numpy as np
+
+from gensim.models import word2vec, word2vec_distributed, fasttext
+from gensim.test.utils import lee_corpus_list
+
+
+class TestWord2VecDistributed(unittest.TestCase):
+    def test_train_local_nodes(self):
+        """Does training on shards with local nodes give a sane model?"""
+        model = word2vec.Word2Vec(sg=1, window=4, hs=0, negative=15, min_count=5, epochs=10, workers=1)
+        model.build_vocab(lee_corpus_list)
+        shards = [lee_corpus_list[i::2] for i in range(2)]
+        trained, raw = word2vec_distributed.train_distributed(model, shards, sync_words=20000)
+
+        self.assertEqual(raw, model.epochs * sum(len(sentence) for sentence in lee_corpus_list))
+        self.assertTrue(0 < trained <= raw)
+        self.assertEqual(model.train_count, 1)
+        sims = model.wv.most_similar('war', topn=len(model.wv))
+        rank = [word for word, _ in sims].index('terrorism')
+        self.assertLess(rank, 50)
+
+    def test_round_deltas(self):
+        """Does a node ship exactly the rows that changed, for both hierarchical softmax and negative sampling?"""
+        for hs, negative in [(1, 0), (0, 5)]:
+            model = word2vec.Word2Vec(vector_size=10, hs=hs, negative=negative, min_count=1, workers=1)
+            model.build_vocab(lee_corpus_list)
+            node = word2vec_distributed.Word2VecNode()
+            node.initialize(model, lee_corpus_list[:20], 1)
+            before = {name: np.array(array) for name, array in word2vec_distributed._synced_arrays(model).items()}
+            deltas, _, raw_words = node.train_round(1000)
+            self.assertGreater(raw_words, 0)
+            self.assertEqual(set(deltas), set(before))
+            for name, array in word2vec_distributed._synced_arrays(model).items():
+                rows, delta = deltas[name]
+                expected = np.flatnonzero((array != before[name]).any(axis=1))
+                np.testing.assert_array_equal(rows, expected)
+                np.testing.assert_array_equal(delta, array[rows] - before[name][rows])
+
+    def test_node_seeds(self):
+        """Does each node draw its own random sequence, reproducibly?"""
+        model = word2vec.Word2Vec(vector_size=10, min_count=1, seed=7)
+        model.build_vocab(lee_corpus_list[:20])
+        draws = []
+        for shard_no in (0, 1, 0):
+            node = word2vec_distributed.Word2VecNode()
+            node.initialize(copy.deepcopy(model), lee_corpus_list[:20], 1, shard_no)
+            draws.append(node.model.random.randint(0, 2**24, size=5).tolist())
+        self.assertNotEqual(draws[0], draws[1])
+        self.assertEqual(draws[0], draws[2])
+
+    def test_errors(self):
+        """Are unsupported models and mismatched shards rejected?"""
+        shards = [lee_corpus_list[:10], lee_corpus_list[10:20]]
+        model = fasttext.FastText(vector_size=10, min_count=1)
+        model.build_vocab(lee_corpus_list[:20])
+        self.assertRaises(NotImplementedError, word2vec_distributed.train_distributed, model, shards)
+
+        model = word2vec.Word2Vec(vector_size=10, min_count=1)
+        self.assertRaises(RuntimeError, word2vec_distributed.train_distributed, model, shards)
+        model.build_vocab(lee_corpus_list[:20])
+        self.assertRaises(ValueError, word2vec_distributed.train_distributed, model, shards, nodes=[object()])
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
+    unittest.main()
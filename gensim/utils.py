@@ -1776,6 +1776,190 @@ def trim_vocab_by_freq(vocab, topk, trim_rule=None):
     prune_vocab(vocab, min_count, trim_rule=trim_rule)
 
 
+class SpaceSaving:
+    """Approximate counts of the most frequent items of a stream, in bounded memory.
+
+    Implements the Space-Saving algorithm of `Metwally, Agrawal & El Abbadi, "Efficient Computation of Frequent
+    and Top-k Elements in Data Streams" (2005) <https://doi.org/10.1007/978-3-540-30570-5_27>`_: at most
+    `capacity` items are counted, and a new item replaces the least counted one, inheriting its count.
+
+    The counts have explicit error bounds. Out of `total` counted items:
+
+    * every count is an upper bound of the true count, overestimating it by at most `errors[item]`, which is
+      itself at most :meth:`max_error` <= `total / capacity`,
+    * every item more frequent than :meth:`max_error` is guaranteed to be counted.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of counted items.
+
+    Attributes
+    ----------
+    counts : dict of (object, int)
+        Upper bounds of the counts of the counted items.
+    errors : dict of (object, int)
+        Maximum overestimation of the counted items that replaced another one; 0 for the other items.
+    total : int
+        Number of items counted so far.
+
+    Examples
+    --------
+    .. sourcecode:: pycon
+
+        >>> from gensim.utils import SpaceSaving
+        >>>
+        >>> sketch = SpaceSaving(2)
+        >>> sketch.update(['a', 'b', 'a', 'c', 'a'])
+        >>> sorted(sketch.counts.items())
+        [('a', 3), ('c', 2)]
+        >>> sketch.max_error()
+        2
+
+    """
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = int(capacity)
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        self._dropped = False  # was any item ever replaced?
+        self._heap = []  # (count, seq, item) of each counted item; the count may be stale, but never too high
+        self._seq = itertools.count()  # tie breaker, so that items are never compared
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __contains__(self, item):
+        return item in self.counts
+
+    def update(self, items):
+        """Count each of `items` once.
+
+        Parameters
+        ----------
+        items : list of object
+            The items to count, such as the words of a sentence.
+
+        """
+        counts = self.counts
+        for item in items:
+            if item in counts:
+                counts[item] += 1
+            else:
+                self._insert(item)
+        self.total += len(items)
+
+    def _insert(self, item):
+        if len(self.counts) < self.capacity:
+            self.counts[item] = 1
+            heapq.heappush(self._heap, (1, next(self._seq), item))
+            return
+        min_count, min_item = self._pop_min()
+        self._dropped = True
+        del self.counts[min_item]
+        self.errors.pop(min_item, None)
+        self.counts[item] = min_count + 1
+        self.errors[item] = min_count
+        heapq.heappush(self._heap, (min_count + 1, next(self._seq), item))
+
+    def _min(self):
+        """Refresh stale heap entries until the top one is the least counted item."""
+        heap, counts = self._heap, self.counts
+        while heap[0][0] != counts[heap[0][2]]:
+            item = heap[0][2]
+            heapq.heapreplace(heap, (counts[item], next(self._seq), item))
+        return heap[0][0], heap[0][2]
+
+    def _pop_min(self):
+        min_count, min_item = self._min()
+        heapq.heappop(self._heap)
+        return min_count, min_item
+
+    def max_error(self):
+        """Get an upper bound of the overestimation of any count, which is also the highest possible true count
+        of an item that isn't counted.
+
+        Returns
+        -------
+        int
+            The lowest count once any item had to be replaced, 0 before.
+
+        """
+        if not self._dropped:
+            return 0
+        return self._min()[0]
+
+    def lower_bound(self, item):
+        """Get the guaranteed minimum count of `item`.
+
+        Parameters
+        ----------
+        item : object
+            The counted item.
+
+        Returns
+        -------
+        int
+            Lower bound of the true count, 0 if `item` isn't counted.
+
+        """
+        if item not in self.counts:
+            return 0
+        return self.counts[item] - self.errors.get(item, 0)
+
+    def merge(self, other):
+        """Add the counts of another sketch, as if all its items had been counted by this one.
+
+        Items counted by only one of the sketches get the :meth:`max_error` of the other one added, so that
+        the merged counts remain upper bounds, with error bounds the sum of those of both sketches.
+        Then the `capacity` highest counts are kept. See `Agarwal et al., "Mergeable Summaries" (2012)
+        <https://doi.org/10.1145/2213556.2213562>`_.
+
+        Parameters
+        ----------
+        other : :class:`~gensim.utils.SpaceSaving`
+            The sketch to merge into this one.
+
+        """
+        missing, other_missing = self.max_error(), other.max_error()
+        counts, errors = {}, {}
+        for item in itertools.chain(self.counts, (item for item in other.counts if item not in self.counts)):
+            if item in self.counts:
+                count, error = self.counts[item], self.errors.get(item, 0)
+            else:
+                count, error = missing, missing
+            if item in other.counts:
+                count, error = count + other.counts[item], error + other.errors.get(item, 0)
+            else:
+                count, error = count + other_missing, error + other_missing
+            counts[item] = count
+            if error:
+                errors[item] = error
+        self._dropped = self._dropped or other._dropped
+        if len(counts) > self.capacity:
+            self._dropped = True
+            kept = heapq.nlargest(self.capacity, counts.items(), key=lambda item_count: item_count[1])
+            counts = dict(kept)
+            errors = {item: error for item, error in errors.items() if item in counts}
+        self.counts, self.errors = counts, errors
+        self.total += other.total
+        self._heap = [(count, next(self._seq), item) for item, count in counts.items()]
+        heapq.heapify(self._heap)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_heap'], state['_seq']  # rebuilt from the counts
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._seq = itertools.count()
+        self._heap = [(count, next(self._seq), item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+
 def merge_counts(dict1, dict2):
     """Merge `dict1` of (word, freq1) and `dict2` of (word, freq2) into `dict1` of (word, freq1+freq2).
     Parameters
@@ -28,6 +28,7 @@ c_extensions = {
     'gensim._matutils': 'gensim/_matutils.c',
     'gensim.models.nmf_pgd': 'gensim/models/nmf_pgd.c',
     'gensim.similarities.fastss': 'gensim/similarities/fastss.c',
+    'gensim.similarities.hnsw_inner': 'gensim/similarities/hnsw_inner.c',
 }
 
 cpp_extensions = {